@@ -0,0 +1,172 @@
+'''
+Local HTTPS server for the HTTP/2 benchmark, negotiating HTTP/2 or HTTP/1.1 via ALPN
+(with a temporary self-signed certificate, created using the openssl command)
+and counting the accepted connections:
+
+    python -m benchmarks.h2_server --port 8443
+'''
+
+import argparse
+import logging
+import os
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+from typing import BinaryIO, Optional
+
+import h2.config
+import h2.connection
+import h2.events
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+RESPONSE_BODY = b'{"status": "ok"}'
+
+RECEIVE_BUFFER_SIZE = 64 * 1024
+
+
+def get_self_signed_ssl_context(cert_dir: str) -> ssl.SSLContext:
+    cert_file = os.path.join(cert_dir, 'cert.pem')
+    key_file = os.path.join(cert_dir, 'key.pem')
+    subprocess.run(
+        [
+            'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+            '-keyout', key_file, '-out', cert_file, '-days', '1',
+            '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost'
+        ],
+        check=True,
+        capture_output=True
+    )
+    ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_context.load_cert_chain(cert_file, key_file)
+    ssl_context.set_alpn_protocols(['h2', 'http/1.1'])
+    return ssl_context
+
+
+def handle_http2_connection(tls_socket: ssl.SSLSocket, response_body: bytes):
+    connection = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    connection.initiate_connection()
+    tls_socket.sendall(connection.data_to_send())
+    while data := tls_socket.recv(RECEIVE_BUFFER_SIZE):
+        for event in connection.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                connection.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.RequestReceived):
+                connection.send_headers(event.stream_id, [
+                    (':status', '200'),
+                    ('content-type', 'application/json'),
+                    ('content-length', str(len(response_body)))
+                ])
+                connection.send_data(event.stream_id, response_body, end_stream=True)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                return
+        tls_socket.sendall(connection.data_to_send())
+
+
+def read_http1_request(rfile: BinaryIO) -> bool:
+    request_line = rfile.readline()
+    if not request_line:
+        return False
+    content_length = 0
+    while (header_line := rfile.readline()) not in (b'\r\n', b'\n', b''):
+        name, _, value = header_line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            content_length = int(value.strip())
+    rfile.read(content_length)
+    return True
+
+
+def handle_http1_connection(tls_socket: ssl.SSLSocket, response_body: bytes):
+    # keep-alive, until the client closes the connection
+    with tls_socket.makefile('rb') as rfile:
+        while read_http1_request(rfile):
+            tls_socket.sendall(
+                b'HTTP/1.1 200 OK\r\n'
+                b'Content-Type: application/json\r\n'
+                + f'Content-Length: {len(response_body)}\r\n\r\n'.encode('ascii')
+                + response_body
+            )
+
+
+class LocalHttpServer:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        port: int = 0,
+        response_body: bytes = RESPONSE_BODY
+    ):
+        self.response_body = response_body
+        self.connection_count = 0
+        self._connection_count_lock = threading.Lock()
+        self._cert_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.ssl_context = get_self_signed_ssl_context(self._cert_dir.name)
+        self._server_socket = socket.create_server(('localhost', port))
+        self.port = self._server_socket.getsockname()[1]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f'https://localhost:{self.port}/'
+
+    def _handle_connection(self, client_socket: socket.socket):
+        try:
+            with self.ssl_context.wrap_socket(client_socket, server_side=True) as tls_socket:
+                if tls_socket.selected_alpn_protocol() == 'h2':
+                    handle_http2_connection(tls_socket, self.response_body)
+                else:
+                    handle_http1_connection(tls_socket, self.response_body)
+        except OSError as exc:
+            LOGGER.debug('Connection closed: %r', exc)
+
+    def _serve(self):
+        while True:
+            try:
+                client_socket, _ = self._server_socket.accept()
+            except OSError:
+                # the server socket was closed
+                return
+            with self._connection_count_lock:
+                self.connection_count += 1
+            threading.Thread(
+                target=self._handle_connection, args=(client_socket,), daemon=True
+            ).start()
+
+    def start(self) -> 'LocalHttpServer':
+        self._thread = threading.Thread(target=self._serve, name='h2-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        try:
+            # wakes up the blocking accept (closing alone doesn't)
+            self._server_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._server_socket.close()
+        if self._thread is not None:
+            self._thread.join()
+        self._cert_dir.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=8443)
+    args = parser.parse_args()
+    server = LocalHttpServer(port=args.port).start()
+    print(f'Serving on: {server.url}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level='WARNING')
+    main()
@@ -0,0 +1,89 @@
+'''
+Compares reshaping a large response with a Jinja response_template (as WebApiTool does)
+and with a compiled response_projection.
+
+    python -m benchmarks.projection --items 100000 --repeat 5
+'''
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Sequence
+
+from py_conf_mcp.tools.sources.web_api import get_evaluated_template
+from py_conf_mcp.utils.projection import compile_projection
+
+
+RESPONSE_TEMPLATE = (
+    '['
+    '{% for item in response_json.data["items"] if item.status == "active" %}'
+    '{"id": {{ item.id }}, "name": {{ item.user.name | tojson }}}'
+    '{{ "," if not loop.last }}'
+    '{% endfor %}'
+    ']'
+)
+
+RESPONSE_PROJECTION = "data.items[?status == 'active'].{id: id, name: user.name}"
+
+
+def get_response_json(item_count: int) -> Any:
+    return {
+        'data': {
+            'items': [
+                {
+                    'id': index,
+                    'status': 'active' if index % 2 == 0 else 'inactive',
+                    'user': {'name': f'user_{index}', 'email': f'user_{index}@example.org'},
+                    'tags': ['tag_1', 'tag_2'],
+                    'score': index / 3
+                }
+                for index in range(item_count)
+            ]
+        }
+    }
+
+
+def get_durations(fn: Callable[[], Any], repeat: int) -> Sequence[float]:
+    durations = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start_time)
+    return durations
+
+
+def print_summary(name: str, durations: Sequence[float]):
+    print(
+        f'{name}: repeat={len(durations)}'
+        f' median={statistics.median(durations) * 1000:.1f}ms'
+        f' min={min(durations) * 1000:.1f}ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    response_json = get_response_json(args.items)
+    variables = {'response_json': response_json}
+    projection = compile_projection(RESPONSE_PROJECTION)
+    # both produce the same result (the template as a JSON string)
+    assert json.loads(get_evaluated_template(RESPONSE_TEMPLATE, variables)) == (
+        projection(response_json)
+    )
+
+    print_summary(
+        'response_template',
+        get_durations(lambda: get_evaluated_template(RESPONSE_TEMPLATE, variables), args.repeat)
+    )
+    print_summary(
+        'response_projection',
+        get_durations(lambda: projection(response_json), args.repeat)
+    )
+
+
+if __name__ == '__main__':
+    main()
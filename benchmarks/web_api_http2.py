@@ -0,0 +1,107 @@
+'''
+Compares HTTP/1.1 (requests) and HTTP/2 (httpx) calls of WebApiTool,
+with many concurrent calls against a single HTTPS host supporting HTTP/2.
+By default against a local server (see `benchmarks.h2_server`),
+which also counts the opened connections:
+
+    python -m benchmarks.web_api_http2 --concurrency 100
+    python -m benchmarks.web_api_http2 --url https://example.org/ --concurrency 100
+'''
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import statistics
+import time
+from typing import Optional, Sequence
+
+from benchmarks.h2_server import LocalHttpServer
+from py_conf_mcp.tools.sources import web_api
+from py_conf_mcp.tools.sources.web_api import WebApiTool
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_http2_connection_count(verify_ssl: bool) -> int:
+    # pylint: disable=protected-access
+    return len(web_api.get_http2_client(verify_ssl)._transport._pool.connections)  # type: ignore
+
+
+def get_latencies(tool: WebApiTool, concurrency: int, call_count: int) -> Sequence[float]:
+    def timed_call(_: int) -> float:
+        start_time = time.perf_counter()
+        tool()
+        return time.perf_counter() - start_time
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed_call, range(call_count)))
+
+
+def print_summary(
+    name: str,
+    latencies: Sequence[float],
+    connection_count: Optional[int]
+):
+    sorted_latencies = sorted(latencies)
+    print(
+        f'{name}: calls={len(latencies)}'
+        f' connections={connection_count if connection_count is not None else "n/a"}'
+        f' p50={statistics.median(sorted_latencies) * 1000:.1f}ms'
+        f' p95={sorted_latencies[int(len(sorted_latencies) * 0.95) - 1] * 1000:.1f}ms'
+        f' max={sorted_latencies[-1] * 1000:.1f}ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help='default: a local server with a self-signed certificate')
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--calls', type=int, default=1000)
+    parser.add_argument('--no-verify-ssl', action='store_true')
+    args = parser.parse_args()
+    local_server: Optional[LocalHttpServer] = None
+    url = args.url
+    verify_ssl = not args.no_verify_ssl
+    if not url:
+        local_server = LocalHttpServer().start()
+        url = local_server.url
+        verify_ssl = False
+
+    def get_measured_connection_count(previous_connection_count: int) -> Optional[int]:
+        # only the local server can count the connections opened by requests
+        if local_server is None:
+            return None
+        return local_server.connection_count - previous_connection_count
+
+    try:
+        http1_tool = WebApiTool(url=url, verify_ssl=verify_ssl)
+        previous_connection_count = local_server.connection_count if local_server else 0
+        http1_latencies = get_latencies(http1_tool, args.concurrency, args.calls)
+        print_summary(
+            'http/1.1',
+            http1_latencies,
+            connection_count=get_measured_connection_count(previous_connection_count)
+        )
+
+        http2_tool = WebApiTool(url=url, verify_ssl=verify_ssl, http2=True)
+        previous_connection_count = local_server.connection_count if local_server else 0
+        http2_latencies = get_latencies(http2_tool, args.concurrency, args.calls)
+        http2_connection_count = get_measured_connection_count(previous_connection_count)
+        print_summary(
+            'http/2',
+            http2_latencies,
+            connection_count=(
+                http2_connection_count
+                if http2_connection_count is not None
+                else get_http2_connection_count(verify_ssl)
+            )
+        )
+    finally:
+        if local_server is not None:
+            local_server.stop()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level='WARNING')
+    main()
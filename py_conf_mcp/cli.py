@@ -1,29 +1,96 @@
 import argparse
-from typing import Literal
+import functools
+import sys
+from typing import Literal, Optional, Sequence
+
+import anyio
 from fastmcp import FastMCP
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+import uvicorn
 
-from py_conf_mcp.config import LOGGER, AppConfig, load_app_config
+from py_conf_mcp.config import (
+    LOGGER,
+    AppConfig,
+    get_app_config_file,
+    load_app_config,
+    load_app_config_from_file
+)
+from py_conf_mcp.daemon import run_daemon_async
+from py_conf_mcp.reload import (
+    DEFAULT_WATCH_INTERVAL_SECONDS,
+    ConfigFileWatcher,
+    McpToolsReloader,
+    add_mcp_tool
+)
+from py_conf_mcp.stdio_shim import get_default_daemon_socket_path
+from py_conf_mcp.tools.admission_control import DEFAULT_ADMISSION_CONTROLLER
+from py_conf_mcp.tools.client_fairness import (
+    DEFAULT_CLIENT_FAIRNESS_CONTROLLER,
+    check_client_fairness_config_for_transport
+)
+from py_conf_mcp.tools.refresh_ahead import (
+    DEFAULT_REFRESH_AHEAD_SCHEDULER,
+    RefreshAheadScheduler
+)
 from py_conf_mcp.tools.resolver import ConfigToolResolver
+from py_conf_mcp.utils.json import get_serialized_tool_result
+from py_conf_mcp.utils.logging import TruncatedLogValue
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+from py_conf_mcp.validation import get_app_config_errors, validate_app_config
+
+
+DEFAULT_GZIP_MINIMUM_SIZE = 1000
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+async def get_metrics_response(_request: Request) -> Response:
+    return PlainTextResponse(
+        DEFAULT_METRICS_REGISTRY.get_prometheus_text(),
+        media_type=PROMETHEUS_CONTENT_TYPE
+    )
 
 
-def create_mcp_for_app_config(app_config: AppConfig) -> FastMCP:
-    LOGGER.info('app_config: %r', app_config)
+def create_mcp_for_app_config(
+    app_config: AppConfig,
+    json_response: bool = False,
+    refresh_ahead_scheduler: Optional[RefreshAheadScheduler] = None
+) -> FastMCP:
+    LOGGER.debug('app_config: %r', TruncatedLogValue(app_config))
+    validate_app_config(app_config)
 
     tool_resolver = ConfigToolResolver(
         tool_definitions_config=app_config.tool_definitions
     )
 
     tools = tool_resolver.get_tools_by_name(app_config.server.tools)
-    LOGGER.info('Tools: %r', tools)
+    LOGGER.info('Tools: %r', TruncatedLogValue([tool.name for tool in tools]))
 
-    mcp: FastMCP = FastMCP(app_config.server.name, stateless_http=True)
+    mcp: FastMCP = FastMCP(
+        app_config.server.name,
+        stateless_http=True,
+        json_response=json_response,
+        # allows tools to be replaced by a config reload
+        on_duplicate_tools='replace',
+        tool_serializer=get_serialized_tool_result
+    )
 
+    DEFAULT_ADMISSION_CONTROLLER.configure(app_config.server.admission_control)
+    DEFAULT_CLIENT_FAIRNESS_CONTROLLER.configure(app_config.server.client_fairness)
     for tool in tools:
-        mcp.add_tool(
-            tool.tool_fn,
-            name=tool.name,
-            description=tool.description
-        )
+        add_mcp_tool(mcp, tool)
+
+    if refresh_ahead_scheduler is not None:
+        refresh_ahead_scheduler.update({
+            tool.name: tool.refresh_ahead
+            for tool in tools
+            if tool.refresh_ahead is not None
+        })
+
+    mcp.custom_route('/metrics', methods=['GET'])(get_metrics_response)
 
     return mcp
 
@@ -35,6 +102,16 @@ def create_mcp() -> FastMCP:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='MCP CLI')
+    parser.add_argument(
+        'command',
+        nargs='?',
+        default='serve',
+        choices=['serve', 'daemon', 'validate'],
+        help=(
+            'Start the server (default), start a daemon for the stdio shim'
+            ' (py_conf_mcp.stdio_shim) or only validate the config'
+        )
+    )
     parser.add_argument(
         '--transport',
         type=str,
@@ -43,23 +120,146 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument('--host', type=str, default='localhost')
     parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument(
+        '--socket',
+        type=str,
+        help='Unix socket path of the daemon (default: derived from the config file)'
+    )
+    parser.add_argument(
+        '--gzip-minimum-size',
+        type=int,
+        default=DEFAULT_GZIP_MINIMUM_SIZE,
+        help=(
+            'Minimum response size in bytes to compress with gzip'
+            ' (HTTP transports only, 0 to disable)'
+        )
+    )
+    parser.add_argument(
+        '--json-response',
+        action='store_true',
+        help=(
+            'Respond with JSON rather than SSE for streamable-http'
+            ' (allows the response to be compressed)'
+        )
+    )
+    parser.add_argument(
+        '--watch-config',
+        action='store_true',
+        help='Reload changed tools when the config file changes'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL_SECONDS
+    )
     return parser.parse_args()
 
 
-def run(
-    transport: Literal['stdio', 'sse'],
+def get_http_middleware(gzip_minimum_size: int) -> Sequence[Middleware]:
+    if gzip_minimum_size <= 0:
+        return []
+    # Note: SSE responses (text/event-stream) are excluded by the GZipMiddleware
+    return [Middleware(GZipMiddleware, minimum_size=gzip_minimum_size)]
+
+
+async def run_http_async(  # pylint: disable=too-many-arguments
+    mcp: FastMCP,
+    *,
+    transport: Literal['sse', 'streamable-http'],
     host: str,
-    port: int
+    port: int,
+    middleware: Sequence[Middleware]
 ) -> None:
-    mcp = create_mcp()
-    mcp.run(transport=transport, host=host, port=port)
+    app = mcp.http_app(transport=transport, middleware=list(middleware))
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level=mcp.settings.log_level.lower(),
+        timeout_graceful_shutdown=0,
+        # lifespan is required for streamable http
+        lifespan='on'
+    )
+    await uvicorn.Server(config).serve()
+
+
+def run(  # pylint: disable=too-many-arguments
+    transport: Literal['stdio', 'sse', 'streamable-http'],
+    host: str,
+    port: int,
+    *,
+    watch_config: bool = False,
+    watch_interval: float = DEFAULT_WATCH_INTERVAL_SECONDS,
+    gzip_minimum_size: int = DEFAULT_GZIP_MINIMUM_SIZE,
+    json_response: bool = False,
+    daemon_socket: Optional[str] = None
+) -> None:
+    config_file = get_app_config_file()
+    app_config = load_app_config_from_file(config_file)
+    check_client_fairness_config_for_transport(
+        app_config.server.client_fairness,
+        transport='stdio' if daemon_socket else transport
+    )
+    mcp = create_mcp_for_app_config(
+        app_config=app_config,
+        json_response=json_response,
+        refresh_ahead_scheduler=DEFAULT_REFRESH_AHEAD_SCHEDULER
+    )
+    if watch_config:
+        ConfigFileWatcher(
+            config_file,
+            reloader=McpToolsReloader(
+                mcp,
+                app_config=app_config,
+                refresh_ahead_scheduler=DEFAULT_REFRESH_AHEAD_SCHEDULER
+            ),
+            interval_seconds=watch_interval
+        ).start()
+    if watch_config or len(DEFAULT_REFRESH_AHEAD_SCHEDULER):
+        # also picks up refresh-ahead tools added by a config reload
+        DEFAULT_REFRESH_AHEAD_SCHEDULER.start()
+    if daemon_socket:
+        anyio.run(run_daemon_async, mcp, daemon_socket)
+        return
+    if transport == 'stdio':
+        mcp.run(transport=transport)
+        return
+    anyio.run(functools.partial(
+        run_http_async,
+        mcp,
+        transport=transport,
+        host=host,
+        port=port,
+        middleware=get_http_middleware(gzip_minimum_size)
+    ))
+
+
+def validate() -> bool:
+    errors = get_app_config_errors(load_app_config())
+    for error in errors:
+        print(error, file=sys.stderr)
+    if errors:
+        print(f'Config is invalid ({len(errors)} errors)', file=sys.stderr)
+        return False
+    print('Config is valid', file=sys.stderr)
+    return True
 
 
 def main():
     args = parse_args()
     LOGGER.info('Arguments: %r', args)
+    if args.command == 'validate':
+        sys.exit(0 if validate() else 1)
+    daemon_socket: Optional[str] = None
+    if args.command == 'daemon':
+        daemon_socket = args.socket or get_default_daemon_socket_path(get_app_config_file())
     run(
         transport=args.transport,
         host=args.host,
-        port=args.port
+        port=args.port,
+        watch_config=args.watch_config,
+        watch_interval=args.watch_interval,
+        gzip_minimum_size=args.gzip_minimum_size,
+        json_response=args.json_response,
+        daemon_socket=daemon_socket
     )
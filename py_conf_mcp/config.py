@@ -1,15 +1,29 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+import functools
+import glob
+import hashlib
 import logging
 import os
+import pickle
+import threading
 from typing import Any, Mapping, Optional, Sequence
 
 import yaml
 
 from py_conf_mcp.config_typing import (
+    AdmissionControlConfigDict,
+    ClientFairnessConfigDict,
     FromPythonClassConfigDict,
     FromPythonFunctionConfigDict,
     InputConfigDict,
+    LogConfigDict,
+    MemoryBudgetConfigDict,
+    OutputPolicyConfigDict,
+    RefreshAheadConfigDict,
+    ResultCacheConfigDict,
     ServerConfigDict,
+    ToolQuotaConfigDict,
     AppConfigDict,
     ToolDefinitionsConfigDict
 )
@@ -18,8 +32,13 @@ from py_conf_mcp.config_typing import (
 LOGGER = logging.getLogger(__name__)
 
 
+# use the libyaml based loader when PyYAML was built with it
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 class EnvironmentVariables:
     CONFIG_FILE = 'CONFIG_FILE'
+    CONFIG_CACHE_DIR = 'CONFIG_CACHE_DIR'
 
 
 @dataclass(frozen=True)
@@ -42,13 +61,108 @@ class FromPythonFunctionConfig:
 
 
 @dataclass(frozen=True)
-class FromPythonClassConfig:
+class LogConfig:
+    level: Optional[str] = None
+    sample_rate: float = 1.0
+
+    @staticmethod
+    def from_dict(log_config_dict: LogConfigDict) -> 'LogConfig':
+        return LogConfig(
+            level=log_config_dict.get('level'),
+            sample_rate=log_config_dict.get('sampleRate', 1.0)
+        )
+
+
+@dataclass(frozen=True)
+class OutputPolicyConfig:
+    max_bytes: Optional[int] = None
+    max_items: Optional[int] = None
+    truncation_strategy: str = 'head'
+    enable_cursor: bool = False
+
+    @staticmethod
+    def from_dict(output_policy_config_dict: OutputPolicyConfigDict) -> 'OutputPolicyConfig':
+        return OutputPolicyConfig(
+            max_bytes=output_policy_config_dict.get('maxBytes'),
+            max_items=output_policy_config_dict.get('maxItems'),
+            truncation_strategy=output_policy_config_dict.get('truncationStrategy', 'head'),
+            enable_cursor=output_policy_config_dict.get('enableCursor', False)
+        )
+
+    def __bool__(self) -> bool:
+        return self.max_bytes is not None or self.max_items is not None
+
+
+@dataclass(frozen=True)
+class MemoryBudgetConfig:
+    max_bytes: Optional[int] = None
+    # fraction of the calls to measure the peak allocation of (via tracemalloc)
+    trace_sample_rate: float = 0.0
+
+    @staticmethod
+    def from_dict(memory_budget_config_dict: MemoryBudgetConfigDict) -> 'MemoryBudgetConfig':
+        return MemoryBudgetConfig(
+            max_bytes=memory_budget_config_dict.get('maxBytes'),
+            trace_sample_rate=memory_budget_config_dict.get('traceSampleRate', 0.0)
+        )
+
+    def __bool__(self) -> bool:
+        return self.max_bytes is not None or self.trace_sample_rate > 0
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    backend: Optional[str] = None
+    ttl_seconds: float = 300.0
+    max_entries: int = 1000
+    path: Optional[str] = None
+    url: Optional[str] = None
+
+    @staticmethod
+    def from_dict(result_cache_config_dict: ResultCacheConfigDict) -> 'ResultCacheConfig':
+        return ResultCacheConfig(
+            backend=result_cache_config_dict.get('backend'),
+            ttl_seconds=result_cache_config_dict.get('ttlSeconds', 300.0),
+            max_entries=result_cache_config_dict.get('maxEntries', 1000),
+            path=result_cache_config_dict.get('path'),
+            url=result_cache_config_dict.get('url')
+        )
+
+    def __bool__(self) -> bool:
+        return self.backend is not None
+
+
+@dataclass(frozen=True)
+class RefreshAheadConfig:
+    inputs: Sequence[Mapping[str, Any]] = field(default_factory=list)
+    interval_seconds: float = 60.0
+    jitter_ratio: float = 0.1
+
+    @staticmethod
+    def from_dict(refresh_ahead_config_dict: RefreshAheadConfigDict) -> 'RefreshAheadConfig':
+        return RefreshAheadConfig(
+            inputs=refresh_ahead_config_dict.get('inputs', []),
+            interval_seconds=refresh_ahead_config_dict.get('intervalSeconds', 60.0),
+            jitter_ratio=refresh_ahead_config_dict.get('jitterRatio', 0.1)
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.inputs)
+
+
+@dataclass(frozen=True)
+class FromPythonClassConfig:  # pylint: disable=too-many-instance-attributes
     name: str
     module: str
     class_name: str
     description: Optional[str] = None
     init_parameters: Mapping[str, Any] = field(default_factory=dict)
     inputs: Mapping[str, InputConfigDict] = field(default_factory=dict)
+    log: LogConfig = field(default_factory=LogConfig)
+    output_policy: OutputPolicyConfig = field(default_factory=OutputPolicyConfig)
+    memory_budget: MemoryBudgetConfig = field(default_factory=MemoryBudgetConfig)
+    result_cache: ResultCacheConfig = field(default_factory=ResultCacheConfig)
+    refresh_ahead: RefreshAheadConfig = field(default_factory=RefreshAheadConfig)
 
     @staticmethod
     def from_dict(
@@ -60,7 +174,20 @@ class FromPythonClassConfig:
             class_name=from_python_class_config_dict['className'],
             description=from_python_class_config_dict.get('description'),
             init_parameters=from_python_class_config_dict.get('initParameters', {}),
-            inputs=from_python_class_config_dict.get('inputs', {})
+            inputs=from_python_class_config_dict.get('inputs', {}),
+            log=LogConfig.from_dict(from_python_class_config_dict.get('log', {})),
+            output_policy=OutputPolicyConfig.from_dict(
+                from_python_class_config_dict.get('outputPolicy', {})
+            ),
+            memory_budget=MemoryBudgetConfig.from_dict(
+                from_python_class_config_dict.get('memoryBudget', {})
+            ),
+            result_cache=ResultCacheConfig.from_dict(
+                from_python_class_config_dict.get('resultCache', {})
+            ),
+            refresh_ahead=RefreshAheadConfig.from_dict(
+                from_python_class_config_dict.get('refreshAhead', {})
+            )
         )
 
 
@@ -91,16 +218,120 @@ class ToolDefinitionsConfig:
         )
 
 
+@dataclass(frozen=True)
+class AdmissionControlConfig:
+    max_event_loop_lag_seconds: Optional[float] = None
+    max_in_flight_calls: Optional[int] = None
+    max_executor_queue_depth: Optional[int] = None
+    low_priority_threshold_ratio: float = 0.5
+    retry_after_seconds: float = 1.0
+    tool_priorities: Mapping[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def from_dict(
+        admission_control_config_dict: AdmissionControlConfigDict
+    ) -> 'AdmissionControlConfig':
+        return AdmissionControlConfig(
+            max_event_loop_lag_seconds=admission_control_config_dict.get(
+                'maxEventLoopLagSeconds'
+            ),
+            max_in_flight_calls=admission_control_config_dict.get('maxInFlightCalls'),
+            max_executor_queue_depth=admission_control_config_dict.get(
+                'maxExecutorQueueDepth'
+            ),
+            low_priority_threshold_ratio=admission_control_config_dict.get(
+                'lowPriorityThresholdRatio', 0.5
+            ),
+            retry_after_seconds=admission_control_config_dict.get('retryAfterSeconds', 1.0),
+            tool_priorities=admission_control_config_dict.get('toolPriorities', {})
+        )
+
+    def __bool__(self) -> bool:
+        return (
+            self.max_event_loop_lag_seconds is not None
+            or self.max_in_flight_calls is not None
+            or self.max_executor_queue_depth is not None
+        )
+
+
+@dataclass(frozen=True)
+class ToolQuotaConfig:
+    max_calls: int
+    window_seconds: float
+
+    @staticmethod
+    def from_dict(tool_quota_config_dict: ToolQuotaConfigDict) -> 'ToolQuotaConfig':
+        return ToolQuotaConfig(
+            max_calls=tool_quota_config_dict['maxCalls'],
+            window_seconds=tool_quota_config_dict['windowSeconds']
+        )
+
+
+@dataclass(frozen=True)
+class ClientFairnessConfig:  # pylint: disable=too-many-instance-attributes
+    # by default, clients are identified by their SSE session (or by their remote
+    # address, e.g. with streamable HTTP, which has no sessions across requests)
+    client_id_header: Optional[str] = None
+    # header values may be secrets (e.g. API keys), client weights use the hashed id
+    hash_client_id: bool = True
+    max_concurrent_calls: Optional[int] = None
+    max_concurrent_calls_per_client: Optional[int] = None
+    max_queued_calls_per_client: Optional[int] = None
+    client_weights: Mapping[str, float] = field(default_factory=dict)
+    tool_quotas: Mapping[str, ToolQuotaConfig] = field(default_factory=dict)
+
+    @staticmethod
+    def from_dict(
+        client_fairness_config_dict: ClientFairnessConfigDict
+    ) -> 'ClientFairnessConfig':
+        return ClientFairnessConfig(
+            client_id_header=client_fairness_config_dict.get('clientIdHeader'),
+            hash_client_id=client_fairness_config_dict.get('hashClientId', True),
+            max_concurrent_calls=client_fairness_config_dict.get('maxConcurrentCalls'),
+            max_concurrent_calls_per_client=client_fairness_config_dict.get(
+                'maxConcurrentCallsPerClient'
+            ),
+            max_queued_calls_per_client=client_fairness_config_dict.get(
+                'maxQueuedCallsPerClient'
+            ),
+            client_weights=client_fairness_config_dict.get('clientWeights', {}),
+            tool_quotas={
+                tool_name: ToolQuotaConfig.from_dict(tool_quota_config_dict)
+                for tool_name, tool_quota_config_dict in client_fairness_config_dict.get(
+                    'toolQuotas', {}
+                ).items()
+            }
+        )
+
+    @property
+    def is_queuing_enabled(self) -> bool:
+        return (
+            self.max_concurrent_calls is not None
+            or self.max_concurrent_calls_per_client is not None
+        )
+
+    def __bool__(self) -> bool:
+        return self.is_queuing_enabled or bool(self.tool_quotas)
+
+
 @dataclass(frozen=True)
 class ServerConfig:
     name: str
     tools: Sequence[str]
+    admission_control: AdmissionControlConfig = field(default_factory=AdmissionControlConfig)
+    client_fairness: ClientFairnessConfig = field(default_factory=ClientFairnessConfig)
 
     @staticmethod
     def from_dict(server_config_dict: ServerConfigDict) -> 'ServerConfig':
         return ServerConfig(
             name=server_config_dict['name'],
-            tools=server_config_dict['tools']
+            tools=server_config_dict['tools'],
+            admission_control=AdmissionControlConfig.from_dict(
+                server_config_dict.get('admissionControl', {})
+            ),
+            client_fairness=ClientFairnessConfig.from_dict(
+                server_config_dict.get('clientFairness', {})
+            )
         )
 
 
@@ -119,16 +350,184 @@ class AppConfig:
         )
 
 
+def get_tool_config_by_name(
+    tool_definitions_config: ToolDefinitionsConfig
+) -> Mapping[str, FromPythonFunctionConfig | FromPythonClassConfig]:
+    tool_configs: Sequence[FromPythonFunctionConfig | FromPythonClassConfig] = [
+        *tool_definitions_config.from_python_function,
+        *tool_definitions_config.from_python_class
+    ]
+    return {tool_config.name: tool_config for tool_config in tool_configs}
+
+
 def get_app_config_file() -> str:
     return os.environ[EnvironmentVariables.CONFIG_FILE]
 
 
-def load_app_config_from_file(config_file: str) -> AppConfig:
+def get_app_config_cache_dir() -> Optional[str]:
+    return os.environ.get(EnvironmentVariables.CONFIG_CACHE_DIR) or None
+
+
+def get_app_config_files(config_file: str) -> Sequence[str]:
+    # multiple files or glob patterns can be separated by os.pathsep (like PATH)
+    config_files: list[str] = []
+    for config_file_pattern in config_file.split(os.pathsep):
+        if not config_file_pattern:
+            continue
+        if any(char in config_file_pattern for char in '*?['):
+            config_files.extend(sorted(glob.glob(config_file_pattern)))
+        else:
+            config_files.append(config_file_pattern)
+    if not config_files:
+        raise FileNotFoundError(f'No config files found for: {repr(config_file)}')
+    return config_files
+
+
+def load_app_config_dict_from_file(config_file: str) -> AppConfigDict:
     LOGGER.info('Loading config from: %r', config_file)
     with open(config_file, 'r', encoding='utf-8') as config_fp:
-        return AppConfig.from_dict(
-            yaml.safe_load(config_fp)
+        return yaml.load(config_fp, Loader=YamlSafeLoader)
+
+
+def get_merged_app_config_dict(
+    app_config_dicts: Sequence[AppConfigDict]
+) -> AppConfigDict:
+    if len(app_config_dicts) == 1:
+        return app_config_dicts[0]
+    from_python_function: list[FromPythonFunctionConfigDict] = []
+    from_python_class: list[FromPythonClassConfigDict] = []
+    server_config_dict: Optional[ServerConfigDict] = None
+    for app_config_dict in app_config_dicts:
+        tool_definitions_config_dict = app_config_dict.get('toolDefinitions', {})
+        from_python_function.extend(
+            tool_definitions_config_dict.get('fromPythonFunction', [])
+        )
+        from_python_class.extend(
+            tool_definitions_config_dict.get('fromPythonClass', [])
+        )
+        if 'server' not in app_config_dict:
+            continue
+        if server_config_dict is None:
+            server_config_dict = app_config_dict['server']
+            continue
+        admission_control_config_dict = app_config_dict['server'].get(
+            'admissionControl',
+            server_config_dict.get('admissionControl')
+        )
+        client_fairness_config_dict = app_config_dict['server'].get(
+            'clientFairness',
+            server_config_dict.get('clientFairness')
+        )
+        server_config_dict = {
+            'name': app_config_dict['server'].get('name', server_config_dict['name']),
+            'tools': list(dict.fromkeys([
+                *server_config_dict['tools'],
+                *app_config_dict['server'].get('tools', [])
+            ]))
+        }
+        if admission_control_config_dict is not None:
+            server_config_dict['admissionControl'] = admission_control_config_dict
+        if client_fairness_config_dict is not None:
+            server_config_dict['clientFairness'] = client_fairness_config_dict
+    if server_config_dict is None:
+        raise KeyError('server')
+    return {
+        'toolDefinitions': {
+            'fromPythonFunction': from_python_function,
+            'fromPythonClass': from_python_class
+        },
+        'server': server_config_dict
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_config_schema_hash() -> str:
+    # the cached config classes and their parsing (e.g. defaults) are defined in this module
+    with open(__file__, 'rb') as module_fp:
+        return hashlib.sha256(module_fp.read()).hexdigest()
+
+
+def get_app_config_cache_key(config_files: Sequence[str]) -> str:
+    config_hash = hashlib.sha256()
+    # a cache written by a different version of the config classes is not reused
+    config_hash.update(get_app_config_schema_hash().encode('utf-8'))
+    for config_file in config_files:
+        config_hash.update(config_file.encode('utf-8'))
+        config_hash.update(str(os.stat(config_file).st_mtime_ns).encode('utf-8'))
+        with open(config_file, 'rb') as config_fp:
+            config_hash.update(hashlib.sha256(config_fp.read()).digest())
+    return config_hash.hexdigest()
+
+
+def get_app_config_cache_file(cache_dir: str, cache_key: str) -> str:
+    return os.path.join(cache_dir, f'app-config-{cache_key}.pickle')
+
+
+def load_cached_app_config(cache_file: str) -> Optional[AppConfig]:
+    try:
+        with open(cache_file, 'rb') as cache_fp:
+            app_config = pickle.load(cache_fp)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        LOGGER.warning('Ignoring invalid config cache %r: %r', cache_file, exc)
+        return None
+    if not isinstance(app_config, AppConfig):
+        return None
+    LOGGER.info('Loaded config from cache: %r', cache_file)
+    return app_config
+
+
+def save_cached_app_config(cache_file: str, app_config: AppConfig):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    temp_cache_file = f'{cache_file}.{os.getpid()}.tmp'
+    with open(temp_cache_file, 'wb') as cache_fp:
+        pickle.dump(app_config, cache_fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_cache_file, cache_file)
+
+
+def load_app_config_dicts_from_files(
+    config_files: Sequence[str]
+) -> Sequence[AppConfigDict]:
+    if len(config_files) == 1 or threading.current_thread() is not threading.main_thread():
+        # not forking worker processes from other threads (e.g. the config file watcher)
+        return [load_app_config_dict_from_file(config_file) for config_file in config_files]
+    # YAML parsing is CPU bound, therefore using processes rather than threads
+    with ProcessPoolExecutor(
+        max_workers=min(len(config_files), os.cpu_count() or 1)
+    ) as executor:
+        return list(executor.map(load_app_config_dict_from_file, config_files))
+
+
+def load_app_config_from_files(
+    config_files: Sequence[str],
+    cache_dir: Optional[str] = None
+) -> AppConfig:
+    cache_file: Optional[str] = None
+    if cache_dir:
+        cache_file = get_app_config_cache_file(
+            cache_dir,
+            get_app_config_cache_key(config_files)
         )
+        app_config = load_cached_app_config(cache_file)
+        if app_config is not None:
+            return app_config
+    app_config = AppConfig.from_dict(get_merged_app_config_dict(
+        load_app_config_dicts_from_files(config_files)
+    ))
+    if cache_file:
+        save_cached_app_config(cache_file, app_config)
+    return app_config
+
+
+def load_app_config_from_file(
+    config_file: str,
+    cache_dir: Optional[str] = None
+) -> AppConfig:
+    return load_app_config_from_files(
+        get_app_config_files(config_file),
+        cache_dir=cache_dir or get_app_config_cache_dir()
+    )
 
 
 def load_app_config() -> AppConfig:
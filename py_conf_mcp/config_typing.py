@@ -16,6 +16,37 @@ class FromPythonFunctionConfigDict(TypedDict):
     description: NotRequired[str]
 
 
+class LogConfigDict(TypedDict):
+    level: NotRequired[str]
+    sampleRate: NotRequired[float]
+
+
+class OutputPolicyConfigDict(TypedDict):
+    maxBytes: NotRequired[int]
+    maxItems: NotRequired[int]
+    truncationStrategy: NotRequired[str]
+    enableCursor: NotRequired[bool]
+
+
+class MemoryBudgetConfigDict(TypedDict):
+    maxBytes: NotRequired[int]
+    traceSampleRate: NotRequired[float]
+
+
+class ResultCacheConfigDict(TypedDict):
+    backend: NotRequired[str]
+    ttlSeconds: NotRequired[float]
+    maxEntries: NotRequired[int]
+    path: NotRequired[str]
+    url: NotRequired[str]
+
+
+class RefreshAheadConfigDict(TypedDict):
+    inputs: NotRequired[Sequence[Mapping[str, Any]]]
+    intervalSeconds: NotRequired[float]
+    jitterRatio: NotRequired[float]
+
+
 class FromPythonClassConfigDict(TypedDict):
     name: str
     module: str
@@ -23,6 +54,11 @@ class FromPythonClassConfigDict(TypedDict):
     description: NotRequired[str]
     initParameters: NotRequired[Mapping[str, Any]]
     inputs: NotRequired[Mapping[str, InputConfigDict]]
+    log: NotRequired[LogConfigDict]
+    outputPolicy: NotRequired[OutputPolicyConfigDict]
+    memoryBudget: NotRequired[MemoryBudgetConfigDict]
+    resultCache: NotRequired[ResultCacheConfigDict]
+    refreshAhead: NotRequired[RefreshAheadConfigDict]
 
 
 class ToolDefinitionsConfigDict(TypedDict):
@@ -30,9 +66,35 @@ class ToolDefinitionsConfigDict(TypedDict):
     fromPythonClass: NotRequired[Sequence[FromPythonClassConfigDict]]
 
 
+class AdmissionControlConfigDict(TypedDict):
+    maxEventLoopLagSeconds: NotRequired[float]
+    maxInFlightCalls: NotRequired[int]
+    maxExecutorQueueDepth: NotRequired[int]
+    lowPriorityThresholdRatio: NotRequired[float]
+    retryAfterSeconds: NotRequired[float]
+    toolPriorities: NotRequired[Mapping[str, str]]
+
+
+class ToolQuotaConfigDict(TypedDict):
+    maxCalls: int
+    windowSeconds: float
+
+
+class ClientFairnessConfigDict(TypedDict):
+    clientIdHeader: NotRequired[str]
+    hashClientId: NotRequired[bool]
+    maxConcurrentCalls: NotRequired[int]
+    maxConcurrentCallsPerClient: NotRequired[int]
+    maxQueuedCallsPerClient: NotRequired[int]
+    clientWeights: NotRequired[Mapping[str, float]]
+    toolQuotas: NotRequired[Mapping[str, ToolQuotaConfigDict]]
+
+
 class ServerConfigDict(TypedDict):
     name: str
     tools: Sequence[str]
+    admissionControl: NotRequired[AdmissionControlConfigDict]
+    clientFairness: NotRequired[ClientFairnessConfigDict]
 
 
 class AppConfigDict(TypedDict):
@@ -0,0 +1,146 @@
+from contextlib import asynccontextmanager
+import logging
+import os
+import socket
+from typing import AsyncIterator, Tuple
+
+import anyio
+import anyio.lowlevel
+from anyio.abc import ByteStream, SocketListener
+from anyio.streams.buffered import BufferedByteReceiveStream
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from fastmcp import FastMCP
+import mcp.types
+from mcp.shared.message import SessionMessage
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+SOCKET_FILE_MODE = 0o600
+
+SOCKET_DIR_MODE = 0o700
+
+
+@asynccontextmanager
+async def byte_stream_server(
+    stream: ByteStream
+) -> AsyncIterator[Tuple[
+    MemoryObjectReceiveStream[SessionMessage | Exception],
+    MemoryObjectSendStream[SessionMessage]
+]]:
+    '''
+    Same as the stdio server transport of the MCP SDK (newline delimited JSON),
+    but over a (socket) byte stream.
+    '''
+    read_stream_writer, read_stream = anyio.create_memory_object_stream[
+        SessionMessage | Exception
+    ](0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
+    buffered_stream = BufferedByteReceiveStream(stream)
+
+    async def stream_reader():
+        try:
+            async with read_stream_writer:
+                while True:
+                    try:
+                        line = await buffered_stream.receive_until(b'\n', MAX_MESSAGE_BYTES)
+                    except (anyio.EndOfStream, anyio.IncompleteRead):
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        message = mcp.types.JSONRPCMessage.model_validate_json(line)
+                    except Exception as exc:  # pylint: disable=broad-exception-caught
+                        await read_stream_writer.send(exc)
+                        continue
+                    await read_stream_writer.send(SessionMessage(message))
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+
+    async def stream_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    message_json = session_message.message.model_dump_json(
+                        by_alias=True, exclude_none=True
+                    )
+                    await stream.send(message_json.encode('utf-8') + b'\n')
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(stream_reader)
+        task_group.start_soon(stream_writer)
+        yield read_stream, write_stream
+        # e.g. the writer would otherwise wait for further messages
+        task_group.cancel_scope.cancel()
+
+
+async def run_mcp_session(mcp_server: FastMCP, stream: ByteStream):
+    # pylint: disable=protected-access
+    async with byte_stream_server(stream) as (read_stream, write_stream):
+        await mcp_server._mcp_server.run(
+            read_stream,
+            write_stream,
+            mcp_server._mcp_server.create_initialization_options()
+        )
+
+
+def is_socket_in_use(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+async def create_daemon_listener(socket_path: str) -> SocketListener:
+    socket_dir = os.path.dirname(socket_path)
+    if socket_dir:
+        os.makedirs(socket_dir, mode=SOCKET_DIR_MODE, exist_ok=True)
+    if os.path.exists(socket_path):
+        if is_socket_in_use(socket_path):
+            raise RuntimeError(f'Daemon already running for socket: {repr(socket_path)}')
+        # left behind by a previous daemon
+        os.unlink(socket_path)
+    # created with the restricted mode, rather than changing it after binding
+    previous_umask = os.umask(0o777 & ~SOCKET_FILE_MODE)
+    try:
+        return await anyio.create_unix_listener(socket_path)
+    finally:
+        os.umask(previous_umask)
+
+
+async def serve_daemon(
+    mcp_server: FastMCP,
+    listener: SocketListener
+):
+    '''
+    Serves an MCP session for each connection (e.g. from the stdio shim),
+    sharing the already resolved tools (and their pools and caches).
+    '''
+    async def handle_connection(stream: ByteStream):
+        LOGGER.info('Session started')
+        try:
+            async with stream:
+                await run_mcp_session(mcp_server, stream)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning('Session failed: %r', exc, exc_info=True)
+        LOGGER.info('Session ended')
+
+    async with listener:
+        await listener.serve(handle_connection)
+
+
+async def run_daemon_async(mcp_server: FastMCP, socket_path: str):
+    listener = await create_daemon_listener(socket_path)
+    LOGGER.info('Daemon listening on: %r', socket_path)
+    try:
+        await serve_daemon(mcp_server, listener)
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -0,0 +1,216 @@
+from dataclasses import dataclass, field
+import logging
+import os
+import threading
+from typing import Callable, Mapping, Optional, Sequence, Tuple
+
+from fastmcp import FastMCP
+
+from py_conf_mcp.config import (
+    AppConfig,
+    FromPythonClassConfig,
+    FromPythonFunctionConfig,
+    ToolDefinitionsConfig,
+    get_app_config_files,
+    load_app_config_from_file
+)
+from py_conf_mcp.tools.admission_control import (
+    DEFAULT_ADMISSION_CONTROLLER,
+    get_tool_function_with_admission_control
+)
+from py_conf_mcp.tools.client_fairness import (
+    DEFAULT_CLIENT_FAIRNESS_CONTROLLER,
+    get_tool_function_with_client_fairness
+)
+from py_conf_mcp.tools.refresh_ahead import RefreshAheadScheduler
+from py_conf_mcp.tools.resolver import ConfigToolResolver, Tool, get_tool_config_hash
+from py_conf_mcp.validation import validate_app_config
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_WATCH_INTERVAL_SECONDS = 2.0
+
+
+def get_server_tool_function(tool: Tool) -> Callable:
+    # the controls shared by all tools registered with the server
+    return get_tool_function_with_admission_control(
+        get_tool_function_with_client_fairness(tool.tool_fn, tool.name),
+        tool.name
+    )
+
+
+def add_mcp_tool(mcp: FastMCP, tool: Tool):
+    # replaces a tool with the same name (see `on_duplicate_tools`)
+    mcp.add_tool(
+        get_server_tool_function(tool),
+        name=tool.name,
+        description=tool.description
+    )
+
+
+def remove_mcp_tool(mcp: FastMCP, tool_name: str):
+    # the pinned fastmcp version has no public API to remove a tool
+    mcp._tool_manager._tools.pop(tool_name, None)  # pylint: disable=protected-access
+    mcp._cache.clear()  # pylint: disable=protected-access
+
+
+def get_tool_config_hash_by_name(
+    tool_definitions_config: ToolDefinitionsConfig
+) -> Mapping[str, str]:
+    tool_configs: Sequence[FromPythonFunctionConfig | FromPythonClassConfig] = [
+        *tool_definitions_config.from_python_function,
+        *tool_definitions_config.from_python_class
+    ]
+    return {
+        tool_config.name: get_tool_config_hash(tool_config, tool_definitions_config)
+        for tool_config in tool_configs
+    }
+
+
+@dataclass(frozen=True)
+class ToolsDiff:
+    added: Sequence[str] = field(default_factory=list)
+    removed: Sequence[str] = field(default_factory=list)
+    changed: Sequence[str] = field(default_factory=list)
+    unchanged: Sequence[str] = field(default_factory=list)
+
+
+def get_tools_diff(
+    previous_app_config: AppConfig,
+    app_config: AppConfig
+) -> ToolsDiff:
+    previous_hash_by_name = get_tool_config_hash_by_name(
+        previous_app_config.tool_definitions
+    )
+    hash_by_name = get_tool_config_hash_by_name(app_config.tool_definitions)
+    previous_tool_names = set(previous_app_config.server.tools)
+    tool_names = set(app_config.server.tools)
+    added = []
+    changed = []
+    unchanged = []
+    for tool_name in app_config.server.tools:
+        if tool_name not in previous_tool_names:
+            added.append(tool_name)
+        elif previous_hash_by_name.get(tool_name) != hash_by_name.get(tool_name):
+            changed.append(tool_name)
+        else:
+            unchanged.append(tool_name)
+    return ToolsDiff(
+        added=added,
+        removed=[
+            tool_name
+            for tool_name in previous_app_config.server.tools
+            if tool_name not in tool_names
+        ],
+        changed=changed,
+        unchanged=unchanged
+    )
+
+
+class McpToolsReloader:
+    '''
+    Rebuilds only added or changed tools and replaces them in FastMCP,
+    once all of them are resolved. Unchanged tool instances are kept.
+    '''
+
+    def __init__(
+        self,
+        mcp: FastMCP,
+        app_config: AppConfig,
+        refresh_ahead_scheduler: Optional[RefreshAheadScheduler] = None
+    ):
+        self.mcp = mcp
+        self.app_config = app_config
+        self.refresh_ahead_scheduler = refresh_ahead_scheduler
+        self._lock = threading.Lock()
+
+    def reload(self, app_config: AppConfig) -> ToolsDiff:
+        validate_app_config(app_config)
+        with self._lock:
+            tools_diff = get_tools_diff(self.app_config, app_config)
+            LOGGER.info('Reloading tools: %r', tools_diff)
+            if app_config.server.name != self.app_config.server.name:
+                LOGGER.warning('Server name change requires a restart, ignoring')
+            tool_resolver = ConfigToolResolver(
+                tool_definitions_config=app_config.tool_definitions
+            )
+            # resolve all new tools first, so that a failure leaves the registry untouched
+            resolved_tools = tool_resolver.get_tools_by_name(
+                [*tools_diff.added, *tools_diff.changed]
+            )
+            for tool in resolved_tools:
+                add_mcp_tool(self.mcp, tool)
+            for tool_name in tools_diff.removed:
+                remove_mcp_tool(self.mcp, tool_name)
+            if self.refresh_ahead_scheduler is not None:
+                # changed tools are registered again, with their new tool instance
+                self.refresh_ahead_scheduler.update(
+                    {
+                        tool.name: tool.refresh_ahead
+                        for tool in resolved_tools
+                        if tool.refresh_ahead is not None
+                    },
+                    removed_tool_names=[*tools_diff.removed, *tools_diff.changed]
+                )
+            DEFAULT_ADMISSION_CONTROLLER.configure(app_config.server.admission_control)
+            DEFAULT_CLIENT_FAIRNESS_CONTROLLER.configure(app_config.server.client_fairness)
+            self.app_config = app_config
+            return tools_diff
+
+
+def get_config_files_state(
+    config_file: str
+) -> Optional[Sequence[Tuple[str, float]]]:
+    try:
+        return [
+            (config_file_path, os.stat(config_file_path).st_mtime)
+            for config_file_path in get_app_config_files(config_file)
+        ]
+    except FileNotFoundError:
+        return None
+
+
+class ConfigFileWatcher:
+    def __init__(
+        self,
+        config_file: str,
+        reloader: McpToolsReloader,
+        interval_seconds: float = DEFAULT_WATCH_INTERVAL_SECONDS
+    ):
+        self.config_file = config_file
+        self.reloader = reloader
+        self.interval_seconds = interval_seconds
+        self._last_state = get_config_files_state(config_file)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check_for_changes(self) -> Optional[ToolsDiff]:
+        state = get_config_files_state(self.config_file)
+        if state is None or state == self._last_state:
+            return None
+        self._last_state = state
+        try:
+            return self.reloader.reload(load_app_config_from_file(self.config_file))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning(
+                'Failed to reload config, keeping previous tools: %r', exc, exc_info=True
+            )
+            return None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval_seconds):
+            self.check_for_changes()
+
+    def start(self):
+        LOGGER.info('Watching config file for changes: %r', self.config_file)
+        self._thread = threading.Thread(
+            target=self._run, name='config-file-watcher', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,210 @@
+'''
+Lightweight stdio transport, connecting to a pre-warmed daemon over a Unix socket
+(started on demand), so that an MCP client session starts within milliseconds:
+
+    python -m py_conf_mcp.stdio_shim
+
+Only uses the standard library, so that it doesn't pay for importing the server.
+'''
+
+import argparse
+import hashlib
+import logging
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+# same as py_conf_mcp.config.EnvironmentVariables.CONFIG_FILE (not imported on purpose)
+CONFIG_FILE_ENV_VAR = 'CONFIG_FILE'
+
+DEFAULT_DAEMON_START_TIMEOUT_SECONDS = 60.0
+
+DAEMON_CONNECT_RETRY_INTERVAL_SECONDS = 0.05
+
+PIPE_BUFFER_SIZE = 64 * 1024
+
+DAEMON_SOCKET_DIR_MODE = 0o700
+
+
+def get_private_dir(path: str) -> str:
+    '''
+    Creates the directory if needed, and checks that only the current user can access it
+    (e.g. another user could otherwise replace the socket in a shared directory).
+    '''
+    os.makedirs(path, mode=DAEMON_SOCKET_DIR_MODE, exist_ok=True)
+    dir_stat = os.lstat(path)
+    if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid():
+        raise PermissionError(f'Directory is not owned by the current user: {repr(path)}')
+    if dir_stat.st_mode & 0o077:
+        raise PermissionError(f'Directory is accessible by other users: {repr(path)}')
+    return path
+
+
+def get_default_daemon_socket_dir() -> str:
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return get_private_dir(os.path.join(runtime_dir, 'py-conf-mcp'))
+    return get_private_dir(os.path.join(tempfile.gettempdir(), f'py-conf-mcp-{os.getuid()}'))
+
+
+def get_default_daemon_socket_path(config_file: str) -> str:
+    # one daemon per user and config, e.g. not to share tools across configs
+    config_hash = hashlib.sha256(
+        os.path.abspath(config_file).encode('utf-8')
+    ).hexdigest()[:16]
+    return os.path.join(get_default_daemon_socket_dir(), f'{config_hash}.sock')
+
+
+def check_socket_owner(socket_path: str):
+    # e.g. not to send requests (and secrets) to a daemon started by another user
+    socket_uid = os.lstat(socket_path).st_uid
+    if socket_uid != os.getuid():
+        raise PermissionError(
+            f'Daemon socket is owned by another user ({socket_uid}): {repr(socket_path)}'
+        )
+
+
+def connect_to_daemon(socket_path: str) -> socket.socket:
+    check_socket_owner(socket_path)
+    client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client_socket.connect(socket_path)
+    except OSError:
+        client_socket.close()
+        raise
+    return client_socket
+
+
+def get_daemon_log_path(socket_path: str) -> str:
+    return os.path.splitext(socket_path)[0] + '.log'
+
+
+def start_daemon(socket_path: str) -> subprocess.Popen:
+    log_path = get_daemon_log_path(socket_path)
+    LOGGER.info('Starting daemon for socket: %r (log: %r)', socket_path, log_path)
+    # logging to a file rather than the stderr of the shim, which is a pipe of the
+    # MCP client (that the daemon would keep open and may fill, beyond the session)
+    with open(log_path, 'ab') as log_fp:
+        return subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, '-m', 'py_conf_mcp', 'daemon', '--socket', socket_path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_fp,
+            start_new_session=True
+        )
+
+
+def connect_or_start_daemon(
+    socket_path: str,
+    start_timeout_seconds: float = DEFAULT_DAEMON_START_TIMEOUT_SECONDS
+) -> socket.socket:
+    try:
+        return connect_to_daemon(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    process = start_daemon(socket_path)
+    deadline = time.monotonic() + start_timeout_seconds
+    while True:
+        try:
+            return connect_to_daemon(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # e.g. exited as another shim started a daemon for the same socket at the same time
+            if process.poll() is not None and not os.path.exists(socket_path):
+                raise RuntimeError(
+                    f'Daemon exited with code {process.returncode}'
+                    f' (log: {get_daemon_log_path(socket_path)})'
+                ) from None
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(DAEMON_CONNECT_RETRY_INTERVAL_SECONDS)
+
+
+def copy_fd_to_socket(fd: int, client_socket: socket.socket):
+    try:
+        while True:
+            data = os.read(fd, PIPE_BUFFER_SIZE)
+            if not data:
+                break
+            client_socket.sendall(data)
+    except OSError as exc:
+        LOGGER.debug('Stopped copying to socket: %r', exc)
+    finally:
+        # lets the daemon end the session
+        try:
+            client_socket.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+def copy_socket_to_fd(client_socket: socket.socket, fd: int):
+    while True:
+        data = client_socket.recv(PIPE_BUFFER_SIZE)
+        if not data:
+            break
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+
+def run_shim(client_socket: socket.socket, stdin_fd: int, stdout_fd: int):
+    stdin_thread = threading.Thread(
+        target=copy_fd_to_socket,
+        args=(stdin_fd, client_socket),
+        name='stdio-shim-stdin',
+        daemon=True
+    )
+    stdin_thread.start()
+    try:
+        copy_socket_to_fd(client_socket, stdout_fd)
+    finally:
+        client_socket.close()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='MCP stdio shim for the daemon')
+    parser.add_argument(
+        '--socket',
+        type=str,
+        help='Unix socket path of the daemon (default: derived from $CONFIG_FILE)'
+    )
+    parser.add_argument(
+        '--no-start-daemon',
+        action='store_true',
+        help='Fail rather than start the daemon, if it is not running'
+    )
+    parser.add_argument(
+        '--start-timeout',
+        type=float,
+        default=DEFAULT_DAEMON_START_TIMEOUT_SECONDS
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None):
+    args = parse_args(argv)
+    socket_path = args.socket or get_default_daemon_socket_path(
+        os.environ[CONFIG_FILE_ENV_VAR]
+    )
+    if args.no_start_daemon:
+        client_socket = connect_to_daemon(socket_path)
+    else:
+        client_socket = connect_or_start_daemon(
+            socket_path,
+            start_timeout_seconds=args.start_timeout
+        )
+    run_shim(client_socket, stdin_fd=sys.stdin.fileno(), stdout_fd=sys.stdout.fileno())
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level='WARNING')
+    main()
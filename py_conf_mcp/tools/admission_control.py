@@ -0,0 +1,233 @@
+import asyncio
+from dataclasses import dataclass
+import functools
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import anyio.to_thread
+
+from py_conf_mcp.config import AdmissionControlConfig
+from py_conf_mcp.utils.awaitable import get_running_loop_or_none
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_EVENT_LOOP_LAG_CHECK_INTERVAL_SECONDS = 0.1
+
+
+class PriorityClasses:
+    # never shed
+    CRITICAL = 'critical'
+    NORMAL = 'normal'
+    # shed first, at a fraction of the thresholds
+    LOW = 'low'
+
+
+PRIORITY_CLASSES = (PriorityClasses.CRITICAL, PriorityClasses.NORMAL, PriorityClasses.LOW)
+
+
+class AdmissionRejectedError(RuntimeError):
+    '''
+    Raised for calls rejected due to overload, which can be retried later.
+    '''
+
+    def __init__(self, reason: str, retry_after_seconds: float):
+        super().__init__(
+            f'Server overloaded ({reason}), retryable: please retry after'
+            f' {retry_after_seconds:.1f} seconds'
+        )
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+class EventLoopLagMonitor:
+    '''
+    Measures the event loop lag from a background thread, by scheduling
+    a callback on the loop and timing how late it runs.
+    A callback that hasn't run yet (e.g. the loop is blocked) counts as lag, too.
+    '''
+
+    def __init__(self, interval_seconds: float = DEFAULT_EVENT_LOOP_LAG_CHECK_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lag_seconds = 0.0
+        self._pending_since: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _on_tick(self, scheduled_at: float):
+        self._lag_seconds = time.monotonic() - scheduled_at
+        self._pending_since = None
+
+    def _run(self, loop: asyncio.AbstractEventLoop):
+        while not self._stop_event.wait(self.interval_seconds):
+            if loop.is_closed():
+                break
+            if self._pending_since is not None:
+                continue
+            scheduled_at = time.monotonic()
+            self._pending_since = scheduled_at
+            try:
+                loop.call_soon_threadsafe(self._on_tick, scheduled_at)
+            except RuntimeError:
+                # the loop was closed
+                break
+
+    def ensure_started(self, loop: asyncio.AbstractEventLoop):
+        if self._loop is loop:
+            return
+        with self._lock:
+            if self._loop is loop:
+                return
+            self.stop()
+            self._loop = loop
+            self._lag_seconds = 0.0
+            self._pending_since = None
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(loop,), name='event-loop-lag-monitor', daemon=True
+            )
+            self._thread.start()
+
+    def get_lag_seconds(self) -> float:
+        pending_since = self._pending_since
+        if pending_since is not None:
+            return max(self._lag_seconds, time.monotonic() - pending_since)
+        return self._lag_seconds
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def get_executor_queue_depth() -> int:
+    # calls waiting for a worker thread (e.g. of async tools using to_thread)
+    try:
+        return anyio.to_thread.current_default_thread_limiter().statistics().tasks_waiting
+    except RuntimeError:
+        # not within an event loop
+        return 0
+
+
+@dataclass
+class AdmissionTicket:
+    admission_controller: 'AdmissionController'
+    is_released: bool = False
+
+    def release(self):
+        if not self.is_released:
+            self.is_released = True
+            self.admission_controller.release()
+
+
+class AdmissionController:
+    '''
+    Rejects new tool calls early while the server is overloaded
+    (event loop lag, in-flight calls or executor queue depth above the thresholds),
+    rather than letting the latency of all calls grow.
+    '''
+
+    def __init__(
+        self,
+        config: Optional[AdmissionControlConfig] = None,
+        event_loop_lag_monitor: Optional[EventLoopLagMonitor] = None
+    ):
+        self.config = config or AdmissionControlConfig()
+        self.event_loop_lag_monitor = event_loop_lag_monitor or EventLoopLagMonitor()
+        self.in_flight_calls = 0
+        self._lock = threading.Lock()
+
+    def configure(self, config: AdmissionControlConfig):
+        self.config = config
+
+    def get_priority(self, tool_name: str) -> str:
+        return self.config.tool_priorities.get(tool_name, PriorityClasses.NORMAL)
+
+    def get_threshold_ratio(self, priority: str) -> float:
+        if priority == PriorityClasses.LOW:
+            return self.config.low_priority_threshold_ratio
+        return 1.0
+
+    def get_rejection_reason(self, priority: str) -> Optional[str]:
+        config = self.config
+        ratio = self.get_threshold_ratio(priority)
+        if (
+            config.max_in_flight_calls is not None
+            and self.in_flight_calls >= config.max_in_flight_calls * ratio
+        ):
+            return f'in-flight calls: {self.in_flight_calls}'
+        if config.max_event_loop_lag_seconds is not None:
+            loop = get_running_loop_or_none()
+            if loop is not None:
+                self.event_loop_lag_monitor.ensure_started(loop)
+                lag_seconds = self.event_loop_lag_monitor.get_lag_seconds()
+                if lag_seconds > config.max_event_loop_lag_seconds * ratio:
+                    return f'event loop lag: {lag_seconds:.3f}s'
+        if config.max_executor_queue_depth is not None:
+            queue_depth = get_executor_queue_depth()
+            if queue_depth >= config.max_executor_queue_depth * ratio:
+                return f'executor queue depth: {queue_depth}'
+        return None
+
+    def admit(self, tool_name: str) -> AdmissionTicket:
+        priority = self.get_priority(tool_name)
+        if self.config and priority != PriorityClasses.CRITICAL:
+            reason = self.get_rejection_reason(priority)
+            if reason is not None:
+                LOGGER.warning(
+                    'Rejecting call of %r (priority: %s): %s', tool_name, priority, reason
+                )
+                DEFAULT_METRICS_REGISTRY.increment(
+                    'py_conf_mcp_admission_rejected_calls_total',
+                    labels={'tool': tool_name, 'priority': priority}
+                )
+                raise AdmissionRejectedError(
+                    reason,
+                    retry_after_seconds=self.config.retry_after_seconds
+                )
+        with self._lock:
+            self.in_flight_calls += 1
+            DEFAULT_METRICS_REGISTRY.set_gauge('py_conf_mcp_in_flight_calls', self.in_flight_calls)
+        return AdmissionTicket(self)
+
+    def release(self):
+        with self._lock:
+            self.in_flight_calls -= 1
+            DEFAULT_METRICS_REGISTRY.set_gauge('py_conf_mcp_in_flight_calls', self.in_flight_calls)
+
+
+DEFAULT_ADMISSION_CONTROLLER = AdmissionController()
+
+
+async def _get_awaited_and_released(awaitable: Awaitable, ticket: AdmissionTicket) -> Any:
+    try:
+        return await awaitable
+    finally:
+        ticket.release()
+
+
+def get_tool_function_with_admission_control(
+    tool_fn: Callable,
+    tool_name: str,
+    admission_controller: AdmissionController = DEFAULT_ADMISSION_CONTROLLER
+) -> Callable:
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        ticket = admission_controller.admit(tool_name)
+        try:
+            result = tool_fn(**kwargs)
+        except BaseException:
+            ticket.release()
+            raise
+        if inspect.isawaitable(result):
+            # async results (e.g. BigQuery jobs) are in flight until awaited
+            return _get_awaited_and_released(result, ticket)
+        ticket.release()
+        return result
+
+    return wrapper
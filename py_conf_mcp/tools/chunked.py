@@ -0,0 +1,98 @@
+import functools
+import logging
+import tempfile
+from typing import Any, Callable, Iterator, Mapping
+
+import anyio.to_thread
+from fastmcp.server.dependencies import get_context
+
+from py_conf_mcp.config import OutputPolicyConfig
+from py_conf_mcp.tools.output_policy import (
+    DEFAULT_RESULT_STORE,
+    ResultFile,
+    ResultStore,
+    get_result_file_with_output_policy
+)
+from py_conf_mcp.utils.memory import account_memory
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+# larger results are returned in pages of this size (see `get_more_results`)
+DEFAULT_MAX_CHUNKED_RESULT_BYTES = 1024 * 1024
+
+
+_END_OF_CHUNKS = object()
+
+
+def is_chunk_iterator(result: Any) -> bool:
+    return (
+        isinstance(result, Iterator)
+        and not isinstance(result, (str, bytes, Mapping))
+    )
+
+
+async def report_chunk_progress(progress: int):
+    try:
+        context = get_context()
+        await context.report_progress(progress=progress)
+    except (RuntimeError, LookupError, ValueError):
+        # no active request (e.g. when called directly)
+        pass
+
+
+async def get_chunked_result(
+    chunks: Iterator[str],
+    max_bytes: int = DEFAULT_MAX_CHUNKED_RESULT_BYTES,
+    result_store: ResultStore = DEFAULT_RESULT_STORE
+) -> Any:
+    '''
+    Consumes the chunks in a worker thread, so that producing a chunk
+    (e.g. fetching the next result page) does not block the event loop,
+    while reporting progress to the client after every chunk.
+    MCP has no partial tool results, so the chunks are spooled to a temporary file
+    (kept in memory up to `max_bytes`). A larger result is returned in pages,
+    with a cursor for `get_more_results`.
+    '''
+    spooled_file = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=max_bytes
+    )
+    size = 0
+    chunk_count = 0
+    try:
+        while True:
+            chunk: Any = await anyio.to_thread.run_sync(next, chunks, _END_OF_CHUNKS)
+            if chunk is _END_OF_CHUNKS:
+                break
+            size += await anyio.to_thread.run_sync(spooled_file.write, chunk.encode('utf-8'))
+            chunk_count += 1
+            await report_chunk_progress(chunk_count)
+    except BaseException:
+        spooled_file.close()
+        raise
+    LOGGER.debug('spooled %d chunks (%d bytes)', chunk_count, size)
+    if size <= max_bytes:
+        with spooled_file:
+            spooled_file.seek(0)
+            content = spooled_file.read().decode('utf-8')
+        account_memory(len(content))
+        return content
+    result = get_result_file_with_output_policy(
+        ResultFile(spooled_file, size=size),
+        output_policy=OutputPolicyConfig(max_bytes=max_bytes, enable_cursor=True),
+        result_store=result_store
+    )
+    account_memory(len(result['content']))
+    return result
+
+
+def get_tool_function_with_chunked_result(tool_fn: Callable) -> Callable:
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        result = tool_fn(**kwargs)
+        if is_chunk_iterator(result):
+            return get_chunked_result(result)
+        return result
+
+    return wrapper
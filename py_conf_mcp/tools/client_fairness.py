@@ -0,0 +1,371 @@
+from collections import deque
+from dataclasses import dataclass, field
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Optional, Tuple
+
+import anyio
+from fastmcp.server.dependencies import get_http_request
+
+from py_conf_mcp.config import ClientFairnessConfig
+from py_conf_mcp.tools.admission_control import AdmissionRejectedError
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_CLIENT_ID = 'default'
+
+# the session of the SSE transport, which is validated by the transport
+SSE_SESSION_ID_QUERY_PARAMETER = 'session_id'
+
+QUEUE_FULL_RETRY_AFTER_SECONDS = 1.0
+
+# expired quota windows are only purged once there are more entries than this
+MAX_QUOTA_WINDOWS_BEFORE_PURGE = 10_000
+
+
+class QuotaExceededError(RuntimeError):
+    '''
+    Raised for calls exceeding the tool call quota of a client,
+    which can be retried once the quota window ends.
+    '''
+
+    def __init__(self, tool_name: str, max_calls: int, retry_after_seconds: float):
+        super().__init__(
+            f'Quota exceeded for {repr(tool_name)} ({max_calls} calls per window),'
+            f' retryable: please retry after {retry_after_seconds:.1f} seconds'
+        )
+        self.tool_name = tool_name
+        self.max_calls = max_calls
+        self.retry_after_seconds = retry_after_seconds
+
+
+def get_hashed_client_id(client_id: str) -> str:
+    # e.g. for API keys, which shouldn't end up in logs or metrics
+    return hashlib.sha256(client_id.encode('utf-8')).hexdigest()[:16]
+
+
+def get_client_id_from_header(header_name: str) -> Optional[str]:
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        # not an HTTP request (e.g. stdio)
+        return None
+    return request.headers.get(header_name) or None
+
+
+def get_client_id_from_session_or_remote_address() -> Optional[str]:
+    # only sessions lasting longer than a request identify a client, i.e. SSE sessions:
+    # with (stateless) streamable HTTP, every request has its own session,
+    # which would result in new client states and metric labels for every call
+    # (the remote address is used instead, which may be shared, e.g. behind a proxy)
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        # not an HTTP request (e.g. stdio, with a single client)
+        return None
+    session_id = request.query_params.get(SSE_SESSION_ID_QUERY_PARAMETER)
+    if session_id:
+        return f'session-{session_id}'
+    if request.client is not None and request.client.host:
+        return f'address-{request.client.host}'
+    return None
+
+
+def get_client_id(config: ClientFairnessConfig) -> str:
+    client_id: Optional[str] = None
+    if config.client_id_header:
+        client_id = get_client_id_from_header(config.client_id_header)
+    if client_id is None:
+        client_id = get_client_id_from_session_or_remote_address()
+        return client_id or DEFAULT_CLIENT_ID
+    if config.hash_client_id:
+        return get_hashed_client_id(client_id)
+    return client_id
+
+
+def check_client_fairness_config_for_transport(config: ClientFairnessConfig, transport: str):
+    if config and transport == 'streamable-http' and not config.client_id_header:
+        LOGGER.warning(
+            'Client fairness without clientIdHeader: streamable HTTP has no client sessions,'
+            ' clients are identified by their remote address instead'
+        )
+
+
+class ToolQuotaLimiter:
+    '''
+    Counts tool calls per client and tool within fixed time windows.
+    '''
+
+    def __init__(self, time_fn: Callable[[], float] = time.monotonic):
+        self.time_fn = time_fn
+        # (client id, tool name) -> (window start, call count)
+        self._windows: dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired_windows(self, now: float, config: ClientFairnessConfig):
+        self._windows = {
+            (client_id, tool_name): (window_start, call_count)
+            for (client_id, tool_name), (window_start, call_count) in self._windows.items()
+            if (
+                tool_name in config.tool_quotas
+                and now - window_start < config.tool_quotas[tool_name].window_seconds
+            )
+        }
+
+    def check_and_count(self, config: ClientFairnessConfig, client_id: str, tool_name: str):
+        tool_quota = config.tool_quotas.get(tool_name)
+        if tool_quota is None:
+            return
+        key = (client_id, tool_name)
+        with self._lock:
+            now = self.time_fn()
+            if len(self._windows) > MAX_QUOTA_WINDOWS_BEFORE_PURGE:
+                self._purge_expired_windows(now, config)
+            window_start, call_count = self._windows.get(key, (now, 0))
+            if now - window_start >= tool_quota.window_seconds:
+                window_start, call_count = now, 0
+            if call_count >= tool_quota.max_calls:
+                retry_after_seconds = window_start + tool_quota.window_seconds - now
+            else:
+                self._windows[key] = (window_start, call_count + 1)
+                return
+        DEFAULT_METRICS_REGISTRY.increment(
+            'py_conf_mcp_quota_rejected_calls_total',
+            labels={'tool': tool_name, 'client': client_id}
+        )
+        raise QuotaExceededError(
+            tool_name,
+            max_calls=tool_quota.max_calls,
+            retry_after_seconds=retry_after_seconds
+        )
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+
+@dataclass
+class _QueuedCall:
+    client_id: str
+    start_tag: float
+    finish_tag: float
+    event: anyio.Event = field(default_factory=anyio.Event)
+    is_granted: bool = False
+
+
+@dataclass
+class _ClientState:
+    running_calls: int = 0
+    last_finish_tag: float = 0.0
+    queued_calls: Deque[_QueuedCall] = field(default_factory=deque)
+
+
+class FairCallScheduler:
+    '''
+    Limits the concurrent calls (overall and per client) and grants the available
+    slots by start-time fair queuing: every call advances the virtual time of its
+    client by 1 / weight, and the queued call with the lowest finish tag goes first.
+    This way, a client sending many (slow) calls can't starve the other clients.
+    '''
+
+    def __init__(self, config: Optional[ClientFairnessConfig] = None):
+        self.config = config or ClientFairnessConfig()
+        self.running_calls = 0
+        self._virtual_time = 0.0
+        self._client_states: dict[str, _ClientState] = {}
+
+    def configure(self, config: ClientFairnessConfig):
+        self.config = config
+        self._dispatch()
+
+    def get_weight(self, client_id: str) -> float:
+        return self.config.client_weights.get(client_id, 1.0)
+
+    def _get_client_state(self, client_id: str) -> _ClientState:
+        client_state = self._client_states.get(client_id)
+        if client_state is None:
+            client_state = _ClientState(last_finish_tag=self._virtual_time)
+            self._client_states[client_id] = client_state
+        return client_state
+
+    def _update_client_metrics(self, client_id: str, client_state: _ClientState):
+        labels = {'client': client_id}
+        if not client_state.running_calls and not client_state.queued_calls:
+            # the client is idle, its gauges are added again with its next call
+            DEFAULT_METRICS_REGISTRY.remove('py_conf_mcp_client_running_calls', labels=labels)
+            DEFAULT_METRICS_REGISTRY.remove('py_conf_mcp_client_queued_calls', labels=labels)
+            return
+        DEFAULT_METRICS_REGISTRY.set_gauge(
+            'py_conf_mcp_client_running_calls', client_state.running_calls, labels=labels
+        )
+        DEFAULT_METRICS_REGISTRY.set_gauge(
+            'py_conf_mcp_client_queued_calls', len(client_state.queued_calls), labels=labels
+        )
+
+    def _is_client_below_limit(self, client_state: _ClientState) -> bool:
+        max_calls = self.config.max_concurrent_calls_per_client
+        return max_calls is None or client_state.running_calls < max_calls
+
+    def _is_below_limit(self) -> bool:
+        max_calls = self.config.max_concurrent_calls
+        return max_calls is None or self.running_calls < max_calls
+
+    def _get_next_queued_call(self) -> Optional[_QueuedCall]:
+        next_queued_call: Optional[_QueuedCall] = None
+        for client_state in self._client_states.values():
+            if not client_state.queued_calls or not self._is_client_below_limit(client_state):
+                continue
+            queued_call = client_state.queued_calls[0]
+            if next_queued_call is None or queued_call.finish_tag < next_queued_call.finish_tag:
+                next_queued_call = queued_call
+        return next_queued_call
+
+    def _dispatch(self):
+        while self._is_below_limit():
+            queued_call = self._get_next_queued_call()
+            if queued_call is None:
+                break
+            client_state = self._client_states[queued_call.client_id]
+            client_state.queued_calls.popleft()
+            client_state.running_calls += 1
+            self.running_calls += 1
+            self._virtual_time = max(self._virtual_time, queued_call.start_tag)
+            queued_call.is_granted = True
+            queued_call.event.set()
+            self._update_client_metrics(queued_call.client_id, client_state)
+
+    def _remove_client_state_if_idle(self, client_id: str, client_state: _ClientState):
+        # clients without calls only keep their place in virtual time while not idle
+        if not client_state.running_calls and not client_state.queued_calls:
+            del self._client_states[client_id]
+
+    def check_queue_available(self, client_id: str):
+        # without creating a client state, e.g. before counting the call against a quota
+        max_queued_calls = self.config.max_queued_calls_per_client
+        if max_queued_calls is None:
+            return
+        client_state = self._client_states.get(client_id) or _ClientState()
+        if self._is_below_limit() and self._is_client_below_limit(client_state):
+            # the call won't be queued
+            return
+        queued_calls = len(client_state.queued_calls)
+        if queued_calls >= max_queued_calls:
+            DEFAULT_METRICS_REGISTRY.increment(
+                'py_conf_mcp_client_queue_rejected_calls_total',
+                labels={'client': client_id}
+            )
+            raise AdmissionRejectedError(
+                f'queued calls of client: {queued_calls}',
+                retry_after_seconds=QUEUE_FULL_RETRY_AFTER_SECONDS
+            )
+
+    async def acquire(self, client_id: str):
+        self.check_queue_available(client_id)
+        client_state = self._get_client_state(client_id)
+        start_tag = max(self._virtual_time, client_state.last_finish_tag)
+        queued_call = _QueuedCall(
+            client_id=client_id,
+            start_tag=start_tag,
+            finish_tag=start_tag + 1.0 / self.get_weight(client_id)
+        )
+        client_state.last_finish_tag = queued_call.finish_tag
+        client_state.queued_calls.append(queued_call)
+        self._dispatch()
+        if queued_call.is_granted:
+            return
+        self._update_client_metrics(client_id, client_state)
+        try:
+            await queued_call.event.wait()
+        except BaseException:
+            if queued_call.is_granted:
+                self.release(client_id)
+            else:
+                client_state.queued_calls.remove(queued_call)
+                self._update_client_metrics(client_id, client_state)
+                self._remove_client_state_if_idle(client_id, client_state)
+            raise
+
+    def release(self, client_id: str):
+        client_state = self._client_states[client_id]
+        client_state.running_calls -= 1
+        self.running_calls -= 1
+        self._update_client_metrics(client_id, client_state)
+        self._remove_client_state_if_idle(client_id, client_state)
+        self._dispatch()
+
+    def get_queued_calls(self, client_id: str) -> int:
+        client_state = self._client_states.get(client_id)
+        return len(client_state.queued_calls) if client_state else 0
+
+
+class ClientFairnessController:
+    def __init__(self, config: Optional[ClientFairnessConfig] = None):
+        self.config = config or ClientFairnessConfig()
+        self.quota_limiter = ToolQuotaLimiter()
+        self.scheduler = FairCallScheduler(self.config)
+
+    def configure(self, config: ClientFairnessConfig):
+        self.config = config
+        self.scheduler.configure(config)
+
+
+DEFAULT_CLIENT_FAIRNESS_CONTROLLER = ClientFairnessController()
+
+
+async def _get_scheduled_result(  # pylint: disable=too-many-arguments
+    tool_fn: Callable,
+    kwargs: dict,
+    *,
+    client_id: str,
+    tool_name: str,
+    config: ClientFairnessConfig,
+    client_fairness_controller: ClientFairnessController
+) -> Any:
+    scheduler = client_fairness_controller.scheduler
+    # a call rejected by a full queue doesn't count against the quota
+    # (without awaiting in between, the queue can't fill up before acquiring)
+    scheduler.check_queue_available(client_id)
+    client_fairness_controller.quota_limiter.check_and_count(config, client_id, tool_name)
+    await scheduler.acquire(client_id)
+    try:
+        result = tool_fn(**kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    finally:
+        scheduler.release(client_id)
+
+
+def get_tool_function_with_client_fairness(
+    tool_fn: Callable,
+    tool_name: str,
+    client_fairness_controller: ClientFairnessController = DEFAULT_CLIENT_FAIRNESS_CONTROLLER
+) -> Callable:
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        config = client_fairness_controller.config
+        if not config:
+            return tool_fn(**kwargs)
+        client_id = get_client_id(config)
+        if not config.is_queuing_enabled:
+            client_fairness_controller.quota_limiter.check_and_count(
+                config, client_id, tool_name
+            )
+            return tool_fn(**kwargs)
+        return _get_scheduled_result(
+            tool_fn,
+            kwargs,
+            client_id=client_id,
+            tool_name=tool_name,
+            config=config,
+            client_fairness_controller=client_fairness_controller
+        )
+
+    return wrapper
@@ -0,0 +1,155 @@
+from contextlib import contextmanager
+import functools
+import inspect
+import logging
+import random
+import threading
+import tracemalloc
+from typing import Any, Awaitable, Callable, Iterator
+
+from py_conf_mcp.config import MemoryBudgetConfig
+from py_conf_mcp.utils.memory import MemoryBudget, memory_budget_context
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class MemoryTracer:
+    '''
+    Measures the peak allocation of sampled tool calls via tracemalloc,
+    which is only enabled while a sampled call is running.
+    As tracemalloc is process wide, only one call is traced at a time,
+    and the peak includes allocations of concurrent calls.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def trace_peak_memory(self, tool_name: str) -> Iterator[None]:
+        if not self._lock.acquire(blocking=False):
+            # already tracing another call
+            yield
+            return
+        try:
+            was_tracing = tracemalloc.is_tracing()
+            if not was_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            start_bytes, _ = tracemalloc.get_traced_memory()
+            try:
+                yield
+            finally:
+                _, peak_bytes = tracemalloc.get_traced_memory()
+                if not was_tracing:
+                    tracemalloc.stop()
+                LOGGER.info(
+                    'Peak memory of %r call: %d bytes', tool_name, peak_bytes - start_bytes
+                )
+                DEFAULT_METRICS_REGISTRY.set_gauge(
+                    'py_conf_mcp_tool_call_peak_memory_bytes',
+                    peak_bytes - start_bytes,
+                    labels={'tool': tool_name}
+                )
+        finally:
+            self._lock.release()
+
+
+DEFAULT_MEMORY_TRACER = MemoryTracer()
+
+
+def record_memory_budget_metrics(
+    memory_budget: MemoryBudget,
+    tool_name: str
+):
+    labels = {'tool': tool_name}
+    DEFAULT_METRICS_REGISTRY.set_gauge(
+        'py_conf_mcp_tool_call_accounted_memory_bytes', memory_budget.used_bytes, labels=labels
+    )
+    if memory_budget.exceeded_error is not None:
+        LOGGER.warning('Aborted %r call: %s', tool_name, memory_budget.exceeded_error)
+        DEFAULT_METRICS_REGISTRY.increment(
+            'py_conf_mcp_memory_budget_exceeded_total', labels=labels
+        )
+
+
+def get_result_within_memory_budget(
+    call_fn: Callable[[], Any],
+    memory_budget: MemoryBudget,
+    tool_name: str
+) -> Any:
+    try:
+        with memory_budget_context(memory_budget):
+            return call_fn()
+    except BaseException as exc:
+        if memory_budget.exceeded_error is not None and exc is not memory_budget.exceeded_error:
+            # e.g. wrapped in an exception group by concurrent page fetches
+            raise memory_budget.exceeded_error from exc
+        raise
+    finally:
+        record_memory_budget_metrics(memory_budget, tool_name)
+
+
+async def get_awaited_result_within_memory_budget(
+    awaitable: Awaitable,
+    memory_budget: MemoryBudget,
+    tool_name: str
+) -> Any:
+    # within the awaiting task, so that worker threads inherit the budget
+    with memory_budget_context(memory_budget):
+        try:
+            return await awaitable
+        except BaseException as exc:
+            exceeded_error = memory_budget.exceeded_error
+            if exceeded_error is not None and exc is not exceeded_error:
+                raise exceeded_error from exc
+            raise
+        finally:
+            record_memory_budget_metrics(memory_budget, tool_name)
+
+
+async def get_traced_awaited_result(
+    awaitable: Awaitable,
+    tool_name: str,
+    memory_tracer: MemoryTracer
+) -> Any:
+    with memory_tracer.trace_peak_memory(tool_name):
+        return await awaitable
+
+
+def get_tool_function_with_memory_budget(
+    tool_fn: Callable,
+    memory_budget_config: MemoryBudgetConfig,
+    tool_name: str,
+    memory_tracer: MemoryTracer = DEFAULT_MEMORY_TRACER
+) -> Callable:
+    '''
+    Accounts the memory of the result built by each call against the budget,
+    aborting the call once it is exceeded.
+    Awaitable results (e.g. chunked results) are accounted while awaited.
+    '''
+    def get_result(**kwargs) -> Any:
+        memory_budget = MemoryBudget(max_bytes=memory_budget_config.max_bytes)
+        result = get_result_within_memory_budget(
+            functools.partial(tool_fn, **kwargs),
+            memory_budget=memory_budget,
+            tool_name=tool_name
+        )
+        if inspect.isawaitable(result):
+            return get_awaited_result_within_memory_budget(
+                result, memory_budget=memory_budget, tool_name=tool_name
+            )
+        return result
+
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        if random.random() >= memory_budget_config.trace_sample_rate:
+            return get_result(**kwargs)
+        with memory_tracer.trace_peak_memory(tool_name):
+            result = get_result(**kwargs)
+            if not inspect.isawaitable(result):
+                return result
+        return get_traced_awaited_result(result, tool_name, memory_tracer)
+
+    return wrapper
@@ -0,0 +1,360 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+import logging
+import secrets
+import threading
+import time
+from typing import IO, Any, Callable, Mapping, Optional, Sequence
+
+from mcp.types import TextContent
+
+from py_conf_mcp.config import OutputPolicyConfig
+from py_conf_mcp.utils.awaitable import get_mapped_maybe_awaitable
+from py_conf_mcp.utils.json import get_json_bytes, get_json_str
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_RESULT_STORE_MAX_ENTRIES = 100
+
+DEFAULT_RESULT_STORE_TTL_SECONDS = 600.0
+
+
+class TruncationStrategies:
+    HEAD = 'head'
+    SAMPLE = 'sample'
+    SUMMARIZE = 'summarize'
+
+
+class InvalidCursorError(KeyError):
+    pass
+
+
+class ResultFile:
+    '''
+    Result content spooled to a (temporary) file, e.g. a chunked result,
+    which is read page by page rather than kept in memory.
+    '''
+
+    def __init__(self, file: IO[bytes], size: int):
+        self.file = file
+        self.size = size
+        self._lock = threading.Lock()
+
+    def read_page(self, offset: int, max_bytes: int) -> str:
+        with self._lock:
+            self.file.seek(offset)
+            # at least one (whole) character, so that a cursor makes progress
+            data = self.file.read(max(max_bytes, 4))
+        # the last character may be incomplete
+        return get_str_truncated_to_max_bytes(
+            data.decode('utf-8', errors='ignore'),
+            max_bytes
+        )
+
+    def close(self):
+        self.file.close()
+
+
+@dataclass(frozen=True)
+class StoredResult:
+    remaining: Sequence[Any] | str | ResultFile
+    output_policy: OutputPolicyConfig
+    offset: int
+    total: int
+    expires_at: float
+
+
+class ResultStore:
+    '''
+    Bounded in-memory store for the remainder of truncated results.
+    '''
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESULT_STORE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_RESULT_STORE_TTL_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._stored_results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(  # pylint: disable=too-many-arguments
+        self,
+        remaining: Sequence[Any] | str | ResultFile,
+        *,
+        output_policy: OutputPolicyConfig,
+        offset: int,
+        total: int
+    ) -> str:
+        cursor = secrets.token_urlsafe(16)
+        stored_result = StoredResult(
+            remaining=remaining,
+            output_policy=output_policy,
+            offset=offset,
+            total=total,
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+        with self._lock:
+            self._stored_results[cursor] = stored_result
+            while len(self._stored_results) > self.max_entries:
+                self._stored_results.popitem(last=False)
+        return cursor
+
+    def pop(self, cursor: str) -> StoredResult:
+        with self._lock:
+            stored_result = self._stored_results.pop(cursor, None)
+        if stored_result is None or stored_result.expires_at < time.monotonic():
+            raise InvalidCursorError(f'Unknown or expired cursor: {repr(cursor)}')
+        return stored_result
+
+    def __len__(self) -> int:
+        return len(self._stored_results)
+
+
+DEFAULT_RESULT_STORE = ResultStore()
+
+
+def get_json_size(value: Any) -> int:
+    return len(get_json_bytes(value))
+
+
+def get_item_count_within_max_bytes(items: Sequence[Any], max_bytes: int) -> int:
+    # '[' and ']', followed by ',' between items
+    size = 2
+    for index, item in enumerate(items):
+        size += get_json_size(item) + (1 if index else 0)
+        if size > max_bytes:
+            return index
+    return len(items)
+
+
+def get_sampled_items(items: Sequence[Any], count: int) -> Sequence[Any]:
+    if count <= 0:
+        return []
+    if count >= len(items):
+        return list(items)
+    step = len(items) / count
+    return [items[int(index * step)] for index in range(count)]
+
+
+def get_items_summary(items: Sequence[Any]) -> dict:
+    field_counts: dict[str, int] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for key, value in item.items():
+            if value is not None:
+                field_counts[key] = field_counts.get(key, 0) + 1
+    return {
+        'total_items': len(items),
+        'non_null_counts_by_field': field_counts
+    }
+
+
+def get_str_truncated_to_max_bytes(value: str, max_bytes: int) -> str:
+    truncated = value.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
+    if not truncated:
+        # always return at least one (whole) character, so that a cursor makes progress
+        return value[:1]
+    # prefer ending on a complete line (e.g. for CSV)
+    last_line_end = truncated.rfind('\n')
+    if last_line_end > 0:
+        return truncated[:last_line_end + 1]
+    return truncated
+
+
+def get_str_with_output_policy(
+    value: str,
+    output_policy: OutputPolicyConfig,
+    result_store: ResultStore,
+    offset: int = 0,
+    total: Optional[int] = None
+) -> Any:
+    total = len(value) + offset if total is None else total
+    content = value
+    if output_policy.max_bytes and len(value.encode('utf-8')) > output_policy.max_bytes:
+        content = get_str_truncated_to_max_bytes(value, output_policy.max_bytes)
+    if content == value:
+        # e.g. a single character exceeding max_bytes
+        if not offset:
+            return value
+        return {
+            'content': value,
+            'truncated': False,
+            'offset': offset,
+            'total_length': total
+        }
+    LOGGER.info(
+        'truncating result (length: %d, returned: %d)',
+        len(value), len(content)
+    )
+    result: dict[str, Any] = {
+        'content': content,
+        'truncated': True,
+        'offset': offset,
+        'total_length': total
+    }
+    if output_policy.enable_cursor:
+        result['cursor'] = result_store.put(
+            value[len(content):],
+            output_policy=output_policy,
+            offset=offset + len(content),
+            total=total
+        )
+    return result
+
+
+def get_result_file_with_output_policy(
+    result_file: ResultFile,
+    output_policy: OutputPolicyConfig,
+    result_store: ResultStore,
+    offset: int = 0
+) -> Any:
+    # the offset and total length are in bytes
+    assert output_policy.max_bytes
+    content = result_file.read_page(offset, output_policy.max_bytes)
+    next_offset = offset + len(content.encode('utf-8'))
+    result: dict[str, Any] = {
+        'content': content,
+        'truncated': next_offset < result_file.size,
+        'offset': offset,
+        'total_length': result_file.size
+    }
+    if next_offset >= result_file.size:
+        result_file.close()
+    elif output_policy.enable_cursor:
+        result['cursor'] = result_store.put(
+            result_file,
+            output_policy=output_policy,
+            offset=next_offset,
+            total=result_file.size
+        )
+    return result
+
+
+def get_items_with_output_policy(
+    items: Sequence[Any],
+    output_policy: OutputPolicyConfig,
+    result_store: ResultStore,
+    offset: int = 0,
+    total: Optional[int] = None
+) -> Any:
+    total = len(items) + offset if total is None else total
+    count = len(items)
+    if output_policy.max_items is not None:
+        count = min(count, output_policy.max_items)
+    if output_policy.max_bytes is not None and count:
+        # always return at least one item, so that a cursor makes progress
+        count = max(
+            1,
+            get_item_count_within_max_bytes(items[:count], output_policy.max_bytes)
+        )
+    if count == len(items):
+        if not offset:
+            return items
+        return {
+            'items': list(items),
+            'truncated': False,
+            'offset': offset,
+            'total_items': total
+        }
+    LOGGER.info(
+        'truncating result (strategy: %r, items: %d, returned: %d)',
+        output_policy.truncation_strategy, len(items), count
+    )
+    if output_policy.truncation_strategy == TruncationStrategies.SUMMARIZE:
+        return {**get_items_summary(items), 'truncated': True}
+    if output_policy.truncation_strategy == TruncationStrategies.SAMPLE:
+        return {
+            'items': get_sampled_items(items, count),
+            'truncated': True,
+            'total_items': total
+        }
+    result: dict[str, Any] = {
+        'items': list(items[:count]),
+        'truncated': True,
+        'offset': offset,
+        'total_items': total
+    }
+    if output_policy.enable_cursor:
+        result['cursor'] = result_store.put(
+            items[count:],
+            output_policy=output_policy,
+            offset=offset + count,
+            total=total
+        )
+    return result
+
+
+def get_result_with_output_policy(
+    result: Any,
+    output_policy: OutputPolicyConfig,
+    result_store: ResultStore = DEFAULT_RESULT_STORE
+) -> Any:
+    if isinstance(result, TextContent):
+        if not output_policy.max_bytes:
+            return result
+        result = result.text
+    if isinstance(result, Mapping):
+        if not output_policy.max_bytes or get_json_size(result) <= output_policy.max_bytes:
+            return result
+        # e.g. a JSON object response, truncated (and paged) as serialized JSON
+        result = get_json_str(result)
+    if isinstance(result, str):
+        return get_str_with_output_policy(result, output_policy, result_store)
+    if isinstance(result, (list, tuple)):
+        return get_items_with_output_policy(result, output_policy, result_store)
+    return result
+
+
+def get_tool_function_with_output_policy(
+    tool_fn: Callable,
+    output_policy: OutputPolicyConfig,
+    result_store: ResultStore = DEFAULT_RESULT_STORE
+) -> Callable:
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        return get_mapped_maybe_awaitable(
+            tool_fn(**kwargs),
+            functools.partial(
+                get_result_with_output_policy,
+                output_policy=output_policy,
+                result_store=result_store
+            )
+        )
+
+    return wrapper
+
+
+def get_more_results(cursor: str) -> Any:
+    '''
+    Fetches the next part of a truncated tool result.
+    Pass the `cursor` returned with the truncated result.
+    '''
+    stored_result = DEFAULT_RESULT_STORE.pop(cursor)
+    if isinstance(stored_result.remaining, ResultFile):
+        return get_result_file_with_output_policy(
+            stored_result.remaining,
+            output_policy=stored_result.output_policy,
+            result_store=DEFAULT_RESULT_STORE,
+            offset=stored_result.offset
+        )
+    if isinstance(stored_result.remaining, str):
+        return get_str_with_output_policy(
+            stored_result.remaining,
+            output_policy=stored_result.output_policy,
+            result_store=DEFAULT_RESULT_STORE,
+            offset=stored_result.offset,
+            total=stored_result.total
+        )
+    return get_items_with_output_policy(
+        stored_result.remaining,
+        output_policy=stored_result.output_policy,
+        result_store=DEFAULT_RESULT_STORE,
+        offset=stored_result.offset,
+        total=stored_result.total
+    )
@@ -0,0 +1,216 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import inspect
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import anyio
+
+from py_conf_mcp.config import RefreshAheadConfig
+from py_conf_mcp.tools.result_cache import ResultCache
+from py_conf_mcp.utils.signature import get_arguments_with_defaults
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_REFRESH_AHEAD_MAX_WORKERS = 4
+
+MAX_SCHEDULER_WAIT_SECONDS = 1.0
+
+
+async def _get_awaited(value: Any) -> Any:
+    return await value
+
+
+def get_resolved_result(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        # only called from worker threads, without a running event loop
+        return anyio.run(_get_awaited, result)
+    return result
+
+
+def refresh_result_cache_entry(
+    tool_fn: Callable,
+    result_cache: ResultCache,
+    arguments: Mapping[str, Any]
+):
+    # use the same key as calls via FastMCP, which passes all inputs
+    kwargs = get_arguments_with_defaults(tool_fn, arguments)
+    result_cache.set(kwargs, get_resolved_result(tool_fn(**kwargs)))
+
+
+def get_jittered_interval(interval_seconds: float, jitter_ratio: float) -> float:
+    jitter_seconds = interval_seconds * jitter_ratio
+    return max(0.0, interval_seconds + random.uniform(-jitter_seconds, jitter_seconds))
+
+
+@dataclass(frozen=True)
+class RefreshAheadRegistration:
+    '''
+    The refresh-ahead of a resolved tool, to be added to a scheduler
+    once the tool is registered with the server.
+    '''
+    refresh_fn: Callable[[Mapping[str, Any]], Any]
+    refresh_ahead_config: RefreshAheadConfig
+
+
+@dataclass
+class RefreshAheadEntry:
+    tool_name: str
+    refresh_fn: Callable[[Mapping[str, Any]], Any]
+    refresh_ahead_config: RefreshAheadConfig
+    next_refresh_at: float
+    is_running: bool = False
+
+
+def get_new_refresh_ahead_entry(
+    tool_name: str,
+    registration: RefreshAheadRegistration
+) -> RefreshAheadEntry:
+    refresh_ahead_config = registration.refresh_ahead_config
+    # the first refresh warms up the cache, jittered within the first interval
+    first_refresh_at = time.monotonic() + random.uniform(
+        0, refresh_ahead_config.interval_seconds * refresh_ahead_config.jitter_ratio
+    )
+    return RefreshAheadEntry(
+        tool_name=tool_name,
+        refresh_fn=registration.refresh_fn,
+        refresh_ahead_config=refresh_ahead_config,
+        next_refresh_at=first_refresh_at
+    )
+
+
+class RefreshAheadScheduler:
+    '''
+    Periodically calls tools with the configured inputs in the background,
+    to keep their result cache entries warm.
+    Refreshes are jittered, so that tools sharing an interval spread out.
+    '''
+
+    def __init__(self, max_workers: int = DEFAULT_REFRESH_AHEAD_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._entries: dict[str, RefreshAheadEntry] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def add(
+        self,
+        tool_name: str,
+        refresh_fn: Callable[[Mapping[str, Any]], Any],
+        refresh_ahead_config: RefreshAheadConfig
+    ):
+        with self._lock:
+            self._entries[tool_name] = get_new_refresh_ahead_entry(
+                tool_name,
+                RefreshAheadRegistration(
+                    refresh_fn=refresh_fn,
+                    refresh_ahead_config=refresh_ahead_config
+                )
+            )
+
+    def remove(self, tool_name: str):
+        with self._lock:
+            self._entries.pop(tool_name, None)
+
+    def update(
+        self,
+        registration_by_tool_name: Mapping[str, RefreshAheadRegistration],
+        removed_tool_names: Sequence[str] = ()
+    ):
+        # in one step, e.g. together with swapping the tools of a config reload
+        with self._lock:
+            for tool_name in removed_tool_names:
+                self._entries.pop(tool_name, None)
+            for tool_name, registration in registration_by_tool_name.items():
+                self._entries[tool_name] = get_new_refresh_ahead_entry(tool_name, registration)
+
+    def refresh(self, entry: RefreshAheadEntry):
+        start_time = time.monotonic()
+        try:
+            for arguments in entry.refresh_ahead_config.inputs:
+                try:
+                    entry.refresh_fn(arguments)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    # the previous entry is kept until it expires
+                    LOGGER.warning(
+                        'Failed to refresh %r with %r: %r', entry.tool_name, arguments, exc
+                    )
+        finally:
+            LOGGER.info(
+                'Refreshed %r (%d inputs) in %.3fs',
+                entry.tool_name,
+                len(entry.refresh_ahead_config.inputs),
+                time.monotonic() - start_time
+            )
+            entry.is_running = False
+
+    def get_due_entries(self, now: float) -> list[RefreshAheadEntry]:
+        due_entries = []
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.is_running or entry.next_refresh_at > now:
+                    continue
+                entry.is_running = True
+                entry.next_refresh_at = now + get_jittered_interval(
+                    entry.refresh_ahead_config.interval_seconds,
+                    entry.refresh_ahead_config.jitter_ratio
+                )
+                due_entries.append(entry)
+        return due_entries
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        due_entries = self.get_due_entries(time.monotonic() if now is None else now)
+        for entry in due_entries:
+            if self._executor is not None:
+                self._executor.submit(self.refresh, entry)
+            else:
+                self.refresh(entry)
+        return len(due_entries)
+
+    def get_wait_seconds(self) -> float:
+        with self._lock:
+            next_refresh_at = min(
+                (entry.next_refresh_at for entry in self._entries.values()),
+                default=None
+            )
+        if next_refresh_at is None:
+            return MAX_SCHEDULER_WAIT_SECONDS
+        return min(
+            MAX_SCHEDULER_WAIT_SECONDS,
+            max(0.0, next_refresh_at - time.monotonic())
+        )
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.run_pending()
+            self._stop_event.wait(self.get_wait_seconds())
+
+    def start(self):
+        LOGGER.info('Starting refresh-ahead for: %r', list(self._entries.keys()))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='refresh-ahead'
+        )
+        self._thread = threading.Thread(
+            target=self._run, name='refresh-ahead-scheduler', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+DEFAULT_REFRESH_AHEAD_SCHEDULER = RefreshAheadScheduler()
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import functools
+import hashlib
 import importlib
 import inspect
+import json
 import logging
 from typing import Annotated, Any, Callable, Literal, Mapping, Optional, Sequence
 
@@ -11,9 +13,23 @@ import pydantic
 from py_conf_mcp.config import (
     FromPythonClassConfig,
     FromPythonFunctionConfig,
-    ToolDefinitionsConfig
+    LogConfig,
+    ToolDefinitionsConfig,
+    get_tool_config_by_name
 )
 from py_conf_mcp.config_typing import InputConfigDict
+from py_conf_mcp.tools.chunked import get_tool_function_with_chunked_result
+from py_conf_mcp.tools.memory_budget import get_tool_function_with_memory_budget
+from py_conf_mcp.tools.output_policy import get_tool_function_with_output_policy
+from py_conf_mcp.tools.refresh_ahead import (
+    RefreshAheadRegistration,
+    refresh_result_cache_entry
+)
+from py_conf_mcp.tools.result_cache import (
+    get_result_cache_for_config,
+    get_tool_function_with_result_cache
+)
+from py_conf_mcp.utils.logging import SamplingFilter, TruncatedLogValue
 
 
 LOGGER = logging.getLogger(__name__)
@@ -24,6 +40,8 @@ class Tool:
     tool_fn: Callable
     name: str
     description: Optional[str] = None
+    # added to the scheduler by the server registering the tool
+    refresh_ahead: Optional[RefreshAheadRegistration] = None
 
 
 class ToolResolver(ABC):
@@ -45,13 +63,78 @@ class InvalidToolNameError(KeyError):
     pass
 
 
+def get_tool_class(config: FromPythonClassConfig) -> type:
+    tool_module = importlib.import_module(config.module)
+    tool_class = getattr(tool_module, config.class_name)
+    assert isinstance(tool_class, type)
+    return tool_class
+
+
+def get_referenced_tool_names(
+    tool_config: FromPythonFunctionConfig | FromPythonClassConfig
+) -> Sequence[str]:
+    # other configured tools called by the tool (see `ToolClass.get_referenced_tool_names`)
+    if not isinstance(tool_config, FromPythonClassConfig):
+        return []
+    tool_class = get_tool_class(tool_config)
+    if not hasattr(tool_class, 'get_referenced_tool_names'):
+        return []
+    return tool_class.get_referenced_tool_names(tool_config.init_parameters)
+
+
+def get_tool_config_hash_dict(
+    tool_config: FromPythonFunctionConfig | FromPythonClassConfig,
+    tool_config_by_name: Mapping[str, FromPythonFunctionConfig | FromPythonClassConfig],
+    visited_tool_names: frozenset[str]
+) -> dict:
+    hash_dict: dict = {'type': type(tool_config).__name__, **asdict(tool_config)}
+    referenced_tool_names = [
+        tool_name
+        for tool_name in get_referenced_tool_names(tool_config)
+        if tool_name in tool_config_by_name and tool_name not in visited_tool_names
+    ]
+    if referenced_tool_names:
+        hash_dict['referencedTools'] = {
+            tool_name: get_tool_config_hash_dict(
+                tool_config_by_name[tool_name],
+                tool_config_by_name,
+                visited_tool_names=visited_tool_names | {tool_name}
+            )
+            for tool_name in referenced_tool_names
+        }
+    return hash_dict
+
+
+def get_tool_config_hash(
+    tool_config: FromPythonFunctionConfig | FromPythonClassConfig,
+    tool_definitions_config: Optional[ToolDefinitionsConfig] = None
+) -> str:
+    '''
+    With the tool definitions, the hash includes the config of referenced tools,
+    so that e.g. a composite tool changes with the tools of its branches.
+    '''
+    return hashlib.sha256(
+        json.dumps(
+            get_tool_config_hash_dict(
+                tool_config,
+                get_tool_config_by_name(tool_definitions_config)
+                if tool_definitions_config is not None
+                else {},
+                visited_tool_names=frozenset([tool_config.name])
+            ),
+            sort_keys=True,
+            default=str
+        ).encode('utf-8')
+    ).hexdigest()
+
+
 def get_tool_from_tool_class(
-    tool_class: type[Tool],
+    tool_class: type,
     init_parameters: Mapping[str, Any],
     available_kwargs: Mapping[str, Any]
-) -> Tool:
+) -> Any:
     parameters = inspect.signature(tool_class).parameters
-    LOGGER.info('tool_class: %r, parameters: %r', tool_class, parameters)
+    LOGGER.debug('tool_class: %r, parameters: %r', tool_class, parameters)
     extra_kwargs = {
         key: value
         for key, value in available_kwargs.items()
@@ -109,7 +192,7 @@ def get_tool_function_with_dynamic_parameters(
     inputs: Mapping[str, InputConfigDict],
     tool_name: str
 ) -> Callable:
-    LOGGER.info('inputs: %r', inputs)
+    LOGGER.debug('inputs: %r', TruncatedLogValue(inputs))
 
     @functools.wraps(tool_fn)
     def wrapper(**kwargs):
@@ -143,13 +226,36 @@ def get_tool_function_with_dynamic_parameters(
     return wrapper
 
 
+def get_tool_logger(
+    tool_name: str,
+    log_config: LogConfig
+) -> logging.Logger:
+    tool_logger = logging.getLogger(f'py_conf_mcp.tools.{tool_name}')
+    if log_config.level:
+        tool_logger.setLevel(log_config.level)
+    for log_filter in list(tool_logger.filters):
+        if isinstance(log_filter, SamplingFilter):
+            tool_logger.removeFilter(log_filter)
+    if log_config.sample_rate < 1.0:
+        tool_logger.addFilter(SamplingFilter(sample_rate=log_config.sample_rate))
+    return tool_logger
+
+
 def get_tool_from_python_class(
-    config: FromPythonClassConfig
+    config: FromPythonClassConfig,
+    tool_resolver: Optional[ToolResolver] = None,
+    tool_definitions_config: Optional[ToolDefinitionsConfig] = None
 ) -> Tool:
-    tool_module = importlib.import_module(config.module)
-    tool_class = getattr(tool_module, config.class_name)
-    assert isinstance(tool_class, type)
-    tool_fn = tool_class(**config.init_parameters)
+    tool_class = get_tool_class(config)
+    tool_fn = get_tool_from_tool_class(
+        tool_class,
+        init_parameters=config.init_parameters,
+        available_kwargs={
+            'logger': get_tool_logger(config.name, config.log),
+            'tool_name': config.name,
+            'tool_resolver': tool_resolver
+        }
+    )
 
     try:
         tool_fn = tool_fn.__call__
@@ -163,10 +269,35 @@ def get_tool_from_python_class(
             config.inputs,
             tool_name=config.name
         )
+    tool_fn = get_tool_function_with_chunked_result(tool_fn)
+    if config.memory_budget:
+        tool_fn = get_tool_function_with_memory_budget(
+            tool_fn,
+            config.memory_budget,
+            tool_name=config.name
+        )
+    refresh_ahead: Optional[RefreshAheadRegistration] = None
+    if config.result_cache:
+        result_cache = get_result_cache_for_config(
+            config.result_cache,
+            namespace=get_tool_config_hash(config, tool_definitions_config)
+        )
+        if config.refresh_ahead:
+            refresh_ahead = RefreshAheadRegistration(
+                refresh_fn=functools.partial(refresh_result_cache_entry, tool_fn, result_cache),
+                refresh_ahead_config=config.refresh_ahead
+            )
+        tool_fn = get_tool_function_with_result_cache(tool_fn, result_cache=result_cache)
+    if config.output_policy:
+        tool_fn = get_tool_function_with_output_policy(
+            tool_fn,
+            output_policy=config.output_policy
+        )
     return Tool(
         tool_fn=tool_fn,
         name=config.name,
-        description=config.description
+        description=config.description,
+        refresh_ahead=refresh_ahead
     )
 
 
@@ -184,5 +315,9 @@ class ConfigToolResolver(ToolResolver):
             self.tool_definitions_config.from_python_class
         ):
             if from_python_class_config.name == tool_name:
-                return get_tool_from_python_class(from_python_class_config)
+                return get_tool_from_python_class(
+                    from_python_class_config,
+                    tool_resolver=self,
+                    tool_definitions_config=self.tool_definitions_config
+                )
         raise InvalidToolNameError(f'Unrecognised tool: {repr(tool_name)}')
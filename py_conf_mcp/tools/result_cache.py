@@ -0,0 +1,304 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional, Protocol, Tuple
+
+import anyio.to_thread
+from mcp.types import TextContent
+
+from py_conf_mcp.config import ResultCacheConfig
+from py_conf_mcp.utils.awaitable import (
+    get_mapped_maybe_awaitable,
+    get_running_loop_or_none
+)
+from py_conf_mcp.utils.json import get_json_bytes
+
+try:
+    import redis  # type: ignore[import-not-found]
+except ImportError:
+    redis = None  # pylint: disable=invalid-name
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+
+SQLITE_PRUNE_EVERY_N_SETS = 100
+
+
+class ResultCacheBackends:
+    MEMORY = 'memory'
+    SQLITE = 'sqlite'
+    NETWORK = 'network'
+
+
+class ResultCacheBackend(ABC):
+    # whether get and set block on I/O (and shouldn't run on the event loop)
+    is_blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        pass
+
+
+class InMemoryResultCacheBackend(ResultCacheBackend):
+    '''
+    Bounded in-process LRU, only shared within the current process.
+    '''
+
+    is_blocking = False
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResultCacheBackend(ResultCacheBackend):
+    '''
+    File based cache that can be shared by multiple processes on the same host.
+    Uses SQLite in WAL mode, with one connection per thread.
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._set_count = 0
+        self._set_count_lock = threading.Lock()
+        parent_dir = os.path.dirname(path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        with self._get_connection() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS result_cache'
+                ' (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)'
+            )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._get_connection().execute(
+            'SELECT value FROM result_cache WHERE key = ? AND expires_at >= ?',
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        now = time.time()
+        with self._get_connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO result_cache (key, value, expires_at)'
+                ' VALUES (?, ?, ?)',
+                (key, value, now + ttl_seconds)
+            )
+            with self._set_count_lock:
+                self._set_count += 1
+                is_prune_due = self._set_count % SQLITE_PRUNE_EVERY_N_SETS == 0
+            if is_prune_due:
+                connection.execute('DELETE FROM result_cache WHERE expires_at < ?', (now,))
+
+
+class NetworkCacheClient(Protocol):
+    '''
+    The subset of a Redis-like client used by the network backend.
+    '''
+
+    def get(self, name: str) -> Optional[bytes]:
+        ...
+
+    def set(self, name: str, value: bytes, px: Optional[int] = None) -> Any:
+        ...
+
+
+class NetworkResultCacheBackend(ResultCacheBackend):
+    def __init__(self, client: NetworkCacheClient):
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        self.client.set(key, value, px=max(1, int(ttl_seconds * 1000)))
+
+
+def get_network_cache_client(url: str) -> NetworkCacheClient:
+    if redis is None:
+        raise ImportError('The network result cache backend requires the redis package')
+    return redis.Redis.from_url(url)
+
+
+@functools.lru_cache(maxsize=None)
+def get_result_cache_backend(result_cache_config: ResultCacheConfig) -> ResultCacheBackend:
+    # backends are shared by tools with the same cache config
+    backend = result_cache_config.backend
+    if backend == ResultCacheBackends.MEMORY:
+        return InMemoryResultCacheBackend(max_entries=result_cache_config.max_entries)
+    if backend == ResultCacheBackends.SQLITE:
+        if not result_cache_config.path:
+            raise ValueError('The sqlite result cache backend requires a path')
+        return SqliteResultCacheBackend(path=result_cache_config.path)
+    if backend == ResultCacheBackends.NETWORK:
+        if not result_cache_config.url:
+            raise ValueError('The network result cache backend requires a url')
+        return NetworkResultCacheBackend(get_network_cache_client(result_cache_config.url))
+    raise ValueError(f'Unsupported result cache backend: {repr(backend)}')
+
+
+def get_serialized_cache_value(result: Any) -> bytes:
+    # JSON rather than pickle, as loading a pickle from a shared cache could run code
+    if isinstance(result, TextContent):
+        result = result.text
+    elif isinstance(result, (bytes, bytearray)):
+        # already serialized JSON (passed through by the tool result serializer)
+        result = result.decode('utf-8')
+    return get_json_bytes(result)
+
+
+def get_deserialized_cache_value(value: bytes) -> Any:
+    return json.loads(value)
+
+
+def get_result_cache_key(namespace: str, kwargs: Mapping[str, Any]) -> str:
+    kwargs_hash = hashlib.sha256(get_json_bytes(sorted(kwargs.items()))).hexdigest()
+    return f'py_conf_mcp:{namespace}:{kwargs_hash}'
+
+
+class ResultCache:
+    '''
+    Tool result cache, with keys namespaced by the tool config hash,
+    so that a config change invalidates previous results.
+    '''
+
+    def __init__(
+        self,
+        backend: ResultCacheBackend,
+        namespace: str,
+        ttl_seconds: float
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+
+    def get_key(self, kwargs: Mapping[str, Any]) -> str:
+        return get_result_cache_key(self.namespace, kwargs)
+
+    def get(self, kwargs: Mapping[str, Any]) -> Tuple[bool, Any]:
+        key = self.get_key(kwargs)
+        try:
+            value = self.backend.get(key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning('Failed to read from result cache: %r', exc)
+            return False, None
+        if value is None:
+            return False, None
+        try:
+            return True, get_deserialized_cache_value(value)
+        except ValueError as exc:
+            LOGGER.warning('Failed to deserialize result cache value: %r', exc)
+            return False, None
+
+    def set(self, kwargs: Mapping[str, Any], result: Any) -> Any:
+        try:
+            self.backend.set(
+                self.get_key(kwargs),
+                get_serialized_cache_value(result),
+                ttl_seconds=self.ttl_seconds
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning('Failed to write to result cache: %r', exc)
+        return result
+
+    async def get_async(self, kwargs: Mapping[str, Any]) -> Tuple[bool, Any]:
+        return await anyio.to_thread.run_sync(self.get, kwargs)
+
+    async def set_async(self, kwargs: Mapping[str, Any], result: Any) -> Any:
+        return await anyio.to_thread.run_sync(self.set, kwargs, result)
+
+
+def get_result_cache_for_config(
+    result_cache_config: ResultCacheConfig,
+    namespace: str
+) -> ResultCache:
+    return ResultCache(
+        backend=get_result_cache_backend(result_cache_config),
+        namespace=namespace,
+        ttl_seconds=result_cache_config.ttl_seconds
+    )
+
+
+async def get_result_with_result_cache_async(
+    tool_fn: Callable,
+    result_cache: ResultCache,
+    kwargs: Mapping[str, Any]
+) -> Any:
+    # the blocking cache I/O runs in worker threads, rather than on the event loop
+    is_hit, result = await result_cache.get_async(kwargs)
+    if is_hit:
+        LOGGER.info('result cache hit (namespace: %r)', result_cache.namespace)
+        return result
+    result = tool_fn(**kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return await result_cache.set_async(kwargs, result)
+
+
+def get_tool_function_with_result_cache(
+    tool_fn: Callable,
+    result_cache: ResultCache
+) -> Callable:
+    @functools.wraps(tool_fn)
+    def wrapper(**kwargs):
+        if result_cache.backend.is_blocking and get_running_loop_or_none() is not None:
+            return get_result_with_result_cache_async(tool_fn, result_cache, kwargs)
+        is_hit, result = result_cache.get(kwargs)
+        if is_hit:
+            LOGGER.info('result cache hit (namespace: %r)', result_cache.namespace)
+            return result
+        return get_mapped_maybe_awaitable(
+            tool_fn(**kwargs),
+            functools.partial(result_cache.set, kwargs)
+        )
+
+    return wrapper
@@ -1,94 +1,592 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+import functools
 import logging
-from typing import Any, Iterable, Mapping, Sequence
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
+import anyio
+import anyio.to_thread
 from google.cloud import bigquery
+from google.cloud.bigquery.job import QueryJob
 from google.cloud.bigquery.table import RowIterator
-import jinja2
 
 from py_conf_mcp.tools.typing import ToolClass
-from py_conf_mcp.utils.json import get_json_as_csv_lines
+from py_conf_mcp.utils.json import (
+    get_json_as_csv_lines,
+    get_json_str,
+    iter_json_as_csv_chunks
+)
+from py_conf_mcp.utils.logging import TruncatedLogValue, get_payload_summary
+from py_conf_mcp.utils.memory import account_memory_for_value
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+from py_conf_mcp.utils.projection import get_optional_compiled_projection
+from py_conf_mcp.utils.sql_template import get_evaluated_sql_template
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+DRY_RUN_CACHE_MAX_ENTRIES = 1000
+
+# estimates change as the underlying tables grow
+DRY_RUN_CACHE_TTL_SECONDS = 600.0
+
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 5.0
+
+DEFAULT_PAGE_SIZE = 10000
+
+DEFAULT_MAX_CONCURRENT_PAGE_FETCHES = 4
+
+
+class MaximumBytesBilledActions:
+    REJECT = 'reject'
+    WARN = 'warn'
+
+
+class MaximumBytesBilledExceededError(ValueError):
+    pass
+
+
+BQ_ARRAY_PARAMETER_TYPE_BY_PYTHON_TYPE: Mapping[type, str] = {
+    bool: 'BOOL',
+    int: 'INT64',
+    float: 'FLOAT64',
+    str: 'STRING'
+}
+
+
 def toquoted(value: str) -> str:
     if value is None:
         raise ValueError('value must not be none')
     return "'" + value.replace("'", "\\'") + "'"
 
 
-def get_evaluated_template(template: str, variables: Mapping[str, Any]) -> Any:
-    env = jinja2.Environment()
-    env.filters['toquoted'] = toquoted
-    compiled_template = env.from_string(template)
-    return compiled_template.render(variables)
+def get_bq_array_parameter_type(values: Sequence[Any]) -> str:
+    if not values:
+        return 'STRING'
+    return BQ_ARRAY_PARAMETER_TYPE_BY_PYTHON_TYPE.get(type(values[0]), 'STRING')
+
+
+def get_bq_array_query_parameter(
+    name: str,
+    values: Sequence[Any],
+    parameter_type: Optional[str] = None
+) -> bigquery.ArrayQueryParameter:
+    return bigquery.ArrayQueryParameter(
+        name,
+        parameter_type or get_bq_array_parameter_type(values),
+        list(values)
+    )
+
+
+def get_rows_split_by_key(
+    rows: Iterable[dict],
+    key_column: str,
+    keys: Sequence[Any]
+) -> Sequence[dict]:
+    # compare as strings, the key column type may differ from the input type
+    rows_by_key: dict[str, list[dict]] = {str(key): [] for key in keys}
+    for row in rows:
+        key_rows = rows_by_key.get(str(row.get(key_column)))
+        if key_rows is not None:
+            key_rows.append(row)
+    return [
+        {'input': key, 'rows': rows_by_key[str(key)]}
+        for key in keys
+    ]
+
+
+def get_csv_rows(result: Any) -> Sequence[dict]:
+    # e.g. a result projection returning a single value or a list of values
+    if not isinstance(result, list) or not all(isinstance(row, dict) for row in result):
+        raise ValueError(
+            'The csv output format requires a list of objects,'
+            f' the result projection returned: {type(result).__name__}'
+        )
+    return result
 
 
 def get_bq_client(project_name: str) -> bigquery.Client:
     return bigquery.Client(project=project_name)
 
 
+class DryRunCache:
+    '''
+    Bounded LRU for dry run estimates, with entries expiring after a TTL.
+    '''
+
+    def __init__(
+        self,
+        max_entries: int = DRY_RUN_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DRY_RUN_CACHE_TTL_SECONDS,
+        time_fn: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.time_fn = time_fn
+        self._entries: OrderedDict[Hashable, Tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute_fn: Callable[[], int]) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self.time_fn():
+                self._entries.move_to_end(key)
+                return entry[0]
+        # computed outside of the lock, concurrent misses may both run the dry run
+        value = compute_fn()
+        with self._lock:
+            self._entries[key] = (value, self.time_fn() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+DEFAULT_DRY_RUN_CACHE = DryRunCache()
+
+
+def get_query_parameters_cache_key(
+    query_parameters: Optional[Sequence[bigquery.ArrayQueryParameter]]
+) -> str:
+    # query parameters aren't hashable, their API representation is
+    return get_json_str([
+        query_parameter.to_api_repr()
+        for query_parameter in query_parameters or []
+    ])
+
+
+def get_bq_dry_run_total_bytes_processed(
+    project_name: str,
+    query: str,
+    query_parameters: Optional[Sequence[bigquery.ArrayQueryParameter]] = None
+) -> int:
+    # cached per rendered SQL, for a while (the estimate changes with the underlying tables)
+    return DEFAULT_DRY_RUN_CACHE.get_or_compute(
+        (project_name, query, get_query_parameters_cache_key(query_parameters)),
+        functools.partial(
+            get_uncached_bq_dry_run_total_bytes_processed,
+            project_name,
+            query,
+            query_parameters
+        )
+    )
+
+
+def get_uncached_bq_dry_run_total_bytes_processed(
+    project_name: str,
+    query: str,
+    query_parameters: Optional[Sequence[bigquery.ArrayQueryParameter]] = None
+) -> int:
+    client = get_bq_client(project_name=project_name)
+    job_config = bigquery.QueryJobConfig(
+        dry_run=True,
+        use_query_cache=False,
+        query_parameters=list(query_parameters or [])
+    )
+    query_job = client.query(query, job_config=job_config)
+    return query_job.total_bytes_processed or 0
+
+
+def record_bq_query_job_metrics(
+    query_job: QueryJob,
+    metric_labels: Optional[Mapping[str, str]] = None
+):
+    DEFAULT_METRICS_REGISTRY.increment(
+        'py_conf_mcp_bigquery_jobs_total',
+        labels=metric_labels
+    )
+    DEFAULT_METRICS_REGISTRY.increment(
+        'py_conf_mcp_bigquery_bytes_processed_total',
+        query_job.total_bytes_processed or 0,
+        labels=metric_labels
+    )
+    DEFAULT_METRICS_REGISTRY.increment(
+        'py_conf_mcp_bigquery_slot_milliseconds_total',
+        query_job.slot_millis or 0,
+        labels=metric_labels
+    )
+    if query_job.cache_hit:
+        DEFAULT_METRICS_REGISTRY.increment(
+            'py_conf_mcp_bigquery_cache_hits_total',
+            labels=metric_labels
+        )
+
+
 def get_bq_result_from_bq_query(
     project_name: str,
     query: str,
-    query_parameters: Sequence[Any] | None = tuple()
+    query_parameters: Sequence[Any] | None = tuple(),
+    maximum_bytes_billed: Optional[int] = None,
+    metric_labels: Optional[Mapping[str, str]] = None
 ) -> RowIterator:
     client = get_bq_client(project_name=project_name)
-    job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=query_parameters,
+        maximum_bytes_billed=maximum_bytes_billed
+    )
     query_job = client.query(query, job_config=job_config)  # Make an API request.
     bq_result = query_job.result()  # Waits for query to finish
     LOGGER.debug('bq_result: %r', bq_result)
+    LOGGER.info(
+        'query job: bytes processed: %r, slot millis: %r, cache hit: %r',
+        query_job.total_bytes_processed, query_job.slot_millis, query_job.cache_hit
+    )
+    record_bq_query_job_metrics(query_job, metric_labels=metric_labels)
     return bq_result
 
 
+def get_bq_first_page_rows(
+    query_job: QueryJob,
+    page_size: int
+) -> Tuple[Sequence[dict], int]:
+    bq_result = query_job.result(max_results=page_size)
+    return [
+        account_memory_for_value(dict(row.items()))
+        for row in bq_result
+    ], bq_result.total_rows or 0
+
+
+def get_bq_page_rows(
+    client: bigquery.Client,
+    query_job: QueryJob,
+    start_index: int,
+    page_size: int
+) -> Sequence[dict]:
+    return [
+        account_memory_for_value(dict(row.items()))
+        for row in client.list_rows(
+            query_job.destination,
+            start_index=start_index,
+            max_results=page_size
+        )
+    ]
+
+
+async def wait_for_bq_query_job(
+    query_job: QueryJob,
+    poll_interval_seconds: float,
+    max_poll_interval_seconds: float
+):
+    # each poll is a short API call, no thread is held while waiting
+    while not await anyio.to_thread.run_sync(query_job.done):
+        await anyio.sleep(poll_interval_seconds)
+        poll_interval_seconds = min(poll_interval_seconds * 2, max_poll_interval_seconds)
+
+
+async def cancel_bq_query_job(query_job: QueryJob):
+    with anyio.CancelScope(shield=True):
+        try:
+            await anyio.to_thread.run_sync(query_job.cancel)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning('Failed to cancel query job: %r', exc)
+
+
+async def get_bq_rows_from_bq_query_async(  # pylint: disable=too-many-arguments,too-many-locals
+    project_name: str,
+    query: str,
+    *,
+    query_parameters: Sequence[Any] | None = tuple(),
+    maximum_bytes_billed: Optional[int] = None,
+    metric_labels: Optional[Mapping[str, str]] = None,
+    poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_concurrent_page_fetches: int = DEFAULT_MAX_CONCURRENT_PAGE_FETCHES,
+    timeout_seconds: Optional[float] = None
+) -> Sequence[dict]:
+    '''
+    Submits the query job and polls it with backoff, then fetches the
+    remaining result pages concurrently, without blocking the event loop.
+    The job is cancelled if the call is cancelled or the timeout expires
+    (including while submitting it).
+    '''
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=query_parameters,
+        maximum_bytes_billed=maximum_bytes_billed
+    )
+    query_job: Optional[QueryJob] = None
+    with anyio.fail_after(timeout_seconds):
+        try:
+            client = await anyio.to_thread.run_sync(get_bq_client, project_name)
+            # the submission completes even if cancelled meanwhile (and is then cancelled)
+            query_job = await anyio.to_thread.run_sync(
+                functools.partial(client.query, query, job_config=job_config)
+            )
+            await wait_for_bq_query_job(
+                query_job,
+                poll_interval_seconds=poll_interval_seconds,
+                max_poll_interval_seconds=max_poll_interval_seconds
+            )
+            first_page_rows, total_rows = await anyio.to_thread.run_sync(
+                get_bq_first_page_rows, query_job, page_size
+            )
+            record_bq_query_job_metrics(query_job, metric_labels=metric_labels)
+            start_indexes = range(len(first_page_rows), total_rows, page_size)
+            pages: list[Sequence[dict]] = [[] for _ in start_indexes]
+            limiter = anyio.CapacityLimiter(max_concurrent_page_fetches)
+
+            async def fetch_page(page_index: int, start_index: int):
+                pages[page_index] = await anyio.to_thread.run_sync(
+                    get_bq_page_rows, client, query_job, start_index, page_size,
+                    limiter=limiter
+                )
+
+            async with anyio.create_task_group() as task_group:
+                for page_index, start_index in enumerate(start_indexes):
+                    task_group.start_soon(fetch_page, page_index, start_index)
+        except anyio.get_cancelled_exc_class():
+            if query_job is not None:
+                LOGGER.info('cancelling query job: %r', query_job.job_id)
+                await cancel_bq_query_job(query_job)
+            raise
+    LOGGER.info('fetched %d rows in %d pages', total_rows, len(start_indexes) + 1)
+    return [
+        row
+        for page_rows in [first_page_rows, *pages]
+        for row in page_rows
+    ]
+
+
 def iter_dict_from_bq_query(
     project_name: str,
     query: str,
-    query_parameters: Sequence[Any] | None = tuple()
+    query_parameters: Sequence[Any] | None = tuple(),
+    maximum_bytes_billed: Optional[int] = None,
+    metric_labels: Optional[Mapping[str, str]] = None
 ) -> Iterable[dict]:
     bq_result = get_bq_result_from_bq_query(
         project_name=project_name,
         query=query,
-        query_parameters=query_parameters
+        query_parameters=query_parameters,
+        maximum_bytes_billed=maximum_bytes_billed,
+        metric_labels=metric_labels
     )
     for row in bq_result:
         LOGGER.debug('row: %r', row)
-        yield dict(row.items())
+        # aborts building the result once the memory budget of the call is exceeded
+        yield account_memory_for_value(dict(row.items()))
 
 
 class BigQueryTool(ToolClass):  # pylint: disable=too-many-instance-attributes
-    def __init__(  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         *,
         project_name: str,
         sql_query: str,
         is_sql_query_template: bool = True,
-        output_format: str = 'json'
+        output_format: str = 'json',
+        csv_chunk_size: Optional[int] = None,
+        result_projection: Optional[str] = None,
+        dry_run: bool = False,
+        maximum_bytes_billed: Optional[int] = None,
+        maximum_bytes_billed_action: str = MaximumBytesBilledActions.REJECT,
+        async_query: bool = False,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrent_page_fetches: int = DEFAULT_MAX_CONCURRENT_PAGE_FETCHES,
+        timeout_seconds: Optional[float] = None,
+        batch_parameter: Optional[str] = None,
+        batch_key_column: Optional[str] = None,
+        batch_parameter_type: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
     ):
         super().__init__()
         self.project_name = project_name
         self.sql_query = sql_query
         self.is_sql_query_template = is_sql_query_template
         self.output_format = output_format
+        self.csv_chunk_size = csv_chunk_size
+        if result_projection and output_format == 'csv' and csv_chunk_size:
+            raise ValueError('result_projection is not supported with csv_chunk_size')
+        self.result_projection = get_optional_compiled_projection(result_projection)
+        self.dry_run = dry_run
+        self.maximum_bytes_billed = maximum_bytes_billed
+        self.maximum_bytes_billed_action = maximum_bytes_billed_action
+        self.async_query = async_query
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_poll_interval_seconds = max_poll_interval_seconds
+        self.page_size = page_size
+        self.max_concurrent_page_fetches = max_concurrent_page_fetches
+        self.timeout_seconds = timeout_seconds
+        if batch_parameter and not batch_key_column:
+            raise ValueError('batch_key_column is required with batch_parameter')
+        self.batch_parameter = batch_parameter
+        self.batch_key_column = batch_key_column
+        self.batch_parameter_type = batch_parameter_type
+        self.metric_labels = {'tool': tool_name or ''}
+        self.logger = logger or LOGGER
+
+    def get_query_kwargs(self) -> Mapping[str, Any]:
+        return {
+            'project_name': self.project_name,
+            # only let BigQuery fail the job when we would reject it anyway
+            'maximum_bytes_billed': (
+                self.maximum_bytes_billed
+                if self.maximum_bytes_billed_action == MaximumBytesBilledActions.REJECT
+                else None
+            ),
+            'metric_labels': self.metric_labels
+        }
+
+    def check_dry_run(
+        self,
+        sql_query: str,
+        query_parameters: Optional[Sequence[bigquery.ArrayQueryParameter]] = None
+    ):
+        if not self.dry_run:
+            return
+        total_bytes_processed = get_bq_dry_run_total_bytes_processed(
+            project_name=self.project_name,
+            query=sql_query,
+            query_parameters=query_parameters
+        )
+        self.logger.info('dry run: query would process %d bytes', total_bytes_processed)
+        DEFAULT_METRICS_REGISTRY.increment(
+            'py_conf_mcp_bigquery_dry_run_bytes_processed_total',
+            total_bytes_processed,
+            labels=self.metric_labels
+        )
+        if (
+            self.maximum_bytes_billed is None
+            or total_bytes_processed <= self.maximum_bytes_billed
+        ):
+            return
+        message = (
+            f'Query would process {total_bytes_processed} bytes,'
+            f' exceeding the maximum of {self.maximum_bytes_billed} bytes'
+        )
+        if self.maximum_bytes_billed_action == MaximumBytesBilledActions.REJECT:
+            DEFAULT_METRICS_REGISTRY.increment(
+                'py_conf_mcp_bigquery_rejected_queries_total',
+                labels=self.metric_labels
+            )
+            raise MaximumBytesBilledExceededError(message)
+        self.logger.warning(message)
+
+    def iter_csv_chunks(self, sql_query: str) -> Iterator[str]:
+        self.logger.info(
+            'Streaming BigQuery SQL as CSV:\n```sql\n%s\n```',
+            TruncatedLogValue(sql_query)
+        )
+        assert self.csv_chunk_size
+        yield from iter_json_as_csv_chunks(
+            iter_dict_from_bq_query(
+                query=sql_query,
+                **self.get_query_kwargs()
+            ),
+            chunk_size=self.csv_chunk_size
+        )
+
+    def get_sql_query(self, variables: Mapping[str, Any]) -> str:
+        if not self.is_sql_query_template:
+            return self.sql_query
+        return get_evaluated_sql_template(
+            self.sql_query, variables=variables, toquoted_filter=toquoted
+        )
+
+    def is_csv_chunked(self) -> bool:
+        return bool(self.output_format == 'csv' and self.csv_chunk_size)
 
     def __call__(self, **kwargs):
-        sql_query = self.sql_query
-        if self.is_sql_query_template:
-            sql_query = get_evaluated_template(
-                sql_query,
-                variables=kwargs
+        if self.async_query and not self.batch_parameter and not self.is_csv_chunked():
+            return self.get_result_async(kwargs)
+        sql_query = self.get_sql_query(kwargs)
+        if self.batch_parameter:
+            return self.get_batch_result(sql_query, kwargs[self.batch_parameter])
+        self.check_dry_run(sql_query)
+        if self.is_csv_chunked():
+            return self.iter_csv_chunks(sql_query)
+        try:
+            self.logger.info(
+                'Running BigQuery SQL:\n```sql\n%s\n```',
+                TruncatedLogValue(sql_query)
+            )
+            return self.get_formatted_result(list(iter_dict_from_bq_query(
+                query=sql_query,
+                **self.get_query_kwargs()
+            )))
+        except Exception as exc:
+            self.logger.warning('Failed to run BigQuery SQL due to %r', exc, exc_info=True)
+            raise
+
+    def get_batch_result(self, sql_query: str, batch_values: Sequence[Any]) -> Any:
+        '''
+        Runs a single query for all of the batch values, passed in as the
+        `@<batch_parameter>` array (e.g. `WHERE id IN UNNEST(@ids)`),
+        and splits the rows by the key column, in the order of the values.
+        '''
+        assert self.batch_parameter and self.batch_key_column
+        query_parameters = [get_bq_array_query_parameter(
+            self.batch_parameter,
+            batch_values,
+            parameter_type=self.batch_parameter_type
+        )]
+        self.check_dry_run(sql_query, query_parameters=query_parameters)
+        self.logger.info(
+            'Running batched BigQuery SQL for %d values:\n```sql\n%s\n```',
+            len(batch_values), TruncatedLogValue(sql_query)
+        )
+        rows = list(iter_dict_from_bq_query(
+            query=sql_query,
+            query_parameters=query_parameters,
+            **self.get_query_kwargs()
+        ))
+        self.logger.info('query returned %d rows', len(rows))
+        return [
+            {**batch_result, 'rows': self.get_formatted_rows(batch_result['rows'])}
+            for batch_result in get_rows_split_by_key(
+                rows,
+                key_column=self.batch_key_column,
+                keys=batch_values
             )
+        ]
+
+    def get_formatted_result(self, rows: Sequence[dict]) -> Any:
+        self.logger.info('query returned %d rows', len(rows))
+        return self.get_formatted_rows(rows)
+
+    def get_formatted_rows(self, rows: Sequence[dict]) -> Any:
+        result: Any = rows
+        if self.result_projection is not None:
+            # e.g. `[?status == 'active'].{id: id, name: name}`
+            result = self.result_projection(result)
+        if self.output_format == 'csv':
+            result = '\n'.join(get_json_as_csv_lines(get_csv_rows(result)))
+        self.logger.debug(
+            'query results: %r (%s)',
+            TruncatedLogValue(result), get_payload_summary(result)
+        )
+        return result
+
+    async def get_result_async(self, variables: Mapping[str, Any]) -> Any:
+        # the template (e.g. reading secrets) and the dry run may block, run in a thread
+        sql_query = await anyio.to_thread.run_sync(self.get_sql_query, variables)
+        await anyio.to_thread.run_sync(self.check_dry_run, sql_query)
         try:
-            LOGGER.info('Running BigQuery SQL:\n```sql\n%s\n```', sql_query)
-            result: Any = list(iter_dict_from_bq_query(
-                project_name=self.project_name,
-                query=sql_query
+            self.logger.info(
+                'Running BigQuery SQL asynchronously:\n```sql\n%s\n```',
+                TruncatedLogValue(sql_query)
+            )
+            return self.get_formatted_result(await get_bq_rows_from_bq_query_async(
+                query=sql_query,
+                poll_interval_seconds=self.poll_interval_seconds,
+                max_poll_interval_seconds=self.max_poll_interval_seconds,
+                page_size=self.page_size,
+                max_concurrent_page_fetches=self.max_concurrent_page_fetches,
+                timeout_seconds=self.timeout_seconds,
+                **self.get_query_kwargs()
             ))
-            if self.output_format == 'csv':
-                result = '\n'.join(get_json_as_csv_lines(result))
-            LOGGER.info('query results: %r', result)
         except Exception as exc:
-            LOGGER.warning('Failed to run BigQuery SQL due to %r', exc, exc_info=True)
+            self.logger.warning('Failed to run BigQuery SQL due to %r', exc, exc_info=True)
             raise
-        return result
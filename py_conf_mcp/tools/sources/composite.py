@@ -0,0 +1,184 @@
+import functools
+import inspect
+import logging
+import re
+from typing import Any, Callable, Mapping, NotRequired, Optional, Sequence, TypedDict
+
+import anyio
+import anyio.to_thread
+import jinja2
+from mcp.types import TextContent
+
+from py_conf_mcp.tools.resolver import ToolResolver
+from py_conf_mcp.tools.typing import ToolClass
+from py_conf_mcp.utils.logging import TruncatedLogValue, get_payload_summary
+from py_conf_mcp.utils.secret_provider import SECRET_TEMPLATE_GLOBALS
+from py_conf_mcp.utils.signature import get_arguments_with_defaults
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+TIMED_OUT_ERROR = 'timed out'
+
+SINGLE_VARIABLE_TEMPLATE_PATTERN = re.compile(r'^\{\{\s*(\w+)\s*\}\}$')
+
+
+class CompositeBranchConfig(TypedDict):
+    tool: str
+    name: NotRequired[str]
+    arguments: NotRequired[Mapping[str, Any]]
+
+
+def get_evaluated_template(template: str, variables: Mapping[str, Any]) -> Any:
+    compiled_template = jinja2.Template(template)
+    compiled_template.globals.update(SECRET_TEMPLATE_GLOBALS)
+    return compiled_template.render(variables)
+
+
+def get_evaluated_argument(value: Any, variables: Mapping[str, Any]) -> Any:
+    if not isinstance(value, str):
+        return value
+    # pass through the value of a single variable as is (e.g. to keep its type)
+    single_variable_match = SINGLE_VARIABLE_TEMPLATE_PATTERN.match(value)
+    if single_variable_match:
+        return variables.get(single_variable_match.group(1))
+    return get_evaluated_template(value, variables)
+
+
+def get_evaluated_arguments(
+    arguments: Mapping[str, Any],
+    variables: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    return {
+        key: get_evaluated_argument(value, variables)
+        for key, value in arguments.items()
+    }
+
+
+async def get_tool_fn_result(tool_fn: Callable, arguments: Mapping[str, Any]) -> Any:
+    result = await anyio.to_thread.run_sync(
+        functools.partial(tool_fn, **get_arguments_with_defaults(tool_fn, arguments)),
+        abandon_on_cancel=True
+    )
+    if inspect.isawaitable(result):
+        result = await result
+    if isinstance(result, TextContent):
+        # e.g. static content, merged as text
+        return result.text
+    return result
+
+
+class CompositeTool(ToolClass):
+    '''
+    Calls other configured tools concurrently, with a shared deadline,
+    and merges their results (optionally via a template).
+    A failing branch does not fail the other branches.
+    '''
+
+    TEMPLATE_PARAMETER_NAMES = ('branches', 'response_template')
+
+    @classmethod
+    def get_referenced_tool_names(cls, init_parameters: Mapping[str, Any]) -> Sequence[str]:
+        branches = init_parameters.get('branches')
+        if not isinstance(branches, list):
+            return []
+        return [
+            branch['tool']
+            for branch in branches
+            if isinstance(branch, Mapping) and isinstance(branch.get('tool'), str)
+        ]
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        branches: Sequence[CompositeBranchConfig],
+        response_template: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+        tool_resolver: Optional[ToolResolver] = None,
+        tool_name: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        super().__init__()
+        if tool_resolver is None:
+            raise ValueError('tool_resolver is required')
+        branch_names = [branch.get('name', branch['tool']) for branch in branches]
+        if len(set(branch_names)) != len(branch_names):
+            raise ValueError(f'Branch names must be unique: {branch_names}')
+        if tool_name and any(branch['tool'] == tool_name for branch in branches):
+            raise ValueError(f'Composite tool must not call itself: {repr(tool_name)}')
+        self.branches = branches
+        self.branch_names = branch_names
+        self.response_template = response_template
+        self.timeout_seconds = timeout_seconds
+        self.logger = logger or LOGGER
+        self.branch_tool_fns = [
+            tool.tool_fn
+            for tool in tool_resolver.get_tools_by_name(
+                [branch['tool'] for branch in branches]
+            )
+        ]
+
+    async def get_branch_results(
+        self,
+        variables: Mapping[str, Any]
+    ) -> tuple[Mapping[str, Any], Mapping[str, str]]:
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+
+        async def run_branch(branch_name: str, tool_fn: Callable, arguments: Mapping[str, Any]):
+            try:
+                results[branch_name] = await get_tool_fn_result(tool_fn, arguments)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.warning('Branch %r failed: %r', branch_name, exc, exc_info=True)
+                errors[branch_name] = repr(exc)
+
+        with anyio.move_on_after(self.timeout_seconds):
+            async with anyio.create_task_group() as task_group:
+                for branch_name, branch, tool_fn in zip(
+                    self.branch_names, self.branches, self.branch_tool_fns
+                ):
+                    task_group.start_soon(
+                        run_branch,
+                        branch_name,
+                        tool_fn,
+                        get_evaluated_arguments(branch.get('arguments', {}), variables)
+                    )
+        for branch_name in self.branch_names:
+            if branch_name not in results and branch_name not in errors:
+                self.logger.warning('Branch %r timed out', branch_name)
+                errors[branch_name] = TIMED_OUT_ERROR
+        return results, errors
+
+    async def get_result_async(self, variables: Mapping[str, Any]) -> Any:
+        results, errors = await self.get_branch_results(variables)
+        self.logger.info(
+            'branch results: %r, errors: %r',
+            {name: get_payload_summary(result) for name, result in results.items()},
+            errors
+        )
+        if not self.response_template:
+            return {
+                branch_name: (
+                    {'error': errors[branch_name]}
+                    if branch_name in errors
+                    else {'result': results[branch_name]}
+                )
+                for branch_name in self.branch_names
+            }
+        response_content = get_evaluated_template(
+            self.response_template,
+            variables={
+                'results': results,
+                'errors': errors,
+                'params': variables
+            }
+        )
+        self.logger.debug(
+            'response_content after template: %r',
+            TruncatedLogValue(response_content)
+        )
+        return response_content
+
+    def __call__(self, **kwargs):
+        return self.get_result_async(kwargs)
@@ -0,0 +1,234 @@
+import csv
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Iterator, Mapping, Optional, Sequence, Tuple
+import uuid
+
+from py_conf_mcp.tools.typing import ToolClass
+from py_conf_mcp.utils.json import get_json_as_csv_lines
+from py_conf_mcp.utils.logging import TruncatedLogValue, get_payload_summary
+from py_conf_mcp.utils.sql_template import get_evaluated_sql_template, get_quoted_string
+
+try:
+    import duckdb  # type: ignore[import-not-found]
+except ImportError:
+    duckdb = None  # type: ignore[assignment]  # pylint: disable=invalid-name
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_FETCH_SIZE = 1000
+
+SQLITE_CACHED_STATEMENTS = 256
+
+IN_MEMORY_DATABASE_PATH = ':memory:'
+
+SQLITE_TABLES_SCHEMA_NAME = 'local_tables'
+
+
+class LocalSqlEngines:
+    SQLITE = 'sqlite'
+    DUCKDB = 'duckdb'
+
+
+def iter_dict_from_cursor(cursor: Any, fetch_size: int) -> Iterator[dict]:
+    # fetches the rows in batches, rather than one by one
+    column_names = [column[0] for column in cursor.description or []]
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            break
+        for row in rows:
+            yield dict(zip(column_names, row))
+
+
+def get_quoted_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def get_sqlite_connection(database_path: str) -> sqlite3.Connection:
+    # URIs, so that the shared in-memory database of the tables can be attached
+    if database_path == IN_MEMORY_DATABASE_PATH:
+        return sqlite3.connect(
+            database_path,
+            uri=True,
+            cached_statements=SQLITE_CACHED_STATEMENTS
+        )
+    # read-only, so that workers don't block each other (or modify the data)
+    return sqlite3.connect(
+        f'file:{database_path}?mode=ro',
+        uri=True,
+        cached_statements=SQLITE_CACHED_STATEMENTS
+    )
+
+
+def load_csv_into_sqlite_table(connection: sqlite3.Connection, table_name: str, path: str):
+    with open(path, encoding='utf-8', newline='') as csv_fp:
+        reader = csv.reader(csv_fp)
+        column_names = next(reader)
+        quoted_table_name = get_quoted_identifier(table_name)
+        connection.execute(
+            f'CREATE TABLE {quoted_table_name} ('
+            + ', '.join(get_quoted_identifier(name) for name in column_names)
+            + ')'
+        )
+        connection.executemany(
+            f'INSERT INTO {quoted_table_name} VALUES ('
+            + ', '.join('?' * len(column_names))
+            + ')',
+            reader
+        )
+    connection.commit()
+
+
+def get_shared_sqlite_tables_connection(
+    tables: Mapping[str, str]
+) -> Tuple[sqlite3.Connection, str]:
+    # the tables are loaded once into a shared in-memory database,
+    # which exists as long as this connection is kept open
+    database_uri = f'file:py_conf_mcp_tables_{uuid.uuid4().hex}?mode=memory&cache=shared'
+    connection = sqlite3.connect(database_uri, uri=True, check_same_thread=False)
+    for table_name, path in tables.items():
+        load_csv_into_sqlite_table(connection, table_name, path)
+    return connection, database_uri
+
+
+def get_file_format(path: str) -> str:
+    return os.path.splitext(path)[1].lstrip('.').lower()
+
+
+class LocalSqlTool(ToolClass):  # pylint: disable=too-many-instance-attributes
+    '''
+    Runs SQL against local database files (SQLite or DuckDB),
+    or Parquet / CSV files registered as tables, within the process.
+    Connections are kept per thread and statements are cached per connection,
+    so inputs should preferably be passed as bound parameters
+    (`:name` for SQLite, `$name` for DuckDB) rather than via the template.
+    '''
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        sql_query: str,
+        database_path: str = IN_MEMORY_DATABASE_PATH,
+        engine: str = LocalSqlEngines.SQLITE,
+        tables: Optional[Mapping[str, str]] = None,
+        query_parameters: Optional[Sequence[str]] = None,
+        is_sql_query_template: bool = True,
+        output_format: str = 'json',
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        logger: Optional[logging.Logger] = None
+    ):
+        super().__init__()
+        if engine not in (LocalSqlEngines.SQLITE, LocalSqlEngines.DUCKDB):
+            raise ValueError(f'Unsupported engine: {repr(engine)}')
+        if engine == LocalSqlEngines.DUCKDB and duckdb is None:
+            raise ImportError('The duckdb engine requires the duckdb package')
+        self.sql_query = sql_query
+        self.database_path = database_path
+        self.engine = engine
+        self.tables = tables or {}
+        if engine == LocalSqlEngines.SQLITE:
+            for path in self.tables.values():
+                if get_file_format(path) != 'csv':
+                    raise ValueError(f'Only CSV tables are supported by SQLite: {repr(path)}')
+        self.query_parameters = query_parameters or []
+        self.is_sql_query_template = is_sql_query_template
+        self.output_format = output_format
+        self.fetch_size = fetch_size
+        self.logger = logger or LOGGER
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._duckdb_connection: Any = None
+        self._sqlite_tables_connection: Optional[sqlite3.Connection] = None
+        self._sqlite_tables_database_uri: Optional[str] = None
+
+    def _get_sqlite_tables_database_uri(self) -> str:
+        with self._lock:
+            if self._sqlite_tables_database_uri is None:
+                (
+                    self._sqlite_tables_connection,
+                    self._sqlite_tables_database_uri
+                ) = get_shared_sqlite_tables_connection(self.tables)
+            return self._sqlite_tables_database_uri
+
+    def _get_new_sqlite_connection(self) -> sqlite3.Connection:
+        connection = get_sqlite_connection(self.database_path)
+        if self.tables:
+            # unqualified table names are also looked up in attached databases
+            connection.execute(
+                f'ATTACH DATABASE ? AS {SQLITE_TABLES_SCHEMA_NAME}',
+                (self._get_sqlite_tables_database_uri(),)
+            )
+        return connection
+
+    def _get_duckdb_connection(self) -> Any:
+        with self._lock:
+            if self._duckdb_connection is None:
+                self._duckdb_connection = duckdb.connect(
+                    self.database_path,
+                    read_only=self.database_path != IN_MEMORY_DATABASE_PATH
+                )
+            return self._duckdb_connection
+
+    def _get_new_duckdb_cursor(self) -> Any:
+        # DuckDB cursors are separate connections to the same database,
+        # which don't see the temporary views of each other
+        # (but views can't be created in a read-only database)
+        cursor = self._get_duckdb_connection().cursor()
+        for table_name, path in self.tables.items():
+            # DuckDB reads Parquet and CSV files directly (by extension)
+            cursor.execute(
+                f'CREATE TEMP VIEW {get_quoted_identifier(table_name)}'
+                f' AS SELECT * FROM {get_quoted_string(path)}'
+            )
+        return cursor
+
+    def get_connection(self) -> Any:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.engine == LocalSqlEngines.DUCKDB:
+                connection = self._get_new_duckdb_cursor()
+            else:
+                connection = self._get_new_sqlite_connection()
+            self._local.connection = connection
+        return connection
+
+    def get_parameters(self, kwargs: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {name: kwargs.get(name) for name in self.query_parameters}
+
+    def get_rows(self, sql_query: str, parameters: Mapping[str, Any]) -> list[dict]:
+        cursor = self.get_connection().execute(sql_query, parameters)
+        return list(iter_dict_from_cursor(cursor, fetch_size=self.fetch_size))
+
+    def get_formatted_result(self, rows: Sequence[dict]) -> Any:
+        self.logger.info('query returned %d rows', len(rows))
+        result: Any = rows
+        if self.output_format == 'csv':
+            result = '\n'.join(get_json_as_csv_lines(rows))
+        self.logger.debug(
+            'query results: %r (%s)',
+            TruncatedLogValue(result), get_payload_summary(result)
+        )
+        return result
+
+    def __call__(self, **kwargs):
+        sql_query = self.sql_query
+        if self.is_sql_query_template:
+            sql_query = get_evaluated_sql_template(
+                sql_query,
+                variables=kwargs
+            )
+        parameters = self.get_parameters(kwargs)
+        try:
+            self.logger.info(
+                'Running local SQL (%s):\n```sql\n%s\n```\nparameters: %r',
+                self.engine, TruncatedLogValue(sql_query), TruncatedLogValue(parameters)
+            )
+            return self.get_formatted_result(self.get_rows(sql_query, parameters))
+        except Exception as exc:
+            self.logger.warning('Failed to run local SQL due to %r', exc, exc_info=True)
+            raise
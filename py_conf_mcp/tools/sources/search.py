@@ -0,0 +1,515 @@
+from collections import Counter
+from dataclasses import dataclass
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+from pathlib import Path
+import re
+import struct
+import threading
+import time
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
+
+from py_conf_mcp.tools.typing import ToolClass
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+INDEX_MAGIC = b'PCMFTS01'
+
+# magic, meta length, document count, term count, postings count, average document length
+INDEX_HEADER = struct.Struct('<8sIIIIf')
+
+UINT32_SIZE = 4
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+PARAGRAPH_SEPARATOR_PATTERN = re.compile(rb'\n[ \t]*\n')
+
+DEFAULT_TOP_K = 5
+
+DEFAULT_SNIPPET_LENGTH = 300
+
+DEFAULT_MAX_DOCUMENT_BYTES = 4000
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 5.0
+
+BM25_K1 = 1.2
+
+BM25_B = 0.75
+
+
+def get_tokens(text: str) -> Sequence[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def iter_document_ranges(
+    content: bytes,
+    max_document_bytes: int = DEFAULT_MAX_DOCUMENT_BYTES
+) -> Iterable[Tuple[int, int]]:
+    # documents are paragraphs, long paragraphs are split on a line boundary
+    paragraph_ranges = []
+    start = 0
+    for match in PARAGRAPH_SEPARATOR_PATTERN.finditer(content):
+        paragraph_ranges.append((start, match.start()))
+        start = match.end()
+    paragraph_ranges.append((start, len(content)))
+    for start, end in paragraph_ranges:
+        while end - start > max_document_bytes:
+            split_at = content.rfind(b'\n', start, start + max_document_bytes)
+            if split_at <= start:
+                split_at = start + max_document_bytes
+            yield start, split_at
+            start = split_at
+        if content[start:end].strip():
+            yield start, end
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    name: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class IndexedDocument:
+    file_index: int
+    start: int
+    end: int
+    length: int
+
+
+def get_padded_bytes(value: bytes) -> bytes:
+    # aligns the following uint32 sections (whitespace keeps the JSON valid)
+    return value + b' ' * (-len(value) % UINT32_SIZE)
+
+
+def get_index_bytes(
+    files: Sequence[IndexedFile],
+    documents: Sequence[IndexedDocument],
+    document_term_frequencies: Sequence[Mapping[str, int]]
+) -> bytes:
+    '''
+    Serializes the index into a compact binary format, with fixed size
+    uint32 sections, so that it can be used directly via mmap:
+    header, meta (JSON), documents, term offsets, postings offsets,
+    postings (document id, term frequency) and the sorted terms.
+    '''
+    postings_by_term: dict[bytes, list[Tuple[int, int]]] = {}
+    for document_id, term_frequencies in enumerate(document_term_frequencies):
+        for term, term_frequency in term_frequencies.items():
+            postings_by_term.setdefault(term.encode('utf-8'), []).append(
+                (document_id, term_frequency)
+            )
+    sorted_terms = sorted(postings_by_term.keys())
+    term_offsets = [0]
+    postings_offsets = [0]
+    postings: list[int] = []
+    for term_bytes in sorted_terms:
+        term_offsets.append(term_offsets[-1] + len(term_bytes))
+        for document_id, term_frequency in postings_by_term[term_bytes]:
+            postings.extend((document_id, term_frequency))
+        postings_offsets.append(len(postings) // 2)
+    meta = get_padded_bytes(json.dumps({
+        'files': [[f.name, f.mtime_ns, f.size] for f in files]
+    }).encode('utf-8'))
+    average_document_length = (
+        sum(document.length for document in documents) / len(documents)
+        if documents else 0.0
+    )
+    return b''.join([
+        INDEX_HEADER.pack(
+            INDEX_MAGIC,
+            len(meta),
+            len(documents),
+            len(sorted_terms),
+            len(postings) // 2,
+            average_document_length
+        ),
+        meta,
+        struct.pack(
+            f'<{len(documents) * 4}I',
+            *(
+                value
+                for document in documents
+                for value in (document.file_index, document.start, document.end, document.length)
+            )
+        ),
+        struct.pack(f'<{len(term_offsets)}I', *term_offsets),
+        struct.pack(f'<{len(postings_offsets)}I', *postings_offsets),
+        struct.pack(f'<{len(postings)}I', *postings),
+        b''.join(sorted_terms)
+    ])
+
+
+class InvalidSearchIndexError(ValueError):
+    pass
+
+
+class SearchIndex:  # pylint: disable=too-many-instance-attributes
+    '''
+    Read-only view over the binary index (e.g. a memory-mapped file),
+    without copying the sections.
+    '''
+
+    def __init__(self, buffer: Any):
+        self._buffer = memoryview(buffer)
+        if len(self._buffer) < INDEX_HEADER.size:
+            raise InvalidSearchIndexError('Truncated search index header')
+        (
+            magic, meta_length, self.document_count, self.term_count,
+            postings_count, self.average_document_length
+        ) = INDEX_HEADER.unpack_from(self._buffer, 0)
+        if magic != INDEX_MAGIC:
+            # e.g. written by a previous version, with a different format
+            raise InvalidSearchIndexError(f'Unsupported search index format: {magic!r}')
+        offset = INDEX_HEADER.size
+        terms_offset = offset + meta_length + UINT32_SIZE * (
+            self.document_count * 4 + (self.term_count + 1) * 2 + postings_count * 2
+        )
+        if meta_length % UINT32_SIZE or terms_offset > len(self._buffer):
+            raise InvalidSearchIndexError('Truncated search index')
+        try:
+            meta = json.loads(bytes(self._buffer[offset:offset + meta_length]))
+            self.files = [IndexedFile(*file_values) for file_values in meta['files']]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise InvalidSearchIndexError(f'Invalid search index meta: {exc!r}') from exc
+        offset += meta_length
+        self._documents = self._get_uint32_view(offset, self.document_count * 4)
+        offset += self.document_count * 4 * UINT32_SIZE
+        self._term_offsets = self._get_uint32_view(offset, self.term_count + 1)
+        offset += (self.term_count + 1) * UINT32_SIZE
+        self._postings_offsets = self._get_uint32_view(offset, self.term_count + 1)
+        offset += (self.term_count + 1) * UINT32_SIZE
+        self._postings = self._get_uint32_view(offset, postings_count * 2)
+        offset += postings_count * 2 * UINT32_SIZE
+        self._terms = self._buffer[offset:]
+        if self._term_offsets[-1] != len(self._terms):
+            raise InvalidSearchIndexError('Truncated search index terms')
+
+    def _get_uint32_view(self, offset: int, count: int) -> memoryview:
+        return self._buffer[offset:offset + count * UINT32_SIZE].cast('I')
+
+    def get_term(self, term_index: int) -> bytes:
+        return bytes(
+            self._terms[self._term_offsets[term_index]:self._term_offsets[term_index + 1]]
+        )
+
+    def get_term_index(self, term: bytes) -> Optional[int]:
+        low = 0
+        high = self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            middle_term = self.get_term(middle)
+            if middle_term < term:
+                low = middle + 1
+            elif middle_term > term:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def get_postings(self, term_index: int) -> Iterable[Tuple[int, int]]:
+        postings = self._postings
+        for posting_index in range(
+            self._postings_offsets[term_index], self._postings_offsets[term_index + 1]
+        ):
+            yield postings[posting_index * 2], postings[posting_index * 2 + 1]
+
+    def get_document(self, document_id: int) -> IndexedDocument:
+        offset = document_id * 4
+        return IndexedDocument(*self._documents[offset:offset + 4])
+
+    def get_document_term_frequencies(
+        self,
+        document_ids: set[int]
+    ) -> Mapping[int, Mapping[str, int]]:
+        # inverts the postings, to reuse documents of unchanged files
+        term_frequencies_by_document_id: dict[int, dict[str, int]] = {
+            document_id: {} for document_id in document_ids
+        }
+        for term_index in range(self.term_count):
+            term: Optional[str] = None
+            for document_id, term_frequency in self.get_postings(term_index):
+                if document_id in document_ids:
+                    if term is None:
+                        term = self.get_term(term_index).decode('utf-8')
+                    term_frequencies_by_document_id[document_id][term] = term_frequency
+        return term_frequencies_by_document_id
+
+    def search(self, query_terms: Sequence[str], top_k: int) -> Sequence[Tuple[float, int]]:
+        scores: dict[int, float] = {}
+        for term in set(query_terms):
+            term_index = self.get_term_index(term.encode('utf-8'))
+            if term_index is None:
+                continue
+            postings = list(self.get_postings(term_index))
+            document_frequency = len(postings)
+            idf = math.log(
+                1 + (self.document_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            for document_id, term_frequency in postings:
+                document_length = self._documents[document_id * 4 + 3]
+                scores[document_id] = scores.get(document_id, 0.0) + idf * (
+                    term_frequency * (BM25_K1 + 1)
+                    / (
+                        term_frequency
+                        + BM25_K1 * (
+                            1 - BM25_B
+                            + BM25_B * document_length / (self.average_document_length or 1)
+                        )
+                    )
+                )
+        return heapq.nlargest(
+            top_k,
+            ((score, document_id) for document_id, score in scores.items())
+        )
+
+
+def get_document_ids_by_file(
+    index: Optional[SearchIndex]
+) -> Mapping[IndexedFile, Sequence[int]]:
+    document_ids_by_file: dict[IndexedFile, list[int]] = {}
+    if index is not None:
+        for document_id in range(index.document_count):
+            indexed_file = index.files[index.get_document(document_id).file_index]
+            document_ids_by_file.setdefault(indexed_file, []).append(document_id)
+    return document_ids_by_file
+
+
+def get_indexed_files(root: Path, file_names: Sequence[str]) -> Sequence[IndexedFile]:
+    indexed_files = []
+    for file_name in file_names:
+        stat_result = os.stat(root / file_name)
+        indexed_files.append(
+            IndexedFile(file_name, stat_result.st_mtime_ns, stat_result.st_size)
+        )
+    return indexed_files
+
+
+def get_updated_index_bytes(  # pylint: disable=too-many-locals
+    root: Path,
+    file_names: Sequence[str],
+    previous_index: Optional[SearchIndex],
+    max_document_bytes: int = DEFAULT_MAX_DOCUMENT_BYTES
+) -> bytes:
+    '''
+    Only reads and tokenizes new or changed files, documents of unchanged
+    files are taken from the previous index.
+    '''
+    previous_document_ids_by_file = get_document_ids_by_file(previous_index)
+    files = get_indexed_files(root, file_names)
+    reused_document_ids = {
+        document_id
+        for indexed_file in files
+        for document_id in previous_document_ids_by_file.get(indexed_file, [])
+    }
+    previous_term_frequencies = (
+        previous_index.get_document_term_frequencies(reused_document_ids)
+        if previous_index is not None and reused_document_ids
+        else {}
+    )
+    documents: list[IndexedDocument] = []
+    document_term_frequencies: list[Mapping[str, int]] = []
+    changed_file_count = 0
+    for file_index, indexed_file in enumerate(files):
+        if indexed_file in previous_document_ids_by_file:
+            assert previous_index is not None
+            for document_id in previous_document_ids_by_file[indexed_file]:
+                previous_document = previous_index.get_document(document_id)
+                documents.append(IndexedDocument(
+                    file_index,
+                    previous_document.start,
+                    previous_document.end,
+                    previous_document.length
+                ))
+                document_term_frequencies.append(previous_term_frequencies[document_id])
+            continue
+        changed_file_count += 1
+        content = (root / indexed_file.name).read_bytes()
+        for start, end in iter_document_ranges(content, max_document_bytes):
+            tokens = get_tokens(content[start:end].decode('utf-8', errors='ignore'))
+            documents.append(IndexedDocument(file_index, start, end, len(tokens)))
+            document_term_frequencies.append(Counter(tokens))
+    LOGGER.info(
+        'Indexed %d files (%d new or changed), %d documents',
+        len(files), changed_file_count, len(documents)
+    )
+    return get_index_bytes(files, documents, document_term_frequencies)
+
+
+def get_mapped_index_file(index_path: str) -> Optional[mmap.mmap]:
+    try:
+        with open(index_path, 'rb') as index_fp:
+            return mmap.mmap(index_fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def get_mapped_search_index(index_path: str) -> Optional[SearchIndex]:
+    mapped_index = get_mapped_index_file(index_path)
+    if mapped_index is None:
+        return None
+    try:
+        return SearchIndex(mapped_index)
+    except InvalidSearchIndexError as exc:
+        # rebuilt from scratch
+        LOGGER.warning('Ignoring invalid search index %r: %r', index_path, exc)
+        return None
+
+
+def save_index_bytes(index_path: str, index_bytes: bytes):
+    temp_index_path = f'{index_path}.{os.getpid()}.tmp'
+    with open(temp_index_path, 'wb') as index_fp:
+        index_fp.write(index_bytes)
+    # existing mappings of the previous index stay valid
+    os.replace(temp_index_path, index_path)
+
+
+def get_snippet(text: str, query_terms: Sequence[str], snippet_length: int) -> str:
+    lower_text = text.lower()
+    positions = [
+        position
+        for position in (lower_text.find(term) for term in query_terms)
+        if position >= 0
+    ]
+    start = max(0, min(positions, default=0) - snippet_length // 4)
+    end = min(len(text), start + snippet_length)
+    snippet = text[start:end].strip()
+    return ('...' if start > 0 else '') + snippet + ('...' if end < len(text) else '')
+
+
+class FullTextSearchTool(ToolClass):  # pylint: disable=too-many-instance-attributes
+    '''
+    Keyword search over local files, returning the top-k snippets (BM25 ranking).
+    '''
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        path: str,
+        file_pattern: str = '**/*',
+        index_path: Optional[str] = None,
+        top_k: int = DEFAULT_TOP_K,
+        snippet_length: int = DEFAULT_SNIPPET_LENGTH,
+        max_document_bytes: int = DEFAULT_MAX_DOCUMENT_BYTES,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        logger: Optional[logging.Logger] = None
+    ):
+        super().__init__()
+        self.path = path
+        self.file_pattern = file_pattern
+        self.index_path = index_path
+        self.top_k = top_k
+        self.snippet_length = snippet_length
+        self.max_document_bytes = max_document_bytes
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.logger = logger or LOGGER
+        self.root = Path(path) if os.path.isdir(path) else Path(path).parent
+        self._lock = threading.Lock()
+        self._index: Optional[SearchIndex] = None
+        self._last_refresh_time: Optional[float] = None
+        if index_path:
+            self._index = get_mapped_search_index(index_path)
+        self.refresh_index_if_changed(force=True)
+
+    def is_index_file(self, file_path: Path) -> bool:
+        # e.g. an index within the indexed directory, or its temporary file while saving
+        if not self.index_path:
+            return False
+        index_path = Path(self.index_path).resolve()
+        file_path = file_path.resolve()
+        return file_path == index_path or (
+            file_path.parent == index_path.parent
+            and file_path.name.startswith(f'{index_path.name}.')
+            and file_path.name.endswith('.tmp')
+        )
+
+    def get_file_names(self) -> Sequence[str]:
+        if not os.path.isdir(self.path):
+            return [Path(self.path).name]
+        return sorted(
+            str(file_path.relative_to(self.root))
+            for file_path in self.root.glob(self.file_pattern)
+            if file_path.is_file() and not self.is_index_file(file_path)
+        )
+
+    def is_index_up_to_date(self, file_names: Sequence[str]) -> bool:
+        if self._index is None:
+            return False
+        indexed_files = self._index.files
+        if [indexed_file.name for indexed_file in indexed_files] != list(file_names):
+            return False
+        for indexed_file in indexed_files:
+            stat_result = os.stat(self.root / indexed_file.name)
+            if (stat_result.st_mtime_ns, stat_result.st_size) != (
+                indexed_file.mtime_ns, indexed_file.size
+            ):
+                return False
+        return True
+
+    def refresh_index_if_changed(self, force: bool = False):
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_refresh_time is not None
+            and now - self._last_refresh_time < self.refresh_interval_seconds
+        ):
+            return
+        with self._lock:
+            self._last_refresh_time = now
+            file_names = self.get_file_names()
+            if self.is_index_up_to_date(file_names):
+                return
+            index_bytes = get_updated_index_bytes(
+                self.root,
+                file_names,
+                previous_index=self._index,
+                max_document_bytes=self.max_document_bytes
+            )
+            if not self.index_path:
+                self._index = SearchIndex(index_bytes)
+                return
+            save_index_bytes(self.index_path, index_bytes)
+            self._index = get_mapped_search_index(self.index_path)
+            assert self._index is not None
+
+    def get_document_text(self, document: IndexedDocument, file_name: str) -> str:
+        with open(self.root / file_name, 'rb') as content_fp:
+            content_fp.seek(document.start)
+            return content_fp.read(document.end - document.start).decode(
+                'utf-8', errors='ignore'
+            )
+
+    def search(self, query: str, top_k: int) -> Sequence[Mapping[str, Any]]:
+        self.refresh_index_if_changed()
+        index = self._index
+        assert index is not None
+        query_terms = get_tokens(query)
+        results = []
+        for score, document_id in index.search(query_terms, top_k=top_k):
+            document = index.get_document(document_id)
+            file_name = index.files[document.file_index].name
+            results.append({
+                'file': file_name,
+                'offset': document.start,
+                'score': round(score, 4),
+                'snippet': get_snippet(
+                    self.get_document_text(document, file_name),
+                    query_terms,
+                    snippet_length=self.snippet_length
+                )
+            })
+        self.logger.info('query %r returned %d results', query, len(results))
+        return results
+
+    def __call__(self, **kwargs):
+        return self.search(
+            kwargs['query'],
+            top_k=kwargs.get('top_k') or self.top_k
+        )
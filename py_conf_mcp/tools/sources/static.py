@@ -1,6 +1,20 @@
 # Mostly copied from smolagents examples
 
+import bisect
+from contextlib import contextmanager
+from dataclasses import dataclass
+import functools
+import hashlib
 import logging
+import math
+import mmap
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Any, Iterator, Optional, Sequence, Tuple
+
+from mcp.types import TextContent
 
 from py_conf_mcp.tools.typing import ToolClass
 
@@ -8,12 +22,266 @@ from py_conf_mcp.tools.typing import ToolClass
 LOGGER = logging.getLogger(__name__)
 
 
+MARKDOWN_HEADING_PATTERN = re.compile(rb'^(#{1,6})[ \t]+(.+?)[ \t#]*$', re.MULTILINE)
+
+MARKDOWN_CODE_FENCE_PATTERN = re.compile(rb'^[ ]{0,3}(`{3,}|~{3,})', re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class ContentSection:
+    level: int
+    title: str
+    start: int
+    end: int
+
+
+def get_code_fence_ranges(content: Any) -> Sequence[Tuple[int, int]]:
+    # a fence is closed by a fence of the same character, at least as long
+    code_fence_ranges = []
+    opening: Optional[Tuple[int, bytes]] = None
+    for match in MARKDOWN_CODE_FENCE_PATTERN.finditer(content):
+        fence = match.group(1)
+        if opening is None:
+            opening = (match.start(), fence)
+        elif fence[:1] == opening[1][:1] and len(fence) >= len(opening[1]):
+            code_fence_ranges.append((opening[0], match.end()))
+            opening = None
+    if opening is not None:
+        # an unclosed code block continues until the end
+        code_fence_ranges.append((opening[0], len(content)))
+    return code_fence_ranges
+
+
+def is_in_ranges(position: int, ranges: Sequence[Tuple[int, int]]) -> bool:
+    index = bisect.bisect_right(ranges, (position, math.inf)) - 1
+    return index >= 0 and ranges[index][0] <= position < ranges[index][1]
+
+
+def get_content_sections(content: Any) -> Sequence[ContentSection]:
+    # scans the (memory-mapped) bytes, without decoding the whole content
+    code_fence_ranges = get_code_fence_ranges(content)
+    headings = [
+        (len(match.group(1)), match.group(2).decode('utf-8', errors='replace'), match.start())
+        for match in MARKDOWN_HEADING_PATTERN.finditer(content)
+        # e.g. comments in a shell code block
+        if not is_in_ranges(match.start(), code_fence_ranges)
+    ]
+    sections = []
+    for index, (level, title, start) in enumerate(headings):
+        end = len(content)
+        for next_level, _, next_start in headings[index + 1:]:
+            if next_level <= level:
+                end = next_start
+                break
+        sections.append(ContentSection(level=level, title=title, start=start, end=end))
+    return sections
+
+
+def get_decoded_bytes(content_bytes: bytes) -> str:
+    # a slice by offset may split a multi-byte character
+    return content_bytes.decode('utf-8', errors='ignore')
+
+
+@dataclass(frozen=True)
+class MappedContent:
+    '''
+    Immutable snapshot of a mapped file, the text is only decoded for
+    the requested range (e.g. a section).
+    '''
+    content: Any
+    content_hash: str
+    sections: Sequence[ContentSection]
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def get_text(self, start: int = 0, end: Optional[int] = None) -> str:
+        return get_decoded_bytes(self.content[start:end])
+
+    @functools.cached_property
+    def text_content(self) -> TextContent:
+        # the whole content, only decoded once per mapping
+        return TextContent(type='text', text=self.get_text())
+
+    def close(self):
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+    def get_section(self, title: str) -> Optional[ContentSection]:
+        normalized_title = title.strip().lower()
+        for section in self.sections:
+            if section.title.strip().lower() == normalized_title:
+                return section
+        return None
+
+
+EMPTY_MAPPED_CONTENT = MappedContent(
+    content=b'',
+    content_hash=hashlib.sha256(b'').hexdigest(),
+    sections=[]
+)
+
+
+class MappedContentFile:
+    '''
+    Memory-maps a file, so that its pages are shared between workers,
+    and remaps it when the file changes.
+    The content is read via `read_mapped_content`, as a previous mapping is closed
+    when remapping (reading the mapping of a file truncated in place would crash
+    the process with SIGBUS).
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._mapped_content = EMPTY_MAPPED_CONTENT
+        self.refresh_if_changed()
+
+    def _map(self, file_state: Tuple[int, int]):
+        if file_state[1] == 0:
+            # empty files can't be memory-mapped
+            mapped_content = EMPTY_MAPPED_CONTENT
+        else:
+            with open(self.path, 'rb') as content_fp:
+                content = mmap.mmap(content_fp.fileno(), 0, access=mmap.ACCESS_READ)
+            mapped_content = MappedContent(
+                content=content,
+                content_hash=hashlib.sha256(content).hexdigest(),
+                sections=get_content_sections(content)
+            )
+        previous_mapped_content = self._mapped_content
+        self._mapped_content = mapped_content
+        self._file_state = file_state
+        # no concurrent call is reading it, as the lock is held
+        previous_mapped_content.close()
+        LOGGER.info(
+            'Mapped %r (size: %d, sha256: %s, sections: %d)',
+            self.path, file_state[1], mapped_content.content_hash,
+            len(mapped_content.sections)
+        )
+
+    def refresh_if_changed(self):
+        stat_result = os.stat(self.path)
+        file_state = (stat_result.st_mtime_ns, stat_result.st_size)
+        if file_state == self._file_state:
+            return
+        with self._lock:
+            if file_state != self._file_state:
+                self._map(file_state)
+
+    @contextmanager
+    def read_mapped_content(self) -> Iterator[MappedContent]:
+        with self._lock:
+            yield self._mapped_content
+
+    @property
+    def content_hash(self) -> str:
+        return self._mapped_content.content_hash
+
+    @property
+    def sections(self) -> Sequence[ContentSection]:
+        return self._mapped_content.sections
+
+
 class StaticContentTool(ToolClass):
     def __init__(
         self,
-        content: str
+        content: Optional[str] = None,
+        *,
+        path: Optional[str] = None,
+        file_pattern: str = '**/*'
     ):
+        if (content is None) == (path is None):
+            raise ValueError('Either content or path is required')
         self.content = content
+        self.path = path
+        # returned as is, rather than wrapped (and serialized) for every call
+        self._text_content = (
+            TextContent(type='text', text=content) if content is not None else None
+        )
+        self.file_pattern = file_pattern
+        self._mapped_files: dict[str, MappedContentFile] = {}
+        self._lock = threading.Lock()
+
+    def get_file_names(self) -> Sequence[str]:
+        assert self.path
+        root = Path(self.path)
+        return sorted(
+            str(file_path.relative_to(root))
+            for file_path in root.glob(self.file_pattern)
+            if file_path.is_file()
+        )
+
+    def get_file_path(self, file_name: Optional[str]) -> str:
+        assert self.path
+        if not os.path.isdir(self.path):
+            return self.path
+        if not file_name:
+            raise ValueError('file_name is required, one of: ' + ', '.join(self.get_file_names()))
+        root = Path(self.path).resolve()
+        file_path = (root / file_name).resolve()
+        if not file_path.is_relative_to(root) or not file_path.is_file():
+            raise ValueError(f'Unknown file: {repr(file_name)}')
+        return str(file_path)
+
+    def get_mapped_file(self, file_name: Optional[str]) -> MappedContentFile:
+        file_path = self.get_file_path(file_name)
+        mapped_file = self._mapped_files.get(file_path)
+        if mapped_file is None:
+            with self._lock:
+                mapped_file = self._mapped_files.get(file_path)
+                if mapped_file is None:
+                    mapped_file = MappedContentFile(file_path)
+                    self._mapped_files[file_path] = mapped_file
+                    return mapped_file
+        mapped_file.refresh_if_changed()
+        return mapped_file
+
+    def get_file_content(
+        self,
+        file_name: Optional[str],
+        section: Optional[str],
+        offset: Optional[int],
+        length: Optional[int]
+    ) -> Any:
+        # the same snapshot for the sections and the text, which isn't remapped meanwhile
+        with self.get_mapped_file(file_name).read_mapped_content() as mapped_content:
+            return self.get_mapped_content_range(mapped_content, section, offset, length)
+
+    def get_mapped_content_range(
+        self,
+        mapped_content: MappedContent,
+        section: Optional[str],
+        offset: Optional[int],
+        length: Optional[int]
+    ) -> Any:
+        start = 0
+        end = len(mapped_content)
+        if section:
+            content_section = mapped_content.get_section(section)
+            if content_section is None:
+                raise ValueError(
+                    f'Unknown section: {repr(section)}, available sections: '
+                    + ', '.join(repr(s.title) for s in mapped_content.sections)
+                )
+            start, end = content_section.start, content_section.end
+        if offset:
+            start = min(end, start + offset)
+        if length is not None:
+            end = min(end, start + length)
+        if (start, end) == (0, len(mapped_content)):
+            return mapped_content.text_content
+        return mapped_content.get_text(start, end)
 
-    def __call__(self):
-        return self.content
+    def __call__(self, **kwargs):
+        if self._text_content is not None:
+            return self._text_content
+        # optional inputs, to select a section (by heading) or a slice
+        # (by byte offset and length, relative to the section)
+        return self.get_file_content(
+            file_name=kwargs.get('file_name'),
+            section=kwargs.get('section'),
+            offset=kwargs.get('offset'),
+            length=kwargs.get('length')
+        )
@@ -1,14 +1,36 @@
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import datetime
+import email.utils
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
-from pathlib import Path
-from typing import Any, Mapping, Optional, TypedDict
+import pickle
+import threading
+import time
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, TypedDict, Union
+from urllib.parse import urlsplit
 
+import httpx
+import ijson  # type: ignore[import-untyped]
 import jinja2
 import requests
 import requests.auth
 
 from py_conf_mcp.tools.typing import ToolClass
+from py_conf_mcp.utils.logging import TruncatedLogValue, get_payload_summary
+from py_conf_mcp.utils.memory import (
+    account_memory,
+    account_memory_for_value,
+    check_memory_available,
+    get_current_memory_budget,
+    iter_with_memory_accounting
+)
+from py_conf_mcp.utils.projection import get_optional_compiled_projection
+from py_conf_mcp.utils.secret_provider import SECRET_TEMPLATE_GLOBALS
 
 
 LOGGER = logging.getLogger(__name__)
@@ -18,15 +40,14 @@ def get_requests_session() -> requests.Session:
     return requests.Session()
 
 
-def read_secret_from_env(var_name: str) -> str:
-    path = os.environ[var_name]
-    return Path(path).read_text(encoding='utf-8')
+def get_compiled_template(template: str) -> jinja2.Template:
+    compiled_template = jinja2.Template(template)
+    compiled_template.globals.update(SECRET_TEMPLATE_GLOBALS)
+    return compiled_template
 
 
 def get_evaluated_template(template: str, variables: Mapping[str, Any]) -> Any:
-    compiled_template = jinja2.Template(template)
-    compiled_template.globals['read_secret_from_env'] = read_secret_from_env
-    return compiled_template.render(variables)
+    return get_compiled_template(template).render(variables)
 
 
 def get_evaluated_query_parameters(
@@ -48,53 +69,621 @@ def get_optional_evaluated_json_body(
     return json.loads(get_evaluated_template(json_template, variables))
 
 
+# ijson prefix segment, matching each item of an array
+JSON_PATH_ARRAY_ITEM = 'item'
+
+
+def get_json_path_segments(json_path: str) -> Sequence[str]:
+    return [segment for segment in json_path.split('.') if segment]
+
+
+def iter_json_path_values(value: Any, path_segments: Sequence[str]) -> Iterator[Any]:
+    if not path_segments:
+        yield value
+        return
+    segment, *remaining_segments = path_segments
+    if segment == JSON_PATH_ARRAY_ITEM:
+        if isinstance(value, list):
+            for item in value:
+                yield from iter_json_path_values(item, remaining_segments)
+    elif isinstance(value, dict) and segment in value:
+        yield from iter_json_path_values(value[segment], remaining_segments)
+
+
+def get_json_path_result(values: Iterable[Any], json_path: str) -> Any:
+    # paths through arrays result in a list of all matches, otherwise the first match
+    if JSON_PATH_ARRAY_ITEM in get_json_path_segments(json_path):
+        return list(values)
+    return next(iter(values), None)
+
+
+def get_response_json_for_json_path(response_json: Any, json_path: str) -> Any:
+    return get_json_path_result(
+        iter_json_path_values(response_json, get_json_path_segments(json_path)),
+        json_path=json_path
+    )
+
+
+def get_streamed_response_json_for_json_path(
+    response: 'HttpResponse',
+    json_path: str
+) -> Any:
+    # parse incrementally from the raw stream, only materialising matched values
+    response.raw.decode_content = True
+    return get_json_path_result(
+        iter_with_memory_accounting(ijson.items(
+            response.raw,
+            '.'.join(get_json_path_segments(json_path)),
+            use_float=True
+        )),
+        json_path=json_path
+    )
+
+
+def get_response_content_length(response: 'HttpResponse') -> Optional[int]:
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+RESPONSE_CONTENT_CHUNK_SIZE = 64 * 1024
+
+
+def get_response_content_with_memory_accounting(response: 'HttpResponse') -> bytes:
+    '''
+    Reads the (streamed) response content in chunks, accounting each chunk,
+    so that a response exceeding the memory budget fails while downloading.
+    '''
+    content_length = get_response_content_length(response)
+    if content_length is not None:
+        # fail before downloading the content
+        check_memory_available(content_length)
+    chunks = []
+    for chunk in response.iter_content(chunk_size=RESPONSE_CONTENT_CHUNK_SIZE):
+        account_memory(len(chunk))
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def get_parsed_response_json(response: 'HttpResponse') -> Any:
+    if get_current_memory_budget() is None:
+        return response.json()
+    return account_memory_for_value(json.loads(
+        get_response_content_with_memory_accounting(response)
+    ))
+
+
+CACHEABLE_HTTP_METHODS = {'GET', 'HEAD'}
+
+DEFAULT_HTTP_CACHE_MAX_ENTRIES = 1000
+
+
+@dataclass(frozen=True)
+class HttpCacheControl:
+    max_age: Optional[int] = None
+    no_store: bool = False
+    no_cache: bool = False
+
+    @staticmethod
+    def from_header(cache_control_header: Optional[str]) -> 'HttpCacheControl':
+        max_age: Optional[int] = None
+        no_store = False
+        no_cache = False
+        for directive in (cache_control_header or '').split(','):
+            name, _, value = directive.strip().partition('=')
+            name = name.lower()
+            if name == 'max-age':
+                try:
+                    max_age = int(value.strip('"'))
+                except ValueError:
+                    pass
+            elif name == 'no-store':
+                no_store = True
+            elif name == 'no-cache':
+                no_cache = True
+        return HttpCacheControl(max_age=max_age, no_store=no_store, no_cache=no_cache)
+
+    def get_fresh_seconds(self) -> int:
+        if self.no_cache or self.max_age is None:
+            return 0
+        return max(0, self.max_age)
+
+
+def get_http_date_timestamp(http_date: Optional[str]) -> Optional[float]:
+    if not http_date:
+        return None
+    try:
+        parsed_datetime = email.utils.parsedate_to_datetime(http_date)
+    except (TypeError, ValueError):
+        return None
+    if parsed_datetime.tzinfo is None:
+        parsed_datetime = parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+    return parsed_datetime.timestamp()
+
+
+def get_response_age_seconds(headers: Mapping[str, str]) -> int:
+    try:
+        return max(0, int(headers.get('Age') or 0))
+    except ValueError:
+        return 0
+
+
+def get_response_fresh_seconds(headers: Mapping[str, str], now: float) -> float:
+    cache_control = HttpCacheControl.from_header(headers.get('Cache-Control'))
+    if cache_control.no_cache:
+        return 0
+    if cache_control.max_age is not None:
+        # max-age takes precedence over Expires
+        freshness_lifetime = float(cache_control.get_fresh_seconds())
+    else:
+        expires_timestamp = get_http_date_timestamp(headers.get('Expires'))
+        if expires_timestamp is None:
+            # also for invalid dates (e.g. `0`), which mean already expired
+            return 0
+        date_timestamp = get_http_date_timestamp(headers.get('Date'))
+        freshness_lifetime = expires_timestamp - (
+            date_timestamp if date_timestamp is not None else now
+        )
+    # the time the response already spent in other caches
+    return max(0.0, freshness_lifetime - get_response_age_seconds(headers))
+
+
+@dataclass(frozen=True)
+class HttpCacheEntry:
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def get_conditional_headers(self) -> Mapping[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def get_http_cache_entry_for_response(
+    response: 'HttpResponse',
+    content: bytes,
+    now: float
+) -> Optional[HttpCacheEntry]:
+    cache_control = HttpCacheControl.from_header(response.headers.get('Cache-Control'))
+    if cache_control.no_store:
+        return None
+    entry = HttpCacheEntry(
+        content=content,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+        expires_at=now + get_response_fresh_seconds(response.headers, now=now)
+    )
+    if not entry.is_fresh(now) and not entry.get_conditional_headers():
+        # neither fresh nor can it be revalidated
+        return None
+    return entry
+
+
+def get_http_cache_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any],
+    json_body: Optional[Any] = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> str:
+    key_json = json.dumps(
+        [
+            method,
+            url,
+            sorted(params.items()),
+            json_body,
+            sorted((name.lower(), value) for name, value in (headers or {}).items())
+        ],
+        default=str,
+        sort_keys=True
+    )
+    # hashed, as header values may be secrets (e.g. tokens)
+    return hashlib.sha256(key_json.encode('utf-8')).hexdigest()
+
+
+class HttpCache:
+    '''
+    Bounded in-memory LRU store for HTTP responses,
+    optionally backed by files in a directory (e.g. to survive restarts).
+    '''
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_HTTP_CACHE_MAX_ENTRIES,
+        cache_dir: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[str, HttpCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_cache_file(self, key: str) -> str:
+        assert self.cache_dir
+        return os.path.join(
+            self.cache_dir,
+            hashlib.sha256(key.encode('utf-8')).hexdigest() + '.pickle'
+        )
+
+    def _load_from_disk(self, key: str) -> Optional[HttpCacheEntry]:
+        try:
+            with open(self._get_cache_file(key), 'rb') as cache_fp:
+                entry = pickle.load(cache_fp)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            LOGGER.warning('Ignoring invalid HTTP cache entry: %r', exc)
+            return None
+        return entry if isinstance(entry, HttpCacheEntry) else None
+
+    def _save_to_disk(self, key: str, entry: HttpCacheEntry):
+        cache_file = self._get_cache_file(key)
+        temp_cache_file = f'{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_cache_file, 'wb') as cache_fp:
+            pickle.dump(entry, cache_fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_cache_file, cache_file)
+
+    def get(self, key: str) -> Optional[HttpCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.cache_dir:
+            return None
+        entry = self._load_from_disk(key)
+        if entry is not None:
+            self._put_in_memory(key, entry)
+        return entry
+
+    def _put_in_memory(self, key: str, entry: HttpCacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def put(self, key: str, entry: HttpCacheEntry):
+        self._put_in_memory(key, entry)
+        if self.cache_dir:
+            self._save_to_disk(key, entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class BasicAuthConfig(TypedDict):
     username: str
     password: str
 
 
+class TemplateHTTPBasicAuth(requests.auth.HTTPBasicAuth):
+    '''
+    Basic auth, with the credentials rendered again for each request,
+    so that rotated secrets are used (secret lookups are cached).
+    The templates are compiled once, and rendered per request, without storing
+    the credentials on the (shared) instance.
+    '''
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        basic_auth: BasicAuthConfig
+    ):
+        self.basic_auth = basic_auth
+        self._username_template = get_compiled_template(basic_auth['username'])
+        self._password_template = get_compiled_template(basic_auth['password'])
+
+    @staticmethod
+    def get_template_variables() -> Mapping[str, Any]:
+        return {'env': os.environ}
+
+    @property
+    def username(self) -> str:  # type: ignore[override]
+        return self._username_template.render(self.get_template_variables())
+
+    @property
+    def password(self) -> str:  # type: ignore[override]
+        return self._password_template.render(self.get_template_variables())
+
+    def get_credentials(self) -> Tuple[str, str]:
+        variables = self.get_template_variables()
+        return (
+            self._username_template.render(variables),
+            self._password_template.render(variables)
+        )
+
+    def __call__(self, r):
+        username, password = self.get_credentials()
+        # pylint: disable-next=protected-access
+        r.headers['Authorization'] = requests.auth._basic_auth_str(username, password)
+        return r
+
+
 def get_requests_auth(
     basic_auth: Optional[BasicAuthConfig]
-) -> Optional[requests.auth.HTTPBasicAuth]:
+) -> Optional[TemplateHTTPBasicAuth]:
     if not basic_auth:
         return None
-    variables = {
-        'env': os.environ
-    }
-    return requests.auth.HTTPBasicAuth(
-        username=get_evaluated_template(
-            basic_auth['username'],
-            variables=variables
-        ),
-        password=get_evaluated_template(
-            basic_auth['password'],
-            variables=variables
-        )
+    return TemplateHTTPBasicAuth(basic_auth)
+
+
+DEFAULT_HTTP2_MAX_CONNECTIONS_PER_CLIENT = 10
+
+
+@functools.lru_cache(maxsize=None)
+def get_http2_client(verify_ssl: bool) -> httpx.Client:
+    # shared within the process, so that concurrent calls to the same host
+    # are multiplexed over a single connection (requires the h2 package)
+    return httpx.Client(
+        http2=True,
+        verify=verify_ssl,
+        # no timeout, same as requests
+        timeout=None,
+        limits=httpx.Limits(max_connections=DEFAULT_HTTP2_MAX_CONNECTIONS_PER_CLIENT)
     )
 
 
+class Http2ResponseStream(io.RawIOBase):
+    '''
+    File-like view over the (decoded) streamed content, like `requests.Response.raw`.
+    '''
+
+    def __init__(self, response: httpx.Response):
+        super().__init__()
+        self.decode_content = True
+        self._iterator = response.iter_bytes()
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer:
+            chunk = next(self._iterator, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class Http2Response:
+    '''
+    Exposes the subset of `requests.Response` used by the tool,
+    with HTTP errors raised as `requests.HTTPError`.
+    '''
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def content(self) -> bytes:
+        return self.response.read()
+
+    @functools.cached_property
+    def raw(self) -> Http2ResponseStream:
+        return Http2ResponseStream(self.response)
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        return self.response.iter_bytes(chunk_size=chunk_size)
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        try:
+            self.response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise requests.HTTPError(str(exc)) from exc
+
+    def close(self):
+        self.response.close()
+
+
+HttpResponse = Union[requests.Response, Http2Response]
+
+
 class WebApiTool(ToolClass):  # pylint: disable=too-many-instance-attributes
-    def __init__(  # pylint: disable=too-many-arguments
+    TEMPLATE_PARAMETER_NAMES = (
+        'url', 'query_parameters', 'json_template', 'response_template', 'basic_auth'
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         url: str,
         *,
         query_parameters: Optional[Mapping[str, str]] = None,
         json_template: Optional[str] = None,
         response_template: Optional[str] = None,
+        response_projection: Optional[str] = None,
         headers: Optional[Mapping[str, str]] = None,
         method: str = 'GET',
         verify_ssl: bool = True,
-        basic_auth: Optional[BasicAuthConfig] = None
+        basic_auth: Optional[BasicAuthConfig] = None,
+        response_json_path: Optional[str] = None,
+        stream_response: bool = False,
+        http_cache: bool = False,
+        http_cache_max_entries: int = DEFAULT_HTTP_CACHE_MAX_ENTRIES,
+        http_cache_dir: Optional[str] = None,
+        http2: bool = False,
+        http2_hosts: Optional[Sequence[str]] = None,
+        logger: Optional[logging.Logger] = None
     ):
         super().__init__()
         self.url = url
         self.query_parameters = query_parameters or {}
         self.json_template = json_template
         self.response_template = response_template
+        # a JMESPath expression (requires jmespath), compiled once, e.g. as a faster
+        # alternative to response_template for reshaping; applied after response_json_path,
+        # which is an ijson prefix (e.g. `data.items.item`) selecting values while parsing
+        self.response_projection = get_optional_compiled_projection(response_projection)
         self.method = method
         self.verify_ssl = verify_ssl
         self.headers = headers
         self.auth = get_requests_auth(basic_auth)
+        self.response_json_path = response_json_path
+        self.stream_response = stream_response
+        self.http_cache: Optional[HttpCache] = None
+        if http_cache:
+            self.http_cache = HttpCache(
+                max_entries=http_cache_max_entries,
+                cache_dir=http_cache_dir
+            )
+        self.http2 = http2
+        self.http2_hosts = set(http2_hosts or [])
+        if self.http2 or self.http2_hosts:
+            # fail early, e.g. if h2 is not installed
+            get_http2_client(verify_ssl)
+        self.logger = logger or LOGGER
+
+    def get_response_json_for_json_path(self, response_json: Any) -> Any:
+        if self.response_json_path:
+            return get_response_json_for_json_path(
+                response_json,
+                json_path=self.response_json_path
+            )
+        return response_json
+
+    def get_response_json(self, response: HttpResponse) -> Any:
+        if self.stream_response:
+            return get_streamed_response_json_for_json_path(
+                response,
+                json_path=self.response_json_path or ''
+            )
+        return self.get_response_json_for_json_path(get_parsed_response_json(response))
+
+    def is_stream_request(self) -> bool:
+        # with a memory budget, the content is read in chunks with accounting
+        return self.stream_response or get_current_memory_budget() is not None
+
+    def is_http2_enabled_for_url(self, url: str) -> bool:
+        if self.http2:
+            return True
+        return bool(self.http2_hosts) and urlsplit(url).hostname in self.http2_hosts
+
+    def request_http2(
+        self,
+        *,
+        url: str,
+        params: Mapping[str, Any],
+        json_body: Optional[Any],
+        headers: Optional[Mapping[str, str]]
+    ) -> Http2Response:
+        client = get_http2_client(self.verify_ssl)
+        request = client.build_request(
+            method=self.method,
+            url=url,
+            params=params,
+            headers=headers,
+            json=json_body
+        )
+        return Http2Response(client.send(
+            request,
+            auth=httpx.BasicAuth(*self.auth.get_credentials()) if self.auth else None,
+            stream=self.is_stream_request()
+        ))
+
+    def request(  # pylint: disable=too-many-arguments
+        self,
+        session: requests.Session,
+        *,
+        url: str,
+        params: Mapping[str, Any],
+        json_body: Optional[Any],
+        headers: Optional[Mapping[str, str]]
+    ) -> HttpResponse:
+        if self.is_http2_enabled_for_url(url):
+            return self.request_http2(
+                url=url,
+                params=params,
+                json_body=json_body,
+                headers=headers
+            )
+        return session.request(
+            method=self.method,
+            url=url,
+            params=params,
+            headers=headers,
+            auth=self.auth,
+            verify=self.verify_ssl,
+            json=json_body,
+            stream=self.is_stream_request()
+        )
+
+    def is_http_cache_enabled_for_request(self) -> bool:
+        return (
+            self.http_cache is not None
+            and self.method.upper() in CACHEABLE_HTTP_METHODS
+            and not self.stream_response
+        )
+
+    def get_cached_response_content(
+        self,
+        session: requests.Session,
+        *,
+        url: str,
+        params: Mapping[str, Any],
+        json_body: Optional[Any]
+    ) -> bytes:
+        assert self.http_cache is not None
+        cache_key = get_http_cache_key(
+            self.method, url, params, json_body=json_body, headers=self.headers
+        )
+        cached_entry = self.http_cache.get(cache_key)
+        now = time.time()
+        if cached_entry is not None and cached_entry.is_fresh(now):
+            self.logger.info('using fresh cached response')
+            return cached_entry.content
+        headers = dict(self.headers or {})
+        if cached_entry is not None:
+            headers.update(cached_entry.get_conditional_headers())
+        response = self.request(
+            session,
+            url=url,
+            params=params,
+            json_body=json_body,
+            headers=headers
+        )
+        if cached_entry is not None and response.status_code == 304:
+            self.logger.info('using revalidated cached response')
+            self.http_cache.put(cache_key, replace(
+                cached_entry,
+                etag=response.headers.get('ETag') or cached_entry.etag,
+                last_modified=(
+                    response.headers.get('Last-Modified') or cached_entry.last_modified
+                ),
+                expires_at=now + get_response_fresh_seconds(response.headers, now=now)
+            ))
+            response.close()
+            return cached_entry.content
+        try:
+            response.raise_for_status()
+            content_length = get_response_content_length(response)
+            if content_length is not None:
+                # fail before downloading the content (accounted for by the caller)
+                check_memory_available(content_length)
+            content = response.content
+        finally:
+            response.close()
+        entry = get_http_cache_entry_for_response(response, content=content, now=now)
+        if entry is not None:
+            self.http_cache.put(cache_key, entry)
+        return content
 
     def __call__(self, **kwargs):
         session = get_requests_session()
@@ -107,24 +696,41 @@ class WebApiTool(ToolClass):  # pylint: disable=too-many-instance-attributes
             self.json_template,
             kwargs
         )
-        LOGGER.info(
+        self.logger.info(
             'url: %r (method: %r, params: %r, kwargs: %r, has_json_body: %r)',
-            url, self.method, params, kwargs, bool(json_body)
+            TruncatedLogValue(url),
+            self.method,
+            TruncatedLogValue(params),
+            TruncatedLogValue(kwargs),
+            bool(json_body)
         )
-        LOGGER.info('json_body: %r', json_body)
-        response = session.request(
-            method=self.method,
-            url=url,
-            params=params,
-            headers=self.headers,
-            auth=self.auth,
-            verify=self.verify_ssl,
-            json=json_body
-        )
-        response.raise_for_status()
-        response_json = response.json()
+        self.logger.debug('json_body: %r', TruncatedLogValue(json_body))
+        if self.is_http_cache_enabled_for_request():
+            content = self.get_cached_response_content(
+                session, url=url, params=params, json_body=json_body
+            )
+            account_memory(len(content))
+            response_json = self.get_response_json_for_json_path(
+                account_memory_for_value(json.loads(content))
+            )
+        else:
+            response = self.request(
+                session,
+                url=url,
+                params=params,
+                json_body=json_body,
+                headers=self.headers
+            )
+            try:
+                response.raise_for_status()
+                response_json = self.get_response_json(response)
+            finally:
+                response.close()
+        self.logger.info('response_json: %s', get_payload_summary(response_json))
+        if self.response_projection is not None:
+            response_json = self.response_projection(response_json)
         if not self.response_template:
-            LOGGER.info('response_json: %r', response_json)
+            self.logger.debug('response_json: %r', TruncatedLogValue(response_json))
             return response_json
         response_content = get_evaluated_template(
             self.response_template,
@@ -133,5 +739,8 @@ class WebApiTool(ToolClass):  # pylint: disable=too-many-instance-attributes
                 'params': params
             }
         )
-        LOGGER.info('response_content after template: %r', response_content)
+        self.logger.debug(
+            'response_content after template: %r',
+            TruncatedLogValue(response_content)
+        )
         return response_content
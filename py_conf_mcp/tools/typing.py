@@ -1,6 +1,14 @@
-from typing import Protocol
+from typing import Any, ClassVar, Mapping, Protocol, Sequence
 
 
 class ToolClass(Protocol):
+    # init parameters evaluated as Jinja templates (checked by the config validation)
+    TEMPLATE_PARAMETER_NAMES: ClassVar[Sequence[str]] = ()
+
+    @classmethod
+    def get_referenced_tool_names(cls, init_parameters: Mapping[str, Any]) -> Sequence[str]:
+        # other configured tools called by the tool (e.g. the branches of a composite tool)
+        return []
+
     def __call__(self):
         pass
@@ -0,0 +1,25 @@
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Optional
+
+
+def get_running_loop_or_none() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_mapped_maybe_awaitable(
+    value: Any | Awaitable[Any],
+    map_fn: Callable[[Any], Any]
+) -> Any:
+    '''
+    Applies `map_fn` to the value, or to the awaited value if it is awaitable.
+    This allows sync tool function wrappers to also wrap async tool functions.
+    '''
+    if inspect.isawaitable(value):
+        async def _get_awaited_and_mapped() -> Any:
+            return map_fn(await value)
+        return _get_awaited_and_mapped()
+    return map_fn(value)
@@ -1,6 +1,18 @@
+import base64
 import csv
+import datetime
+import decimal
 from io import StringIO
-from typing import Iterable
+import itertools
+import json
+from typing import Any, Iterable, Iterator
+
+from py_conf_mcp.utils.memory import account_memory
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]  # pylint: disable=invalid-name
 
 
 def get_json_as_csv_lines(json_list: Iterable[dict]) -> Iterable[str]:
@@ -16,4 +28,85 @@ def get_json_as_csv_lines(json_list: Iterable[dict]) -> Iterable[str]:
     writer = csv.DictWriter(buffer, fieldnames=fieldnames)
     writer.writeheader()
     writer.writerows(json_list)
+    # the encoded lines are kept in addition to the rows
+    account_memory(buffer.tell())
     return buffer.getvalue().splitlines()
+
+
+def iter_json_as_csv_chunks(
+    json_iterable: Iterable[dict],
+    chunk_size: int = 1000
+) -> Iterator[str]:
+    '''
+    Streaming alternative to `get_json_as_csv_lines`, for rows sharing the same keys
+    (e.g. query results). The columns are taken from the first row.
+    Joining the chunks results in the lines joined by a new line.
+    '''
+    json_iterator = iter(json_iterable)
+    first_row = next(json_iterator, None)
+    if first_row is None:
+        return
+    buffer = StringIO()
+    writer = csv.DictWriter(
+        buffer,
+        fieldnames=list(first_row.keys()),
+        extrasaction='ignore',
+        lineterminator='\n'
+    )
+    writer.writeheader()
+    rows: Iterator[dict] = itertools.chain([first_row], json_iterator)
+    is_first_chunk = True
+    while True:
+        chunk_rows = list(itertools.islice(rows, chunk_size))
+        if not chunk_rows:
+            break
+        writer.writerows(chunk_rows)
+        chunk = buffer.getvalue().rstrip('\n')
+        buffer.seek(0)
+        buffer.truncate()
+        yield chunk if is_first_chunk else '\n' + chunk
+        is_first_chunk = False
+
+
+def get_json_serializable_value(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        # as a string, to not lose precision (e.g. BigQuery NUMERIC)
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode('ascii')
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def get_json_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(  # pylint: disable=no-member
+            value,
+            default=get_json_serializable_value,
+            option=orjson.OPT_NON_STR_KEYS  # pylint: disable=no-member
+        )
+    return json.dumps(
+        value,
+        default=get_json_serializable_value,
+        ensure_ascii=False,
+        separators=(',', ':')
+    ).encode('utf-8')
+
+
+def get_json_str(value: Any) -> str:
+    return get_json_bytes(value).decode('utf-8')
+
+
+def get_serialized_tool_result(result: Any) -> str:
+    '''
+    Serializer for tool results. Tools may return already serialized JSON as bytes,
+    which is passed through without encoding it again.
+    '''
+    if isinstance(result, str):
+        return result
+    if isinstance(result, (bytes, bytearray)):
+        return result.decode('utf-8')
+    return get_json_str(result)
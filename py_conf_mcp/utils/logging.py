@@ -0,0 +1,87 @@
+import logging
+import random
+import reprlib
+from typing import Any
+
+
+DEFAULT_MAX_LOG_VALUE_LENGTH = 1000
+
+TRUNCATION_MARKER = '...'
+
+
+def get_truncated_str(value: str, max_length: int = DEFAULT_MAX_LOG_VALUE_LENGTH) -> str:
+    if len(value) <= max_length:
+        return value
+    return value[:max_length] + TRUNCATION_MARKER
+
+
+def get_repr_for_max_length(max_length: int) -> reprlib.Repr:
+    # reprlib only visits a bounded number of items and nesting levels,
+    # so the cost does not grow with the size of the payload
+    return reprlib.Repr(
+        maxlevel=4,
+        maxlist=20,
+        maxtuple=20,
+        maxdict=20,
+        maxset=20,
+        maxfrozenset=20,
+        maxdeque=20,
+        maxarray=20,
+        maxstring=max_length,
+        maxlong=max_length,
+        maxother=max_length
+    )
+
+
+def get_truncated_repr(value: Any, max_length: int = DEFAULT_MAX_LOG_VALUE_LENGTH) -> str:
+    return get_truncated_str(
+        get_repr_for_max_length(max_length).repr(value),
+        max_length=max_length
+    )
+
+
+def get_payload_summary(value: Any) -> str:
+    try:
+        return f'{type(value).__name__}(len={len(value)})'
+    except TypeError:
+        return type(value).__name__
+
+
+class TruncatedLogValue:
+    '''
+    Wraps a log argument, so that it is only formatted (and truncated)
+    if the log record is actually emitted.
+    '''
+
+    def __init__(self, value: Any, max_length: int = DEFAULT_MAX_LOG_VALUE_LENGTH):
+        self.value = value
+        self.max_length = max_length
+
+    def __repr__(self) -> str:
+        return get_truncated_repr(self.value, max_length=self.max_length)
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            return get_truncated_str(self.value, max_length=self.max_length)
+        return repr(self)
+
+
+class SamplingFilter(logging.Filter):
+    '''
+    Only lets through a sample of the verbose (by default DEBUG) records.
+    Records above `max_sampled_level` are always let through.
+    '''
+
+    def __init__(
+        self,
+        sample_rate: float,
+        max_sampled_level: int = logging.DEBUG
+    ):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.max_sampled_level = max_sampled_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_sampled_level:
+            return True
+        return random.random() < self.sample_rate
@@ -0,0 +1,106 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import sys
+import threading
+from typing import Any, Iterable, Iterator, Mapping, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+class MemoryBudgetExceededError(RuntimeError):
+    def __init__(self, max_bytes: int, used_bytes: int):
+        super().__init__(
+            f'Memory budget exceeded: the result would use at least {used_bytes} bytes,'
+            f' exceeding the maximum of {max_bytes} bytes'
+        )
+        self.max_bytes = max_bytes
+        self.used_bytes = used_bytes
+
+
+class MemoryBudget:
+    '''
+    Accounts the (estimated) memory of the result being built by a single tool call,
+    which can be shared with worker threads (e.g. fetching result pages).
+    '''
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.exceeded_error: Optional[MemoryBudgetExceededError] = None
+        self._lock = threading.Lock()
+
+    def _raise_if_exceeded(self, used_bytes: int):
+        if self.max_bytes is None or used_bytes <= self.max_bytes:
+            return
+        error = MemoryBudgetExceededError(max_bytes=self.max_bytes, used_bytes=used_bytes)
+        self.exceeded_error = self.exceeded_error or error
+        raise error
+
+    def check_available(self, nbytes: int):
+        # e.g. for a Content-Length, before reading the content
+        self._raise_if_exceeded(self.used_bytes + nbytes)
+
+    def add(self, nbytes: int):
+        with self._lock:
+            self.used_bytes += nbytes
+            used_bytes = self.used_bytes
+        self._raise_if_exceeded(used_bytes)
+
+
+_current_memory_budget: ContextVar[Optional[MemoryBudget]] = ContextVar(
+    'memory_budget', default=None
+)
+
+
+def get_current_memory_budget() -> Optional[MemoryBudget]:
+    return _current_memory_budget.get()
+
+
+@contextmanager
+def memory_budget_context(memory_budget: MemoryBudget) -> Iterator[MemoryBudget]:
+    token = _current_memory_budget.set(memory_budget)
+    try:
+        yield memory_budget
+    finally:
+        _current_memory_budget.reset(token)
+
+
+def get_estimated_size(value: Any) -> int:
+    '''
+    Estimates the memory used by a (JSON like) value, including nested values.
+    Shared values (e.g. interned strings) are counted every time.
+    '''
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            size += get_estimated_size(key) + get_estimated_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += get_estimated_size(item)
+    return size
+
+
+def account_memory(nbytes: int):
+    memory_budget = _current_memory_budget.get()
+    if memory_budget is not None:
+        memory_budget.add(nbytes)
+
+
+def account_memory_for_value(value: T) -> T:
+    memory_budget = _current_memory_budget.get()
+    # only estimate the size if there is a budget to account it to
+    if memory_budget is not None:
+        memory_budget.add(get_estimated_size(value))
+    return value
+
+
+def check_memory_available(nbytes: int):
+    memory_budget = _current_memory_budget.get()
+    if memory_budget is not None:
+        memory_budget.check_available(nbytes)
+
+
+def iter_with_memory_accounting(iterable: Iterable[T]) -> Iterator[T]:
+    for item in iterable:
+        yield account_memory_for_value(item)
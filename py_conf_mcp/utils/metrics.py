@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+import threading
+from typing import Mapping, Optional, Sequence, Tuple
+
+
+MetricLabels = Tuple[Tuple[str, str], ...]
+
+
+class MetricTypes:
+    COUNTER = 'counter'
+    GAUGE = 'gauge'
+
+
+@dataclass(frozen=True)
+class MetricSample:
+    name: str
+    labels: Mapping[str, str]
+    value: float
+    metric_type: str
+
+
+def get_metric_labels(labels: Optional[Mapping[str, str]]) -> MetricLabels:
+    return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+
+def get_prometheus_escaped_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def get_prometheus_metric_line(sample: MetricSample) -> str:
+    if not sample.labels:
+        return f'{sample.name} {sample.value}'
+    labels_str = ','.join(
+        f'{key}="{get_prometheus_escaped_label_value(value)}"'
+        for key, value in sample.labels.items()
+    )
+    return f'{sample.name}{{{labels_str}}} {sample.value}'
+
+
+class MetricsRegistry:
+    '''
+    Minimal in-process registry for counters and gauges,
+    which can be rendered in the Prometheus text format.
+    '''
+
+    def __init__(self):
+        self._values: dict[Tuple[str, MetricLabels], float] = {}
+        self._metric_types: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def increment(
+        self,
+        name: str,
+        value: float = 1.0,
+        labels: Optional[Mapping[str, str]] = None
+    ):
+        key = (name, get_metric_labels(labels))
+        with self._lock:
+            self._metric_types.setdefault(name, MetricTypes.COUNTER)
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set_gauge(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Mapping[str, str]] = None
+    ):
+        key = (name, get_metric_labels(labels))
+        with self._lock:
+            self._metric_types.setdefault(name, MetricTypes.GAUGE)
+            self._values[key] = value
+
+    def remove(
+        self,
+        name: str,
+        labels: Optional[Mapping[str, str]] = None
+    ):
+        # e.g. for gauges of clients that are gone, to not keep their labels forever
+        with self._lock:
+            self._values.pop((name, get_metric_labels(labels)), None)
+
+    def get_value(
+        self,
+        name: str,
+        labels: Optional[Mapping[str, str]] = None
+    ) -> float:
+        return self._values.get((name, get_metric_labels(labels)), 0.0)
+
+    def get_samples(self) -> Sequence[MetricSample]:
+        with self._lock:
+            values = sorted(self._values.items())
+            metric_types = dict(self._metric_types)
+        return [
+            MetricSample(
+                name=name,
+                labels=dict(labels),
+                value=value,
+                metric_type=metric_types[name]
+            )
+            for (name, labels), value in values
+        ]
+
+    def get_prometheus_text(self) -> str:
+        lines = []
+        previous_name = None
+        for sample in self.get_samples():
+            if sample.name != previous_name:
+                lines.append(f'# TYPE {sample.name} {sample.metric_type}')
+                previous_name = sample.name
+            lines.append(get_prometheus_metric_line(sample))
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._metric_types.clear()
+
+
+DEFAULT_METRICS_REGISTRY = MetricsRegistry()
@@ -0,0 +1,49 @@
+'''
+Declarative projections over JSON like values, using JMESPath
+(requires the optional jmespath package), e.g.:
+`data.items[?status == 'active'].{id: id, name: user.name}`
+
+Expressions are compiled once, so that evaluating them doesn't need to parse anything.
+'''
+
+from dataclasses import dataclass
+import functools
+from typing import Any, Optional
+
+try:
+    import jmespath  # type: ignore[import-untyped]
+    import jmespath.exceptions  # type: ignore[import-untyped]
+except ImportError:
+    jmespath = None  # pylint: disable=invalid-name
+
+
+class ProjectionSyntaxError(ValueError):
+    def __init__(self, message: str, expression: str):
+        super().__init__(f'{message} (projection: {repr(expression)})')
+        self.expression = expression
+
+
+@dataclass(frozen=True)
+class CompiledProjection:
+    expression: str
+    parsed_result: Any
+
+    def __call__(self, value: Any) -> Any:
+        return self.parsed_result.search(value)
+
+
+@functools.lru_cache(maxsize=1000)
+def compile_projection(expression: str) -> CompiledProjection:
+    if jmespath is None:
+        raise ImportError('Projections require the jmespath package')
+    try:
+        parsed_result = jmespath.compile(expression)
+    except jmespath.exceptions.JMESPathError as exc:
+        raise ProjectionSyntaxError(str(exc), expression=expression) from exc
+    return CompiledProjection(expression=expression, parsed_result=parsed_result)
+
+
+def get_optional_compiled_projection(
+    expression: Optional[str]
+) -> Optional[CompiledProjection]:
+    return compile_projection(expression) if expression else None
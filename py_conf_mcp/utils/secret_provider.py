@@ -0,0 +1,173 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_SECRET_CHECK_INTERVAL_SECONDS = 1.0
+
+
+class SecretBackends:
+    ENV = 'env'
+    ENV_FILE = 'env_file'
+    FILE = 'file'
+
+
+class SecretBackend(ABC):
+    @abstractmethod
+    def get_secret(self, name: str) -> str:
+        pass
+
+    def get_version(self, name: str) -> Optional[Hashable]:  # pylint: disable=unused-argument
+        # None: the secret does not change while the process is running
+        return None
+
+
+def get_file_version(path: str) -> Hashable:
+    # follows symlinks, i.e. also detects an atomically swapped mounted secret
+    stat_result = os.stat(path)
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class EnvSecretBackend(SecretBackend):
+    '''
+    Secret values passed in directly via environment variables.
+    '''
+
+    def get_secret(self, name: str) -> str:
+        return os.environ[name]
+
+
+class FileSecretBackend(SecretBackend):
+    '''
+    Secret values read from files (e.g. mounted secrets), by path.
+    '''
+
+    def get_path(self, name: str) -> str:
+        return name
+
+    def get_secret(self, name: str) -> str:
+        return Path(self.get_path(name)).read_text(encoding='utf-8')
+
+    def get_version(self, name: str) -> Optional[Hashable]:
+        return get_file_version(self.get_path(name))
+
+
+class EnvFileSecretBackend(FileSecretBackend):
+    '''
+    Secret values read from files, with the path in an environment variable.
+    '''
+
+    def get_path(self, name: str) -> str:
+        return os.environ[name]
+
+    def get_version(self, name: str) -> Optional[Hashable]:
+        path = self.get_path(name)
+        return (path, get_file_version(path))
+
+
+@dataclass
+class CachedSecret:
+    value: str
+    version: Optional[Hashable]
+    checked_at: float
+
+
+class SecretProvider:
+    '''
+    Caches secrets in memory, so that templates can read them on every call.
+    The version of a cached secret (e.g. the file mtime) is only checked
+    at most once per check interval, so that rotated secrets are picked up
+    without a restart.
+    '''
+
+    def __init__(
+        self,
+        backends: Optional[Mapping[str, SecretBackend]] = None,
+        check_interval_seconds: float = DEFAULT_SECRET_CHECK_INTERVAL_SECONDS
+    ):
+        self.backends: dict[str, SecretBackend] = dict(backends or {
+            SecretBackends.ENV: EnvSecretBackend(),
+            SecretBackends.ENV_FILE: EnvFileSecretBackend(),
+            SecretBackends.FILE: FileSecretBackend()
+        })
+        self.check_interval_seconds = check_interval_seconds
+        self._cached_secrets: dict[Tuple[str, str], CachedSecret] = {}
+        self._lock = threading.Lock()
+
+    def register_backend(self, backend_name: str, backend: SecretBackend):
+        with self._lock:
+            self.backends[backend_name] = backend
+            self._cached_secrets = {
+                key: cached_secret
+                for key, cached_secret in self._cached_secrets.items()
+                if key[0] != backend_name
+            }
+
+    def get_backend(self, backend_name: str) -> SecretBackend:
+        backend = self.backends.get(backend_name)
+        if backend is None:
+            raise ValueError(f'Unknown secret backend: {repr(backend_name)}')
+        return backend
+
+    def _get_loaded_secret(
+        self,
+        key: Tuple[str, str],
+        cached_secret: Optional[CachedSecret],
+        now: float
+    ) -> CachedSecret:
+        backend = self.get_backend(key[0])
+        version = backend.get_version(key[1])
+        if cached_secret is not None and cached_secret.version == version:
+            cached_secret.checked_at = now
+            return cached_secret
+        if cached_secret is not None:
+            LOGGER.info('Reloading changed secret %r (backend: %r)', key[1], key[0])
+        loaded_secret = CachedSecret(
+            value=backend.get_secret(key[1]),
+            version=version,
+            checked_at=now
+        )
+        self._cached_secrets[key] = loaded_secret
+        return loaded_secret
+
+    def get_secret(self, name: str, backend_name: str = SecretBackends.ENV_FILE) -> str:
+        key = (backend_name, name)
+        now = time.monotonic()
+        cached_secret = self._cached_secrets.get(key)
+        if cached_secret is not None and (
+            cached_secret.version is None
+            or now - cached_secret.checked_at < self.check_interval_seconds
+        ):
+            return cached_secret.value
+        with self._lock:
+            return self._get_loaded_secret(key, self._cached_secrets.get(key), now).value
+
+    def clear(self):
+        with self._lock:
+            self._cached_secrets.clear()
+
+
+DEFAULT_SECRET_PROVIDER = SecretProvider()
+
+
+def read_secret_from_env(var_name: str) -> str:
+    return DEFAULT_SECRET_PROVIDER.get_secret(var_name, SecretBackends.ENV_FILE)
+
+
+def read_secret(name: str, backend_name: str = SecretBackends.ENV_FILE) -> str:
+    return DEFAULT_SECRET_PROVIDER.get_secret(name, backend_name)
+
+
+SECRET_TEMPLATE_GLOBALS = {
+    'read_secret_from_env': read_secret_from_env,
+    'read_secret': read_secret
+}
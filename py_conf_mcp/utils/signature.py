@@ -0,0 +1,20 @@
+import inspect
+from typing import Any, Callable, Mapping
+
+
+def get_arguments_with_defaults(
+    tool_fn: Callable,
+    arguments: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    # inputs are otherwise only defaulted by FastMCP, when called by a client
+    signature = inspect.signature(tool_fn)
+    bound_arguments = signature.bind_partial(**arguments)
+    bound_arguments.apply_defaults()
+    arguments_with_defaults: dict[str, Any] = {}
+    for name, value in bound_arguments.arguments.items():
+        kind = signature.parameters[name].kind
+        if kind == inspect.Parameter.VAR_KEYWORD:
+            arguments_with_defaults.update(value)
+        elif kind != inspect.Parameter.VAR_POSITIONAL:
+            arguments_with_defaults[name] = value
+    return arguments_with_defaults
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Mapping
+
+import jinja2
+
+from py_conf_mcp.utils.secret_provider import SECRET_TEMPLATE_GLOBALS
+
+
+def get_quoted_string(value: str) -> str:
+    # standard SQL, a quote is escaped by doubling it
+    return "'" + value.replace("'", "''") + "'"
+
+
+def toquoted(value: str) -> str:
+    if value is None:
+        raise ValueError('value must not be none')
+    return get_quoted_string(value)
+
+
+def get_evaluated_sql_template(
+    template: str,
+    variables: Mapping[str, Any],
+    toquoted_filter: Callable[[str], str] = toquoted
+) -> str:
+    # the `toquoted` filter depends on the SQL dialect (e.g. BigQuery escapes quotes)
+    env = jinja2.Environment()
+    env.filters['toquoted'] = toquoted_filter
+    env.globals.update(SECRET_TEMPLATE_GLOBALS)
+    compiled_template = env.from_string(template)
+    return compiled_template.render(variables)
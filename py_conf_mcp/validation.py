@@ -0,0 +1,397 @@
+import importlib
+import inspect
+import logging
+from typing import Any, Iterable, Mapping, Sequence
+
+import jinja2
+import pydantic
+
+from py_conf_mcp.config import (
+    AdmissionControlConfig,
+    ClientFairnessConfig,
+    AppConfig,
+    FromPythonClassConfig,
+    FromPythonFunctionConfig,
+    ToolDefinitionsConfig,
+    get_tool_config_by_name
+)
+from py_conf_mcp.config_typing import InputConfigDict
+from py_conf_mcp.tools.resolver import (
+    get_inspect_parameter_annotation_for_input_config_dict,
+    get_referenced_tool_names
+)
+from py_conf_mcp.tools.admission_control import PRIORITY_CLASSES
+from py_conf_mcp.tools.result_cache import ResultCacheBackends
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConfigValidationError(ValueError):
+    def __init__(self, errors: Sequence[str]):
+        super().__init__(
+            f'Invalid config ({len(errors)} errors):\n'
+            + '\n'.join(f'- {error}' for error in errors)
+        )
+        self.errors = errors
+
+
+def is_template(value: str) -> bool:
+    return '{{' in value or '{%' in value
+
+
+def iter_template_errors(value: Any, path: str) -> Iterable[str]:
+    if isinstance(value, str):
+        if not is_template(value):
+            return
+        try:
+            # only parse, custom filters are registered by the individual tools
+            jinja2.Environment().parse(value)
+        except jinja2.TemplateSyntaxError as exc:
+            yield f'{path}: invalid template: {exc} (line {exc.lineno})'
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            yield from iter_template_errors(item, f'{path}.{key}')
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            yield from iter_template_errors(item, f'{path}[{index}]')
+
+
+def iter_input_errors(
+    input_name: str,
+    input_config_dict: InputConfigDict,
+    path: str
+) -> Iterable[str]:
+    if 'type' not in input_config_dict:
+        yield f'{path}: missing type'
+        return
+    try:
+        annotation = get_inspect_parameter_annotation_for_input_config_dict(
+            input_config_dict
+        )
+        model = pydantic.create_model(  # type: ignore
+            f'{input_name}_Input',
+            **{input_name: (annotation, ...)}
+        )
+        model.model_json_schema()
+    except Exception:  # pylint: disable=broad-exception-caught
+        yield f'{path}: invalid type {repr(input_config_dict["type"])}'
+        return
+    if 'default' in input_config_dict:
+        try:
+            model.model_validate({input_name: input_config_dict['default']})
+        except pydantic.ValidationError as exc:
+            yield (
+                f'{path}: invalid default {repr(input_config_dict["default"])}: '
+                + '; '.join(error['msg'] for error in exc.errors())
+            )
+
+
+def get_template_parameter_names(
+    tool_class: type,
+    parameters: Mapping[str, inspect.Parameter],
+    init_parameters: Mapping[str, Any]
+) -> set[str]:
+    '''
+    The parameters declared as templates by the tool class, and parameters with
+    an enabled `is_<name>_template` flag (e.g. `sql_query`).
+    Other values may contain `{{` literally (e.g. static content).
+    '''
+    template_parameter_names = set(getattr(tool_class, 'TEMPLATE_PARAMETER_NAMES', ()))
+    for name, parameter in parameters.items():
+        if not (name.startswith('is_') and name.endswith('_template')):
+            continue
+        template_parameter_name = name[len('is_'):-len('_template')]
+        if init_parameters.get(name, parameter.default) is True:
+            template_parameter_names.add(template_parameter_name)
+        else:
+            template_parameter_names.discard(template_parameter_name)
+    return template_parameter_names
+
+
+def iter_init_parameter_errors(
+    tool_class: type,
+    init_parameters: Mapping[str, Any],
+    path: str
+) -> Iterable[str]:
+    parameters = inspect.signature(tool_class).parameters
+    accepts_kwargs = any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    )
+    if not accepts_kwargs:
+        for key in init_parameters.keys():
+            if key not in parameters:
+                yield (
+                    f'{path}.initParameters.{key}: unknown parameter'
+                    f' (expected one of: {", ".join(parameters.keys())})'
+                )
+    for parameter in parameters.values():
+        if (
+            parameter.default is inspect.Parameter.empty
+            and parameter.kind not in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD
+            )
+            and parameter.name not in init_parameters
+        ):
+            yield f'{path}.initParameters.{parameter.name}: missing required parameter'
+    template_parameter_names = get_template_parameter_names(
+        tool_class,
+        parameters,
+        init_parameters
+    )
+    for key, value in init_parameters.items():
+        if key in template_parameter_names:
+            yield from iter_template_errors(value, f'{path}.initParameters.{key}')
+
+
+def iter_from_python_function_errors(
+    config: FromPythonFunctionConfig,
+    path: str
+) -> Iterable[str]:
+    try:
+        tool_module = importlib.import_module(config.module)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        yield f'{path}.module: failed to import {repr(config.module)}: {exc!r}'
+        return
+    tool = getattr(tool_module, config.key, None)
+    if tool is None:
+        yield f'{path}.key: {repr(config.key)} not found in {repr(config.module)}'
+    elif not callable(tool):
+        yield f'{path}.key: {repr(config.key)} is not callable'
+
+
+def iter_output_policy_errors(
+    config: FromPythonClassConfig,
+    path: str
+) -> Iterable[str]:
+    # a limit of 0 would result in pages (and cursors) without any content
+    for key, value in [
+        ('maxItems', config.output_policy.max_items),
+        ('maxBytes', config.output_policy.max_bytes)
+    ]:
+        if value is not None and value <= 0:
+            yield f'{path}.outputPolicy.{key}: must be greater than 0'
+
+
+def iter_result_cache_errors(
+    config: FromPythonClassConfig,
+    path: str
+) -> Iterable[str]:
+    backend = config.result_cache.backend
+    if backend is None:
+        return
+    if backend not in (
+        ResultCacheBackends.MEMORY,
+        ResultCacheBackends.SQLITE,
+        ResultCacheBackends.NETWORK
+    ):
+        yield f'{path}.resultCache.backend: unsupported backend {repr(backend)}'
+    elif backend == ResultCacheBackends.SQLITE and not config.result_cache.path:
+        yield f'{path}.resultCache.path: required for the sqlite backend'
+    elif backend == ResultCacheBackends.NETWORK and not config.result_cache.url:
+        yield f'{path}.resultCache.url: required for the network backend'
+
+
+def iter_refresh_ahead_errors(
+    config: FromPythonClassConfig,
+    path: str
+) -> Iterable[str]:
+    if not config.refresh_ahead:
+        return
+    if not config.result_cache:
+        yield f'{path}.refreshAhead: requires resultCache'
+    elif config.refresh_ahead.interval_seconds >= config.result_cache.ttl_seconds:
+        yield (
+            f'{path}.refreshAhead.intervalSeconds: must be less than'
+            f' resultCache.ttlSeconds ({config.result_cache.ttl_seconds})'
+        )
+
+
+def iter_memory_budget_errors(
+    config: FromPythonClassConfig,
+    path: str
+) -> Iterable[str]:
+    max_bytes = config.memory_budget.max_bytes
+    if max_bytes is not None and max_bytes <= 0:
+        yield f'{path}.memoryBudget.maxBytes: must be greater than 0'
+    if not 0 <= config.memory_budget.trace_sample_rate <= 1:
+        yield f'{path}.memoryBudget.traceSampleRate: must be between 0 and 1'
+
+
+def iter_from_python_class_errors(
+    config: FromPythonClassConfig,
+    path: str
+) -> Iterable[str]:
+    for input_name, input_config_dict in config.inputs.items():
+        yield from iter_input_errors(
+            input_name,
+            input_config_dict,
+            path=f'{path}.inputs.{input_name}'
+        )
+    yield from iter_output_policy_errors(config, path)
+    yield from iter_result_cache_errors(config, path)
+    yield from iter_refresh_ahead_errors(config, path)
+    yield from iter_memory_budget_errors(config, path)
+    try:
+        tool_module = importlib.import_module(config.module)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        yield f'{path}.module: failed to import {repr(config.module)}: {exc!r}'
+        return
+    tool_class = getattr(tool_module, config.class_name, None)
+    if not isinstance(tool_class, type):
+        yield f'{path}.className: {repr(config.class_name)} is not a class'
+        return
+    yield from iter_init_parameter_errors(
+        tool_class,
+        config.init_parameters,
+        path=path
+    )
+
+
+def iter_tool_definitions_errors(
+    tool_definitions_config: ToolDefinitionsConfig
+) -> Iterable[str]:
+    tool_names: set[str] = set()
+    for index, from_python_function_config in enumerate(
+        tool_definitions_config.from_python_function
+    ):
+        path = f'toolDefinitions.fromPythonFunction[{index}]'
+        if from_python_function_config.name in tool_names:
+            yield f'{path}.name: duplicate tool {repr(from_python_function_config.name)}'
+        tool_names.add(from_python_function_config.name)
+        yield from iter_from_python_function_errors(from_python_function_config, path)
+    for index, from_python_class_config in enumerate(
+        tool_definitions_config.from_python_class
+    ):
+        path = f'toolDefinitions.fromPythonClass[{index}]'
+        if from_python_class_config.name in tool_names:
+            yield f'{path}.name: duplicate tool {repr(from_python_class_config.name)}'
+        tool_names.add(from_python_class_config.name)
+        yield from iter_from_python_class_errors(from_python_class_config, path)
+
+
+def iter_tool_reference_errors(
+    tool_definitions_config: ToolDefinitionsConfig
+) -> Iterable[str]:
+    '''
+    Reports unknown referenced tools and reference cycles (e.g. a -> b -> a),
+    which would otherwise recurse while resolving the tools.
+    '''
+    path_by_tool_name = {
+        **{
+            config.name: f'toolDefinitions.fromPythonFunction[{index}]'
+            for index, config in enumerate(tool_definitions_config.from_python_function)
+        },
+        **{
+            config.name: f'toolDefinitions.fromPythonClass[{index}]'
+            for index, config in enumerate(tool_definitions_config.from_python_class)
+        }
+    }
+    referenced_tool_names_by_name: dict[str, Sequence[str]] = {}
+    for tool_name, tool_config in get_tool_config_by_name(tool_definitions_config).items():
+        try:
+            referenced_tool_names_by_name[tool_name] = get_referenced_tool_names(tool_config)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. failing to import the tool class (reported for the tool definition)
+            referenced_tool_names_by_name[tool_name] = []
+    for tool_name, referenced_tool_names in referenced_tool_names_by_name.items():
+        for referenced_tool_name in referenced_tool_names:
+            if referenced_tool_name not in referenced_tool_names_by_name:
+                yield (
+                    f'{path_by_tool_name[tool_name]}.initParameters:'
+                    f' unknown referenced tool {repr(referenced_tool_name)}'
+                )
+    visited_tool_names: set[str] = set()
+
+    def iter_cycle_errors(tool_name: str, tool_name_path: list[str]) -> Iterable[str]:
+        for referenced_tool_name in referenced_tool_names_by_name.get(tool_name, []):
+            if referenced_tool_name in tool_name_path:
+                cycle = tool_name_path[tool_name_path.index(referenced_tool_name):]
+                yield (
+                    f'{path_by_tool_name[tool_name]}.initParameters:'
+                    f' tool reference cycle: {" -> ".join([*cycle, referenced_tool_name])}'
+                )
+            elif referenced_tool_name not in visited_tool_names:
+                visited_tool_names.add(referenced_tool_name)
+                yield from iter_cycle_errors(
+                    referenced_tool_name,
+                    [*tool_name_path, referenced_tool_name]
+                )
+
+    for tool_name in referenced_tool_names_by_name:
+        if tool_name not in visited_tool_names:
+            visited_tool_names.add(tool_name)
+            yield from iter_cycle_errors(tool_name, [tool_name])
+
+
+def iter_admission_control_errors(
+    admission_control_config: AdmissionControlConfig,
+    tool_names: Sequence[str]
+) -> Iterable[str]:
+    path = 'server.admissionControl'
+    for tool_name, priority in admission_control_config.tool_priorities.items():
+        if tool_name not in tool_names:
+            yield f'{path}.toolPriorities.{tool_name}: unknown server tool'
+        if priority not in PRIORITY_CLASSES:
+            yield (
+                f'{path}.toolPriorities.{tool_name}: unsupported priority {repr(priority)}'
+                f' (expected one of: {", ".join(PRIORITY_CLASSES)})'
+            )
+    if not 0 < admission_control_config.low_priority_threshold_ratio <= 1:
+        yield f'{path}.lowPriorityThresholdRatio: must be greater than 0 and at most 1'
+
+
+def iter_client_fairness_errors(
+    client_fairness_config: ClientFairnessConfig,
+    tool_names: Sequence[str]
+) -> Iterable[str]:
+    path = 'server.clientFairness'
+    for key, value in [
+        ('maxConcurrentCalls', client_fairness_config.max_concurrent_calls),
+        ('maxConcurrentCallsPerClient', client_fairness_config.max_concurrent_calls_per_client)
+    ]:
+        if value is not None and value <= 0:
+            yield f'{path}.{key}: must be greater than 0'
+    max_queued_calls = client_fairness_config.max_queued_calls_per_client
+    if max_queued_calls is not None and max_queued_calls < 0:
+        yield f'{path}.maxQueuedCallsPerClient: must not be negative'
+    for client_id, weight in client_fairness_config.client_weights.items():
+        if not weight > 0:
+            yield f'{path}.clientWeights.{client_id}: must be greater than 0'
+    for tool_name, tool_quota in client_fairness_config.tool_quotas.items():
+        if tool_name not in tool_names:
+            yield f'{path}.toolQuotas.{tool_name}: unknown server tool'
+        if tool_quota.max_calls < 0:
+            yield f'{path}.toolQuotas.{tool_name}.maxCalls: must not be negative'
+        if not tool_quota.window_seconds > 0:
+            yield f'{path}.toolQuotas.{tool_name}.windowSeconds: must be greater than 0'
+
+
+def get_app_config_errors(app_config: AppConfig) -> Sequence[str]:
+    errors = list(iter_tool_definitions_errors(app_config.tool_definitions))
+    errors.extend(iter_tool_reference_errors(app_config.tool_definitions))
+    tool_names = {
+        *(config.name for config in app_config.tool_definitions.from_python_function),
+        *(config.name for config in app_config.tool_definitions.from_python_class)
+    }
+    for index, tool_name in enumerate(app_config.server.tools):
+        if tool_name not in tool_names:
+            errors.append(f'server.tools[{index}]: unknown tool {repr(tool_name)}')
+    errors.extend(iter_admission_control_errors(
+        app_config.server.admission_control,
+        tool_names=app_config.server.tools
+    ))
+    errors.extend(iter_client_fairness_errors(
+        app_config.server.client_fairness,
+        tool_names=app_config.server.tools
+    ))
+    return errors
+
+
+def validate_app_config(app_config: AppConfig):
+    errors = get_app_config_errors(app_config)
+    if errors:
+        raise ConfigValidationError(errors)
+    LOGGER.info('Config is valid')
@@ -1,13 +1,21 @@
+from pathlib import Path
+
 import pytest
+from starlette.testclient import TestClient
 
-from py_conf_mcp.cli import create_mcp_for_app_config
+from py_conf_mcp.cli import create_mcp_for_app_config, get_http_middleware, validate
 from py_conf_mcp.config import (
     AppConfig,
+    ClientFairnessConfig,
+    EnvironmentVariables,
     FromPythonClassConfig,
     FromPythonFunctionConfig,
     ServerConfig,
-    ToolDefinitionsConfig
+    ToolDefinitionsConfig,
+    ToolQuotaConfig
 )
+from py_conf_mcp.utils.metrics import DEFAULT_METRICS_REGISTRY
+from py_conf_mcp.validation import ConfigValidationError
 
 
 FROM_PYTHON_FUNCTION_CONFIG_1 = FromPythonFunctionConfig(
@@ -57,3 +65,133 @@ class TestCreateMcpForAppConfig:
         assert mcp.name == 'Test MCP Server'
         tools = await mcp.get_tools()
         assert tools
+
+    def test_should_fail_to_create_mcp_with_invalid_config(self):
+        with pytest.raises(ConfigValidationError):
+            create_mcp_for_app_config(app_config=AppConfig(
+                tool_definitions=ToolDefinitionsConfig(),
+                server=ServerConfig(name='Test MCP Server', tools=['unknown'])
+            ))
+
+
+class TestValidate:
+    def test_should_return_true_for_valid_config(self, mock_env: dict, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text(
+            "server:\n  name: 'Test MCP Server'\n  tools: []\n",
+            encoding='utf-8'
+        )
+        mock_env[EnvironmentVariables.CONFIG_FILE] = str(config_file)
+        assert validate() is True
+
+    def test_should_return_false_for_invalid_config(self, mock_env: dict, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text(
+            "server:\n  name: 'Test MCP Server'\n  tools: ['unknown']\n",
+            encoding='utf-8'
+        )
+        mock_env[EnvironmentVariables.CONFIG_FILE] = str(config_file)
+        assert validate() is False
+
+
+class TestGetHttpMiddleware:
+    def test_should_return_no_middleware_if_disabled(self):
+        assert not get_http_middleware(gzip_minimum_size=0)
+
+    def test_should_compress_large_json_responses(self):
+        mcp = create_mcp_for_app_config(
+            app_config=AppConfig(
+                tool_definitions=ToolDefinitionsConfig(
+                    from_python_class=[FROM_PYTHON_CLASS_CONFIG_1]
+                ),
+                server=ServerConfig(
+                    name='Test MCP Server',
+                    tools=[FROM_PYTHON_CLASS_CONFIG_1.name]
+                )
+            ),
+            json_response=True
+        )
+        app = mcp.http_app(middleware=list(get_http_middleware(gzip_minimum_size=10)))
+        with TestClient(app) as client:
+            response = client.post(
+                '/mcp/',
+                json={
+                    'jsonrpc': '2.0',
+                    'id': 1,
+                    'method': 'tools/call',
+                    'params': {'name': FROM_PYTHON_CLASS_CONFIG_1.name, 'arguments': {}}
+                },
+                headers={
+                    'Accept': 'application/json, text/event-stream',
+                    'Accept-Encoding': 'gzip'
+                }
+            )
+        assert response.status_code == 200
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.json()['result']['content'][0]['text'] == 'Static content'
+
+
+class TestClientFairness:
+    def test_should_enforce_tool_quota_per_client_id_header(self):
+        mcp = create_mcp_for_app_config(
+            app_config=AppConfig(
+                tool_definitions=ToolDefinitionsConfig(
+                    from_python_class=[FROM_PYTHON_CLASS_CONFIG_1]
+                ),
+                server=ServerConfig(
+                    name='Test MCP Server',
+                    tools=[FROM_PYTHON_CLASS_CONFIG_1.name],
+                    client_fairness=ClientFairnessConfig(
+                        client_id_header='X-Client-Id',
+                        max_concurrent_calls_per_client=1,
+                        tool_quotas={
+                            FROM_PYTHON_CLASS_CONFIG_1.name: ToolQuotaConfig(
+                                max_calls=1, window_seconds=60
+                            )
+                        }
+                    )
+                )
+            ),
+            json_response=True
+        )
+
+        with TestClient(mcp.http_app()) as client:
+            def call_tool(client_id: str) -> dict:
+                return client.post(
+                    '/mcp/',
+                    json={
+                        'jsonrpc': '2.0',
+                        'id': 1,
+                        'method': 'tools/call',
+                        'params': {'name': FROM_PYTHON_CLASS_CONFIG_1.name, 'arguments': {}}
+                    },
+                    headers={
+                        'Accept': 'application/json, text/event-stream',
+                        'X-Client-Id': client_id
+                    }
+                ).json()['result']
+
+            assert call_tool('client_1')['content'][0]['text'] == 'Static content'
+            assert call_tool('client_1')['isError']
+            assert not call_tool('client_2')['isError']
+
+
+class TestMetricsRoute:
+    def test_should_return_metrics_in_prometheus_format(self):
+        mcp = create_mcp_for_app_config(
+            app_config=AppConfig(
+                tool_definitions=ToolDefinitionsConfig(
+                    from_python_class=[FROM_PYTHON_CLASS_CONFIG_1]
+                ),
+                server=ServerConfig(
+                    name='Test MCP Server',
+                    tools=[FROM_PYTHON_CLASS_CONFIG_1.name]
+                )
+            )
+        )
+        DEFAULT_METRICS_REGISTRY.increment('test_metric_total', labels={'tool': 'tool_1'})
+        with TestClient(mcp.http_app()) as client:
+            response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/plain')
+        assert 'test_metric_total{tool="tool_1"}' in response.text
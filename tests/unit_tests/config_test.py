@@ -1,15 +1,30 @@
+import os
 from pathlib import Path
+import threading
+from unittest.mock import patch
 
 import yaml
 
+from py_conf_mcp import config as config_module
 from py_conf_mcp.config import (
+    AdmissionControlConfig,
+    ClientFairnessConfig,
     FromPythonClassConfig,
     ServerConfig,
     AppConfig,
     EnvironmentVariables,
     FromPythonFunctionConfig,
+    LogConfig,
+    MemoryBudgetConfig,
+    OutputPolicyConfig,
+    RefreshAheadConfig,
+    ResultCacheConfig,
     ToolDefinitionsConfig,
-    load_app_config
+    ToolQuotaConfig,
+    get_app_config_files,
+    get_merged_app_config_dict,
+    load_app_config,
+    load_app_config_from_file
 )
 from py_conf_mcp.config_typing import (
     FromPythonClassConfigDict,
@@ -120,6 +135,97 @@ class TestFromPythonClassConfig:
             'param_1': {'type': 'str', 'default': 'default_value_1'}
         }
 
+    def test_should_use_default_log_config(self):
+        tool_config = FromPythonClassConfig.from_dict(
+            FROM_PYTHON_CLASS_CONFIG_DICT_1
+        )
+        assert tool_config.log == LogConfig()
+
+    def test_should_load_log_config(self):
+        tool_config = FromPythonClassConfig.from_dict({
+            **FROM_PYTHON_CLASS_CONFIG_DICT_1,
+            'log': {
+                'level': 'DEBUG',
+                'sampleRate': 0.1
+            }
+        })
+        assert tool_config.log == LogConfig(level='DEBUG', sample_rate=0.1)
+
+    def test_should_load_output_policy(self):
+        tool_config = FromPythonClassConfig.from_dict({
+            **FROM_PYTHON_CLASS_CONFIG_DICT_1,
+            'outputPolicy': {
+                'maxBytes': 1000,
+                'maxItems': 10,
+                'truncationStrategy': 'sample',
+                'enableCursor': True
+            }
+        })
+        assert tool_config.output_policy == OutputPolicyConfig(
+            max_bytes=1000,
+            max_items=10,
+            truncation_strategy='sample',
+            enable_cursor=True
+        )
+        assert bool(tool_config.output_policy) is True
+
+    def test_should_be_falsy_output_policy_without_limits(self):
+        tool_config = FromPythonClassConfig.from_dict(FROM_PYTHON_CLASS_CONFIG_DICT_1)
+        assert bool(tool_config.output_policy) is False
+
+    def test_should_load_memory_budget(self):
+        tool_config = FromPythonClassConfig.from_dict({
+            **FROM_PYTHON_CLASS_CONFIG_DICT_1,
+            'memoryBudget': {
+                'maxBytes': 1000,
+                'traceSampleRate': 0.01
+            }
+        })
+        assert tool_config.memory_budget == MemoryBudgetConfig(
+            max_bytes=1000,
+            trace_sample_rate=0.01
+        )
+        assert bool(tool_config.memory_budget) is True
+        assert not FromPythonClassConfig.from_dict(
+            FROM_PYTHON_CLASS_CONFIG_DICT_1
+        ).memory_budget
+
+    def test_should_load_result_cache(self):
+        tool_config = FromPythonClassConfig.from_dict({
+            **FROM_PYTHON_CLASS_CONFIG_DICT_1,
+            'resultCache': {
+                'backend': 'sqlite',
+                'ttlSeconds': 60,
+                'path': '/tmp/cache.sqlite'
+            }
+        })
+        assert tool_config.result_cache == ResultCacheConfig(
+            backend='sqlite',
+            ttl_seconds=60,
+            path='/tmp/cache.sqlite'
+        )
+        assert bool(tool_config.result_cache) is True
+
+    def test_should_load_refresh_ahead(self):
+        tool_config = FromPythonClassConfig.from_dict({
+            **FROM_PYTHON_CLASS_CONFIG_DICT_1,
+            'refreshAhead': {
+                'inputs': [{'param_1': 'value_1'}],
+                'intervalSeconds': 30,
+                'jitterRatio': 0.2
+            }
+        })
+        assert tool_config.refresh_ahead == RefreshAheadConfig(
+            inputs=[{'param_1': 'value_1'}],
+            interval_seconds=30,
+            jitter_ratio=0.2
+        )
+        assert bool(tool_config.refresh_ahead) is True
+
+    def test_should_be_falsy_result_cache_without_backend(self):
+        tool_config = FromPythonClassConfig.from_dict(FROM_PYTHON_CLASS_CONFIG_DICT_1)
+        assert bool(tool_config.result_cache) is False
+
 
 class TestToolDefinitionsConfig:
     def test_should_be_falsy_if_empty(self):
@@ -163,6 +269,50 @@ class TestServerConfig:
         agent_config = ServerConfig.from_dict(SERVER_CONFIG_DICT_1)
         assert agent_config.tools == SERVER_CONFIG_DICT_1['tools']
 
+    def test_should_disable_admission_control_by_default(self):
+        agent_config = ServerConfig.from_dict(SERVER_CONFIG_DICT_1)
+        assert not agent_config.admission_control
+
+    def test_should_load_admission_control(self):
+        agent_config = ServerConfig.from_dict({
+            **SERVER_CONFIG_DICT_1,
+            'admissionControl': {
+                'maxEventLoopLagSeconds': 0.5,
+                'maxInFlightCalls': 100,
+                'maxExecutorQueueDepth': 50,
+                'lowPriorityThresholdRatio': 0.8,
+                'retryAfterSeconds': 2.0,
+                'toolPriorities': {'tool_1': 'critical'}
+            }
+        })
+        assert agent_config.admission_control == AdmissionControlConfig(
+            max_event_loop_lag_seconds=0.5,
+            max_in_flight_calls=100,
+            max_executor_queue_depth=50,
+            low_priority_threshold_ratio=0.8,
+            retry_after_seconds=2.0,
+            tool_priorities={'tool_1': 'critical'}
+        )
+        assert agent_config.admission_control
+
+    def test_should_load_client_fairness(self):
+        agent_config = ServerConfig.from_dict({
+            **SERVER_CONFIG_DICT_1,
+            'clientFairness': {
+                'clientIdHeader': 'X-Client-Id',
+                'maxConcurrentCallsPerClient': 4,
+                'clientWeights': {'client_1': 2},
+                'toolQuotas': {'tool_1': {'maxCalls': 100, 'windowSeconds': 60}}
+            }
+        })
+        assert agent_config.client_fairness == ClientFairnessConfig(
+            client_id_header='X-Client-Id',
+            max_concurrent_calls_per_client=4,
+            client_weights={'client_1': 2},
+            tool_quotas={'tool_1': ToolQuotaConfig(max_calls=100, window_seconds=60)}
+        )
+        assert agent_config.client_fairness.is_queuing_enabled
+
 
 class TestAppConfig:
     def test_should_load_server_config(self):
@@ -186,3 +336,117 @@ class TestLoadAppConfig:
         mock_env[EnvironmentVariables.CONFIG_FILE] = str(config_file)
         app_config = load_app_config()
         assert app_config == AppConfig.from_dict(APP_CONFIG_DICT_1)
+
+    def test_should_load_and_merge_app_config_from_multiple_files(
+        self,
+        mock_env: dict,
+        tmp_path: Path
+    ):
+        config_file_1 = tmp_path / 'config-1.yaml'
+        config_file_2 = tmp_path / 'config-2.yaml'
+        config_file_1.write_text(yaml.safe_dump({
+            'toolDefinitions': TOOL_DEFINITIONS_CONFIG_DICT_1
+        }), encoding='utf-8')
+        config_file_2.write_text(yaml.safe_dump(APP_CONFIG_DICT_1), encoding='utf-8')
+        mock_env[EnvironmentVariables.CONFIG_FILE] = str(tmp_path / 'config-*.yaml')
+        app_config = load_app_config()
+        assert app_config == AppConfig.from_dict({
+            **APP_CONFIG_DICT_1,
+            'toolDefinitions': TOOL_DEFINITIONS_CONFIG_DICT_1
+        })
+
+    def test_should_load_app_config_from_cache(self, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        cache_dir = tmp_path / 'cache'
+        config_file.write_text(yaml.safe_dump(APP_CONFIG_DICT_1), encoding='utf-8')
+        app_config = load_app_config_from_file(str(config_file), cache_dir=str(cache_dir))
+        assert len(os.listdir(cache_dir)) == 1
+        with patch.object(config_module, 'load_app_config_dicts_from_files') as load_mock:
+            cached_app_config = load_app_config_from_file(
+                str(config_file), cache_dir=str(cache_dir)
+            )
+            load_mock.assert_not_called()
+        assert cached_app_config == app_config
+
+    def test_should_not_use_cache_if_file_changed(self, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        cache_dir = tmp_path / 'cache'
+        config_file.write_text(yaml.safe_dump(APP_CONFIG_DICT_1), encoding='utf-8')
+        load_app_config_from_file(str(config_file), cache_dir=str(cache_dir))
+        config_file.write_text(yaml.safe_dump({
+            **APP_CONFIG_DICT_1,
+            'toolDefinitions': TOOL_DEFINITIONS_CONFIG_DICT_1
+        }), encoding='utf-8')
+        app_config = load_app_config_from_file(str(config_file), cache_dir=str(cache_dir))
+        assert app_config.tool_definitions
+
+    def test_should_not_use_cache_if_schema_changed(self, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        cache_dir = tmp_path / 'cache'
+        config_file.write_text(yaml.safe_dump(APP_CONFIG_DICT_1), encoding='utf-8')
+        load_app_config_from_file(str(config_file), cache_dir=str(cache_dir))
+        with patch.object(config_module, 'get_app_config_schema_hash') as schema_hash_mock:
+            schema_hash_mock.return_value = 'other_schema_hash'
+            load_app_config_from_file(str(config_file), cache_dir=str(cache_dir))
+        assert len(os.listdir(cache_dir)) == 2
+
+    def test_should_load_multiple_files_without_processes_outside_main_thread(
+        self,
+        tmp_path: Path
+    ):
+        config_file_1 = tmp_path / 'config-1.yaml'
+        config_file_2 = tmp_path / 'config-2.yaml'
+        config_file_1.write_text(yaml.safe_dump({
+            'toolDefinitions': TOOL_DEFINITIONS_CONFIG_DICT_1
+        }), encoding='utf-8')
+        config_file_2.write_text(yaml.safe_dump(APP_CONFIG_DICT_1), encoding='utf-8')
+        results = []
+        with patch.object(config_module, 'ProcessPoolExecutor') as executor_mock:
+            thread = threading.Thread(target=lambda: results.append(
+                load_app_config_from_file(str(tmp_path / 'config-*.yaml'))
+            ))
+            thread.start()
+            thread.join()
+            executor_mock.assert_not_called()
+        assert results[0].tool_definitions == ToolDefinitionsConfig.from_dict(
+            TOOL_DEFINITIONS_CONFIG_DICT_1
+        )
+
+
+class TestGetAppConfigFiles:
+    def test_should_return_single_file(self):
+        assert get_app_config_files('/path/config.yaml') == ['/path/config.yaml']
+
+    def test_should_split_multiple_files(self):
+        assert get_app_config_files(
+            os.pathsep.join(['/path/config-1.yaml', '/path/config-2.yaml'])
+        ) == ['/path/config-1.yaml', '/path/config-2.yaml']
+
+    def test_should_expand_glob_pattern_in_sorted_order(self, tmp_path: Path):
+        (tmp_path / 'b.yaml').write_text('', encoding='utf-8')
+        (tmp_path / 'a.yaml').write_text('', encoding='utf-8')
+        assert get_app_config_files(str(tmp_path / '*.yaml')) == [
+            str(tmp_path / 'a.yaml'),
+            str(tmp_path / 'b.yaml')
+        ]
+
+
+class TestGetMergedAppConfigDict:
+    def test_should_concatenate_tool_definitions_and_server_tools(self):
+        merged = get_merged_app_config_dict([
+            {
+                'toolDefinitions': {'fromPythonFunction': [FROM_PYTHON_FUNCTION_CONFIG_DICT_1]},
+                'server': {'name': 'Server 1', 'tools': ['tool_1']}
+            },
+            {
+                'toolDefinitions': {'fromPythonClass': [FROM_PYTHON_CLASS_CONFIG_DICT_1]},
+                'server': {'name': 'Server 2', 'tools': ['tool_1', 'tool_2']}
+            }
+        ])
+        assert merged == {
+            'toolDefinitions': {
+                'fromPythonFunction': [FROM_PYTHON_FUNCTION_CONFIG_DICT_1],
+                'fromPythonClass': [FROM_PYTHON_CLASS_CONFIG_DICT_1]
+            },
+            'server': {'name': 'Server 2', 'tools': ['tool_1', 'tool_2']}
+        }
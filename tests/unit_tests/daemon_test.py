@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import anyio
+from fastmcp import FastMCP
+from mcp.client.session import ClientSession
+import mcp.types
+import pytest
+
+from py_conf_mcp.cli import create_mcp_for_app_config
+from py_conf_mcp.config import (
+    AppConfig,
+    FromPythonClassConfig,
+    ServerConfig,
+    ToolDefinitionsConfig
+)
+from py_conf_mcp.daemon import (
+    byte_stream_server,
+    create_daemon_listener,
+    serve_daemon
+)
+
+
+FROM_PYTHON_CLASS_CONFIG_1 = FromPythonClassConfig(
+    name='get_static_content',
+    module='py_conf_mcp.tools.sources.static',
+    class_name='StaticContentTool',
+    init_parameters={
+        'content': 'Static content'
+    }
+)
+
+
+@pytest.fixture(name='mcp_server')
+def _mcp_server() -> FastMCP:
+    return create_mcp_for_app_config(app_config=AppConfig(
+        tool_definitions=ToolDefinitionsConfig(
+            from_python_class=[FROM_PYTHON_CLASS_CONFIG_1]
+        ),
+        server=ServerConfig(
+            name='Test MCP Server',
+            tools=[FROM_PYTHON_CLASS_CONFIG_1.name]
+        )
+    ))
+
+
+@pytest.fixture(name='socket_path')
+def _socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / 'daemon.sock')
+
+
+async def call_tool_via_socket(socket_path: str, tool_name: str) -> mcp.types.CallToolResult:
+    async with await anyio.connect_unix(socket_path) as stream:
+        async with byte_stream_server(stream) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                return await session.call_tool(tool_name, {})
+
+
+class TestServeDaemon:
+    @pytest.mark.asyncio
+    async def test_should_serve_sessions_sharing_tools(
+        self,
+        mcp_server: FastMCP,
+        socket_path: str
+    ):
+        listener = await create_daemon_listener(socket_path)
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(serve_daemon, mcp_server, listener)
+            with anyio.fail_after(10):
+                for _ in range(2):
+                    result = await call_tool_via_socket(socket_path, 'get_static_content')
+                    assert not result.isError
+                    assert isinstance(result.content[0], mcp.types.TextContent)
+                    assert result.content[0].text == 'Static content'
+            task_group.cancel_scope.cancel()
+
+
+class TestCreateDaemonListener:
+    @pytest.mark.asyncio
+    async def test_should_only_allow_owner_to_connect(self, socket_path: str):
+        async with await create_daemon_listener(socket_path):
+            assert Path(socket_path).stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_should_create_socket_dir_only_accessible_by_owner(self, tmp_path: Path):
+        socket_path = tmp_path / 'daemon' / 'daemon.sock'
+        async with await create_daemon_listener(str(socket_path)):
+            assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.asyncio
+    async def test_should_replace_stale_socket_file(self, socket_path: str):
+        Path(socket_path).touch()
+        async with await create_daemon_listener(socket_path):
+            assert Path(socket_path).is_socket()
+
+    @pytest.mark.asyncio
+    async def test_should_fail_if_daemon_is_already_running(self, socket_path: str):
+        async with await create_daemon_listener(socket_path):
+            with pytest.raises(RuntimeError):
+                await create_daemon_listener(socket_path)
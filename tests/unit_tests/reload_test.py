@@ -0,0 +1,247 @@
+import dataclasses
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from py_conf_mcp import reload
+from py_conf_mcp.cli import create_mcp_for_app_config
+from py_conf_mcp.config import (
+    AppConfig,
+    FromPythonClassConfig,
+    RefreshAheadConfig,
+    ResultCacheConfig,
+    ServerConfig,
+    ToolDefinitionsConfig
+)
+from py_conf_mcp.reload import (
+    ConfigFileWatcher,
+    McpToolsReloader,
+    get_tool_config_hash,
+    get_tools_diff
+)
+from py_conf_mcp.tools.refresh_ahead import RefreshAheadScheduler
+from py_conf_mcp.validation import ConfigValidationError
+
+
+STATIC_TOOL_CONFIG_1 = FromPythonClassConfig(
+    name='static_1',
+    module='py_conf_mcp.tools.sources.static',
+    class_name='StaticContentTool',
+    init_parameters={'content': 'Static content 1'}
+)
+
+STATIC_TOOL_CONFIG_2 = FromPythonClassConfig(
+    name='static_2',
+    module='py_conf_mcp.tools.sources.static',
+    class_name='StaticContentTool',
+    init_parameters={'content': 'Static content 2'}
+)
+
+COMPOSITE_TOOL_CONFIG_1 = FromPythonClassConfig(
+    name='composite_1',
+    module='py_conf_mcp.tools.sources.composite',
+    class_name='CompositeTool',
+    init_parameters={'branches': [{'tool': 'static_1'}]}
+)
+
+
+def _get_app_config(*tool_configs: FromPythonClassConfig) -> AppConfig:
+    return AppConfig(
+        tool_definitions=ToolDefinitionsConfig(from_python_class=list(tool_configs)),
+        server=ServerConfig(
+            name='Test MCP Server',
+            tools=[tool_config.name for tool_config in tool_configs]
+        )
+    )
+
+
+class TestGetToolConfigHash:
+    def test_should_return_same_hash_for_equal_config(self):
+        assert get_tool_config_hash(STATIC_TOOL_CONFIG_1) == get_tool_config_hash(
+            dataclasses.replace(STATIC_TOOL_CONFIG_1)
+        )
+
+    def test_should_return_different_hash_for_changed_config(self):
+        assert get_tool_config_hash(STATIC_TOOL_CONFIG_1) != get_tool_config_hash(
+            dataclasses.replace(STATIC_TOOL_CONFIG_1, init_parameters={'content': 'other'})
+        )
+
+    def test_should_include_referenced_tool_configs(self):
+        changed_static_tool_config_1 = dataclasses.replace(
+            STATIC_TOOL_CONFIG_1, init_parameters={'content': 'other'}
+        )
+        assert get_tool_config_hash(
+            COMPOSITE_TOOL_CONFIG_1,
+            _get_app_config(COMPOSITE_TOOL_CONFIG_1, STATIC_TOOL_CONFIG_1).tool_definitions
+        ) != get_tool_config_hash(
+            COMPOSITE_TOOL_CONFIG_1,
+            _get_app_config(
+                COMPOSITE_TOOL_CONFIG_1, changed_static_tool_config_1
+            ).tool_definitions
+        )
+
+
+class TestGetToolsDiff:
+    def test_should_detect_added_removed_changed_and_unchanged_tools(self):
+        changed_tool_config_2 = dataclasses.replace(
+            STATIC_TOOL_CONFIG_2, init_parameters={'content': 'changed'}
+        )
+        added_tool_config = dataclasses.replace(STATIC_TOOL_CONFIG_1, name='static_3')
+        removed_tool_config = dataclasses.replace(STATIC_TOOL_CONFIG_1, name='static_4')
+        tools_diff = get_tools_diff(
+            _get_app_config(STATIC_TOOL_CONFIG_1, STATIC_TOOL_CONFIG_2, removed_tool_config),
+            _get_app_config(STATIC_TOOL_CONFIG_1, changed_tool_config_2, added_tool_config)
+        )
+        assert tools_diff.unchanged == ['static_1']
+        assert tools_diff.changed == ['static_2']
+        assert tools_diff.added == ['static_3']
+        assert tools_diff.removed == ['static_4']
+
+    def test_should_detect_composite_tool_changed_by_its_branch_tool(self):
+        tools_diff = get_tools_diff(
+            _get_app_config(STATIC_TOOL_CONFIG_1, COMPOSITE_TOOL_CONFIG_1),
+            _get_app_config(
+                dataclasses.replace(STATIC_TOOL_CONFIG_1, init_parameters={'content': 'other'}),
+                COMPOSITE_TOOL_CONFIG_1
+            )
+        )
+        assert tools_diff.changed == ['static_1', 'composite_1']
+
+
+class TestMcpToolsReloader:
+    @pytest.mark.asyncio
+    async def test_should_keep_unchanged_and_rebuild_changed_tools(self):
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1, STATIC_TOOL_CONFIG_2)
+        mcp = create_mcp_for_app_config(app_config)
+        previous_tools = dict(await mcp.get_tools())
+        reloader = McpToolsReloader(mcp, app_config=app_config)
+        reloader.reload(_get_app_config(
+            STATIC_TOOL_CONFIG_1,
+            dataclasses.replace(STATIC_TOOL_CONFIG_2, init_parameters={'content': 'changed'})
+        ))
+        tools = await mcp.get_tools()
+        assert tools['static_1'] is previous_tools['static_1']
+        assert tools['static_2'] is not previous_tools['static_2']
+        assert tools['static_2'].fn().text == 'changed'
+
+    @pytest.mark.asyncio
+    async def test_should_add_and_remove_tools(self):
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1)
+        mcp = create_mcp_for_app_config(app_config)
+        reloader = McpToolsReloader(mcp, app_config=app_config)
+        reloader.reload(_get_app_config(STATIC_TOOL_CONFIG_2))
+        tools = await mcp.get_tools()
+        assert set(tools.keys()) == {'static_2'}
+
+    @pytest.mark.asyncio
+    async def test_should_remove_previously_listed_tool(self):
+        # guards the fastmcp internals used to remove a tool (fastmcp is pinned)
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1, STATIC_TOOL_CONFIG_2)
+        mcp = create_mcp_for_app_config(app_config)
+        assert set((await mcp.get_tools()).keys()) == {'static_1', 'static_2'}
+        reloader = McpToolsReloader(mcp, app_config=app_config)
+        reloader.reload(_get_app_config(STATIC_TOOL_CONFIG_2))
+        assert set((await mcp.get_tools()).keys()) == {'static_2'}
+        assert not mcp._tool_manager.has_tool('static_1')  # pylint: disable=protected-access
+
+    @pytest.mark.asyncio
+    async def test_should_keep_tools_if_new_tool_cannot_be_resolved(self):
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1)
+        mcp = create_mcp_for_app_config(app_config)
+        reloader = McpToolsReloader(mcp, app_config=app_config)
+        with pytest.raises(ConfigValidationError):
+            reloader.reload(_get_app_config(
+                dataclasses.replace(STATIC_TOOL_CONFIG_2, module='invalid_module')
+            ))
+        tools = await mcp.get_tools()
+        assert set(tools.keys()) == {'static_1'}
+        assert reloader.app_config == app_config
+
+    def test_should_update_refresh_ahead_with_tools(self):
+        refreshed_tool_config = dataclasses.replace(
+            STATIC_TOOL_CONFIG_1,
+            result_cache=ResultCacheConfig(backend='memory', ttl_seconds=60),
+            refresh_ahead=RefreshAheadConfig(inputs=[{}], interval_seconds=10)
+        )
+        app_config = _get_app_config(refreshed_tool_config, STATIC_TOOL_CONFIG_2)
+        refresh_ahead_scheduler = RefreshAheadScheduler()
+        mcp = create_mcp_for_app_config(
+            app_config, refresh_ahead_scheduler=refresh_ahead_scheduler
+        )
+        assert len(refresh_ahead_scheduler) == 1
+        reloader = McpToolsReloader(
+            mcp, app_config=app_config, refresh_ahead_scheduler=refresh_ahead_scheduler
+        )
+        reloader.reload(_get_app_config(STATIC_TOOL_CONFIG_2))
+        assert len(refresh_ahead_scheduler) == 0
+
+    def test_should_keep_refresh_ahead_if_tool_cannot_be_resolved(
+        self,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        refreshed_tool_config = dataclasses.replace(
+            STATIC_TOOL_CONFIG_1,
+            result_cache=ResultCacheConfig(backend='memory', ttl_seconds=60),
+            refresh_ahead=RefreshAheadConfig(inputs=[{}], interval_seconds=10)
+        )
+        app_config = _get_app_config(refreshed_tool_config)
+        refresh_ahead_scheduler = RefreshAheadScheduler()
+        mcp = create_mcp_for_app_config(
+            app_config, refresh_ahead_scheduler=refresh_ahead_scheduler
+        )
+        reloader = McpToolsReloader(
+            mcp, app_config=app_config, refresh_ahead_scheduler=refresh_ahead_scheduler
+        )
+
+        def get_tool_by_name(*_):
+            raise RuntimeError('failed to resolve tool')
+
+        monkeypatch.setattr(reload.ConfigToolResolver, 'get_tool_by_name', get_tool_by_name)
+        with pytest.raises(RuntimeError):
+            reloader.reload(_get_app_config(dataclasses.replace(
+                refreshed_tool_config, init_parameters={'content': 'changed'}
+            )))
+        assert len(refresh_ahead_scheduler) == 1
+
+
+class TestConfigFileWatcher:
+    @pytest.mark.asyncio
+    async def test_should_reload_tools_if_config_file_changed(self, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1)
+        config_file.write_text('', encoding='utf-8')
+        mcp = create_mcp_for_app_config(app_config)
+        watcher = ConfigFileWatcher(
+            str(config_file), reloader=McpToolsReloader(mcp, app_config=app_config)
+        )
+        assert watcher.check_for_changes() is None
+        config_file.write_text(yaml.safe_dump({
+            'toolDefinitions': {
+                'fromPythonClass': [{
+                    'name': STATIC_TOOL_CONFIG_2.name,
+                    'module': STATIC_TOOL_CONFIG_2.module,
+                    'className': STATIC_TOOL_CONFIG_2.class_name,
+                    'initParameters': dict(STATIC_TOOL_CONFIG_2.init_parameters)
+                }]
+            },
+            'server': {'name': 'Test MCP Server', 'tools': [STATIC_TOOL_CONFIG_2.name]}
+        }), encoding='utf-8')
+        os.utime(config_file, (1, 1))
+        tools_diff = watcher.check_for_changes()
+        assert tools_diff is not None
+        assert tools_diff.added == [STATIC_TOOL_CONFIG_2.name]
+        assert set((await mcp.get_tools()).keys()) == {STATIC_TOOL_CONFIG_2.name}
+
+    def test_should_ignore_invalid_config(self, tmp_path: Path):
+        config_file = tmp_path / 'config.yaml'
+        app_config = _get_app_config(STATIC_TOOL_CONFIG_1)
+        config_file.write_text('', encoding='utf-8')
+        mcp = create_mcp_for_app_config(app_config)
+        watcher = ConfigFileWatcher(
+            str(config_file), reloader=McpToolsReloader(mcp, app_config=app_config)
+        )
+        config_file.write_text('invalid: [', encoding='utf-8')
+        os.utime(config_file, (1, 1))
+        assert watcher.check_for_changes() is None
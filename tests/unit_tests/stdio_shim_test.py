@@ -0,0 +1,168 @@
+import os
+from pathlib import Path
+import socket
+import threading
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from py_conf_mcp import stdio_shim
+from py_conf_mcp.stdio_shim import (
+    connect_or_start_daemon,
+    connect_to_daemon,
+    get_default_daemon_socket_path,
+    get_private_dir,
+    run_shim,
+    start_daemon
+)
+
+
+@pytest.fixture(name='socket_path')
+def _socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / 'daemon.sock')
+
+
+@pytest.fixture(name='start_daemon_mock')
+def _start_daemon_mock() -> Iterator[MagicMock]:
+    with patch.object(stdio_shim, 'start_daemon') as mock:
+        mock.return_value.poll.return_value = None
+        yield mock
+
+
+def get_listening_socket(socket_path: str) -> socket.socket:
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server_socket.bind(socket_path)
+    server_socket.listen()
+    return server_socket
+
+
+@pytest.fixture(name='runtime_dir', autouse=True)
+def _runtime_dir(tmp_path: Path) -> Iterator[Path]:
+    runtime_dir = tmp_path / 'runtime'
+    runtime_dir.mkdir(mode=0o700)
+    with patch.dict(os.environ, {'XDG_RUNTIME_DIR': str(runtime_dir)}):
+        yield runtime_dir
+
+
+class TestGetPrivateDir:
+    def test_should_create_dir_only_accessible_by_owner(self, tmp_path: Path):
+        path = get_private_dir(str(tmp_path / 'private'))
+        assert os.stat(path).st_mode & 0o777 == 0o700
+
+    def test_should_reject_dir_accessible_by_other_users(self, tmp_path: Path):
+        path = tmp_path / 'shared'
+        path.mkdir()
+        path.chmod(0o777)
+        with pytest.raises(PermissionError):
+            get_private_dir(str(path))
+
+
+class TestGetDefaultDaemonSocketPath:
+    def test_should_use_private_dir_in_runtime_dir(self, runtime_dir: Path):
+        socket_path = get_default_daemon_socket_path('config_1.yaml')
+        assert os.path.dirname(socket_path) == str(runtime_dir / 'py-conf-mcp')
+        assert os.stat(os.path.dirname(socket_path)).st_mode & 0o777 == 0o700
+
+    def test_should_derive_socket_path_from_config_file(self):
+        assert get_default_daemon_socket_path('config_1.yaml') == (
+            get_default_daemon_socket_path(os.path.abspath('config_1.yaml'))
+        )
+        assert get_default_daemon_socket_path('config_1.yaml') != (
+            get_default_daemon_socket_path('config_2.yaml')
+        )
+
+
+class TestStartDaemon:
+    def test_should_log_to_file_next_to_socket(self, tmp_path: Path, socket_path: str):
+        with patch.object(stdio_shim.subprocess, 'Popen') as popen_mock:
+            start_daemon(socket_path)
+        stderr = popen_mock.call_args.kwargs['stderr']
+        assert stderr.name == str(tmp_path / 'daemon.log')
+        assert stderr.closed
+
+
+class TestConnectToDaemon:
+    def test_should_reject_socket_owned_by_another_user(self, socket_path: str):
+        with get_listening_socket(socket_path):
+            with patch.object(stdio_shim.os, 'getuid', return_value=os.getuid() + 1):
+                with pytest.raises(PermissionError):
+                    connect_to_daemon(socket_path)
+
+
+class TestConnectOrStartDaemon:
+    def test_should_connect_to_running_daemon(
+        self,
+        socket_path: str,
+        start_daemon_mock: MagicMock
+    ):
+        with get_listening_socket(socket_path):
+            connect_or_start_daemon(socket_path).close()
+        start_daemon_mock.assert_not_called()
+
+    def test_should_start_daemon_and_wait_for_socket(
+        self,
+        socket_path: str,
+        start_daemon_mock: MagicMock
+    ):
+        server_sockets: list[socket.socket] = []
+        timer = threading.Timer(
+            0.1, lambda: server_sockets.append(get_listening_socket(socket_path))
+        )
+        timer.start()
+        try:
+            connect_or_start_daemon(socket_path, start_timeout_seconds=5).close()
+        finally:
+            timer.join()
+            for server_socket in server_sockets:
+                server_socket.close()
+        start_daemon_mock.assert_called_once_with(socket_path)
+
+    def test_should_fail_if_daemon_exits(
+        self,
+        socket_path: str,
+        start_daemon_mock: MagicMock
+    ):
+        start_daemon_mock.return_value.poll.return_value = 1
+        with pytest.raises(RuntimeError):
+            connect_or_start_daemon(socket_path, start_timeout_seconds=5)
+
+    def test_should_connect_to_daemon_started_concurrently_by_another_shim(
+        self,
+        socket_path: str,
+        start_daemon_mock: MagicMock
+    ):
+        # the started daemon exits, as the other daemon is about to listen on the socket
+        start_daemon_mock.return_value.poll.return_value = 1
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server_socket.bind(socket_path)
+        timer = threading.Timer(0.1, server_socket.listen)
+        timer.start()
+        try:
+            connect_or_start_daemon(socket_path, start_timeout_seconds=5).close()
+        finally:
+            timer.join()
+            server_socket.close()
+
+
+class TestRunShim:
+    def test_should_pipe_stdin_to_daemon_and_daemon_to_stdout(self):
+        client_socket, daemon_socket = socket.socketpair()
+        stdin_read_fd, stdin_write_fd = os.pipe()
+        stdout_read_fd, stdout_write_fd = os.pipe()
+
+        def echo_daemon():
+            with daemon_socket:
+                while data := daemon_socket.recv(1024):
+                    daemon_socket.sendall(b'echo: ' + data)
+
+        daemon_thread = threading.Thread(target=echo_daemon)
+        daemon_thread.start()
+        os.write(stdin_write_fd, b'{"id": 1}\n')
+        os.close(stdin_write_fd)
+        run_shim(client_socket, stdin_fd=stdin_read_fd, stdout_fd=stdout_write_fd)
+        daemon_thread.join()
+        os.close(stdout_write_fd)
+        with os.fdopen(stdout_read_fd, 'rb') as stdout_fp:
+            assert stdout_fp.read() == b'echo: {"id": 1}\n'
+        os.close(stdin_read_fd)
@@ -0,0 +1,169 @@
+import time
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from py_conf_mcp.config import AdmissionControlConfig
+from py_conf_mcp.tools import admission_control
+from py_conf_mcp.tools.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+    EventLoopLagMonitor,
+    PriorityClasses,
+    get_tool_function_with_admission_control
+)
+from py_conf_mcp.utils.metrics import MetricsRegistry
+
+
+TOOL_NAME_1 = 'tool_1'
+
+
+@pytest.fixture(name='metrics_registry', autouse=True)
+def _metrics_registry() -> Iterator[MetricsRegistry]:
+    metrics_registry = MetricsRegistry()
+    with patch.object(admission_control, 'DEFAULT_METRICS_REGISTRY', metrics_registry):
+        yield metrics_registry
+
+
+@pytest.fixture(name='event_loop_lag_monitor_mock')
+def _event_loop_lag_monitor_mock() -> MagicMock:
+    event_loop_lag_monitor_mock = MagicMock(EventLoopLagMonitor)
+    event_loop_lag_monitor_mock.get_lag_seconds.return_value = 0.0
+    return event_loop_lag_monitor_mock
+
+
+@pytest.fixture(name='get_executor_queue_depth_mock')
+def _get_executor_queue_depth_mock() -> Iterator[MagicMock]:
+    with patch.object(admission_control, 'get_executor_queue_depth') as mock:
+        mock.return_value = 0
+        yield mock
+
+
+class TestAdmissionController:
+    def test_should_admit_all_calls_without_thresholds(self):
+        admission_controller = AdmissionController()
+        for _ in range(100):
+            admission_controller.admit(TOOL_NAME_1)
+        assert admission_controller.in_flight_calls == 100
+
+    def test_should_reject_calls_above_max_in_flight_calls(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        admission_controller = AdmissionController(AdmissionControlConfig(
+            max_in_flight_calls=2,
+            retry_after_seconds=3.0
+        ))
+        admission_controller.admit(TOOL_NAME_1)
+        ticket = admission_controller.admit(TOOL_NAME_1)
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            admission_controller.admit(TOOL_NAME_1)
+        assert exc_info.value.retry_after_seconds == 3.0
+        assert 'retry after 3.0 seconds' in str(exc_info.value)
+        assert metrics_registry.get_value(
+            'py_conf_mcp_admission_rejected_calls_total',
+            labels={'tool': TOOL_NAME_1, 'priority': PriorityClasses.NORMAL}
+        ) == 1
+        ticket.release()
+        ticket.release()
+        admission_controller.admit(TOOL_NAME_1)
+        assert admission_controller.in_flight_calls == 2
+
+    def test_should_never_reject_critical_tools(self):
+        admission_controller = AdmissionController(AdmissionControlConfig(
+            max_in_flight_calls=1,
+            tool_priorities={TOOL_NAME_1: PriorityClasses.CRITICAL}
+        ))
+        admission_controller.admit('other')
+        admission_controller.admit(TOOL_NAME_1)
+        assert admission_controller.in_flight_calls == 2
+
+    def test_should_shed_low_priority_tools_first(self):
+        admission_controller = AdmissionController(AdmissionControlConfig(
+            max_in_flight_calls=4,
+            low_priority_threshold_ratio=0.5,
+            tool_priorities={TOOL_NAME_1: PriorityClasses.LOW}
+        ))
+        admission_controller.admit('other')
+        admission_controller.admit('other')
+        with pytest.raises(AdmissionRejectedError):
+            admission_controller.admit(TOOL_NAME_1)
+        admission_controller.admit('other')
+
+    @pytest.mark.asyncio
+    async def test_should_reject_calls_above_max_event_loop_lag(
+        self,
+        event_loop_lag_monitor_mock: MagicMock
+    ):
+        admission_controller = AdmissionController(
+            AdmissionControlConfig(max_event_loop_lag_seconds=0.5),
+            event_loop_lag_monitor=event_loop_lag_monitor_mock
+        )
+        admission_controller.admit(TOOL_NAME_1)
+        event_loop_lag_monitor_mock.ensure_started.assert_called()
+        event_loop_lag_monitor_mock.get_lag_seconds.return_value = 0.6
+        with pytest.raises(AdmissionRejectedError, match='event loop lag'):
+            admission_controller.admit(TOOL_NAME_1)
+
+    def test_should_reject_calls_above_max_executor_queue_depth(
+        self,
+        get_executor_queue_depth_mock: MagicMock
+    ):
+        admission_controller = AdmissionController(
+            AdmissionControlConfig(max_executor_queue_depth=10)
+        )
+        admission_controller.admit(TOOL_NAME_1)
+        get_executor_queue_depth_mock.return_value = 10
+        with pytest.raises(AdmissionRejectedError, match='executor queue depth'):
+            admission_controller.admit(TOOL_NAME_1)
+
+
+class TestEventLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_should_measure_blocked_event_loop(self):
+        event_loop_lag_monitor = EventLoopLagMonitor(interval_seconds=0.01)
+        try:
+            loop = admission_control.get_running_loop_or_none()
+            assert loop is not None
+            event_loop_lag_monitor.ensure_started(loop)
+            # blocks the event loop
+            time.sleep(0.3)
+            assert event_loop_lag_monitor.get_lag_seconds() >= 0.2
+        finally:
+            event_loop_lag_monitor.stop()
+
+
+class TestGetToolFunctionWithAdmissionControl:
+    def test_should_release_after_sync_result(self):
+        admission_controller = AdmissionController()
+        tool_fn = get_tool_function_with_admission_control(
+            lambda **kwargs: kwargs, TOOL_NAME_1, admission_controller
+        )
+        assert tool_fn(key_1='value_1') == {'key_1': 'value_1'}
+        assert admission_controller.in_flight_calls == 0
+
+    def test_should_release_after_error(self):
+        admission_controller = AdmissionController()
+        tool_fn = get_tool_function_with_admission_control(
+            MagicMock(side_effect=ValueError()), TOOL_NAME_1, admission_controller
+        )
+        with pytest.raises(ValueError):
+            tool_fn()
+        assert admission_controller.in_flight_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_should_keep_async_result_in_flight_until_awaited(self):
+        admission_controller = AdmissionController()
+
+        async def get_result():
+            assert admission_controller.in_flight_calls == 1
+            return 'result_1'
+
+        tool_fn = get_tool_function_with_admission_control(
+            get_result, TOOL_NAME_1, admission_controller
+        )
+        awaitable = tool_fn()
+        assert admission_controller.in_flight_calls == 1
+        assert await awaitable == 'result_1'
+        assert admission_controller.in_flight_calls == 0
@@ -0,0 +1,61 @@
+import pytest
+
+from py_conf_mcp.tools.chunked import (
+    get_chunked_result,
+    get_tool_function_with_chunked_result,
+    is_chunk_iterator
+)
+from py_conf_mcp.tools.output_policy import ResultStore
+from py_conf_mcp.utils.memory import MemoryBudget, memory_budget_context
+
+
+class TestIsChunkIterator:
+    def test_should_return_true_for_generator(self):
+        assert is_chunk_iterator(iter(['chunk_1']))
+
+    def test_should_return_false_for_str_and_list(self):
+        assert not is_chunk_iterator('chunk_1')
+        assert not is_chunk_iterator(['chunk_1'])
+
+
+class TestGetChunkedResult:
+    @pytest.mark.asyncio
+    async def test_should_join_chunks_within_max_bytes(self):
+        assert await get_chunked_result(iter(['chunk_1', 'chunk_2'])) == 'chunk_1chunk_2'
+
+    @pytest.mark.asyncio
+    async def test_should_return_first_page_with_cursor_exceeding_max_bytes(self):
+        result_store = ResultStore()
+        result = await get_chunked_result(
+            iter(['line_1\n', 'line_2\n', 'line_3\n']),
+            max_bytes=14,
+            result_store=result_store
+        )
+        assert result['content'] == 'line_1\nline_2\n'
+        assert result['truncated'] is True
+        assert result['total_length'] == 21
+        stored_result = result_store.pop(result['cursor'])
+        assert stored_result.offset == 14
+
+    @pytest.mark.asyncio
+    async def test_should_only_account_returned_content_to_memory_budget(self):
+        memory_budget = MemoryBudget(max_bytes=100)
+        with memory_budget_context(memory_budget):
+            result = await get_chunked_result(
+                iter(['x' * 50] * 10), max_bytes=50, result_store=ResultStore()
+            )
+        assert result['content'] == 'x' * 50
+        assert memory_budget.used_bytes == 50
+
+
+class TestGetToolFunctionWithChunkedResult:
+    def test_should_pass_through_regular_result(self):
+        tool_fn = get_tool_function_with_chunked_result(lambda **_: ['item_1'])
+        assert tool_fn() == ['item_1']
+
+    @pytest.mark.asyncio
+    async def test_should_return_awaitable_for_chunk_iterator(self):
+        tool_fn = get_tool_function_with_chunked_result(
+            lambda **_: (chunk for chunk in ['chunk_1', 'chunk_2'])
+        )
+        assert await tool_fn() == 'chunk_1chunk_2'
@@ -0,0 +1,285 @@
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import anyio
+import pytest
+
+from py_conf_mcp.config import ClientFairnessConfig, ToolQuotaConfig
+from py_conf_mcp.tools import client_fairness
+from py_conf_mcp.tools.admission_control import AdmissionRejectedError
+from py_conf_mcp.tools.client_fairness import (
+    DEFAULT_CLIENT_ID,
+    ClientFairnessController,
+    FairCallScheduler,
+    QuotaExceededError,
+    ToolQuotaLimiter,
+    check_client_fairness_config_for_transport,
+    get_client_id,
+    get_hashed_client_id,
+    get_tool_function_with_client_fairness
+)
+from py_conf_mcp.utils.metrics import MetricsRegistry
+
+
+TOOL_NAME_1 = 'tool_1'
+
+CLIENT_ID_1 = 'client_1'
+CLIENT_ID_2 = 'client_2'
+
+
+@pytest.fixture(name='metrics_registry', autouse=True)
+def _metrics_registry() -> Iterator[MetricsRegistry]:
+    metrics_registry = MetricsRegistry()
+    with patch.object(client_fairness, 'DEFAULT_METRICS_REGISTRY', metrics_registry):
+        yield metrics_registry
+
+
+@pytest.fixture(name='get_client_id_from_header_mock')
+def _get_client_id_from_header_mock() -> Iterator[MagicMock]:
+    with patch.object(client_fairness, 'get_client_id_from_header') as mock:
+        yield mock
+
+
+class TestGetClientId:
+    def test_should_fall_back_to_default_client_id_without_request(self):
+        assert get_client_id(ClientFairnessConfig(client_id_header='X-Client-Id')) == (
+            DEFAULT_CLIENT_ID
+        )
+
+    def test_should_use_header_value(self, get_client_id_from_header_mock: MagicMock):
+        get_client_id_from_header_mock.return_value = CLIENT_ID_1
+        assert get_client_id(ClientFairnessConfig(
+            client_id_header='X-Client-Id',
+            hash_client_id=False
+        )) == CLIENT_ID_1
+        get_client_id_from_header_mock.assert_called_with('X-Client-Id')
+
+    def test_should_hash_header_value_by_default(
+        self,
+        get_client_id_from_header_mock: MagicMock
+    ):
+        get_client_id_from_header_mock.return_value = 'Bearer secret'
+        client_id = get_client_id(ClientFairnessConfig(client_id_header='Authorization'))
+        assert client_id == get_hashed_client_id('Bearer secret')
+        assert 'secret' not in client_id
+
+    def test_should_use_sse_session_id(self):
+        request = MagicMock(name='request')
+        request.query_params = {'session_id': 'abc'}
+        with patch.object(client_fairness, 'get_http_request', return_value=request):
+            assert get_client_id(ClientFairnessConfig()) == 'session-abc'
+
+    def test_should_fall_back_to_remote_address_without_stable_session(self):
+        request = MagicMock(name='request')
+        request.query_params = {}
+        request.client.host = '10.0.0.1'
+        with patch.object(client_fairness, 'get_http_request', return_value=request):
+            assert get_client_id(ClientFairnessConfig()) == 'address-10.0.0.1'
+
+    def test_should_fall_back_to_default_client_id_without_remote_address(self):
+        request = MagicMock(name='request')
+        request.query_params = {}
+        request.client = None
+        with patch.object(client_fairness, 'get_http_request', return_value=request):
+            assert get_client_id(ClientFairnessConfig()) == DEFAULT_CLIENT_ID
+
+
+class TestCheckClientFairnessConfigForTransport:
+    def test_should_warn_about_missing_client_id_header_for_streamable_http(
+        self,
+        caplog: pytest.LogCaptureFixture
+    ):
+        config = ClientFairnessConfig(max_concurrent_calls_per_client=1)
+        check_client_fairness_config_for_transport(config, transport='sse')
+        assert not caplog.records
+        check_client_fairness_config_for_transport(config, transport='streamable-http')
+        assert 'clientIdHeader' in caplog.text
+
+
+class TestToolQuotaLimiter:
+    def test_should_reject_calls_above_quota_until_window_ends(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        time_fn = MagicMock(name='time_fn', return_value=100.0)
+        quota_limiter = ToolQuotaLimiter(time_fn=time_fn)
+        config = ClientFairnessConfig(tool_quotas={
+            TOOL_NAME_1: ToolQuotaConfig(max_calls=2, window_seconds=60)
+        })
+        quota_limiter.check_and_count(config, CLIENT_ID_1, TOOL_NAME_1)
+        quota_limiter.check_and_count(config, CLIENT_ID_1, TOOL_NAME_1)
+        time_fn.return_value = 130.0
+        with pytest.raises(QuotaExceededError) as exc_info:
+            quota_limiter.check_and_count(config, CLIENT_ID_1, TOOL_NAME_1)
+        assert exc_info.value.retry_after_seconds == 30.0
+        assert metrics_registry.get_value(
+            'py_conf_mcp_quota_rejected_calls_total',
+            labels={'tool': TOOL_NAME_1, 'client': CLIENT_ID_1}
+        ) == 1
+        # other clients and tools are not affected
+        quota_limiter.check_and_count(config, CLIENT_ID_2, TOOL_NAME_1)
+        quota_limiter.check_and_count(config, CLIENT_ID_1, 'other')
+        time_fn.return_value = 160.0
+        quota_limiter.check_and_count(config, CLIENT_ID_1, TOOL_NAME_1)
+
+
+class TestFairCallScheduler:
+    @pytest.mark.asyncio
+    async def test_should_limit_concurrent_calls_per_client(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        scheduler = FairCallScheduler(ClientFairnessConfig(max_concurrent_calls_per_client=1))
+        await scheduler.acquire(CLIENT_ID_1)
+        await scheduler.acquire(CLIENT_ID_2)
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(scheduler.acquire, CLIENT_ID_1)
+            await anyio.wait_all_tasks_blocked()
+            assert scheduler.get_queued_calls(CLIENT_ID_1) == 1
+            assert metrics_registry.get_value(
+                'py_conf_mcp_client_queued_calls', labels={'client': CLIENT_ID_1}
+            ) == 1
+            scheduler.release(CLIENT_ID_1)
+        assert scheduler.get_queued_calls(CLIENT_ID_1) == 0
+        assert scheduler.running_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_should_remove_client_gauges_once_idle(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        scheduler = FairCallScheduler(ClientFairnessConfig(max_concurrent_calls=1))
+        await scheduler.acquire(CLIENT_ID_1)
+        assert metrics_registry.get_value(
+            'py_conf_mcp_client_running_calls', labels={'client': CLIENT_ID_1}
+        ) == 1
+        scheduler.release(CLIENT_ID_1)
+        assert not [
+            sample for sample in metrics_registry.get_samples()
+            if sample.labels.get('client') == CLIENT_ID_1
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_grant_slots_fairly_between_clients(self):
+        scheduler = FairCallScheduler(ClientFairnessConfig(max_concurrent_calls=1))
+        granted_client_ids: list[str] = []
+
+        async def call(client_id: str):
+            await scheduler.acquire(client_id)
+            granted_client_ids.append(client_id)
+            await anyio.sleep(0)
+            scheduler.release(client_id)
+
+        await scheduler.acquire('blocking')
+        async with anyio.create_task_group() as task_group:
+            # a noisy client queues many calls before another client
+            for _ in range(4):
+                task_group.start_soon(call, CLIENT_ID_1)
+                await anyio.wait_all_tasks_blocked()
+            task_group.start_soon(call, CLIENT_ID_2)
+            await anyio.wait_all_tasks_blocked()
+            scheduler.release('blocking')
+        assert granted_client_ids.index(CLIENT_ID_2) <= 1
+
+    @pytest.mark.asyncio
+    async def test_should_prefer_clients_with_higher_weight(self):
+        scheduler = FairCallScheduler(ClientFairnessConfig(
+            max_concurrent_calls=1,
+            client_weights={CLIENT_ID_2: 3}
+        ))
+        granted_client_ids: list[str] = []
+
+        async def call(client_id: str):
+            await scheduler.acquire(client_id)
+            granted_client_ids.append(client_id)
+            await anyio.sleep(0)
+            scheduler.release(client_id)
+
+        await scheduler.acquire('blocking')
+        async with anyio.create_task_group() as task_group:
+            for _ in range(4):
+                task_group.start_soon(call, CLIENT_ID_1)
+                task_group.start_soon(call, CLIENT_ID_2)
+            await anyio.wait_all_tasks_blocked()
+            scheduler.release('blocking')
+        assert granted_client_ids[:4].count(CLIENT_ID_2) == 3
+
+    @pytest.mark.asyncio
+    async def test_should_reject_calls_above_max_queued_calls(self):
+        scheduler = FairCallScheduler(ClientFairnessConfig(
+            max_concurrent_calls_per_client=1,
+            max_queued_calls_per_client=1
+        ))
+        await scheduler.acquire(CLIENT_ID_1)
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(scheduler.acquire, CLIENT_ID_1)
+            await anyio.wait_all_tasks_blocked()
+            with pytest.raises(AdmissionRejectedError):
+                await scheduler.acquire(CLIENT_ID_1)
+            scheduler.release(CLIENT_ID_1)
+
+    @pytest.mark.asyncio
+    async def test_should_remove_cancelled_queued_call(self):
+        scheduler = FairCallScheduler(ClientFairnessConfig(max_concurrent_calls=1))
+        await scheduler.acquire(CLIENT_ID_1)
+        with anyio.move_on_after(0.01):
+            await scheduler.acquire(CLIENT_ID_2)
+        assert scheduler.get_queued_calls(CLIENT_ID_2) == 0
+        scheduler.release(CLIENT_ID_1)
+        assert scheduler.running_calls == 0
+
+
+class TestGetToolFunctionWithClientFairness:
+    def test_should_call_tool_directly_if_disabled(self):
+        tool_fn = get_tool_function_with_client_fairness(
+            lambda **kwargs: kwargs, TOOL_NAME_1, ClientFairnessController()
+        )
+        assert tool_fn(key_1='value_1') == {'key_1': 'value_1'}
+
+    def test_should_enforce_tool_quota(self):
+        tool_fn = get_tool_function_with_client_fairness(
+            lambda **kwargs: kwargs,
+            TOOL_NAME_1,
+            ClientFairnessController(ClientFairnessConfig(tool_quotas={
+                TOOL_NAME_1: ToolQuotaConfig(max_calls=1, window_seconds=60)
+            }))
+        )
+        assert tool_fn(key_1='value_1') == {'key_1': 'value_1'}
+        with pytest.raises(QuotaExceededError):
+            tool_fn(key_1='value_1')
+
+    @pytest.mark.asyncio
+    async def test_should_schedule_sync_and_async_results(self):
+        client_fairness_controller = ClientFairnessController(
+            ClientFairnessConfig(max_concurrent_calls=1)
+        )
+
+        async def get_result():
+            assert client_fairness_controller.scheduler.running_calls == 1
+            return 'result_1'
+
+        tool_fn = get_tool_function_with_client_fairness(
+            get_result, TOOL_NAME_1, client_fairness_controller
+        )
+        assert await tool_fn() == 'result_1'
+        tool_fn = get_tool_function_with_client_fairness(
+            lambda: 'result_2', TOOL_NAME_1, client_fairness_controller
+        )
+        assert await tool_fn() == 'result_2'
+        assert client_fairness_controller.scheduler.running_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_should_not_count_quota_for_calls_rejected_by_full_queue(self):
+        client_fairness_controller = ClientFairnessController(ClientFairnessConfig(
+            max_concurrent_calls=1,
+            max_queued_calls_per_client=0,
+            tool_quotas={TOOL_NAME_1: ToolQuotaConfig(max_calls=1, window_seconds=60)}
+        ))
+        tool_fn = get_tool_function_with_client_fairness(
+            lambda: 'result_1', TOOL_NAME_1, client_fairness_controller
+        )
+        await client_fairness_controller.scheduler.acquire(DEFAULT_CLIENT_ID)
+        with pytest.raises(AdmissionRejectedError):
+            await tool_fn()
+        client_fairness_controller.scheduler.release(DEFAULT_CLIENT_ID)
+        assert await tool_fn() == 'result_1'
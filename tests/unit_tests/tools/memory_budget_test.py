@@ -0,0 +1,104 @@
+from typing import Iterator
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from py_conf_mcp.config import MemoryBudgetConfig
+from py_conf_mcp.tools import memory_budget
+from py_conf_mcp.tools.memory_budget import (
+    MemoryTracer,
+    get_tool_function_with_memory_budget
+)
+from py_conf_mcp.utils.memory import MemoryBudgetExceededError, account_memory
+from py_conf_mcp.utils.metrics import MetricsRegistry
+
+
+TOOL_NAME_1 = 'tool_1'
+
+
+@pytest.fixture(name='metrics_registry', autouse=True)
+def _metrics_registry() -> Iterator[MetricsRegistry]:
+    metrics_registry = MetricsRegistry()
+    with patch.object(memory_budget, 'DEFAULT_METRICS_REGISTRY', metrics_registry):
+        yield metrics_registry
+
+
+def get_result_of_size(nbytes: int) -> str:
+    account_memory(nbytes)
+    return 'x' * nbytes
+
+
+async def get_result_of_size_async(nbytes: int) -> str:
+    # e.g. built by fetching result pages in worker threads
+    await anyio.to_thread.run_sync(account_memory, nbytes)
+    return 'x' * nbytes
+
+
+class TestGetToolFunctionWithMemoryBudget:
+    def test_should_return_result_within_budget(self, metrics_registry: MetricsRegistry):
+        tool_fn = get_tool_function_with_memory_budget(
+            get_result_of_size, MemoryBudgetConfig(max_bytes=100), tool_name=TOOL_NAME_1
+        )
+        assert tool_fn(nbytes=10) == 'x' * 10
+        assert metrics_registry.get_value(
+            'py_conf_mcp_tool_call_accounted_memory_bytes', labels={'tool': TOOL_NAME_1}
+        ) == 10
+
+    def test_should_abort_call_exceeding_budget(self, metrics_registry: MetricsRegistry):
+        tool_fn = get_tool_function_with_memory_budget(
+            get_result_of_size, MemoryBudgetConfig(max_bytes=100), tool_name=TOOL_NAME_1
+        )
+        with pytest.raises(MemoryBudgetExceededError):
+            tool_fn(nbytes=101)
+        assert metrics_registry.get_value(
+            'py_conf_mcp_memory_budget_exceeded_total', labels={'tool': TOOL_NAME_1}
+        ) == 1
+        # the budget is per call
+        assert tool_fn(nbytes=100) == 'x' * 100
+
+    @pytest.mark.asyncio
+    async def test_should_account_async_result_while_awaited(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        tool_fn = get_tool_function_with_memory_budget(
+            get_result_of_size_async, MemoryBudgetConfig(max_bytes=100), tool_name=TOOL_NAME_1
+        )
+        assert await tool_fn(nbytes=10) == 'x' * 10
+        with pytest.raises(MemoryBudgetExceededError):
+            await tool_fn(nbytes=101)
+        assert metrics_registry.get_value(
+            'py_conf_mcp_memory_budget_exceeded_total', labels={'tool': TOOL_NAME_1}
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_unwrap_exceeded_error_from_exception_group(self):
+        async def get_result_from_concurrent_tasks() -> str:
+            async with anyio.create_task_group() as task_group:
+                for _ in range(2):
+                    task_group.start_soon(get_result_of_size_async, 60)
+            return 'result_1'
+
+        tool_fn = get_tool_function_with_memory_budget(
+            get_result_from_concurrent_tasks,
+            MemoryBudgetConfig(max_bytes=100),
+            tool_name=TOOL_NAME_1
+        )
+        with pytest.raises(MemoryBudgetExceededError):
+            await tool_fn()
+
+    def test_should_record_peak_memory_of_sampled_calls(
+        self,
+        metrics_registry: MetricsRegistry
+    ):
+        tool_fn = get_tool_function_with_memory_budget(
+            get_result_of_size,
+            MemoryBudgetConfig(trace_sample_rate=1.0),
+            tool_name=TOOL_NAME_1,
+            memory_tracer=MemoryTracer()
+        )
+        assert tool_fn(nbytes=1_000_000) == 'x' * 1_000_000
+        assert metrics_registry.get_value(
+            'py_conf_mcp_tool_call_peak_memory_bytes', labels={'tool': TOOL_NAME_1}
+        ) >= 1_000_000
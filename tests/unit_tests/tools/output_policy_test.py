@@ -0,0 +1,214 @@
+from pathlib import Path
+
+from mcp.types import TextContent
+import pytest
+
+from py_conf_mcp.config import OutputPolicyConfig
+from py_conf_mcp.tools import output_policy as output_policy_module
+from py_conf_mcp.tools.output_policy import (
+    InvalidCursorError,
+    ResultFile,
+    ResultStore,
+    TruncationStrategies,
+    get_more_results,
+    get_result_with_output_policy,
+    get_tool_function_with_output_policy
+)
+
+
+ITEMS_1 = [{'id': index, 'value': f'value_{index}'} for index in range(10)]
+
+
+@pytest.fixture(name='result_store')
+def _result_store(monkeypatch: pytest.MonkeyPatch) -> ResultStore:
+    result_store = ResultStore()
+    monkeypatch.setattr(output_policy_module, 'DEFAULT_RESULT_STORE', result_store)
+    return result_store
+
+
+class TestResultStore:
+    def test_should_return_stored_result_by_cursor(self):
+        result_store = ResultStore()
+        cursor = result_store.put(
+            ['item_1'], output_policy=OutputPolicyConfig(), offset=1, total=2
+        )
+        assert result_store.pop(cursor).remaining == ['item_1']
+
+    def test_should_raise_error_for_unknown_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            ResultStore().pop('unknown')
+
+    def test_should_evict_oldest_entries(self):
+        result_store = ResultStore(max_entries=1)
+        cursor_1 = result_store.put(
+            ['item_1'], output_policy=OutputPolicyConfig(), offset=1, total=2
+        )
+        result_store.put(['item_2'], output_policy=OutputPolicyConfig(), offset=1, total=2)
+        assert len(result_store) == 1
+        with pytest.raises(InvalidCursorError):
+            result_store.pop(cursor_1)
+
+    def test_should_raise_error_for_expired_cursor(self):
+        result_store = ResultStore(ttl_seconds=-1)
+        cursor = result_store.put(
+            ['item_1'], output_policy=OutputPolicyConfig(), offset=1, total=2
+        )
+        with pytest.raises(InvalidCursorError):
+            result_store.pop(cursor)
+
+
+class TestGetResultWithOutputPolicy:
+    def test_should_return_result_unchanged_within_limits(self):
+        result = get_result_with_output_policy(
+            ITEMS_1, OutputPolicyConfig(max_items=100, max_bytes=100_000)
+        )
+        assert result == ITEMS_1
+
+    def test_should_return_head_items(self):
+        result = get_result_with_output_policy(
+            ITEMS_1, OutputPolicyConfig(max_items=3)
+        )
+        assert result['items'] == ITEMS_1[:3]
+        assert result['truncated'] is True
+        assert result['total_items'] == len(ITEMS_1)
+        assert 'cursor' not in result
+
+    def test_should_limit_items_by_max_bytes(self):
+        max_bytes = len(str(ITEMS_1[:2]))
+        result = get_result_with_output_policy(
+            ITEMS_1, OutputPolicyConfig(max_bytes=max_bytes)
+        )
+        assert result['items'] == ITEMS_1[:2]
+
+    def test_should_return_sampled_items(self):
+        result = get_result_with_output_policy(
+            ITEMS_1,
+            OutputPolicyConfig(max_items=2, truncation_strategy=TruncationStrategies.SAMPLE)
+        )
+        assert result['items'] == [ITEMS_1[0], ITEMS_1[5]]
+
+    def test_should_return_summary(self):
+        result = get_result_with_output_policy(
+            ITEMS_1,
+            OutputPolicyConfig(max_items=2, truncation_strategy=TruncationStrategies.SUMMARIZE)
+        )
+        assert result == {
+            'total_items': len(ITEMS_1),
+            'non_null_counts_by_field': {'id': len(ITEMS_1), 'value': len(ITEMS_1)},
+            'truncated': True
+        }
+
+    def test_should_truncate_str_at_line_boundary(self):
+        result = get_result_with_output_policy(
+            'line_1\nline_2\nline_3', OutputPolicyConfig(max_bytes=10)
+        )
+        assert result['content'] == 'line_1\n'
+        assert result['truncated'] is True
+
+    def test_should_not_truncate_empty_items(self):
+        assert get_result_with_output_policy(
+            [], OutputPolicyConfig(max_bytes=1, enable_cursor=True)
+        ) == []
+
+    def test_should_return_at_least_one_whole_character(self):
+        result = get_result_with_output_policy(
+            'ééé', OutputPolicyConfig(max_bytes=1)
+        )
+        assert result['content'] == 'é'
+        assert result['truncated'] is True
+
+    def test_should_return_mapping_unchanged_within_max_bytes(self):
+        assert get_result_with_output_policy(
+            {'key': 'value'}, OutputPolicyConfig(max_bytes=100)
+        ) == {'key': 'value'}
+
+    def test_should_truncate_mapping_exceeding_max_bytes_as_json(self):
+        result = get_result_with_output_policy(
+            {'key': 'value' * 10}, OutputPolicyConfig(max_bytes=10)
+        )
+        assert result['content'] == '{"key":"va'
+        assert result['truncated'] is True
+        assert result['total_length'] == len('{"key":"' + 'value' * 10 + '"}')
+
+    def test_should_not_change_other_results(self):
+        assert get_result_with_output_policy(
+            123, OutputPolicyConfig(max_bytes=1)
+        ) == 123
+
+
+class TestGetMoreResults:
+    def test_should_page_through_items_using_cursor(self, result_store: ResultStore):
+        output_policy = OutputPolicyConfig(max_items=4, enable_cursor=True)
+        page_1 = get_result_with_output_policy(
+            ITEMS_1, output_policy, result_store=result_store
+        )
+        page_2 = get_more_results(page_1['cursor'])
+        page_3 = get_more_results(page_2['cursor'])
+        assert page_1['items'] + page_2['items'] + page_3['items'] == ITEMS_1
+        assert page_2['offset'] == 4
+        assert page_3['truncated'] is False
+        assert 'cursor' not in page_3
+
+    def test_should_page_through_str_using_cursor(self, result_store: ResultStore):
+        output_policy = OutputPolicyConfig(max_bytes=7, enable_cursor=True)
+        page_1 = get_result_with_output_policy(
+            'line_1\nline_2', output_policy, result_store=result_store
+        )
+        page_2 = get_more_results(page_1['cursor'])
+        assert page_1['content'] + page_2['content'] == 'line_1\nline_2'
+
+    def test_should_make_progress_with_multi_byte_characters(self, result_store: ResultStore):
+        output_policy = OutputPolicyConfig(max_bytes=1, enable_cursor=True)
+        page = get_result_with_output_policy('ééé', output_policy, result_store=result_store)
+        contents = [page['content']]
+        while 'cursor' in page:
+            page = get_more_results(page['cursor'])
+            contents.append(page['content'])
+        assert contents == ['é', 'é', 'é']
+
+    def test_should_page_through_result_file_using_cursor(
+        self,
+        result_store: ResultStore,
+        tmp_path: Path
+    ):
+        content = 'line_1\nliné_2\nline_3\n'
+        with (tmp_path / 'result').open('w+b') as file:
+            file.write(content.encode('utf-8'))
+            cursor = result_store.put(
+                ResultFile(file, size=file.tell()),
+                output_policy=OutputPolicyConfig(max_bytes=10, enable_cursor=True),
+                offset=0,
+                total=file.tell()
+            )
+            pages = []
+            while cursor:
+                page = get_more_results(cursor)
+                pages.append(page['content'])
+                cursor = page.get('cursor')
+        assert ''.join(pages) == content
+        assert pages[0] == 'line_1\n'
+        assert page['truncated'] is False
+
+
+class TestGetToolFunctionWithOutputPolicy:
+    def test_should_apply_output_policy_to_tool_result(self):
+        tool_fn = get_tool_function_with_output_policy(
+            lambda **_: ITEMS_1,
+            OutputPolicyConfig(max_items=1)
+        )
+        assert tool_fn()['items'] == ITEMS_1[:1]
+
+
+class TestGetResultWithOutputPolicyForTextContent:
+    def test_should_keep_text_content_without_max_bytes(self):
+        text_content = TextContent(type='text', text='line_1\nline_2')
+        assert get_result_with_output_policy(
+            text_content, OutputPolicyConfig(max_items=1)
+        ) is text_content
+
+    def test_should_truncate_text_of_text_content(self):
+        result = get_result_with_output_policy(
+            TextContent(type='text', text='line_1\nline_2'),
+            OutputPolicyConfig(max_bytes=7)
+        )
+        assert result['content'] == 'line_1\n'
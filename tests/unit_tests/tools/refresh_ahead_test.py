@@ -0,0 +1,108 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_conf_mcp.config import RefreshAheadConfig
+from py_conf_mcp.tools.refresh_ahead import (
+    RefreshAheadRegistration,
+    RefreshAheadScheduler,
+    get_jittered_interval,
+    refresh_result_cache_entry
+)
+from py_conf_mcp.tools.result_cache import (
+    InMemoryResultCacheBackend,
+    ResultCache,
+    get_tool_function_with_result_cache
+)
+
+
+REFRESH_AHEAD_CONFIG_1 = RefreshAheadConfig(
+    inputs=[{'param_1': 'value_1'}, {'param_1': 'value_2'}],
+    interval_seconds=10,
+    jitter_ratio=0.1
+)
+
+
+def _get_value(param_1: str, param_2: str = 'default_2') -> str:
+    return f'{param_1}-{param_2}'
+
+
+async def _get_value_async(param_1: str) -> str:
+    return param_1
+
+
+@pytest.fixture(name='result_cache')
+def _result_cache() -> ResultCache:
+    return ResultCache(backend=InMemoryResultCacheBackend(), namespace='ns', ttl_seconds=60)
+
+
+class TestGetJitteredInterval:
+    def test_should_return_interval_within_jitter(self):
+        for _ in range(100):
+            assert 9 <= get_jittered_interval(10, 0.1) <= 11
+
+    def test_should_return_exact_interval_without_jitter(self):
+        assert get_jittered_interval(10, 0) == 10
+
+
+class TestRefreshResultCacheEntry:
+    def test_should_store_result_using_key_with_defaults(self, result_cache: ResultCache):
+        refresh_result_cache_entry(_get_value, result_cache, {'param_1': 'value_1'})
+        tool_fn = MagicMock()
+        cached_tool_fn = get_tool_function_with_result_cache(tool_fn, result_cache)
+        assert cached_tool_fn(param_1='value_1', param_2='default_2') == 'value_1-default_2'
+        tool_fn.assert_not_called()
+
+    def test_should_store_awaited_result(self, result_cache: ResultCache):
+        refresh_result_cache_entry(_get_value_async, result_cache, {'param_1': 'value_1'})
+        assert result_cache.get({'param_1': 'value_1'}) == (True, 'value_1')
+
+
+class TestRefreshAheadScheduler:
+    def test_should_refresh_all_inputs_when_due(self):
+        scheduler = RefreshAheadScheduler()
+        refresh_fn = MagicMock()
+        scheduler.add('tool_1', refresh_fn, REFRESH_AHEAD_CONFIG_1)
+        assert scheduler.run_pending(now=float('inf')) == 1
+        assert [call.args[0] for call in refresh_fn.call_args_list] == list(
+            REFRESH_AHEAD_CONFIG_1.inputs
+        )
+
+    def test_should_not_refresh_again_before_interval(self):
+        scheduler = RefreshAheadScheduler()
+        refresh_fn = MagicMock()
+        scheduler.add('tool_1', refresh_fn, REFRESH_AHEAD_CONFIG_1)
+        now = time.monotonic() + 100
+        entry = scheduler.get_due_entries(now=now)[0]
+        scheduler.refresh(entry)
+        assert now + 9 <= entry.next_refresh_at <= now + 11
+        assert not scheduler.get_due_entries(now=now + 5)
+        assert scheduler.get_due_entries(now=now + 11)
+
+    def test_should_continue_with_other_inputs_if_refresh_fails(self):
+        scheduler = RefreshAheadScheduler()
+        refresh_fn = MagicMock(side_effect=[RuntimeError('failed'), None])
+        scheduler.add('tool_1', refresh_fn, REFRESH_AHEAD_CONFIG_1)
+        scheduler.run_pending(now=float('inf'))
+        assert refresh_fn.call_count == 2
+        assert scheduler.run_pending(now=float('inf')) == 1
+
+    def test_should_remove_entry(self):
+        scheduler = RefreshAheadScheduler()
+        scheduler.add('tool_1', MagicMock(), REFRESH_AHEAD_CONFIG_1)
+        scheduler.remove('tool_1')
+        assert len(scheduler) == 0
+        assert scheduler.run_pending(now=float('inf')) == 0
+
+    def test_should_update_entries_in_one_step(self):
+        scheduler = RefreshAheadScheduler()
+        scheduler.add('tool_1', MagicMock(), REFRESH_AHEAD_CONFIG_1)
+        scheduler.add('tool_2', MagicMock(), REFRESH_AHEAD_CONFIG_1)
+        refresh_fn = MagicMock(name='refresh_fn')
+        scheduler.update(
+            {'tool_2': RefreshAheadRegistration(refresh_fn, REFRESH_AHEAD_CONFIG_1)},
+            removed_tool_names=['tool_1', 'tool_2']
+        )
+        assert scheduler.run_pending(now=float('inf')) == 1
+        assert refresh_fn.call_count == 2
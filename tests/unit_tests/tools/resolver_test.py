@@ -1,4 +1,6 @@
 import dataclasses
+import inspect
+import logging
 from unittest.mock import ANY
 import pytest
 
@@ -7,14 +9,21 @@ from fastmcp.tools.tool import Tool
 from py_conf_mcp.config import (
     FromPythonClassConfig,
     FromPythonFunctionConfig,
+    LogConfig,
+    OutputPolicyConfig,
+    RefreshAheadConfig,
+    ResultCacheConfig,
     ToolDefinitionsConfig
 )
 from py_conf_mcp.tools.example.joke import get_joke
+from py_conf_mcp.tools.refresh_ahead import DEFAULT_REFRESH_AHEAD_SCHEDULER
 from py_conf_mcp.tools.resolver import (
     ConfigToolResolver,
     get_tool_from_python_class,
-    get_tool_function_with_dynamic_parameters
+    get_tool_function_with_dynamic_parameters,
+    get_tool_logger
 )
+from py_conf_mcp.utils.logging import SamplingFilter
 
 
 FROM_PYTHON_CLASS_CONFIG_1 = FromPythonClassConfig(
@@ -139,11 +148,39 @@ class TestGetToolFunctionWithDynamicParameters:
         }
 
 
+class TestGetToolLogger:
+    def test_should_return_logger_for_tool_name(self):
+        tool_logger = get_tool_logger('tool_1', LogConfig())
+        assert tool_logger.name == 'py_conf_mcp.tools.tool_1'
+
+    def test_should_set_configured_log_level(self):
+        tool_logger = get_tool_logger('tool_2', LogConfig(level='WARNING'))
+        assert tool_logger.level == logging.WARNING
+
+    def test_should_add_single_sampling_filter(self):
+        get_tool_logger('tool_3', LogConfig(sample_rate=0.5))
+        tool_logger = get_tool_logger('tool_3', LogConfig(sample_rate=0.1))
+        sampling_filters = [
+            log_filter
+            for log_filter in tool_logger.filters
+            if isinstance(log_filter, SamplingFilter)
+        ]
+        assert len(sampling_filters) == 1
+        assert sampling_filters[0].sample_rate == 0.1
+
+
 class TestFromPythonClassConfig:
     def test_should_load_from_class(self):
         tool = get_tool_from_python_class(FROM_PYTHON_CLASS_CONFIG_1)
         assert tool.name == FROM_PYTHON_CLASS_CONFIG_1.name
 
+    def test_should_pass_tool_logger_to_tool_class(self):
+        tool = get_tool_from_python_class(KWARGS_FROM_PYTHON_CLASS_CONFIG_1)
+        tool_instance = inspect.unwrap(tool.tool_fn).__self__  # type: ignore[attr-defined]
+        assert tool_instance.logger.name == (
+            f'py_conf_mcp.tools.{KWARGS_FROM_PYTHON_CLASS_CONFIG_1.name}'
+        )
+
     def test_should_load_from_class_with_dynamic_parameters(
         self
     ):
@@ -155,6 +192,34 @@ class TestFromPythonClassConfig:
         properties_dict = mcp_tool.parameters['properties']
         assert properties_dict.keys() == {'param_1'}
 
+    def test_should_apply_output_policy(self):
+        tool = get_tool_from_python_class(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            init_parameters={'content': 'line_1\nline_2'},
+            output_policy=OutputPolicyConfig(max_bytes=7)
+        ))
+        assert tool.tool_fn()['content'] == 'line_1\n'
+
+    def test_should_apply_result_cache(self):
+        tool = get_tool_from_python_class(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            result_cache=ResultCacheConfig(backend='memory')
+        ))
+        assert tool.tool_fn().text == 'Static content'
+        # from the cache
+        assert tool.tool_fn() == 'Static content'
+
+    def test_should_return_refresh_ahead_without_scheduling_it(self):
+        refresh_ahead_config = RefreshAheadConfig(inputs=[{}], interval_seconds=10)
+        tool = get_tool_from_python_class(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            result_cache=ResultCacheConfig(backend='memory', ttl_seconds=60),
+            refresh_ahead=refresh_ahead_config
+        ))
+        assert tool.refresh_ahead is not None
+        assert tool.refresh_ahead.refresh_ahead_config == refresh_ahead_config
+        assert len(DEFAULT_REFRESH_AHEAD_SCHEDULER) == 0
+
     def test_should_create_wrapper_if_dynamic_parameters_are_empty_and_fn_accepts_kwargs(
         self
     ):
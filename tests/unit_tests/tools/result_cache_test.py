@@ -0,0 +1,203 @@
+from pathlib import Path
+import threading
+import time
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+from mcp.types import TextContent
+import pytest
+
+from py_conf_mcp.config import ResultCacheConfig
+from py_conf_mcp.tools.result_cache import (
+    InMemoryResultCacheBackend,
+    NetworkResultCacheBackend,
+    ResultCache,
+    SqliteResultCacheBackend,
+    get_result_cache_backend,
+    get_result_cache_key,
+    get_tool_function_with_result_cache
+)
+
+
+class FakeNetworkCacheClient:
+    '''
+    Local stand-in for a Redis-like network cache.
+    '''
+
+    def __init__(self):
+        self.values: dict[str, tuple[bytes, float]] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        entry = self.values.get(name)
+        if entry is None or entry[1] < time.time():
+            return None
+        return entry[0]
+
+    def set(self, name: str, value: bytes, px: Optional[int] = None) -> Any:
+        self.values[name] = (value, time.time() + (px or 0) / 1000)
+        return True
+
+
+class TestInMemoryResultCacheBackend:
+    def test_should_return_stored_value(self):
+        backend = InMemoryResultCacheBackend()
+        backend.set('key_1', b'value_1', ttl_seconds=60)
+        assert backend.get('key_1') == b'value_1'
+
+    def test_should_not_return_expired_value(self):
+        backend = InMemoryResultCacheBackend()
+        backend.set('key_1', b'value_1', ttl_seconds=-1)
+        assert backend.get('key_1') is None
+
+    def test_should_evict_least_recently_used_value(self):
+        backend = InMemoryResultCacheBackend(max_entries=1)
+        backend.set('key_1', b'value_1', ttl_seconds=60)
+        backend.set('key_2', b'value_2', ttl_seconds=60)
+        assert backend.get('key_1') is None
+        assert len(backend) == 1
+
+
+class TestSqliteResultCacheBackend:
+    def test_should_share_values_between_instances(self, tmp_path: Path):
+        path = str(tmp_path / 'cache' / 'results.sqlite')
+        SqliteResultCacheBackend(path).set('key_1', b'value_1', ttl_seconds=60)
+        assert SqliteResultCacheBackend(path).get('key_1') == b'value_1'
+
+    def test_should_not_return_expired_value(self, tmp_path: Path):
+        backend = SqliteResultCacheBackend(str(tmp_path / 'results.sqlite'))
+        backend.set('key_1', b'value_1', ttl_seconds=-1)
+        assert backend.get('key_1') is None
+
+
+class TestNetworkResultCacheBackend:
+    def test_should_set_value_with_ttl_in_milliseconds(self):
+        client = MagicMock(FakeNetworkCacheClient)
+        NetworkResultCacheBackend(client).set('key_1', b'value_1', ttl_seconds=1.5)
+        client.set.assert_called_with('key_1', b'value_1', px=1500)
+
+    def test_should_return_value_from_client(self):
+        backend = NetworkResultCacheBackend(FakeNetworkCacheClient())
+        backend.set('key_1', b'value_1', ttl_seconds=60)
+        assert backend.get('key_1') == b'value_1'
+
+
+class TestGetResultCacheBackend:
+    def test_should_share_backend_for_same_config(self):
+        result_cache_config = ResultCacheConfig(backend='memory', max_entries=123)
+        backend = get_result_cache_backend(result_cache_config)
+        assert isinstance(backend, InMemoryResultCacheBackend)
+        assert get_result_cache_backend(result_cache_config) is backend
+
+    def test_should_raise_error_for_unsupported_backend(self):
+        with pytest.raises(ValueError):
+            get_result_cache_backend(ResultCacheConfig(backend='other'))
+
+
+class TestGetResultCacheKey:
+    def test_should_not_depend_on_kwargs_order(self):
+        assert get_result_cache_key('ns', {'a': 1, 'b': 2}) == (
+            get_result_cache_key('ns', {'b': 2, 'a': 1})
+        )
+
+    def test_should_include_namespace(self):
+        assert get_result_cache_key('ns_1', {'a': 1}) != get_result_cache_key('ns_2', {'a': 1})
+
+
+class TestResultCache:
+    def test_should_store_result_as_json(self):
+        backend = InMemoryResultCacheBackend()
+        result_cache = ResultCache(backend=backend, namespace='ns', ttl_seconds=60)
+        result_cache.set({'a': 1}, [{'id': 1}])
+        assert backend.get(result_cache.get_key({'a': 1})) == b'[{"id":1}]'
+        assert result_cache.get({'a': 1}) == (True, [{'id': 1}])
+
+    def test_should_store_text_content_and_json_bytes_as_text(self):
+        result_cache = ResultCache(
+            backend=InMemoryResultCacheBackend(), namespace='ns', ttl_seconds=60
+        )
+        result_cache.set({'a': 1}, TextContent(type='text', text='text_1'))
+        result_cache.set({'a': 2}, b'{"id":1}')
+        assert result_cache.get({'a': 1}) == (True, 'text_1')
+        assert result_cache.get({'a': 2}) == (True, '{"id":1}')
+
+    def test_should_treat_invalid_value_as_miss(self):
+        backend = InMemoryResultCacheBackend()
+        result_cache = ResultCache(backend=backend, namespace='ns', ttl_seconds=60)
+        backend.set(result_cache.get_key({'a': 1}), b'\x80\x04invalid', ttl_seconds=60)
+        assert result_cache.get({'a': 1}) == (False, None)
+
+
+class TestGetToolFunctionWithResultCache:
+    def test_should_only_call_tool_function_once_for_same_kwargs(self):
+        tool_fn = MagicMock(return_value=[{'id': 1}])
+        wrapped_tool_fn = get_tool_function_with_result_cache(
+            tool_fn,
+            ResultCache(
+                backend=NetworkResultCacheBackend(FakeNetworkCacheClient()),
+                namespace='ns',
+                ttl_seconds=60
+            )
+        )
+        assert wrapped_tool_fn(param_1='value_1') == [{'id': 1}]
+        assert wrapped_tool_fn(param_1='value_1') == [{'id': 1}]
+        assert wrapped_tool_fn(param_1='value_2') == [{'id': 1}]
+        assert tool_fn.call_count == 2
+
+    def test_should_invalidate_results_for_different_namespace(self):
+        tool_fn = MagicMock(return_value='result_1')
+        backend = InMemoryResultCacheBackend()
+        for namespace in ['config_hash_1', 'config_hash_2']:
+            get_tool_function_with_result_cache(
+                tool_fn,
+                ResultCache(backend=backend, namespace=namespace, ttl_seconds=60)
+            )()
+        assert tool_fn.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_cache_async_result(self):
+        calls = []
+
+        async def tool_fn(**kwargs):
+            calls.append(kwargs)
+            return 'result_1'
+
+        wrapped_tool_fn = get_tool_function_with_result_cache(
+            tool_fn,
+            ResultCache(backend=InMemoryResultCacheBackend(), namespace='ns', ttl_seconds=60)
+        )
+        assert await wrapped_tool_fn() == 'result_1'
+        assert wrapped_tool_fn() == 'result_1'
+        assert len(calls) == 1
+
+    def test_should_call_tool_function_if_backend_fails(self):
+        backend = MagicMock(InMemoryResultCacheBackend)
+        backend.get.side_effect = RuntimeError('unavailable')
+        tool_fn = MagicMock(return_value='result_1')
+        wrapped_tool_fn = get_tool_function_with_result_cache(
+            tool_fn,
+            ResultCache(backend=backend, namespace='ns', ttl_seconds=60)
+        )
+        assert wrapped_tool_fn() == 'result_1'
+
+    @pytest.mark.asyncio
+    async def test_should_access_blocking_backend_outside_event_loop(self):
+        client = FakeNetworkCacheClient()
+        client_get = client.get
+        get_thread_ids: list[int] = []
+
+        def get(name: str) -> Optional[bytes]:
+            get_thread_ids.append(threading.get_ident())
+            return client_get(name)
+
+        client.get = get  # type: ignore[method-assign]
+        tool_fn = MagicMock(return_value='result_1')
+        wrapped_tool_fn = get_tool_function_with_result_cache(
+            tool_fn,
+            ResultCache(
+                backend=NetworkResultCacheBackend(client), namespace='ns', ttl_seconds=60
+            )
+        )
+        assert await wrapped_tool_fn() == 'result_1'
+        assert await wrapped_tool_fn() == 'result_1'
+        assert tool_fn.call_count == 1
+        assert threading.get_ident() not in get_thread_ids
@@ -1,11 +1,34 @@
+import functools
+import threading
+import time
 from typing import Iterator
 from unittest.mock import ANY, MagicMock, patch
 
+import anyio
+import anyio.from_thread
 import pytest
 
 from py_conf_mcp.tools.sources import bigquery
-from py_conf_mcp.tools.sources.bigquery import BigQueryTool, toquoted
+from py_conf_mcp.tools.sources.bigquery import (
+    BigQueryTool,
+    DryRunCache,
+    MaximumBytesBilledExceededError,
+    get_bq_dry_run_total_bytes_processed,
+    get_bq_result_from_bq_query,
+    get_bq_array_parameter_type,
+    get_bq_rows_from_bq_query_async,
+    get_rows_split_by_key,
+    iter_dict_from_bq_query,
+    toquoted
+)
 from py_conf_mcp.utils.json import get_json_as_csv_lines
+from py_conf_mcp.utils.memory import (
+    MemoryBudget,
+    MemoryBudgetExceededError,
+    get_estimated_size,
+    memory_budget_context
+)
+from py_conf_mcp.utils.metrics import MetricsRegistry
 
 
 PROJECT_NAME_1 = 'project_name_1'
@@ -21,6 +44,25 @@ def _bigquery_mock() -> Iterator[MagicMock]:
         yield mock
 
 
+@pytest.fixture(name='bq_client_mock')
+def _bq_client_mock() -> Iterator[MagicMock]:
+    with patch.object(bigquery, 'get_bq_client') as mock:
+        yield mock.return_value
+
+
+@pytest.fixture(name='metrics_registry', autouse=True)
+def _metrics_registry() -> Iterator[MetricsRegistry]:
+    metrics_registry = MetricsRegistry()
+    with patch.object(bigquery, 'DEFAULT_METRICS_REGISTRY', metrics_registry):
+        yield metrics_registry
+
+
+@pytest.fixture(name='get_bq_dry_run_total_bytes_processed_mock')
+def _get_bq_dry_run_total_bytes_processed_mock() -> Iterator[MagicMock]:
+    with patch.object(bigquery, 'get_bq_dry_run_total_bytes_processed') as mock:
+        yield mock
+
+
 @pytest.fixture(name='iter_dict_from_bq_query_mock')
 def _iter_dict_from_bq_query_mock() -> Iterator[MagicMock]:
     with patch.object(bigquery, 'iter_dict_from_bq_query') as mock:
@@ -58,7 +100,9 @@ class TestBigQueryTool:
         tool()
         iter_dict_from_bq_query_mock.assert_called_with(
             project_name=PROJECT_NAME_1,
-            query=SQL_QUERY_1
+            query=SQL_QUERY_1,
+            maximum_bytes_billed=None,
+            metric_labels=ANY
         )
 
     def test_should_replace_placeholders_in_sql_query(
@@ -73,7 +117,9 @@ class TestBigQueryTool:
         tool(param_1='value_1')
         iter_dict_from_bq_query_mock.assert_called_with(
             project_name=ANY,
-            query='SELECT value_1'
+            query='SELECT value_1',
+            maximum_bytes_billed=None,
+            metric_labels=ANY
         )
 
     def test_should_return_query_results_as_json(
@@ -98,3 +144,454 @@ class TestBigQueryTool:
         )
         iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
         assert tool() == '\n'.join(list(get_json_as_csv_lines([ROW_1])))
+
+    def test_should_apply_result_projection(
+        self,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        pytest.importorskip('jmespath')
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            result_projection="[?column_1 == 'value_1'].{value: column_1}"
+        )
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1, {'column_1': 'other'}])
+        assert tool() == [{'value': 'value_1'}]
+
+    def test_should_reject_result_projection_with_csv_chunks(self):
+        with pytest.raises(ValueError):
+            BigQueryTool(
+                project_name=PROJECT_NAME_1,
+                sql_query=SQL_QUERY_1,
+                output_format='csv',
+                csv_chunk_size=1,
+                result_projection='[*].column_1'
+            )
+
+    @pytest.mark.parametrize('result_projection', ['[0]', '[*].column_1', 'length'])
+    def test_should_reject_csv_output_for_projection_not_returning_objects(
+        self,
+        iter_dict_from_bq_query_mock: MagicMock,
+        result_projection: str
+    ):
+        pytest.importorskip('jmespath')
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            output_format='csv',
+            result_projection=result_projection
+        )
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
+        with pytest.raises(ValueError, match='list of objects'):
+            tool()
+
+    def test_should_return_projected_objects_as_csv(
+        self,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        pytest.importorskip('jmespath')
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            output_format='csv',
+            result_projection='[*].{value: column_1}'
+        )
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
+        assert tool() == 'value\nvalue_1'
+
+    def test_should_return_query_results_as_csv_chunks(
+        self,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            output_format='csv',
+            csv_chunk_size=1
+        )
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1, ROW_1])
+        chunks = list(tool())
+        assert len(chunks) == 2
+        assert ''.join(chunks) == '\n'.join(list(get_json_as_csv_lines([ROW_1, ROW_1])))
+
+
+class TestDryRunCache:
+    def test_should_compute_value_again_once_expired(self):
+        time_fn = MagicMock(name='time_fn', return_value=100.0)
+        dry_run_cache = DryRunCache(ttl_seconds=60, time_fn=time_fn)
+        compute_fn = MagicMock(name='compute_fn', side_effect=[1, 2])
+        assert dry_run_cache.get_or_compute('key_1', compute_fn) == 1
+        time_fn.return_value = 159.0
+        assert dry_run_cache.get_or_compute('key_1', compute_fn) == 1
+        time_fn.return_value = 160.0
+        assert dry_run_cache.get_or_compute('key_1', compute_fn) == 2
+
+    def test_should_evict_least_recently_used_entry(self):
+        dry_run_cache = DryRunCache(max_entries=1)
+        dry_run_cache.get_or_compute('key_1', lambda: 1)
+        dry_run_cache.get_or_compute('key_2', lambda: 2)
+        assert dry_run_cache.get_or_compute('key_1', lambda: 3) == 3
+
+
+class TestGetBqDryRunTotalBytesProcessed:
+    def test_should_cache_dry_run_per_query(self, bq_client_mock: MagicMock):
+        bigquery.DEFAULT_DRY_RUN_CACHE.clear()
+        bq_client_mock.query.return_value.total_bytes_processed = 123
+        assert get_bq_dry_run_total_bytes_processed(PROJECT_NAME_1, SQL_QUERY_1) == 123
+        assert get_bq_dry_run_total_bytes_processed(PROJECT_NAME_1, SQL_QUERY_1) == 123
+        assert bq_client_mock.query.call_count == 1
+        bigquery.DEFAULT_DRY_RUN_CACHE.clear()
+
+    def test_should_dry_run_and_cache_per_query_parameters(
+        self,
+        bigquery_mock: MagicMock,
+        bq_client_mock: MagicMock
+    ):
+        bigquery.DEFAULT_DRY_RUN_CACHE.clear()
+        query_parameter_1 = MagicMock(name='query_parameter_1')
+        query_parameter_1.to_api_repr.return_value = {'name': 'ids', 'value': 1}
+        query_parameter_2 = MagicMock(name='query_parameter_2')
+        query_parameter_2.to_api_repr.return_value = {'name': 'ids', 'value': 2}
+        bq_client_mock.query.return_value.total_bytes_processed = 123
+        get_bq_dry_run_total_bytes_processed(PROJECT_NAME_1, SQL_QUERY_1, [query_parameter_1])
+        get_bq_dry_run_total_bytes_processed(PROJECT_NAME_1, SQL_QUERY_1, [query_parameter_1])
+        get_bq_dry_run_total_bytes_processed(PROJECT_NAME_1, SQL_QUERY_1, [query_parameter_2])
+        assert bq_client_mock.query.call_count == 2
+        bigquery_mock.QueryJobConfig.assert_called_with(
+            dry_run=True,
+            use_query_cache=False,
+            query_parameters=[query_parameter_2]
+        )
+        bigquery.DEFAULT_DRY_RUN_CACHE.clear()
+
+
+class TestGetBqResultFromBqQuery:
+    def test_should_record_job_metrics(
+        self,
+        bq_client_mock: MagicMock,
+        metrics_registry: MetricsRegistry
+    ):
+        query_job = bq_client_mock.query.return_value
+        query_job.total_bytes_processed = 1000
+        query_job.slot_millis = 20
+        query_job.cache_hit = True
+        labels = {'tool': 'tool_1'}
+        get_bq_result_from_bq_query(PROJECT_NAME_1, SQL_QUERY_1, metric_labels=labels)
+        assert metrics_registry.get_value(
+            'py_conf_mcp_bigquery_bytes_processed_total', labels=labels
+        ) == 1000
+        assert metrics_registry.get_value(
+            'py_conf_mcp_bigquery_slot_milliseconds_total', labels=labels
+        ) == 20
+        assert metrics_registry.get_value(
+            'py_conf_mcp_bigquery_cache_hits_total', labels=labels
+        ) == 1
+
+
+class TestIterDictFromBqQuery:
+    def test_should_abort_once_memory_budget_is_exceeded(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        bq_client_mock.query.return_value.result.return_value = iter([ROW_1] * 10)
+        memory_budget = MemoryBudget(max_bytes=get_estimated_size(ROW_1) * 2)
+        rows = []
+        with memory_budget_context(memory_budget):
+            with pytest.raises(MemoryBudgetExceededError):
+                for row in iter_dict_from_bq_query(PROJECT_NAME_1, SQL_QUERY_1):
+                    rows.append(row)
+        assert rows == [ROW_1, ROW_1]
+
+
+class TestBigQueryToolDryRun:
+    def test_should_reject_query_exceeding_maximum_bytes_billed(
+        self,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        get_bq_dry_run_total_bytes_processed_mock.return_value = 2000
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            dry_run=True,
+            maximum_bytes_billed=1000
+        )
+        with pytest.raises(MaximumBytesBilledExceededError):
+            tool()
+        iter_dict_from_bq_query_mock.assert_not_called()
+
+    def test_should_run_query_within_maximum_bytes_billed(
+        self,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        get_bq_dry_run_total_bytes_processed_mock.return_value = 500
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            dry_run=True,
+            maximum_bytes_billed=1000
+        )
+        assert tool() == [ROW_1]
+        assert iter_dict_from_bq_query_mock.call_args.kwargs['maximum_bytes_billed'] == 1000
+
+    def test_should_only_warn_if_configured(
+        self,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        get_bq_dry_run_total_bytes_processed_mock.return_value = 2000
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query=SQL_QUERY_1,
+            dry_run=True,
+            maximum_bytes_billed=1000,
+            maximum_bytes_billed_action='warn'
+        )
+        assert tool() == [ROW_1]
+        assert iter_dict_from_bq_query_mock.call_args.kwargs['maximum_bytes_billed'] is None
+
+    def test_should_not_dry_run_by_default(
+        self,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        iter_dict_from_bq_query_mock.return_value = iter([ROW_1])
+        BigQueryTool(project_name=PROJECT_NAME_1, sql_query=SQL_QUERY_1)()
+        get_bq_dry_run_total_bytes_processed_mock.assert_not_called()
+
+
+def _get_row_iterator_mock(rows: list[dict], total_rows: int) -> MagicMock:
+    row_iterator_mock = MagicMock()
+    row_iterator_mock.__iter__.return_value = iter(rows)
+    row_iterator_mock.total_rows = total_rows
+    return row_iterator_mock
+
+
+class TestGetBqRowsFromBqQueryAsync:
+    @pytest.mark.asyncio
+    async def test_should_poll_until_done_and_fetch_remaining_pages(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        query_job = bq_client_mock.query.return_value
+        query_job.done.side_effect = [False, False, True]
+        query_job.result.return_value = _get_row_iterator_mock([{'id': 1}], total_rows=3)
+        bq_client_mock.list_rows.side_effect = lambda *_, start_index, **__: [
+            {'id': start_index + 1}
+        ]
+        rows = await get_bq_rows_from_bq_query_async(
+            PROJECT_NAME_1,
+            SQL_QUERY_1,
+            poll_interval_seconds=0.001,
+            page_size=1
+        )
+        assert rows == [{'id': 1}, {'id': 2}, {'id': 3}]
+        assert query_job.done.call_count == 3
+        query_job.result.assert_called_with(max_results=1)
+
+    @pytest.mark.asyncio
+    async def test_should_account_fetched_pages_to_memory_budget(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        query_job = bq_client_mock.query.return_value
+        query_job.done.return_value = True
+        query_job.result.return_value = _get_row_iterator_mock([{'id': 1}], total_rows=3)
+        bq_client_mock.list_rows.side_effect = lambda *_, start_index, **__: [
+            {'id': start_index + 1}
+        ]
+        memory_budget = MemoryBudget(max_bytes=get_estimated_size({'id': 1}) * 2)
+        with memory_budget_context(memory_budget):
+            with pytest.raises((MemoryBudgetExceededError, ExceptionGroup)):
+                await get_bq_rows_from_bq_query_async(
+                    PROJECT_NAME_1,
+                    SQL_QUERY_1,
+                    page_size=1,
+                    max_concurrent_page_fetches=1
+                )
+        assert isinstance(memory_budget.exceeded_error, MemoryBudgetExceededError)
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_job_on_timeout(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        query_job = bq_client_mock.query.return_value
+        query_job.done.return_value = False
+        with pytest.raises(TimeoutError):
+            await get_bq_rows_from_bq_query_async(
+                PROJECT_NAME_1,
+                SQL_QUERY_1,
+                poll_interval_seconds=0.001,
+                max_poll_interval_seconds=0.001,
+                timeout_seconds=0.05
+            )
+        query_job.cancel.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_job_if_cancelled(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        query_job = bq_client_mock.query.return_value
+        polled = anyio.Event()
+
+        def is_done() -> bool:
+            # called in a worker thread
+            anyio.from_thread.run_sync(polled.set)
+            return False
+
+        query_job.done.side_effect = is_done
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(functools.partial(
+                get_bq_rows_from_bq_query_async,
+                PROJECT_NAME_1,
+                SQL_QUERY_1,
+                poll_interval_seconds=0.001,
+                max_poll_interval_seconds=0.001
+            ))
+            await polled.wait()
+            task_group.cancel_scope.cancel()
+        query_job.cancel.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_job_on_timeout_while_submitting(
+        self,
+        bq_client_mock: MagicMock
+    ):
+        query_job = MagicMock(name='query_job')
+
+        def submit_query_job(*_, **__):
+            time.sleep(0.1)
+            return query_job
+
+        bq_client_mock.query.side_effect = submit_query_job
+        with pytest.raises(TimeoutError):
+            await get_bq_rows_from_bq_query_async(
+                PROJECT_NAME_1,
+                SQL_QUERY_1,
+                timeout_seconds=0.01
+            )
+        query_job.cancel.assert_called()
+        query_job.done.assert_not_called()
+
+
+class TestBigQueryToolAsyncQuery:
+    @pytest.mark.asyncio
+    async def test_should_return_awaitable_result(self):
+        with patch.object(bigquery, 'get_bq_rows_from_bq_query_async') as mock:
+            mock.return_value = [ROW_1]
+            tool = BigQueryTool(
+                project_name=PROJECT_NAME_1,
+                sql_query=SQL_QUERY_1,
+                async_query=True,
+                timeout_seconds=10
+            )
+            assert await tool() == [ROW_1]
+            assert mock.call_args.kwargs['timeout_seconds'] == 10
+
+    @pytest.mark.asyncio
+    async def test_should_dry_run_in_worker_thread(
+        self,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock
+    ):
+        dry_run_threads: list[threading.Thread] = []
+
+        def get_total_bytes_processed(**_):
+            dry_run_threads.append(threading.current_thread())
+            return 0
+
+        get_bq_dry_run_total_bytes_processed_mock.side_effect = get_total_bytes_processed
+        with patch.object(bigquery, 'get_bq_rows_from_bq_query_async') as mock:
+            mock.return_value = [ROW_1]
+            tool = BigQueryTool(
+                project_name=PROJECT_NAME_1,
+                sql_query=SQL_QUERY_1,
+                async_query=True,
+                dry_run=True
+            )
+            result = tool()
+            assert not dry_run_threads
+            assert await result == [ROW_1]
+        assert dry_run_threads[0] is not threading.current_thread()
+
+
+class TestGetBqArrayParameterType:
+    def test_should_infer_type_from_first_value(self):
+        assert get_bq_array_parameter_type([1, 2]) == 'INT64'
+        assert get_bq_array_parameter_type(['a']) == 'STRING'
+
+    def test_should_default_to_string(self):
+        assert get_bq_array_parameter_type([]) == 'STRING'
+
+
+class TestGetRowsSplitByKey:
+    def test_should_split_rows_in_order_of_keys(self):
+        rows = [{'id': 2, 'value': 'b'}, {'id': 1, 'value': 'a1'}, {'id': 1, 'value': 'a2'}]
+        assert get_rows_split_by_key(rows, key_column='id', keys=[1, 2, 3]) == [
+            {'input': 1, 'rows': [{'id': 1, 'value': 'a1'}, {'id': 1, 'value': 'a2'}]},
+            {'input': 2, 'rows': [{'id': 2, 'value': 'b'}]},
+            {'input': 3, 'rows': []}
+        ]
+
+    def test_should_match_keys_of_different_type(self):
+        assert get_rows_split_by_key([{'id': 1}], key_column='id', keys=['1']) == [
+            {'input': '1', 'rows': [{'id': 1}]}
+        ]
+
+
+class TestBigQueryToolBatch:
+    def test_should_run_single_query_with_array_parameter(
+        self,
+        bigquery_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        iter_dict_from_bq_query_mock.return_value = iter([{'id': 1}, {'id': 2}])
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query='SELECT id FROM table_1 WHERE id IN UNNEST(@ids)',
+            batch_parameter='ids',
+            batch_key_column='id'
+        )
+        assert tool(ids=[1, 2]) == [
+            {'input': 1, 'rows': [{'id': 1}]},
+            {'input': 2, 'rows': [{'id': 2}]}
+        ]
+        assert iter_dict_from_bq_query_mock.call_count == 1
+        bigquery_mock.ArrayQueryParameter.assert_called_with('ids', 'INT64', [1, 2])
+        assert iter_dict_from_bq_query_mock.call_args.kwargs['query_parameters'] == [
+            bigquery_mock.ArrayQueryParameter.return_value
+        ]
+
+    def test_should_dry_run_batched_query_with_array_parameter(
+        self,
+        bigquery_mock: MagicMock,
+        get_bq_dry_run_total_bytes_processed_mock: MagicMock,
+        iter_dict_from_bq_query_mock: MagicMock
+    ):
+        get_bq_dry_run_total_bytes_processed_mock.return_value = 2000
+        tool = BigQueryTool(
+            project_name=PROJECT_NAME_1,
+            sql_query='SELECT id FROM table_1 WHERE id IN UNNEST(@ids)',
+            batch_parameter='ids',
+            batch_key_column='id',
+            dry_run=True,
+            maximum_bytes_billed=1000
+        )
+        with pytest.raises(MaximumBytesBilledExceededError):
+            tool(ids=[1, 2])
+        assert get_bq_dry_run_total_bytes_processed_mock.call_args.kwargs[
+            'query_parameters'
+        ] == [bigquery_mock.ArrayQueryParameter.return_value]
+        iter_dict_from_bq_query_mock.assert_not_called()
+
+    def test_should_require_batch_key_column(self):
+        with pytest.raises(ValueError):
+            BigQueryTool(
+                project_name=PROJECT_NAME_1,
+                sql_query=SQL_QUERY_1,
+                batch_parameter='ids'
+            )
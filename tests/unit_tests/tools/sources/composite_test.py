@@ -0,0 +1,146 @@
+import time
+
+import anyio
+import pytest
+
+from py_conf_mcp.config import FromPythonClassConfig, ToolDefinitionsConfig
+from py_conf_mcp.tools.resolver import ConfigToolResolver, Tool, ToolResolver
+from py_conf_mcp.tools.sources.composite import (
+    TIMED_OUT_ERROR,
+    CompositeTool,
+    get_evaluated_argument
+)
+
+
+def _get_value(value: str = 'default_1') -> str:
+    return value
+
+
+def _fail() -> str:
+    raise RuntimeError('failed')
+
+
+def _sleep() -> str:
+    time.sleep(1)
+    return 'slow'
+
+
+async def _get_value_async(value: str) -> str:
+    await anyio.sleep(0)
+    return value
+
+
+class DictToolResolver(ToolResolver):
+    def __init__(self, tool_fn_by_name: dict):
+        self.tool_fn_by_name = tool_fn_by_name
+
+    def get_tool_by_name(self, tool_name: str) -> Tool:
+        return Tool(tool_fn=self.tool_fn_by_name[tool_name], name=tool_name)
+
+
+TOOL_RESOLVER_1 = DictToolResolver({
+    'get_value': _get_value,
+    'get_value_async': _get_value_async,
+    'fail': _fail,
+    'sleep': _sleep
+})
+
+
+class TestGetEvaluatedArgument:
+    def test_should_keep_type_of_single_variable(self):
+        assert get_evaluated_argument('{{ value }}', {'value': 123}) == 123
+
+    def test_should_render_template(self):
+        assert get_evaluated_argument('id-{{ value }}', {'value': 123}) == 'id-123'
+
+    def test_should_pass_through_non_str_value(self):
+        assert get_evaluated_argument(123, {}) == 123
+
+
+class TestCompositeTool:
+    @pytest.mark.asyncio
+    async def test_should_return_results_of_all_branches(self):
+        tool = CompositeTool(
+            branches=[
+                {'tool': 'get_value'},
+                {'tool': 'get_value_async', 'arguments': {'value': '{{ param_1 }}'}}
+            ],
+            tool_resolver=TOOL_RESOLVER_1
+        )
+        assert await tool(param_1='value_1') == {
+            'get_value': {'result': 'default_1'},
+            'get_value_async': {'result': 'value_1'}
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_isolate_branch_errors(self):
+        tool = CompositeTool(
+            branches=[{'tool': 'get_value'}, {'tool': 'fail'}],
+            tool_resolver=TOOL_RESOLVER_1
+        )
+        assert await tool() == {
+            'get_value': {'result': 'default_1'},
+            'fail': {'error': "RuntimeError('failed')"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_report_branches_exceeding_deadline(self):
+        tool = CompositeTool(
+            branches=[{'tool': 'get_value'}, {'tool': 'sleep'}],
+            timeout_seconds=0.1,
+            tool_resolver=TOOL_RESOLVER_1
+        )
+        assert await tool() == {
+            'get_value': {'result': 'default_1'},
+            'sleep': {'error': TIMED_OUT_ERROR}
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_merge_results_using_template(self):
+        tool = CompositeTool(
+            branches=[
+                {'name': 'first', 'tool': 'get_value', 'arguments': {'value': 'a'}},
+                {'name': 'second', 'tool': 'get_value', 'arguments': {'value': 'b'}},
+                {'tool': 'fail'}
+            ],
+            response_template=(
+                '{{ results.first }}, {{ results.second }}'
+                '{% if errors.fail %} (fail: {{ errors.fail }}){% endif %}'
+            ),
+            tool_resolver=TOOL_RESOLVER_1
+        )
+        assert await tool() == "a, b (fail: RuntimeError('failed'))"
+
+    def test_should_reject_duplicate_branch_names(self):
+        with pytest.raises(ValueError):
+            CompositeTool(
+                branches=[{'tool': 'get_value'}, {'tool': 'get_value'}],
+                tool_resolver=TOOL_RESOLVER_1
+            )
+
+    def test_should_reject_calling_itself(self):
+        with pytest.raises(ValueError):
+            CompositeTool(
+                branches=[{'tool': 'composite'}],
+                tool_resolver=TOOL_RESOLVER_1,
+                tool_name='composite'
+            )
+
+    @pytest.mark.asyncio
+    async def test_should_resolve_configured_tools(self):
+        static_tool_config = FromPythonClassConfig(
+            name='get_static_content',
+            module='py_conf_mcp.tools.sources.static',
+            class_name='StaticContentTool',
+            init_parameters={'content': 'Static content'}
+        )
+        composite_tool_config = FromPythonClassConfig(
+            name='get_all',
+            module='py_conf_mcp.tools.sources.composite',
+            class_name='CompositeTool',
+            init_parameters={'branches': [{'tool': 'get_static_content'}]}
+        )
+        tool = ConfigToolResolver(ToolDefinitionsConfig(
+            from_python_class=[static_tool_config, composite_tool_config]
+        )).get_tool_by_name('get_all')
+        assert await tool.tool_fn() == {'get_static_content': {'result': 'Static content'}}
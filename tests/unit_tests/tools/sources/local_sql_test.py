@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from py_conf_mcp.tools.sources import local_sql
+from py_conf_mcp.tools.sources.local_sql import (
+    LocalSqlEngines,
+    LocalSqlTool,
+    iter_dict_from_cursor
+)
+from py_conf_mcp.utils.json import get_json_as_csv_lines
+
+
+ROW_1 = {'id': 1, 'name': 'name_1'}
+ROW_2 = {'id': 2, 'name': 'name_2'}
+
+
+@pytest.fixture(name='database_path')
+def _database_path(tmp_path: Path) -> str:
+    database_path = str(tmp_path / 'database.sqlite')
+    with sqlite3.connect(database_path) as connection:
+        connection.execute('CREATE TABLE items (id INTEGER, name TEXT)')
+        connection.executemany(
+            'INSERT INTO items VALUES (:id, :name)',
+            [ROW_1, ROW_2]
+        )
+    connection.close()
+    return database_path
+
+
+@pytest.fixture(name='csv_path')
+def _csv_path(tmp_path: Path) -> str:
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('id,name\n1,name_1\n2,name_2\n', encoding='utf-8')
+    return str(csv_path)
+
+
+class TestIterDictFromCursor:
+    def test_should_fetch_rows_in_batches(self):
+        cursor = MagicMock(name='cursor')
+        cursor.description = [('id',), ('name',)]
+        cursor.fetchmany.side_effect = [[(1, 'name_1'), (2, 'name_2')], [(3, 'name_3')], []]
+        assert list(iter_dict_from_cursor(cursor, fetch_size=2)) == [
+            ROW_1, ROW_2, {'id': 3, 'name': 'name_3'}
+        ]
+        cursor.fetchmany.assert_called_with(2)
+
+
+class TestLocalSqlTool:
+    def test_should_query_sqlite_database_with_bound_parameters(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT id, name FROM items WHERE id = :id',
+            database_path=database_path,
+            query_parameters=['id'],
+            is_sql_query_template=False
+        )
+        assert tool(id=2) == [ROW_2]
+
+    def test_should_evaluate_sql_query_template(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT id, name FROM items WHERE name = {{ name | toquoted }}',
+            database_path=database_path
+        )
+        assert tool(name='name_1') == [ROW_1]
+
+    def test_should_return_csv(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT id, name FROM items ORDER BY id',
+            database_path=database_path,
+            output_format='csv'
+        )
+        assert tool() == '\n'.join(get_json_as_csv_lines([ROW_1, ROW_2]))
+
+    def test_should_open_database_read_only(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='DELETE FROM items',
+            database_path=database_path
+        )
+        with pytest.raises(sqlite3.OperationalError):
+            tool()
+
+    def test_should_query_csv_table(self, csv_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT name FROM items WHERE id = :id',
+            tables={'items': csv_path},
+            query_parameters=['id'],
+            is_sql_query_template=False
+        )
+        assert tool(id='2') == [{'name': 'name_2'}]
+
+    def test_should_load_csv_tables_once_for_all_threads(
+        self,
+        database_path: str,
+        csv_path: str
+    ):
+        tool = LocalSqlTool(
+            sql_query='SELECT name FROM csv_items ORDER BY id',
+            database_path=database_path,
+            tables={'csv_items': csv_path}
+        )
+        with patch.object(
+            local_sql, 'load_csv_into_sqlite_table',
+            wraps=local_sql.load_csv_into_sqlite_table
+        ) as load_csv_mock:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(lambda _: tool(), range(4)))
+        assert results == [[{'name': 'name_1'}, {'name': 'name_2'}]] * 4
+        assert load_csv_mock.call_count == 1
+
+    def test_should_quote_template_values_for_sqlite(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT {{ value | toquoted }} AS value',
+            database_path=database_path
+        )
+        assert tool(value="it's") == [{'value': "it's"}]
+
+    def test_should_reject_parquet_table_with_sqlite(self):
+        with pytest.raises(ValueError):
+            LocalSqlTool(sql_query='SELECT 1', tables={'items': 'items.parquet'})
+
+    def test_should_use_one_connection_per_thread(self, database_path: str):
+        tool = LocalSqlTool(
+            sql_query='SELECT id, name FROM items ORDER BY id',
+            database_path=database_path
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: tool(), range(4)))
+        assert results == [[ROW_1, ROW_2]] * 4
+        assert tool.get_connection() is tool.get_connection()
+
+    def test_should_fail_duckdb_engine_without_duckdb(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(local_sql, 'duckdb', None)
+        with pytest.raises(ImportError):
+            LocalSqlTool(sql_query='SELECT 1', engine=LocalSqlEngines.DUCKDB)
+
+    def test_should_query_parquet_table_with_duckdb(self, tmp_path: Path):
+        duckdb = pytest.importorskip('duckdb')
+        parquet_path = str(tmp_path / 'items.parquet')
+        duckdb.execute(
+            "COPY (SELECT 1 AS id, 'name_1' AS name) TO "
+            + local_sql.get_quoted_string(parquet_path)
+            + ' (FORMAT PARQUET)'
+        )
+        tool = LocalSqlTool(
+            sql_query='SELECT id, name FROM items WHERE id = $id',
+            engine=LocalSqlEngines.DUCKDB,
+            tables={'items': parquet_path},
+            query_parameters=['id'],
+            is_sql_query_template=False
+        )
+        # every thread queries via its own cursor
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: tool(id=1), range(4)))
+        assert results == [[ROW_1]] * 4
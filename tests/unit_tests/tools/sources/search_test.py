@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import pytest
+
+from py_conf_mcp.tools.sources import search
+from py_conf_mcp.tools.sources.search import (
+    FullTextSearchTool,
+    IndexedDocument,
+    IndexedFile,
+    InvalidSearchIndexError,
+    SearchIndex,
+    get_index_bytes,
+    get_snippet,
+    iter_document_ranges
+)
+
+
+DOC_1 = '\n'.join([
+    'Apples are red or green.',
+    '',
+    'Bananas are yellow. Bananas are rich in potassium.',
+    '',
+    'Cherries are small and red.',
+    ''
+])
+
+DOC_2 = 'Oranges are orange.\n\nLemons are yellow and sour.\n'
+
+
+@pytest.fixture(name='corpus_dir')
+def _corpus_dir(tmp_path: Path) -> Path:
+    corpus_dir = tmp_path / 'corpus'
+    corpus_dir.mkdir()
+    (corpus_dir / 'doc_1.md').write_text(DOC_1, encoding='utf-8')
+    (corpus_dir / 'doc_2.md').write_text(DOC_2, encoding='utf-8')
+    return corpus_dir
+
+
+class TestIterDocumentRanges:
+    def test_should_split_paragraphs(self):
+        content = b'para 1\n\npara 2\n  \npara 3'
+        assert [
+            content[start:end] for start, end in iter_document_ranges(content)
+        ] == [b'para 1', b'para 2', b'para 3']
+
+    def test_should_split_long_paragraphs_on_line_boundary(self):
+        content = b'line 1\nline 2\nline 3'
+        assert [
+            content[start:end]
+            for start, end in iter_document_ranges(content, max_document_bytes=14)
+        ] == [b'line 1\nline 2', b'\nline 3']
+
+
+class TestSearchIndex:
+    def test_should_read_back_serialized_index(self):
+        index = SearchIndex(get_index_bytes(
+            [IndexedFile('file_1', 1, 2)],
+            [IndexedDocument(0, 0, 10, 2), IndexedDocument(0, 12, 20, 1)],
+            [{'term_1': 1, 'term_2': 1}, {'term_2': 1}]
+        ))
+        assert index.files == [IndexedFile('file_1', 1, 2)]
+        assert index.get_document(1) == IndexedDocument(0, 12, 20, 1)
+        assert index.get_term_index(b'term_2') == 1
+        assert index.get_term_index(b'other') is None
+        assert list(index.get_postings(1)) == [(0, 1), (1, 1)]
+        assert index.get_document_term_frequencies({1}) == {1: {'term_2': 1}}
+
+    def test_should_rank_rare_terms_higher(self):
+        index = SearchIndex(get_index_bytes(
+            [IndexedFile('file_1', 1, 2)],
+            [IndexedDocument(0, 0, 1, 2), IndexedDocument(0, 1, 2, 2)],
+            [{'common': 1, 'rare': 1}, {'common': 2}]
+        ))
+        assert [document_id for _, document_id in index.search(['common', 'rare'], 2)] == [0, 1]
+
+    def test_should_reject_invalid_index(self):
+        with pytest.raises(ValueError):
+            SearchIndex(b'\0' * 64)
+
+    def test_should_reject_truncated_index(self):
+        index_bytes = get_index_bytes(
+            [IndexedFile('file_1', 1, 2)],
+            [IndexedDocument(0, 0, 10, 2)],
+            [{'term_1': 1}]
+        )
+        for length in [0, 8, len(index_bytes) - 1]:
+            with pytest.raises(InvalidSearchIndexError):
+                SearchIndex(index_bytes[:length])
+
+
+class TestGetSnippet:
+    def test_should_return_text_around_first_match(self):
+        assert get_snippet('a b c d e f g', ['f'], snippet_length=8) == '...e f g'
+
+
+class TestFullTextSearchTool:
+    def test_should_return_top_k_snippets(self, corpus_dir: Path):
+        tool = FullTextSearchTool(path=str(corpus_dir))
+        results = tool(query='yellow bananas', top_k=2)
+        assert [result['file'] for result in results] == ['doc_1.md', 'doc_2.md']
+        assert results[0]['snippet'] == 'Bananas are yellow. Bananas are rich in potassium.'
+        assert results[0]['offset'] == DOC_1.index('Bananas')
+        assert results[0]['score'] > results[1]['score']
+
+    def test_should_return_no_results_for_unknown_terms(self, corpus_dir: Path):
+        assert not FullTextSearchTool(path=str(corpus_dir))(query='unknown')
+
+    def test_should_persist_and_reuse_index(self, corpus_dir: Path, tmp_path: Path):
+        index_path = str(tmp_path / 'index.bin')
+        FullTextSearchTool(path=str(corpus_dir), index_path=index_path)
+        assert Path(index_path).exists()
+        tool = FullTextSearchTool(path=str(corpus_dir), index_path=index_path)
+        assert tool(query='lemons')[0]['file'] == 'doc_2.md'
+
+    @pytest.mark.parametrize('index_bytes', [b'', b'PCMFTS00' + b'\0' * 64, b'\xff' * 3])
+    def test_should_rebuild_invalid_or_outdated_index(
+        self,
+        corpus_dir: Path,
+        tmp_path: Path,
+        index_bytes: bytes
+    ):
+        index_path = tmp_path / 'index.bin'
+        index_path.write_bytes(index_bytes)
+        tool = FullTextSearchTool(path=str(corpus_dir), index_path=str(index_path))
+        assert tool(query='lemons')[0]['file'] == 'doc_2.md'
+        assert SearchIndex(index_path.read_bytes()).document_count > 0
+
+    def test_should_not_index_index_file_within_path(self, corpus_dir: Path):
+        index_path = corpus_dir / 'index.bin'
+        FullTextSearchTool(path=str(corpus_dir), index_path=str(index_path))
+        tool = FullTextSearchTool(path=str(corpus_dir), index_path=str(index_path))
+        assert tool.get_file_names() == ['doc_1.md', 'doc_2.md']
+        assert tool.is_index_up_to_date(tool.get_file_names())
+
+    def test_should_only_reindex_changed_files(
+        self,
+        corpus_dir: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        tool = FullTextSearchTool(path=str(corpus_dir), refresh_interval_seconds=0)
+        (corpus_dir / 'doc_2.md').write_text('Limes are green.\n', encoding='utf-8')
+        tokenized_texts: list[str] = []
+        original_get_tokens = search.get_tokens
+
+        def _get_tokens(text: str):
+            tokenized_texts.append(text)
+            return original_get_tokens(text)
+
+        monkeypatch.setattr(search, 'get_tokens', _get_tokens)
+        assert tool(query='limes')[0]['file'] == 'doc_2.md'
+        assert tool(query='cherries')[0]['file'] == 'doc_1.md'
+        assert 'Limes are green.\n' in tokenized_texts
+        assert not any('Apples' in text for text in tokenized_texts)
@@ -1,4 +1,59 @@
-from py_conf_mcp.tools.sources.static import StaticContentTool
+from pathlib import Path
+
+from mcp.types import TextContent
+import pytest
+
+from py_conf_mcp.tools.sources.static import StaticContentTool, get_content_sections
+
+
+MARKDOWN_CONTENT_1 = '\n'.join([
+    '# Title',
+    'Intro',
+    '## Section 1',
+    'Text 1',
+    '### Section 1.1',
+    'Text 1.1',
+    '## Section 2',
+    'Text 2',
+    ''
+])
+
+
+@pytest.fixture(name='markdown_file')
+def _markdown_file(tmp_path: Path) -> Path:
+    markdown_file = tmp_path / 'doc.md'
+    markdown_file.write_text(MARKDOWN_CONTENT_1, encoding='utf-8')
+    return markdown_file
+
+
+class TestGetContentSections:
+    def test_should_end_sections_at_next_heading_of_same_or_higher_level(self):
+        content = MARKDOWN_CONTENT_1.encode('utf-8')
+        sections = {
+            section.title: content[section.start:section.end].decode('utf-8')
+            for section in get_content_sections(content)
+        }
+        assert sections['Section 1'] == '## Section 1\nText 1\n### Section 1.1\nText 1.1\n'
+        assert sections['Section 2'] == '## Section 2\nText 2\n'
+        assert sections['Title'] == MARKDOWN_CONTENT_1
+
+    def test_should_ignore_headings_in_code_fences(self):
+        content = '\n'.join([
+            '# Title',
+            '```bash',
+            '# comment',
+            '```',
+            '~~~~',
+            '# other comment',
+            '~~~',
+            '~~~~',
+            '## Section 1',
+            '```',
+            '# unclosed'
+        ]).encode('utf-8')
+        assert [section.title for section in get_content_sections(content)] == [
+            'Title', 'Section 1'
+        ]
 
 
 class TestStaticContentTool:
@@ -6,4 +61,68 @@ class TestStaticContentTool:
         tool = StaticContentTool(
             content='content_1'
         )
-        assert tool() == 'content_1'
+        assert tool().text == 'content_1'
+        assert tool() is tool()
+
+    def test_should_require_content_or_path(self):
+        with pytest.raises(ValueError):
+            StaticContentTool()
+
+    def test_should_return_text_content_of_file(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        result = tool()
+        assert isinstance(result, TextContent)
+        assert result.text == MARKDOWN_CONTENT_1
+
+    def test_should_decode_file_once_per_mapping(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        assert tool() is tool()
+
+    def test_should_return_section_by_heading(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        assert tool(section='section 2') == '## Section 2\nText 2\n'
+
+    def test_should_return_slice_by_offset_and_length(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        assert tool(offset=2, length=5) == 'Title'
+        assert tool(section='Section 2', offset=3, length=7) == 'Section'
+
+    def test_should_fail_for_unknown_section(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        with pytest.raises(ValueError, match='Section 1'):
+            tool(section='other')
+
+    def test_should_remap_changed_file(self, markdown_file: Path):
+        tool = StaticContentTool(path=str(markdown_file))
+        previous_content_hash = tool.get_mapped_file(None).content_hash
+        markdown_file.write_text('# Changed\n', encoding='utf-8')
+        assert tool().text == '# Changed\n'
+        assert tool.get_mapped_file(None).content_hash != previous_content_hash
+
+    def test_should_close_previous_mapping_when_remapping(
+        self,
+        markdown_file: Path
+    ):
+        tool = StaticContentTool(path=str(markdown_file))
+        with tool.get_mapped_file(None).read_mapped_content() as mapped_content:
+            assert not mapped_content.content.closed
+        # truncated in place, reading beyond the end of the previous mapping would crash
+        markdown_file.write_text('# Changed\n', encoding='utf-8')
+        assert tool().text == '# Changed\n'
+        assert mapped_content.content.closed
+
+    def test_should_select_file_within_directory(self, tmp_path: Path):
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'sub' / 'doc.md').write_text('content_1', encoding='utf-8')
+        tool = StaticContentTool(path=str(tmp_path))
+        assert tool.get_file_names() == ['sub/doc.md']
+        assert tool(file_name='sub/doc.md').text == 'content_1'
+        with pytest.raises(ValueError):
+            tool(file_name='../other.md')
+        with pytest.raises(ValueError):
+            tool()
+
+    def test_should_handle_empty_file(self, tmp_path: Path):
+        empty_file = tmp_path / 'empty.md'
+        empty_file.write_text('', encoding='utf-8')
+        assert StaticContentTool(path=str(empty_file))().text == ''
@@ -1,13 +1,25 @@
+import base64
+from io import BytesIO
+import json
 from typing import Iterator
 from unittest.mock import ANY, MagicMock, patch
 from pathlib import Path
 
+import httpx
 import pytest
 import requests
 import requests.auth
 
 from py_conf_mcp.tools.sources import web_api
 from py_conf_mcp.tools.sources.web_api import BasicAuthConfig, WebApiTool
+from py_conf_mcp.utils import secret_provider
+from py_conf_mcp.utils.memory import (
+    MemoryBudget,
+    MemoryBudgetExceededError,
+    memory_budget_context
+)
+from py_conf_mcp.utils.projection import ProjectionSyntaxError
+from py_conf_mcp.utils.secret_provider import SecretProvider
 
 
 URL_1 = 'https://example/url_1'
@@ -15,6 +27,13 @@ URL_1 = 'https://example/url_1'
 HEADERS_1 = {'User-Agent': 'Test/1'}
 
 
+@pytest.fixture(name='default_secret_provider', autouse=True)
+def _default_secret_provider() -> Iterator[SecretProvider]:
+    provider = SecretProvider(check_interval_seconds=0)
+    with patch.object(secret_provider, 'DEFAULT_SECRET_PROVIDER', provider):
+        yield provider
+
+
 @pytest.fixture(name='requests_response_mock')
 def _requests_response_mock() -> MagicMock:
     return MagicMock(requests.Response)
@@ -42,6 +61,30 @@ def _requests_mock(requests_session_mock: MagicMock) -> Iterator[MagicMock]:
         yield mock
 
 
+RESPONSE_JSON_1 = {
+    'data': {
+        'items': [{'id': 1, 'name': 'name_1'}, {'id': 2, 'name': 'name_2'}],
+        'total': 2
+    }
+}
+
+
+class TestGetResponseJsonForJsonPath:
+    def test_should_return_whole_json_for_empty_path(self):
+        assert web_api.get_response_json_for_json_path(RESPONSE_JSON_1, '') == RESPONSE_JSON_1
+
+    def test_should_return_nested_value(self):
+        assert web_api.get_response_json_for_json_path(RESPONSE_JSON_1, 'data.total') == 2
+
+    def test_should_return_none_for_missing_value(self):
+        assert web_api.get_response_json_for_json_path(RESPONSE_JSON_1, 'data.other') is None
+
+    def test_should_return_list_of_values_within_array(self):
+        assert web_api.get_response_json_for_json_path(
+            RESPONSE_JSON_1, 'data.items.item.name'
+        ) == ['name_1', 'name_2']
+
+
 class TestGetRequestsAuth:
     def test_should_return_none_if_no_basic_auth(self):
         assert web_api.get_requests_auth(None) is None
@@ -88,6 +131,38 @@ class TestGetRequestsAuth:
         assert auth.username == 'user'
         assert auth.password == 'pass'
 
+    def test_should_use_rotated_secret_for_next_request(
+        self,
+        mock_env: dict[str, str],
+        tmp_path: Path
+    ):
+        password_file_path = tmp_path / 'password.txt'
+        password_file_path.write_text('pass_1', encoding='utf-8')
+        mock_env['PASSWORD_FILE_PATH'] = str(password_file_path)
+        auth = web_api.get_requests_auth({
+            'username': 'user',
+            'password': '{{ read_secret_from_env("PASSWORD_FILE_PATH") }}'
+        })
+        assert auth is not None
+        password_file_path.write_text('pass_2_rotated', encoding='utf-8')
+        request = auth(requests.Request('GET', URL_1).prepare())
+        assert auth.password == 'pass_2_rotated'
+        assert request.headers['Authorization'] == (
+            'Basic ' + base64.b64encode(b'user:pass_2_rotated').decode('ascii')
+        )
+
+    def test_should_compile_templates_once_and_not_store_credentials(self):
+        auth = web_api.get_requests_auth({'username': 'user', 'password': '{{ "pass" }}'})
+        assert auth is not None
+        with patch.object(web_api.jinja2, 'Template') as template_mock:
+            request = auth(requests.Request('GET', URL_1).prepare())
+            template_mock.assert_not_called()
+        assert request.headers['Authorization'] == (
+            'Basic ' + base64.b64encode(b'user:pass').decode('ascii')
+        )
+        assert 'username' not in vars(auth)
+        assert 'password' not in vars(auth)
+
 
 class TestWebApiTool:
     def test_should_pass_method_url_and_headers_to_api(
@@ -107,7 +182,8 @@ class TestWebApiTool:
             headers=HEADERS_1,
             auth=ANY,
             verify=ANY,
-            json=ANY
+            json=ANY,
+            stream=ANY
         )
 
     def test_should_return_response_from_api(self, requests_response_mock: MagicMock):
@@ -131,7 +207,8 @@ class TestWebApiTool:
             headers=ANY,
             auth=ANY,
             verify=ANY,
-            json=ANY
+            json=ANY,
+            stream=ANY
         )
 
     def test_should_replace_placeholders_in_query_parameters(
@@ -152,5 +229,392 @@ class TestWebApiTool:
             headers=ANY,
             auth=ANY,
             verify=ANY,
-            json=ANY
+            json=ANY,
+            stream=ANY
+        )
+
+    def test_should_return_response_json_for_json_path(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.json.return_value = RESPONSE_JSON_1
+        tool = WebApiTool(
+            url=URL_1,
+            response_json_path='data.items.item.id'
+        )
+        assert tool() == [1, 2]
+
+    def test_should_apply_response_projection(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        pytest.importorskip('jmespath')
+        requests_response_mock.json.return_value = RESPONSE_JSON_1
+        tool = WebApiTool(
+            url=URL_1,
+            response_projection='data.items[?id > `1`].{item_id: id, item_name: name}'
+        )
+        assert tool() == [{'item_id': 2, 'item_name': 'name_2'}]
+
+    def test_should_apply_response_projection_to_json_path_result(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        pytest.importorskip('jmespath')
+        requests_response_mock.json.return_value = RESPONSE_JSON_1
+        tool = WebApiTool(
+            url=URL_1,
+            response_json_path='data.items.item',
+            response_projection='[?id > `1`].name'
+        )
+        assert tool() == ['name_2']
+
+    def test_should_fail_early_for_invalid_response_projection(self):
+        pytest.importorskip('jmespath')
+        with pytest.raises(ProjectionSyntaxError):
+            WebApiTool(url=URL_1, response_projection='data.')
+
+    def test_should_account_response_json_to_memory_budget(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        requests_response_mock.headers = {}
+        requests_response_mock.iter_content.return_value = iter([content[:10], content[10:]])
+        memory_budget = MemoryBudget(max_bytes=1_000_000)
+        with memory_budget_context(memory_budget):
+            assert WebApiTool(url=URL_1)() == RESPONSE_JSON_1
+        assert memory_budget.used_bytes > len(content)
+
+    def test_should_stream_response_if_memory_budget_is_active(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.headers = {}
+        requests_response_mock.iter_content.return_value = iter([b'{}'])
+        with memory_budget_context(MemoryBudget(max_bytes=1_000_000)):
+            WebApiTool(url=URL_1)()
+        assert requests_request_fn_mock.call_args.kwargs['stream'] is True
+        requests_response_mock.close.assert_called()
+
+    def test_should_not_stream_response_without_memory_budget(
+        self,
+        requests_request_fn_mock: MagicMock
+    ):
+        WebApiTool(url=URL_1)()
+        assert requests_request_fn_mock.call_args.kwargs['stream'] is False
+
+    def test_should_stop_reading_response_exceeding_memory_budget(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        remaining_chunk_mock = MagicMock(name='remaining_chunk')
+        requests_response_mock.headers = {}
+        requests_response_mock.iter_content.return_value = iter([
+            b'x' * 100,
+            b'x' * 100,
+            remaining_chunk_mock
+        ])
+        with memory_budget_context(MemoryBudget(max_bytes=150)):
+            with pytest.raises(MemoryBudgetExceededError):
+                WebApiTool(url=URL_1)()
+        remaining_chunk_mock.__len__.assert_not_called()
+        requests_response_mock.close.assert_called()
+
+    def test_should_reject_content_length_exceeding_memory_budget(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.headers = {'Content-Length': '1000'}
+        with memory_budget_context(MemoryBudget(max_bytes=100)):
+            with pytest.raises(MemoryBudgetExceededError):
+                WebApiTool(url=URL_1)()
+        requests_response_mock.json.assert_not_called()
+
+    def test_should_parse_streamed_response_for_json_path(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.raw = BytesIO(json.dumps(RESPONSE_JSON_1).encode('utf-8'))
+        tool = WebApiTool(
+            url=URL_1,
+            response_json_path='data.items.item',
+            stream_response=True
+        )
+        assert tool() == RESPONSE_JSON_1['data']['items']
+        requests_response_mock.json.assert_not_called()
+        requests_response_mock.close.assert_called()
+        assert requests_request_fn_mock.call_args.kwargs['stream'] is True
+
+    def test_should_parse_whole_streamed_response_without_json_path(
+        self,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.raw = BytesIO(json.dumps(RESPONSE_JSON_1).encode('utf-8'))
+        tool = WebApiTool(
+            url=URL_1,
+            stream_response=True
+        )
+        assert tool() == RESPONSE_JSON_1
+
+
+class TestHttpCacheControl:
+    def test_should_parse_max_age_and_flags(self):
+        cache_control = web_api.HttpCacheControl.from_header('public, max-age=60, no-cache')
+        assert cache_control.max_age == 60
+        assert cache_control.no_cache is True
+        assert cache_control.no_store is False
+
+    def test_should_not_be_fresh_for_no_cache(self):
+        cache_control = web_api.HttpCacheControl.from_header('max-age=60, no-cache')
+        assert cache_control.get_fresh_seconds() == 0
+
+    def test_should_handle_missing_header(self):
+        assert web_api.HttpCacheControl.from_header(None) == web_api.HttpCacheControl()
+
+
+class TestGetResponseFreshSeconds:
+    def test_should_prefer_max_age_and_subtract_age(self):
+        assert web_api.get_response_fresh_seconds(
+            {'Cache-Control': 'max-age=60', 'Age': '20', 'Expires': 'invalid'}, now=0
+        ) == 40
+
+    def test_should_use_expires_relative_to_date(self):
+        assert web_api.get_response_fresh_seconds({
+            'Date': 'Mon, 01 Jan 2024 00:00:00 GMT',
+            'Expires': 'Mon, 01 Jan 2024 00:01:00 GMT'
+        }, now=0) == 60
+
+    def test_should_treat_invalid_expires_as_expired(self):
+        assert web_api.get_response_fresh_seconds({'Expires': '0'}, now=0) == 0
+
+
+class TestGetHttpCacheKey:
+    def test_should_include_json_body_and_headers(self):
+        key = web_api.get_http_cache_key('GET', URL_1, {}, json_body={'id': 1})
+        assert key != web_api.get_http_cache_key('GET', URL_1, {}, json_body={'id': 2})
+        assert key != web_api.get_http_cache_key(
+            'GET', URL_1, {}, json_body={'id': 1}, headers=HEADERS_1
+        )
+
+    def test_should_not_contain_header_values(self):
+        assert 'secret' not in web_api.get_http_cache_key(
+            'GET', URL_1, {}, headers={'Authorization': 'Bearer secret'}
+        )
+
+
+class TestHttpCache:
+    def test_should_evict_least_recently_used_entry(self):
+        http_cache = web_api.HttpCache(max_entries=2)
+        entry = web_api.HttpCacheEntry(
+            content=b'{}', etag='"1"', last_modified=None, expires_at=0
+        )
+        http_cache.put('key_1', entry)
+        http_cache.put('key_2', entry)
+        http_cache.get('key_1')
+        http_cache.put('key_3', entry)
+        assert http_cache.get('key_1') == entry
+        assert http_cache.get('key_2') is None
+        assert len(http_cache) == 2
+
+    def test_should_load_entry_from_cache_dir(self, tmp_path: Path):
+        entry = web_api.HttpCacheEntry(
+            content=b'{}', etag='"1"', last_modified=None, expires_at=0
+        )
+        web_api.HttpCache(cache_dir=str(tmp_path)).put('key_1', entry)
+        assert web_api.HttpCache(cache_dir=str(tmp_path)).get('key_1') == entry
+
+
+class TestWebApiToolHttpCache:
+    def test_should_not_request_again_for_fresh_response(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.status_code = 200
+        requests_response_mock.headers = {'Cache-Control': 'max-age=60'}
+        requests_response_mock.content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        tool = WebApiTool(url=URL_1, http_cache=True)
+        assert tool() == RESPONSE_JSON_1
+        assert tool() == RESPONSE_JSON_1
+        assert requests_request_fn_mock.call_count == 1
+
+    def test_should_revalidate_and_use_cached_response_on_not_modified(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.status_code = 200
+        requests_response_mock.headers = {
+            'ETag': '"etag_1"',
+            'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        requests_response_mock.content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        tool = WebApiTool(url=URL_1, headers=HEADERS_1, http_cache=True)
+        assert tool() == RESPONSE_JSON_1
+        requests_response_mock.status_code = 304
+        requests_response_mock.headers = {}
+        requests_response_mock.content = b''
+        assert tool() == RESPONSE_JSON_1
+        assert requests_request_fn_mock.call_args.kwargs['headers'] == {
+            **HEADERS_1,
+            'If-None-Match': '"etag_1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+
+    def test_should_send_json_body_and_cache_per_body(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.status_code = 200
+        requests_response_mock.headers = {'Cache-Control': 'max-age=60'}
+        requests_response_mock.content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        tool = WebApiTool(
+            url=URL_1,
+            json_template='{"id": {{ id }}}',
+            http_cache=True
+        )
+        tool(id=1)
+        assert requests_request_fn_mock.call_args.kwargs['json'] == {'id': 1}
+        tool(id=1)
+        tool(id=2)
+        assert requests_request_fn_mock.call_count == 2
+        assert requests_request_fn_mock.call_args.kwargs['json'] == {'id': 2}
+
+    def test_should_update_last_modified_on_not_modified(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.status_code = 200
+        requests_response_mock.headers = {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        requests_response_mock.content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        tool = WebApiTool(url=URL_1, http_cache=True)
+        tool()
+        requests_response_mock.status_code = 304
+        requests_response_mock.headers = {'Last-Modified': 'Tue, 02 Jan 2024 00:00:00 GMT'}
+        assert tool() == RESPONSE_JSON_1
+        assert tool() == RESPONSE_JSON_1
+        assert requests_request_fn_mock.call_args.kwargs['headers'] == {
+            'If-Modified-Since': 'Tue, 02 Jan 2024 00:00:00 GMT'
+        }
+
+    def test_should_not_cache_no_store_response(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.status_code = 200
+        requests_response_mock.headers = {'Cache-Control': 'no-store', 'ETag': '"etag_1"'}
+        requests_response_mock.content = json.dumps(RESPONSE_JSON_1).encode('utf-8')
+        tool = WebApiTool(url=URL_1, http_cache=True)
+        tool()
+        tool()
+        assert requests_request_fn_mock.call_count == 2
+        assert 'If-None-Match' not in requests_request_fn_mock.call_args.kwargs['headers']
+
+    def test_should_not_use_cache_for_post_requests(
+        self,
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.json.return_value = RESPONSE_JSON_1
+        tool = WebApiTool(url=URL_1, method='POST', http_cache=True)
+        tool()
+        tool()
+        assert requests_request_fn_mock.call_count == 2
+
+
+class TestWebApiToolHttp2:
+    @pytest.fixture(name='http2_requests')
+    def _http2_requests(self) -> list[httpx.Request]:
+        return []
+
+    @pytest.fixture(name='http2_response', autouse=True)
+    def _http2_response(self) -> httpx.Response:
+        return httpx.Response(200, json=RESPONSE_JSON_1)
+
+    @pytest.fixture(name='get_http2_client_mock', autouse=True)
+    def _get_http2_client_mock(
+        self,
+        http2_requests: list[httpx.Request],
+        http2_response: httpx.Response
+    ) -> Iterator[MagicMock]:
+        def handler(request: httpx.Request) -> httpx.Response:
+            http2_requests.append(request)
+            return httpx.Response(
+                http2_response.status_code,
+                headers=http2_response.headers,
+                content=http2_response.content
+            )
+
+        with patch.object(web_api, 'get_http2_client') as mock:
+            mock.return_value = httpx.Client(transport=httpx.MockTransport(handler))
+            yield mock
+
+    def test_should_send_request_via_shared_http2_client(
+        self,
+        get_http2_client_mock: MagicMock,
+        http2_requests: list[httpx.Request],
+        requests_request_fn_mock: MagicMock
+    ):
+        tool = WebApiTool(
+            url=URL_1,
+            method='POST',
+            query_parameters={'param_1': '{{ value_1 }}'},
+            json_template='{"key_1": "{{ value_1 }}"}',
+            headers=HEADERS_1,
+            http2=True
+        )
+        assert tool(value_1='value_1') == RESPONSE_JSON_1
+        requests_request_fn_mock.assert_not_called()
+        get_http2_client_mock.assert_called_with(True)
+        assert [request.method for request in http2_requests] == ['POST']
+        assert http2_requests[0].url == URL_1 + '?param_1=value_1'
+        assert http2_requests[0].headers['User-Agent'] == HEADERS_1['User-Agent']
+        assert json.loads(http2_requests[0].content) == {'key_1': 'value_1'}
+
+    def test_should_only_use_http2_for_configured_hosts(
+        self,
+        http2_requests: list[httpx.Request],
+        requests_request_fn_mock: MagicMock,
+        requests_response_mock: MagicMock
+    ):
+        requests_response_mock.json.return_value = RESPONSE_JSON_1
+        tool = WebApiTool(url='https://{{ host }}/path', http2_hosts=['example'])
+        tool(host='example')
+        tool(host='other')
+        assert [request.url.host for request in http2_requests] == ['example']
+        assert requests_request_fn_mock.call_args.kwargs['url'] == 'https://other/path'
+
+    def test_should_pass_basic_auth(self, http2_requests: list[httpx.Request]):
+        tool = WebApiTool(
+            url=URL_1,
+            basic_auth={'username': 'user', 'password': 'pass'},
+            http2=True
         )
+        tool()
+        assert http2_requests[0].headers['Authorization'] == (
+            'Basic ' + base64.b64encode(b'user:pass').decode('ascii')
+        )
+
+    def test_should_parse_streamed_response_for_json_path(self):
+        tool = WebApiTool(
+            url=URL_1,
+            response_json_path='data.items.item',
+            stream_response=True,
+            http2=True
+        )
+        assert tool() == RESPONSE_JSON_1['data']['items']
+
+    @pytest.mark.parametrize(
+        'http2_response', [httpx.Response(500, json={'error': 'error_1'})]
+    )
+    def test_should_raise_requests_http_error(self, requests_mock: MagicMock):
+        requests_mock.HTTPError = requests.HTTPError
+        tool = WebApiTool(url=URL_1, http2=True)
+        with pytest.raises(requests.HTTPError):
+            tool()
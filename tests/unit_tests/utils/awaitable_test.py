@@ -0,0 +1,15 @@
+import pytest
+
+from py_conf_mcp.utils.awaitable import get_mapped_maybe_awaitable
+
+
+class TestGetMappedMaybeAwaitable:
+    def test_should_map_value(self):
+        assert get_mapped_maybe_awaitable(1, lambda value: value + 1) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_map_awaited_value(self):
+        async def _get_value():
+            return 1
+
+        assert await get_mapped_maybe_awaitable(_get_value(), lambda value: value + 1) == 2
@@ -1,6 +1,41 @@
 import csv
+import datetime
+import decimal
+import json
 
-from py_conf_mcp.utils.json import get_json_as_csv_lines
+import pytest
+
+from py_conf_mcp.utils import json as json_utils
+from py_conf_mcp.utils.json import (
+    get_json_as_csv_lines,
+    get_json_str,
+    get_serialized_tool_result,
+    iter_json_as_csv_chunks
+)
+
+
+ROW_WITH_NATIVE_TYPES_1 = {
+    'timestamp': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    'date': datetime.date(2024, 1, 2),
+    'numeric': decimal.Decimal('1.23'),
+    'bytes': b'abc'
+}
+
+ROW_WITH_NATIVE_TYPES_1_AS_JSON = {
+    'timestamp': '2024-01-02T03:04:05+00:00',
+    'date': '2024-01-02',
+    'numeric': '1.23',
+    'bytes': 'YWJj'
+}
+
+
+@pytest.fixture(name='use_orjson', params=[True, False])
+def _use_orjson(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if not request.param:
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    elif json_utils.orjson is None:
+        pytest.skip('orjson not installed')
+    return request.param
 
 
 class TestGetJsonAsCsvLines:
@@ -64,3 +99,55 @@ class TestGetJsonAsCsvLines:
         assert csv_as_json == [{
             'parent': str({'nested': 'value'})
         }]
+
+
+class TestIterJsonAsCsvChunks:
+    def test_should_return_no_chunks_for_empty_json_list(self):
+        assert not list(iter_json_as_csv_chunks([]))
+
+    def test_should_return_chunks_joining_to_csv_lines(self):
+        simple_json_list = [{
+            'col1': f'{index}.1',
+            'col2': f'{index}.2'
+        } for index in range(5)]
+        chunks = list(iter_json_as_csv_chunks(simple_json_list, chunk_size=2))
+        assert len(chunks) == 3
+        csv_as_json = list(csv.DictReader(''.join(chunks).split('\n')))
+        assert csv_as_json == simple_json_list
+
+    def test_should_consume_rows_lazily(self):
+        consumed_rows = []
+
+        def _iter_rows():
+            for index in range(5):
+                consumed_rows.append(index)
+                yield {'col1': str(index)}
+
+        chunks = iter_json_as_csv_chunks(_iter_rows(), chunk_size=2)
+        next(chunks)
+        assert len(consumed_rows) == 2
+
+
+@pytest.mark.usefixtures('use_orjson')
+class TestGetJsonStr:
+    def test_should_serialize_simple_json(self):
+        assert json.loads(get_json_str({'key': ['value', 1]})) == {'key': ['value', 1]}
+
+    def test_should_serialize_native_types(self):
+        assert json.loads(get_json_str([ROW_WITH_NATIVE_TYPES_1])) == [
+            ROW_WITH_NATIVE_TYPES_1_AS_JSON
+        ]
+
+    def test_should_not_escape_non_ascii_characters(self):
+        assert get_json_str('\u00e4') == '"\u00e4"'
+
+
+class TestGetSerializedToolResult:
+    def test_should_pass_through_str(self):
+        assert get_serialized_tool_result('text') == 'text'
+
+    def test_should_pass_through_pre_serialized_bytes(self):
+        assert get_serialized_tool_result(b'{"key":"value"}') == '{"key":"value"}'
+
+    def test_should_serialize_other_values(self):
+        assert json.loads(get_serialized_tool_result({'key': 'value'})) == {'key': 'value'}
@@ -0,0 +1,83 @@
+import logging
+from unittest.mock import patch
+
+from py_conf_mcp.utils import logging as logging_utils
+from py_conf_mcp.utils.logging import (
+    SamplingFilter,
+    TruncatedLogValue,
+    get_payload_summary,
+    get_truncated_repr,
+    get_truncated_str
+)
+
+
+def _get_log_record(levelno: int) -> logging.LogRecord:
+    return logging.LogRecord(
+        name='test',
+        level=levelno,
+        pathname=__file__,
+        lineno=1,
+        msg='message',
+        args=None,
+        exc_info=None
+    )
+
+
+class TestGetTruncatedStr:
+    def test_should_not_change_short_str(self):
+        assert get_truncated_str('abc', max_length=3) == 'abc'
+
+    def test_should_truncate_long_str(self):
+        assert get_truncated_str('abcdef', max_length=3) == 'abc...'
+
+
+class TestGetTruncatedRepr:
+    def test_should_return_repr_of_small_value(self):
+        assert get_truncated_repr({'key': 'value'}) == repr({'key': 'value'})
+
+    def test_should_limit_repr_of_long_list(self):
+        result = get_truncated_repr(list(range(100_000)), max_length=50)
+        assert len(result) <= 50 + len('...')
+        assert result.startswith('[0, 1, 2')
+
+    def test_should_limit_repr_of_long_str(self):
+        result = get_truncated_repr('x' * 100_000, max_length=50)
+        assert len(result) <= 50 + len('...')
+
+
+class TestGetPayloadSummary:
+    def test_should_include_type_and_length(self):
+        assert get_payload_summary([1, 2, 3]) == 'list(len=3)'
+
+    def test_should_only_include_type_name_without_length(self):
+        assert get_payload_summary(123) == 'int'
+
+
+class TestTruncatedLogValue:
+    def test_should_not_format_value_until_needed(self):
+        with patch.object(logging_utils, 'get_truncated_repr') as get_truncated_repr_mock:
+            get_truncated_repr_mock.return_value = 'repr_1'
+            value = TruncatedLogValue(['value_1'])
+            get_truncated_repr_mock.assert_not_called()
+            repr(value)
+            get_truncated_repr_mock.assert_called()
+
+    def test_should_use_raw_str_for_str_formatting(self):
+        assert str(TruncatedLogValue('abcdef', max_length=3)) == 'abc...'
+
+    def test_should_use_repr_for_str_formatting_of_other_types(self):
+        assert str(TruncatedLogValue(['value_1'])) == repr(['value_1'])
+
+
+class TestSamplingFilter:
+    def test_should_always_pass_records_above_sampled_level(self):
+        log_filter = SamplingFilter(sample_rate=0.0)
+        assert log_filter.filter(_get_log_record(logging.INFO))
+
+    def test_should_drop_sampled_records_if_sample_rate_is_zero(self):
+        log_filter = SamplingFilter(sample_rate=0.0)
+        assert not log_filter.filter(_get_log_record(logging.DEBUG))
+
+    def test_should_keep_sampled_records_if_sample_rate_is_one(self):
+        log_filter = SamplingFilter(sample_rate=1.0)
+        assert log_filter.filter(_get_log_record(logging.DEBUG))
@@ -0,0 +1,76 @@
+import sys
+
+import anyio.to_thread
+import pytest
+
+from py_conf_mcp.utils.memory import (
+    MemoryBudget,
+    MemoryBudgetExceededError,
+    account_memory,
+    account_memory_for_value,
+    check_memory_available,
+    get_current_memory_budget,
+    get_estimated_size,
+    iter_with_memory_accounting,
+    memory_budget_context
+)
+
+
+class TestGetEstimatedSize:
+    def test_should_include_nested_values(self):
+        value = {'key_1': ['value_1', 'value_2']}
+        assert get_estimated_size(value) == (
+            sys.getsizeof(value)
+            + sys.getsizeof('key_1')
+            + sys.getsizeof(value['key_1'])
+            + sys.getsizeof('value_1')
+            + sys.getsizeof('value_2')
+        )
+
+
+class TestMemoryBudget:
+    def test_should_raise_once_max_bytes_is_exceeded(self):
+        memory_budget = MemoryBudget(max_bytes=100)
+        memory_budget.add(60)
+        memory_budget.check_available(40)
+        with pytest.raises(MemoryBudgetExceededError) as exc_info:
+            memory_budget.add(41)
+        assert exc_info.value.used_bytes == 101
+        assert memory_budget.exceeded_error is exc_info.value
+
+    def test_should_only_account_without_max_bytes(self):
+        memory_budget = MemoryBudget()
+        memory_budget.add(1_000_000)
+        assert memory_budget.used_bytes == 1_000_000
+
+
+class TestMemoryBudgetContext:
+    def test_should_not_account_without_budget(self):
+        assert get_current_memory_budget() is None
+        account_memory(1_000_000)
+        check_memory_available(1_000_000)
+        assert account_memory_for_value('value_1') == 'value_1'
+
+    def test_should_account_to_current_budget(self):
+        memory_budget = MemoryBudget(max_bytes=1000)
+        with memory_budget_context(memory_budget):
+            account_memory(100)
+            with pytest.raises(MemoryBudgetExceededError):
+                check_memory_available(1000)
+        assert get_current_memory_budget() is None
+        assert memory_budget.used_bytes == 100
+
+    def test_should_abort_iteration_once_exceeded(self):
+        items: list[str] = []
+        with memory_budget_context(MemoryBudget(max_bytes=sys.getsizeof('value_1') * 2)):
+            with pytest.raises(MemoryBudgetExceededError):
+                for item in iter_with_memory_accounting(['value_1'] * 10):
+                    items.append(item)
+        assert items == ['value_1'] * 2
+
+    @pytest.mark.asyncio
+    async def test_should_share_budget_with_worker_threads(self):
+        memory_budget = MemoryBudget()
+        with memory_budget_context(memory_budget):
+            await anyio.to_thread.run_sync(account_memory, 100)
+        assert memory_budget.used_bytes == 100
@@ -0,0 +1,38 @@
+from py_conf_mcp.utils.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_should_increment_counter_by_labels(self):
+        registry = MetricsRegistry()
+        registry.increment('metric_1', labels={'tool': 'tool_1'})
+        registry.increment('metric_1', 2, labels={'tool': 'tool_1'})
+        registry.increment('metric_1', labels={'tool': 'tool_2'})
+        assert registry.get_value('metric_1', labels={'tool': 'tool_1'}) == 3
+        assert registry.get_value('metric_1', labels={'tool': 'tool_2'}) == 1
+
+    def test_should_replace_gauge_value(self):
+        registry = MetricsRegistry()
+        registry.set_gauge('metric_1', 5)
+        registry.set_gauge('metric_1', 2)
+        assert registry.get_value('metric_1') == 2
+
+    def test_should_remove_value_by_labels(self):
+        registry = MetricsRegistry()
+        registry.set_gauge('metric_1', 5, labels={'client': 'client_1'})
+        registry.set_gauge('metric_1', 2, labels={'client': 'client_2'})
+        registry.remove('metric_1', labels={'client': 'client_1'})
+        assert [sample.labels for sample in registry.get_samples()] == [{'client': 'client_2'}]
+
+    def test_should_return_zero_for_unknown_metric(self):
+        assert MetricsRegistry().get_value('metric_1') == 0
+
+    def test_should_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.increment('metric_1', labels={'tool': 'tool "1"'})
+        registry.set_gauge('metric_2', 1.5)
+        assert registry.get_prometheus_text() == (
+            '# TYPE metric_1 counter\n'
+            'metric_1{tool="tool \\"1\\""} 1.0\n'
+            '# TYPE metric_2 gauge\n'
+            'metric_2 1.5\n'
+        )
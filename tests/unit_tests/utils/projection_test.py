@@ -0,0 +1,62 @@
+import decimal
+
+import pytest
+
+from py_conf_mcp.utils import projection
+from py_conf_mcp.utils.projection import (
+    ProjectionSyntaxError,
+    compile_projection,
+    get_optional_compiled_projection
+)
+
+
+ITEM_1 = {'id': 1, 'status': 'active', 'user': {'name': 'user_1'}}
+ITEM_2 = {'id': 2, 'status': 'inactive', 'user': {'name': 'user_2'}}
+
+VALUE_1 = {'data': {'items': [ITEM_1, ITEM_2]}}
+
+
+@pytest.fixture(name='jmespath', autouse=True)
+def _jmespath():
+    if projection.jmespath is None:
+        pytest.skip('jmespath not installed')
+
+
+class TestCompileProjection:
+    @pytest.mark.parametrize('expression,expected_result', [
+        ('data.items[0].id', 1),
+        ('data.missing.field', None),
+        ("data.items[?status == 'active'].id", [1]),
+        ('data.items[*].{id: id, name: user.name}', [
+            {'id': 1, 'name': 'user_1'},
+            {'id': 2, 'name': 'user_2'}
+        ])
+    ])
+    def test_should_evaluate_expression(self, expression: str, expected_result):
+        assert compile_projection(expression)(VALUE_1) == expected_result
+
+    def test_should_compare_decimals_as_numbers(self):
+        # e.g. BigQuery NUMERIC values
+        assert compile_projection('[?amount > `1`].amount')([
+            {'amount': decimal.Decimal('0.5')},
+            {'amount': decimal.Decimal('1.5')}
+        ]) == [decimal.Decimal('1.5')]
+
+    @pytest.mark.parametrize('expression', ['data.', 'data[', '{id}', '#'])
+    def test_should_fail_for_invalid_expression(self, expression: str):
+        with pytest.raises(ProjectionSyntaxError):
+            compile_projection(expression)
+
+    def test_should_reuse_compiled_projection(self):
+        assert compile_projection('data.items') is compile_projection('data.items')
+
+    def test_should_fail_without_jmespath(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(projection, 'jmespath', None)
+        with pytest.raises(ImportError):
+            compile_projection.__wrapped__('data.items')
+
+
+class TestGetOptionalCompiledProjection:
+    def test_should_return_none_without_expression(self):
+        assert get_optional_compiled_projection(None) is None
+        assert get_optional_compiled_projection('') is None
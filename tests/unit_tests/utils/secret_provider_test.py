@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from py_conf_mcp.utils import secret_provider
+from py_conf_mcp.utils.secret_provider import (
+    SecretBackend,
+    SecretBackends,
+    SecretProvider,
+    read_secret_from_env
+)
+
+
+SECRET_NAME_1 = 'SECRET_NAME_1'
+
+
+@pytest.fixture(name='secret_path')
+def _secret_path(tmp_path: Path) -> Path:
+    secret_path = tmp_path / 'secret.txt'
+    secret_path.write_text('value_1', encoding='utf-8')
+    return secret_path
+
+
+@pytest.fixture(name='time_mock')
+def _time_mock() -> Iterator[MagicMock]:
+    with patch.object(secret_provider, 'time') as mock:
+        mock.monotonic.return_value = 100.0
+        yield mock
+
+
+def rotate_secret(secret_path: Path, value: str):
+    # atomic replace, like updates of mounted secrets
+    new_secret_path = secret_path.with_suffix('.new')
+    new_secret_path.write_text(value, encoding='utf-8')
+    os.replace(new_secret_path, secret_path)
+
+
+class TestSecretProvider:
+    def test_should_read_secret_from_file(self, secret_path: Path):
+        provider = SecretProvider()
+        assert provider.get_secret(str(secret_path), SecretBackends.FILE) == 'value_1'
+
+    def test_should_read_secret_from_env_file(
+        self,
+        secret_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(SECRET_NAME_1, str(secret_path))
+        assert SecretProvider().get_secret(SECRET_NAME_1) == 'value_1'
+
+    def test_should_read_secret_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(SECRET_NAME_1, 'value_1')
+        assert SecretProvider().get_secret(SECRET_NAME_1, SecretBackends.ENV) == 'value_1'
+
+    def test_should_not_check_file_within_check_interval(
+        self,
+        secret_path: Path,
+        time_mock: MagicMock
+    ):
+        provider = SecretProvider(check_interval_seconds=1.0)
+        provider.get_secret(str(secret_path), SecretBackends.FILE)
+        rotate_secret(secret_path, 'value_2')
+        time_mock.monotonic.return_value = 100.5
+        with patch.object(secret_provider, 'get_file_version') as get_file_version_mock:
+            assert provider.get_secret(str(secret_path), SecretBackends.FILE) == 'value_1'
+            get_file_version_mock.assert_not_called()
+
+    def test_should_reload_rotated_secret_after_check_interval(
+        self,
+        secret_path: Path,
+        time_mock: MagicMock
+    ):
+        provider = SecretProvider(check_interval_seconds=1.0)
+        provider.get_secret(str(secret_path), SecretBackends.FILE)
+        rotate_secret(secret_path, 'value_2')
+        time_mock.monotonic.return_value = 101.5
+        assert provider.get_secret(str(secret_path), SecretBackends.FILE) == 'value_2'
+
+    def test_should_not_read_unchanged_file_again(
+        self,
+        secret_path: Path,
+        time_mock: MagicMock
+    ):
+        provider = SecretProvider(check_interval_seconds=1.0)
+        provider.get_secret(str(secret_path), SecretBackends.FILE)
+        time_mock.monotonic.return_value = 101.5
+        with patch.object(secret_provider, 'Path') as path_mock:
+            assert provider.get_secret(str(secret_path), SecretBackends.FILE) == 'value_1'
+            path_mock.assert_not_called()
+
+    def test_should_use_registered_backend(self):
+        backend = MagicMock(SecretBackend)
+        backend.get_secret.return_value = 'value_1'
+        backend.get_version.return_value = None
+        provider = SecretProvider()
+        provider.register_backend('custom', backend)
+        assert provider.get_secret(SECRET_NAME_1, 'custom') == 'value_1'
+        assert provider.get_secret(SECRET_NAME_1, 'custom') == 'value_1'
+        backend.get_secret.assert_called_once_with(SECRET_NAME_1)
+
+    def test_should_fail_for_unknown_backend(self):
+        with pytest.raises(ValueError):
+            SecretProvider().get_secret(SECRET_NAME_1, 'unknown')
+
+
+class TestReadSecretFromEnv:
+    def test_should_use_default_secret_provider(
+        self,
+        secret_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(SECRET_NAME_1, str(secret_path))
+        monkeypatch.setattr(secret_provider, 'DEFAULT_SECRET_PROVIDER', SecretProvider())
+        assert read_secret_from_env(SECRET_NAME_1) == 'value_1'
@@ -0,0 +1,22 @@
+from py_conf_mcp.utils.signature import get_arguments_with_defaults
+
+
+def _tool_fn(param_1: str, *, param_2: str = 'default_2', **kwargs):
+    return param_1, param_2, kwargs
+
+
+class TestGetArgumentsWithDefaults:
+    def test_should_add_defaults(self):
+        assert get_arguments_with_defaults(_tool_fn, {'param_1': 'value_1'}) == {
+            'param_1': 'value_1',
+            'param_2': 'default_2'
+        }
+
+    def test_should_flatten_var_keyword_arguments(self):
+        assert get_arguments_with_defaults(
+            _tool_fn, {'param_1': 'value_1', 'other': 'value_3'}
+        ) == {
+            'param_1': 'value_1',
+            'param_2': 'default_2',
+            'other': 'value_3'
+        }
@@ -0,0 +1,26 @@
+import pytest
+
+from py_conf_mcp.utils.sql_template import get_evaluated_sql_template, toquoted
+
+
+class TestToQuoted:
+    def test_should_fail_for_none(self):
+        with pytest.raises(ValueError):
+            toquoted(None)  # type: ignore
+
+    def test_should_escape_quote_by_doubling_it(self):
+        assert toquoted('t\'est') == "'t''est'"
+
+
+class TestGetEvaluatedSqlTemplate:
+    def test_should_use_standard_sql_quotes_by_default(self):
+        assert get_evaluated_sql_template(
+            'SELECT {{ value | toquoted }}', {'value': 'it\'s'}
+        ) == "SELECT 'it''s'"
+
+    def test_should_use_provided_toquoted_filter(self):
+        assert get_evaluated_sql_template(
+            'SELECT {{ value | toquoted }}',
+            {'value': 'test'},
+            toquoted_filter=lambda value: f'"{value}"'
+        ) == 'SELECT "test"'
@@ -0,0 +1,315 @@
+import dataclasses
+
+import pytest
+
+from py_conf_mcp.config import (
+    AdmissionControlConfig,
+    AppConfig,
+    ClientFairnessConfig,
+    FromPythonClassConfig,
+    FromPythonFunctionConfig,
+    MemoryBudgetConfig,
+    OutputPolicyConfig,
+    RefreshAheadConfig,
+    ResultCacheConfig,
+    ServerConfig,
+    ToolDefinitionsConfig,
+    ToolQuotaConfig
+)
+from py_conf_mcp.validation import (
+    ConfigValidationError,
+    get_app_config_errors,
+    validate_app_config
+)
+
+
+FROM_PYTHON_FUNCTION_CONFIG_1 = FromPythonFunctionConfig(
+    name='get_joke',
+    module='py_conf_mcp.tools.example.joke',
+    key='get_joke'
+)
+
+FROM_PYTHON_CLASS_CONFIG_1 = FromPythonClassConfig(
+    name='fetch_web_api',
+    module='py_conf_mcp.tools.sources.web_api',
+    class_name='WebApiTool',
+    init_parameters={
+        'url': 'https://example/{{ param_1 }}'
+    },
+    inputs={
+        'param_1': {'type': 'str', 'default': 'value_1'}
+    }
+)
+
+
+def _get_errors_for_tool_config(
+    tool_config: FromPythonClassConfig | FromPythonFunctionConfig
+) -> list[str]:
+    if isinstance(tool_config, FromPythonFunctionConfig):
+        tool_definitions = ToolDefinitionsConfig(from_python_function=[tool_config])
+    else:
+        tool_definitions = ToolDefinitionsConfig(from_python_class=[tool_config])
+    return list(get_app_config_errors(AppConfig(
+        tool_definitions=tool_definitions,
+        server=ServerConfig(name='Test MCP Server', tools=[tool_config.name])
+    )))
+
+
+class TestGetAppConfigErrors:
+    def test_should_not_return_errors_for_valid_config(self):
+        assert not _get_errors_for_tool_config(FROM_PYTHON_FUNCTION_CONFIG_1)
+        assert not _get_errors_for_tool_config(FROM_PYTHON_CLASS_CONFIG_1)
+
+    def test_should_report_module_import_failure(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_FUNCTION_CONFIG_1, module='invalid_module'
+        ))
+        assert len(errors) == 1
+        assert 'failed to import' in errors[0]
+
+    def test_should_report_missing_function(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_FUNCTION_CONFIG_1, key='invalid_key'
+        ))
+        assert errors == [
+            "toolDefinitions.fromPythonFunction[0].key:"
+            " 'invalid_key' not found in 'py_conf_mcp.tools.example.joke'"
+        ]
+
+    def test_should_report_missing_class(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, class_name='InvalidClass'
+        ))
+        assert errors == [
+            "toolDefinitions.fromPythonClass[0].className: 'InvalidClass' is not a class"
+        ]
+
+    def test_should_report_unknown_and_missing_init_parameters(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, init_parameters={'urll': 'https://example'}
+        ))
+        assert len(errors) == 2
+        assert errors[0].startswith(
+            'toolDefinitions.fromPythonClass[0].initParameters.urll: unknown parameter'
+        )
+        assert errors[1] == (
+            'toolDefinitions.fromPythonClass[0].initParameters.url: missing required parameter'
+        )
+
+    def test_should_report_invalid_template(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, init_parameters={'url': 'https://example/{{ param_1'}
+        ))
+        assert len(errors) == 1
+        assert errors[0].startswith(
+            'toolDefinitions.fromPythonClass[0].initParameters.url: invalid template'
+        )
+
+    def test_should_not_report_template_error_for_non_template_parameter(self):
+        tool_config = FromPythonClassConfig(
+            name='query_bigquery',
+            module='py_conf_mcp.tools.sources.bigquery',
+            class_name='BigQueryTool',
+            init_parameters={
+                'project_name': 'project_1',
+                'sql_query': "SELECT '{{ not a template' AS value",
+                'is_sql_query_template': False
+            }
+        )
+        assert not _get_errors_for_tool_config(tool_config)
+        assert len(_get_errors_for_tool_config(dataclasses.replace(
+            tool_config,
+            init_parameters={**tool_config.init_parameters, 'is_sql_query_template': True}
+        ))) == 1
+
+    def test_should_not_report_template_error_for_static_content(self):
+        assert not _get_errors_for_tool_config(FromPythonClassConfig(
+            name='get_static_content',
+            module='py_conf_mcp.tools.sources.static',
+            class_name='StaticContentTool',
+            init_parameters={'content': 'Literal {{ braces'}
+        ))
+
+    def test_should_report_output_policy_limits_of_zero(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            output_policy=OutputPolicyConfig(max_items=0, max_bytes=100)
+        ))
+        assert errors == [
+            'toolDefinitions.fromPythonClass[0].outputPolicy.maxItems: must be greater than 0'
+        ]
+
+    def test_should_report_invalid_result_cache_backend(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, result_cache=ResultCacheConfig(backend='other')
+        ))
+        assert errors == [
+            "toolDefinitions.fromPythonClass[0].resultCache.backend: unsupported backend 'other'"
+        ]
+
+    def test_should_report_missing_result_cache_path(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, result_cache=ResultCacheConfig(backend='sqlite')
+        ))
+        assert errors == [
+            'toolDefinitions.fromPythonClass[0].resultCache.path: required for the sqlite backend'
+        ]
+
+    def test_should_report_refresh_ahead_without_result_cache(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            refresh_ahead=RefreshAheadConfig(inputs=[{}])
+        ))
+        assert errors == [
+            'toolDefinitions.fromPythonClass[0].refreshAhead: requires resultCache'
+        ]
+
+    def test_should_report_refresh_ahead_interval_not_less_than_ttl(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            result_cache=ResultCacheConfig(backend='memory', ttl_seconds=60),
+            refresh_ahead=RefreshAheadConfig(inputs=[{}], interval_seconds=60)
+        ))
+        assert len(errors) == 1
+        assert errors[0].startswith(
+            'toolDefinitions.fromPythonClass[0].refreshAhead.intervalSeconds:'
+        )
+
+    def test_should_report_invalid_memory_budget(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1,
+            memory_budget=MemoryBudgetConfig(max_bytes=0, trace_sample_rate=2)
+        ))
+        assert errors == [
+            'toolDefinitions.fromPythonClass[0].memoryBudget.maxBytes: must be greater than 0',
+            'toolDefinitions.fromPythonClass[0].memoryBudget.traceSampleRate:'
+            ' must be between 0 and 1'
+        ]
+
+    def test_should_report_nested_invalid_template(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, init_parameters={
+                'url': 'https://example',
+                'query_parameters': {'param_1': '{% if %}'}
+            }
+        ))
+        assert len(errors) == 1
+        assert errors[0].startswith(
+            'toolDefinitions.fromPythonClass[0].initParameters.query_parameters.param_1:'
+        )
+
+    def test_should_report_invalid_input_type_and_default(self):
+        errors = _get_errors_for_tool_config(dataclasses.replace(
+            FROM_PYTHON_CLASS_CONFIG_1, inputs={
+                'param_1': {'type': 'invalid_type'},
+                'param_2': {'type': 'int', 'default': 'not a number'},
+                'param_3': {'type': 'str', 'default': 'value_3', 'enum': ['value_1']}
+            }
+        ))
+        assert len(errors) == 3
+        assert errors[0] == (
+            "toolDefinitions.fromPythonClass[0].inputs.param_1: invalid type 'invalid_type'"
+        )
+        assert errors[1].startswith(
+            "toolDefinitions.fromPythonClass[0].inputs.param_2: invalid default 'not a number'"
+        )
+        assert errors[2].startswith(
+            "toolDefinitions.fromPythonClass[0].inputs.param_3: invalid default 'value_3'"
+        )
+
+    def test_should_report_unknown_and_duplicate_tools(self):
+        errors = get_app_config_errors(AppConfig(
+            tool_definitions=ToolDefinitionsConfig(
+                from_python_function=[FROM_PYTHON_FUNCTION_CONFIG_1],
+                from_python_class=[dataclasses.replace(
+                    FROM_PYTHON_CLASS_CONFIG_1, name=FROM_PYTHON_FUNCTION_CONFIG_1.name
+                )]
+            ),
+            server=ServerConfig(name='Test MCP Server', tools=['unknown'])
+        ))
+        assert errors == [
+            "toolDefinitions.fromPythonClass[0].name: duplicate tool 'get_joke'",
+            "server.tools[0]: unknown tool 'unknown'"
+        ]
+
+    def test_should_report_tool_reference_cycle_and_unknown_tool(self):
+        errors = get_app_config_errors(AppConfig(
+            tool_definitions=ToolDefinitionsConfig(from_python_class=[
+                FromPythonClassConfig(
+                    name=f'composite_{index}',
+                    module='py_conf_mcp.tools.sources.composite',
+                    class_name='CompositeTool',
+                    init_parameters={'branches': [{'tool': branch_tool_name}]}
+                )
+                for index, branch_tool_name in enumerate(
+                    ['composite_1', 'composite_0', 'unknown']
+                )
+            ]),
+            server=ServerConfig(name='Test MCP Server', tools=['composite_0'])
+        ))
+        assert errors == [
+            "toolDefinitions.fromPythonClass[2].initParameters:"
+            " unknown referenced tool 'unknown'",
+            'toolDefinitions.fromPythonClass[1].initParameters:'
+            ' tool reference cycle: composite_0 -> composite_1 -> composite_0'
+        ]
+
+    def test_should_report_invalid_admission_control(self):
+        errors = get_app_config_errors(AppConfig(
+            tool_definitions=ToolDefinitionsConfig(
+                from_python_function=[FROM_PYTHON_FUNCTION_CONFIG_1]
+            ),
+            server=ServerConfig(
+                name='Test MCP Server',
+                tools=[FROM_PYTHON_FUNCTION_CONFIG_1.name],
+                admission_control=AdmissionControlConfig(
+                    max_in_flight_calls=10,
+                    low_priority_threshold_ratio=0,
+                    tool_priorities={
+                        FROM_PYTHON_FUNCTION_CONFIG_1.name: 'urgent',
+                        'unknown': 'low'
+                    }
+                )
+            )
+        ))
+        assert errors == [
+            "server.admissionControl.toolPriorities.get_joke: unsupported priority 'urgent'"
+            ' (expected one of: critical, normal, low)',
+            'server.admissionControl.toolPriorities.unknown: unknown server tool',
+            'server.admissionControl.lowPriorityThresholdRatio:'
+            ' must be greater than 0 and at most 1'
+        ]
+
+    def test_should_report_invalid_client_fairness(self):
+        errors = get_app_config_errors(AppConfig(
+            tool_definitions=ToolDefinitionsConfig(
+                from_python_function=[FROM_PYTHON_FUNCTION_CONFIG_1]
+            ),
+            server=ServerConfig(
+                name='Test MCP Server',
+                tools=[FROM_PYTHON_FUNCTION_CONFIG_1.name],
+                client_fairness=ClientFairnessConfig(
+                    max_concurrent_calls=0,
+                    client_weights={'client_1': 0},
+                    tool_quotas={
+                        'unknown': ToolQuotaConfig(max_calls=1, window_seconds=0)
+                    }
+                )
+            )
+        ))
+        assert errors == [
+            'server.clientFairness.maxConcurrentCalls: must be greater than 0',
+            'server.clientFairness.clientWeights.client_1: must be greater than 0',
+            'server.clientFairness.toolQuotas.unknown: unknown server tool',
+            'server.clientFairness.toolQuotas.unknown.windowSeconds: must be greater than 0'
+        ]
+
+
+class TestValidateAppConfig:
+    def test_should_raise_error_with_all_errors(self):
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_app_config(AppConfig(
+                tool_definitions=ToolDefinitionsConfig(),
+                server=ServerConfig(name='Test MCP Server', tools=['unknown_1', 'unknown_2'])
+            ))
+        assert len(exc_info.value.errors) == 2